@@ -94,7 +94,7 @@ class GroupUpdateTree(us.UpdateTree):
                     us.prepare_input_data(prev_socks, node.inputs)
                     if error := node.dependency_error:
                         raise error
-                    node.process()
+                    us.process_node(node)
 
             if is_opened_tree:
                 if self._tree.show_time_mode == "Cumulative":
@@ -17,15 +17,25 @@
 # ##### END GPL LICENSE BLOCK #####
 
 """For internal usage of the sockets module"""
+import hashlib
 import logging
-from collections import UserDict
+import pickle
+import sys
+import threading
+from collections import UserDict, OrderedDict
 from itertools import chain
+from time import perf_counter
 from traceback import format_list, extract_stack
-from typing import NewType, Optional, Literal
+from typing import NewType, Optional, Literal, Callable
 
-from bpy.types import NodeSocket
+import numpy as np
+
+from bpy.types import ID, Node, NodeSocket
+import sverchok.settings as settings
 from sverchok.core.sv_custom_exceptions import SvNoDataError
 from sverchok.utils.handle_blender_data import BlTrees
+from sverchok.utils.tracing import tracer
+from sverchok.utils.ragged_array import SvRaggedArray
 
 
 SockId = NewType('SockId', str)
@@ -153,9 +163,288 @@ class DebugMemory(UserDict):
             return f"{start}...{end}"
 
 
-socket_data_cache: dict[SockId, list] = dict()
+def estimate_size(data) -> int:
+    """Returns approximate size of given data in bytes. Size of big lists is
+    estimated by several of their items"""
+    if isinstance(data, (np.ndarray, SvRaggedArray)):
+        return data.nbytes
+    size = sys.getsizeof(data)
+    if isinstance(data, (list, tuple)) and data:
+        step = max(1, len(data) // 4)
+        sample = data[::step]
+        size += sum(estimate_size(item) for item in sample) * len(data) // len(sample)
+    return size
+
+
+class SocketDataCache(dict):
+    """Storage of socket data which keeps approximate size of the data. When
+    memory budget is set it can evict data which was released by the update
+    system because no node is going to read it during current update. If
+    evicted data is read again it's restored by calling the function which was
+    given together with the released key, usually it recalculates the node.
+    Size of an object which is shared between several sockets is taken into
+    account only once. Data can be written by nodes processed in worker
+    threads, but evicted data is restored only in the main thread because
+    restoring updates nodes."""
+
+    def __init__(self):
+        """:budget: maximum size of data in bytes, 0 means no limit
+        :total_size: approximate size of all stored data in bytes
+        :_sizes: id of stored object -> its size and number of keys keeping it
+        :_released: data which can be evicted in order of releasing
+        :_evicted: functions to restore evicted data
+        :_lock: keeps the sizes consistent when data is written by threads"""
+        super().__init__()
+        self.budget = 0
+        self.total_size = 0
+        self._sizes: dict[int, list[int]] = dict()
+        self._released: dict[SockId, Callable] = dict()
+        self._evicted: dict[SockId, Callable] = dict()
+        self._lock = threading.RLock()
+
+    def __setitem__(self, key: SockId, value):
+        with self._lock:
+            if key in self:
+                self._remove_size(dict.__getitem__(self, key))
+            self._released.pop(key, None)
+            self._evicted.pop(key, None)
+            dict.__setitem__(self, key, value)
+            if (size := self._sizes.get(id(value))) is not None:
+                size[1] += 1
+            else:
+                self._sizes[id(value)] = [estimate_size(value), 1]
+                self.total_size += self._sizes[id(value)][0]
+
+    def __delitem__(self, key: SockId):
+        with self._lock:
+            self._remove_size(dict.pop(self, key))
+            self._released.pop(key, None)
+            self._evicted.pop(key, None)
+
+    def pop(self, key: SockId, *default):
+        with self._lock:
+            if key not in self:
+                return dict.pop(self, key, *default)
+            value = dict.__getitem__(self, key)
+            del self[key]
+            return value
+
+    def clear(self):
+        with self._lock:
+            dict.clear(self)
+            self.total_size = 0
+            self._sizes.clear()
+            self._released.clear()
+            self._evicted.clear()
+
+    def size_of(self, key: SockId) -> int:
+        """Approximate size of data of given socket in bytes"""
+        if key not in self:
+            return 0
+        return self._sizes[id(dict.__getitem__(self, key))][0]
+
+    def release(self, key: SockId, restore: Callable[[], None]):
+        """Marks the data as not needed during current update. Released data
+        can be evicted if the budget is exceeded.
+        :restore: function which should put the data back into the cache"""
+        with self._lock:
+            if key not in self:
+                return
+            self._released.pop(key, None)
+            self._released[key] = restore
+            if self.budget and self.total_size > self.budget:
+                self._evict()
+
+    def restore(self, key: SockId) -> bool:
+        """Tries to restore evicted data. Returns True if it is in the cache.
+        In worker threads it always returns False and the data stays evicted,
+        the update system prepares input data of such nodes in advance"""
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        restore = self._evicted.pop(key, None)
+        if restore is None:
+            return False
+        try:
+            restore()
+        except ReferenceError:  # the tree was changed since data was evicted
+            return False
+        return key in self
+
+    def _evict(self):
+        """Removes released data in order of releasing until total size of the
+        data is inside the budget"""
+        with self._lock:
+            while self.total_size > self.budget and self._released:
+                key = next(iter(self._released))
+                restore = self._released.pop(key)
+                self._remove_size(dict.pop(self, key))
+                self._evicted[key] = restore
+
+    def _remove_size(self, value):
+        size = self._sizes[id(value)]
+        size[1] -= 1
+        if size[1] == 0:
+            self.total_size -= size[0]
+            del self._sizes[id(value)]
+
+
+socket_data_cache: SocketDataCache = SocketDataCache()
 # socket_data_cache = DebugMemory(socket_data_cache)
 
+CopyMode = Literal['DEEP_COPY', 'COPY_ON_WRITE', 'DEBUG']
+_copy_mode: CopyMode = 'DEEP_COPY'
+
+
+def set_cache_budget(megabytes: int):
+    """Sets maximum size of socket data, 0 means unlimited. It's called by
+    the add-on preferences"""
+    socket_data_cache.budget = megabytes * 2 ** 20
+    if socket_data_cache.budget:
+        socket_data_cache._evict()
+
+
+def set_copy_mode(mode: CopyMode):
+    """Defines how sv_get_socket protects cached data from modification by
+    nodes. It's called by the add-on preferences.
+    DEEP_COPY - each read returns full copy of data made by sv_deep_copy
+    COPY_ON_WRITE - each read returns LazyCopyList / read only arrays
+    DEBUG - the same as COPY_ON_WRITE but also logs nodes which change their
+    input data"""
+    global _copy_mode
+    _copy_mode = mode
+
+
+class LazyCopyList(list):
+    """Copy of a list which is made level by level only when a level is
+    accessed. Initially it has only shallow copy of the top level, nested
+    lists are shared with the source. When a nested list is taken via
+    indexing or iteration it's replaced by LazyCopyList of its own, so nested
+    lists of the cache are never given to a node. NumPy arrays are given as
+    read only views. Code reading the list on C level (np.array, for example)
+    does not trigger any copying. If the source has the same nested object
+    several times all of them are replaced by the same copy like
+    copy.deepcopy does."""
+    __slots__ = ('_shared', '_copies')
+
+    def __init__(self, source=()):
+        """:source: list which data should be protected"""
+        if type(source) is not list:
+            source = list.copy(source) if isinstance(source, list) else list(source)
+        super().__init__(source)
+        # children which belong to the source, id -> child, the references
+        # keep the children alive so their ids can't be reused by new objects
+        self._shared = {id(item): item for item in source if isinstance(item, (list, np.ndarray))}
+        self._copies = dict()  # id of shared child -> its copy
+
+    def _own(self, item):
+        """Returns protected copy of given item if it is shared with source"""
+        if id(item) not in self._shared:
+            return item
+        if (owned := self._copies.get(id(item))) is None:
+            if isinstance(item, np.ndarray):
+                owned = read_only_array(item)
+            else:
+                owned = self._child(item)
+            self._copies[id(item)] = owned
+        return owned
+
+    def _child(self, item):
+        return type(self)(item)
+
+    def _own_all(self):
+        if self._shared:
+            for i, item in enumerate(list.__iter__(self)):
+                if id(item) in self._shared:
+                    list.__setitem__(self, i, self._own(item))
+
+    def __getitem__(self, key):
+        item = super().__getitem__(key)
+        if isinstance(key, slice):
+            return self._child(item)
+        if id(item) in self._shared:
+            owned = self._own(item)
+            super().__setitem__(key, owned)
+            return owned
+        return item
+
+    def __iter__(self):
+        self._own_all()
+        return super().__iter__()
+
+    def __reversed__(self):
+        self._own_all()
+        return super().__reversed__()
+
+    def pop(self, index=-1):
+        return self._own(super().pop(index))
+
+    def copy(self):
+        return self._child(self)
+
+    def __add__(self, other):
+        return self._child(list.__add__(list.copy(self), other))
+
+    def __radd__(self, other):
+        return self._child(list.__add__(list(other), list.copy(self)))
+
+    def __mul__(self, other):
+        return self._child(list.__mul__(list.copy(self), other))
+
+    __rmul__ = __mul__
+    __copy__ = copy
+
+    def __reduce_ex__(self, protocol):
+        return list, (list.copy(self),)
+
+
+class DebugLazyCopyList(LazyCopyList):
+    """The same as LazyCopyList but it logs attempts of a node to change the
+    data. Such nodes can't give the data into their outputs without copying"""
+    __slots__ = ('_address',)
+
+    def __init__(self, source=(), address=''):
+        super().__init__(source)
+        self._address = address
+
+    def _child(self, item):
+        return type(self)(item, self._address)
+
+    def _log_mutation(self, method):
+        sv_logger.warning(f"Input data is changed by '{method}' method in {self._address}")
+
+
+def _logged_mutation(name):
+    def method(self, *args, **kwargs):
+        self._log_mutation(name)
+        return getattr(LazyCopyList, name)(self, *args, **kwargs)
+    method.__name__ = name
+    return method
+
+
+for _name in ['__setitem__', '__delitem__', '__iadd__', '__imul__', 'append',
+              'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse']:
+    setattr(DebugLazyCopyList, _name, _logged_mutation(_name))
+
+
+def read_only_array(array: np.ndarray) -> np.ndarray:
+    """Returns view of given array which can't be modified"""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def lazy_copy(data, socket: NodeSocket = None):
+    """Returns data protected from modifications without copying it in
+    advance. If socket is given the data will log its modifications"""
+    if isinstance(data, list):
+        if socket is None:
+            return LazyCopyList(data)
+        address = f"tree='{socket.id_data.name}' node='{socket.node.name}' socket='{socket.name}'"
+        return DebugLazyCopyList(data, address)
+    if isinstance(data, np.ndarray):
+        return read_only_array(data)
+    return sv_deep_copy(data)
+
 
 def sv_deep_copy(lst):
     """return deep copied data of list/tuple structure"""
@@ -183,15 +472,38 @@ def sv_set_socket(socket, data):
     socket_data_cache[socket.socket_id] = data
 
 
-def sv_get_socket(socket, deepcopy=True):
+def sv_get_socket(socket, deepcopy=True, packed=False):
     """gets socket data from socket,
     if deep copy is True a deep copy is make_dep_dict,
     to increase performance if the node doesn't mutate input
     set to False and increase performance substanstilly
+    In copy on write mode the deep copy is replaced by lazy one, see set_copy_mode
+    Packed data (SvRaggedArray) is converted into nested lists unless packed
+    is True, if packed is True other data is returned as is
     """
     data = socket_data_cache.get(socket.socket_id)
+    if data is None and socket_data_cache.restore(socket.socket_id):
+        data = socket_data_cache.get(socket.socket_id)
     if data is not None:
-        return sv_deep_copy(data) if deepcopy else data
+        if isinstance(data, SvRaggedArray):
+            if not packed:
+                return data.to_list()  # it's a new list anyway
+            if not deepcopy:
+                return data
+            return data.copy() if _copy_mode == 'DEEP_COPY' else data.read_only()
+        if not deepcopy or packed:
+            return data
+        if trace := tracer.enabled:
+            start = perf_counter()
+        if _copy_mode == 'DEEP_COPY':
+            data = sv_deep_copy(data)
+        elif _copy_mode == 'COPY_ON_WRITE':
+            data = lazy_copy(data)
+        else:
+            data = lazy_copy(data, socket)
+        if trace:
+            tracer.add('copy', 'copy', start, socket=socket.name, mode=_copy_mode)
+        return data
     else:
         raise SvNoDataError(socket)
 
@@ -204,17 +516,165 @@ def get_output_socket_data(node, output_socket_name):
     """
     socket = node.outputs[output_socket_name]
     sock_address = socket.socket_id
-    if sock_address in socket_data_cache:
+    if sock_address in socket_data_cache or socket_data_cache.restore(sock_address):
         return socket_data_cache[sock_address]
     else:
         raise SvNoDataError(socket)
 
 
+class NodeMemo:
+    """Remembers output data of nodes by their input data and properties. If
+    a node is going to be updated with the same inputs and properties as one
+    of its previous updates its process method can be skipped and the outputs
+    can be restored from the memo. Input data is compared by identity of
+    objects in the socket data cache, so it's cheap for big data, and the
+    nodes whose outputs are restored give the same objects to next nodes.
+    Only nodes with `is_memoizable` flag are remembered. Memory used by
+    remembered data is limited by the size property, the least recently used
+    data is forgotten first. Also, it counts hits and misses per node."""
+
+    def __init__(self):
+        """:size: maximum size of remembered data in bytes, 0 disables the memo
+        :total_size: approximate size of remembered data in bytes
+        :_outputs: (node_id, key) -> (size, {socket_id: data}, input data),
+        input data is kept so ids of the key can't be reused by other objects
+        :_stats: node_id -> [hits, misses]"""
+        self.size = 0
+        self.total_size = 0
+        self._outputs: OrderedDict[tuple[str, tuple], tuple[int, dict, list]] = OrderedDict()
+        self._stats: dict[str, list[int]] = dict()
+
+    def key(self, node: Node) -> Optional[tuple]:
+        """Returns key of input data and properties of given node or None if
+        the node should not be remembered. It should be called after input
+        data of the node is prepared. Properties of the node and of its
+        sockets (default values of unlinked sockets, for example) are hashed,
+        input data is taken by identity"""
+        if not self.size or not getattr(node, 'is_memoizable', False):
+            return None
+        properties = [_properties_values(node)]
+        properties.extend(_properties_values(s, _IGNORED_SOCKET_PROPERTIES)
+                          for s in chain(node.inputs, node.outputs))
+        linked = [s.is_linked for s in chain(node.inputs, node.outputs)]
+        try:
+            dump = pickle.dumps((properties, linked), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:  # some properties can't be pickled
+            return None
+        inputs = tuple(id(socket_data_cache.get(s.socket_id)) if s.is_linked else None
+                       for s in node.inputs)
+        return hashlib.blake2b(dump, digest_size=16).digest(), inputs
+
+    def restore(self, node: Node, key: Optional[tuple]) -> bool:
+        """Puts remembered data into output sockets of the node. Returns False
+        if there is no data for the node with given key"""
+        if key is None:
+            return False
+        stats = self._stats.setdefault(node.node_id, [0, 0])
+        if (record := self._outputs.get((node.node_id, key))) is None:
+            stats[1] += 1
+            return False
+        stats[0] += 1
+        self._outputs.move_to_end((node.node_id, key))
+        _, outputs, _ = record
+        for socket in node.outputs:
+            if socket.socket_id in outputs:
+                socket_data_cache[socket.socket_id] = outputs[socket.socket_id]
+            else:
+                sv_forget_socket(socket)
+        return True
+
+    def store(self, node: Node, key: Optional[tuple]):
+        """Remembers current output data of the node, it should be called
+        after the node was processed"""
+        if key is None:
+            return
+        outputs = {s.socket_id: socket_data_cache[s.socket_id] for s in node.outputs
+                   if s.socket_id in socket_data_cache}
+        inputs = [socket_data_cache.get(s.socket_id) if s.is_linked else None for s in node.inputs]
+        size = sum(socket_data_cache.size_of(sock_id) for sock_id in outputs)
+        size += sum(socket_data_cache.size_of(s.socket_id) for s in node.inputs if s.is_linked)
+        if size > self.size:
+            return
+        if (old := self._outputs.pop((node.node_id, key), None)) is not None:
+            self.total_size -= old[0]
+        self._outputs[(node.node_id, key)] = size, outputs, inputs
+        self.total_size += size
+        while self.total_size > self.size:
+            _, (old_size, *_) = self._outputs.popitem(last=False)
+            self.total_size -= old_size
+
+    def stats(self, node: Node) -> Optional[tuple[int, int]]:
+        """Returns number of hits and misses of given node or None if the node
+        is not remembered"""
+        if (stats := self._stats.get(node.node_id)) is not None:
+            return tuple(stats)
+
+    def set_size(self, megabytes: int):
+        """Sets maximum size of remembered data, 0 disables the memo. It's
+        called by the add-on preferences"""
+        self.size = megabytes * 2 ** 20
+        if not self.size:
+            self.clear()
+        while self.total_size > self.size:
+            _, (old_size, *_) = self._outputs.popitem(last=False)
+            self.total_size -= old_size
+
+    def clear(self):
+        self._outputs.clear()
+        self._stats.clear()
+        self.total_size = 0
+
+
+node_memo = NodeMemo()
+
+
+def _properties_values(data, ignored: set[str] = None) -> list:
+    """Returns values of properties of a node, of a socket or of a property
+    group in a form which can be pickled. Properties of the base Node class
+    like location or name are ignored by default"""
+    if ignored is None:
+        ignored = _IGNORED_PROPERTIES
+    values = []
+    for prop in data.bl_rna.properties:
+        if prop.identifier in ignored:
+            continue
+        value = getattr(data, prop.identifier, None)
+        if prop.type == 'POINTER':
+            if value is None or isinstance(value, ID):
+                value = repr(value)
+            else:
+                value = _properties_values(value)
+        elif prop.type == 'COLLECTION':
+            value = [_properties_values(item) for item in value]
+        elif prop.type == 'ENUM' and prop.is_enum_flag:
+            value = sorted(value)
+        elif getattr(prop, 'is_array', False):
+            value = np.array(value).tolist()
+        values.append((prop.identifier, value))
+    return values
+
+
+_IGNORED_PROPERTIES = {p.identifier for p in Node.bl_rna.properties} | {'n_id', 'refresh'}
+_IGNORED_SOCKET_PROPERTIES = {p.identifier for p in NodeSocket.bl_rna.properties} | {'s_id'}
+
+
 def clear_all_socket_cache():
     """
     Reset socket cache for all node-trees.
     """
     socket_data_cache.clear()
+    node_memo.clear()
+
+
+settings.set_socket_copy_mode = set_copy_mode
+settings.set_socket_cache_budget = set_cache_budget
+settings.set_node_memo_size = node_memo.set_size
+
+
+def register():
+    set_copy_mode(settings.get_param('socket_copy_mode', 'DEEP_COPY'))
+    set_cache_budget(settings.get_param('socket_cache_budget', 0))
+    node_memo.set_size(settings.get_param('node_memo_size', 0))
 
 
 def unregister():
@@ -20,6 +20,8 @@ import inspect
 import sys
 from typing import Set
 
+import numpy as np
+
 from mathutils import Matrix, Quaternion
 import bpy
 from bpy.props import StringProperty, BoolProperty, FloatVectorProperty, IntProperty, FloatProperty, EnumProperty, \
@@ -45,6 +47,7 @@ from sverchok.utils.field.vector import SvVectorField
 from sverchok.utils.curve import SvCurve
 from sverchok.utils.curve.algorithms import reparametrize_curve
 from sverchok.utils.surface import SvSurface
+from sverchok.utils.ragged_array import SvRaggedArray
 
 from sverchok.dependencies import FreeCAD
 
@@ -414,7 +417,7 @@ class SvSocketCommon(SvSocketProcessing):
 
         self.hide = value
 
-    def sv_get(self, default=..., deepcopy=True):
+    def sv_get(self, default=..., deepcopy=True, packed=False):
         """
         The method is used for getting socket data
         In most cases the method should not be overridden
@@ -427,31 +430,44 @@ class SvSocketCommon(SvSocketProcessing):
         5. Raise no data error
         :param default: script default property
         :param deepcopy: in most cases should be False for efficiency but not in cases if input data will be modified
+        :param packed: return data as SvRaggedArray, see pack_data method,
+            otherwise packed data is converted into nested lists.
+            Output sockets always return data as it was set
         :return: data bound to the socket
         """
         if self.is_output:
-            return sv_get_socket(self, False)
+            return sv_get_socket(self, False, packed=True)
 
         if self.is_linked:
-            return sv_get_socket(self, deepcopy)
+            data = sv_get_socket(self, deepcopy, packed)
+            return self.pack_data(data) if packed else data
 
         prop_name = self.get_prop_name()
         if prop_name:
             prop = getattr(self.node, prop_name)
-            return format_bpy_property(prop)
+            data = format_bpy_property(prop)
+            return self.pack_data(data) if packed else data
 
         if self.use_prop and hasattr(self, 'default_property') and self.default_property is not None:
             default_property = self.default_property
-            return format_bpy_property(default_property)
+            data = format_bpy_property(default_property)
+            return self.pack_data(data) if packed else data
 
         if default is not ...:
             return default
 
         raise SvNoDataError(self)
 
+    def pack_data(self, data):
+        """Converts nested lists of the socket into SvRaggedArray.
+        Only sockets which data consists of numbers can pack it"""
+        raise TypeError(f"Data of {self.bl_idname} can't be packed")
+
     def sv_set(self, data):
         """Set data, provide context in case the node can be evaluated several times in different context"""
         if self.is_output:
+            if isinstance(data, SvRaggedArray) and self.get_mode_flags():
+                data = data.to_list()
             data = self.postprocess_output(data)
 
         # it's expensive to call sv_get method to update the number in other places
@@ -714,6 +730,9 @@ class SvVerticesSocket(SocketDomain, NodeSocket, SvSocketCommon):
     def do_flat_topology(self, data):
         return flatten_data(data, 3)
 
+    def pack_data(self, data):
+        return SvRaggedArray.from_list(data, dtype=np.float64, item_shape=(3,))
+
     @property
     def default_property(self):
         return self.prop
@@ -989,6 +1008,9 @@ class SvStringsSocket(SocketDomain, NodeSocket, SvSocketCommon):
     def do_flat_topology(self, data):
         return flatten_data(data, 3)
 
+    def pack_data(self, data):
+        return SvRaggedArray.from_list(data)
+
     def do_flatten(self, data):
         return flatten_data(data, 1)
 
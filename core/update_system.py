@@ -1,7 +1,9 @@
 from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from copy import copy
-from functools import lru_cache
-from graphlib import TopologicalSorter
+from functools import lru_cache, partial
+from graphlib import TopologicalSorter, CycleError
 from itertools import chain
 from time import perf_counter
 from typing import TYPE_CHECKING, Optional, Generator, Iterable
@@ -11,7 +13,10 @@ import sverchok.core.events as ev
 import sverchok.core.tasks as ts
 from sverchok.core.sv_custom_exceptions import CancelError, SvNoDataError
 from sverchok.core.socket_conversions import conversions
+from sverchok.core.socket_data import socket_data_cache, node_memo, estimate_size
 from sverchok.utils.profile import profile
+from sverchok.utils.tracing import tracer
+from sverchok.utils.ragged_array import SvRaggedArray
 from sverchok.utils.sv_logging import node_error_logger
 from sverchok.utils.tree_walk import bfs_walk
 
@@ -30,6 +35,8 @@ def control_center(event):
     2. Check whether the event should be processed
     3. Process event or create task to process via timer"""
     was_executed = True
+    # the tree is evaluated by a script, it only should know what is outdated
+    is_headless = isinstance(event, ev.TreeEvent) and event.tree.tree_id in _headless_trees
 
     # frame update
     # This event can't be handled via NodesUpdater during animation rendering
@@ -38,11 +45,12 @@ def control_center(event):
     if type(event) is ev.AnimationEvent:
         if event.tree.sv_animate:
             UpdateTree.get(event.tree).is_animation_updated = False
-            UpdateTree.update_animation(event)
+            if not is_headless:
+                UpdateTree.update_animation(event)
 
     # something changed in the scene
     elif type(event) is ev.SceneEvent:
-        if event.tree.sv_scene_update and event.tree.sv_process:
+        if event.tree.sv_scene_update and event.tree.sv_process and not is_headless:
             UpdateTree.get(event.tree).is_scene_updated = False
             ts.tasks.add(ts.Task(event.tree,
                                  UpdateTree.main_update(event.tree),
@@ -52,7 +60,7 @@ def control_center(event):
     elif type(event) is ev.PropertyEvent:
         tree = UpdateTree.get(event.tree)
         tree.add_outdated(event.updated_nodes)
-        if event.tree.sv_process:
+        if event.tree.sv_process and not is_headless:
             ts.tasks.add(ts.Task(event.tree,
                                  UpdateTree.main_update(event.tree),
                                  is_scene_update=False))
@@ -60,9 +68,10 @@ def control_center(event):
     # update the whole tree anyway
     elif type(event) is ev.ForceEvent:
         UpdateTree.reset_tree(event.tree)
-        ts.tasks.add(ts.Task(event.tree,
-                             UpdateTree.main_update(event.tree),
-                             is_scene_update=False))
+        if not is_headless:
+            ts.tasks.add(ts.Task(event.tree,
+                                 UpdateTree.main_update(event.tree),
+                                 is_scene_update=False))
 
     # mark that the tree topology has changed
     # also this can be called (by Blender) during undo event in this case all
@@ -70,7 +79,7 @@ def control_center(event):
     # all nodes are new, and won't be able to detect changes, and will update all
     elif type(event) is ev.TreeEvent:
         UpdateTree.get(event.tree).is_updated = False
-        if event.tree.sv_process:
+        if event.tree.sv_process and not is_headless:
             ts.tasks.add(ts.Task(event.tree,
                                  UpdateTree.main_update(event.tree),
                                  is_scene_update=False))
@@ -84,6 +93,31 @@ def control_center(event):
     return was_executed
 
 
+_headless_trees: set[str] = set()  # ids of trees which are evaluated by scripts
+
+
+@contextmanager
+def headless_update(tree: NodeTree):
+    """Inside the context events of the tree don't evaluate it, they only mark
+    changed nodes as outdated. The tree should be evaluated explicitly via
+    `UpdateTree.main_update`. Unlike switching off the `sv_process` property
+    it does not generate any events itself.
+
+        with headless_update(tree):
+            node.prop = value
+            for _ in UpdateTree.main_update(tree, update_interface=False):
+                pass
+    """
+    if tree.tree_id in _headless_trees:
+        yield
+        return
+    _headless_trees.add(tree.tree_id)
+    try:
+        yield
+    finally:
+        _headless_trees.discard(tree.tree_id)
+
+
 class SearchTree:
     """Data structure which represents Blender node trees but with ability
     of efficient search tree elements. Also it keeps tree state so it can be
@@ -95,6 +129,10 @@ class SearchTree:
     _to_socks: dict[NodeSocket, set[NodeSocket]]
     _links: set[tuple[NodeSocket, NodeSocket]]
     _sock_node: dict[NodeSocket, Node]
+    _node_socks: dict[Node, set[NodeSocket]]  # keys of _sock_node by nodes
+    _raw_links: dict[tuple[NodeSocket, NodeSocket], tuple[Node, Node]]
+    _raw_nodes: set[Node]
+    _special_nodes: dict[Node, tuple]
 
     def __init__(self, tree: NodeTree):
         self._tree = tree
@@ -106,6 +144,8 @@ class SearchTree:
         self._to_socks = defaultdict(set)  # only connected
         self._links = set()  # from to socket
         self._sock_node = dict()
+        self._node_socks = defaultdict(set)
+        self._raw_links, self._raw_nodes, self._special_nodes = _topology_snapshot(tree)
 
         for link in (li for li in tree.links if not li.is_muted):
             self._from_nodes[link.to_node].add(link.from_node)
@@ -117,6 +157,7 @@ class SearchTree:
         for node in tree.nodes:
             for sock in chain(node.inputs, node.outputs):
                 self._sock_node[sock] = node
+                self._node_socks[node].add(sock)
 
         self._remove_reroutes()
         self._remove_wifi_nodes()
@@ -186,7 +227,7 @@ class SearchTree:
             prepare_input_data(self.previous_sockets(node), node.inputs)
             if error := node.dependency_error:
                 raise error
-            node.process()
+            process_node(node)
 
     def _remove_reroutes(self):
         for r in self._tree.nodes:
@@ -405,14 +446,15 @@ class UpdateTree(SearchTree):
             if refresh_tree:
                 # update topology
                 if not _tree.is_updated:
-                    old = _tree
-                    _tree = old.copy(tree)
+                    changed_nodes = _tree._update_topology(tree)
+                    if changed_nodes is None:
+                        old = _tree
+                        _tree = old.copy(tree)
+                        changed_nodes = _tree._update_difference(old)
 
                 # update outdated nodes list
                 if _tree._outdated_nodes is not None:
                     if not _tree.is_updated:
-                        changed_nodes = _tree._update_difference(old)
-
                         # disconnected input sockets can remember previous data
                         # a node can be laizy and don't recalculate output
                         util_nodes = {'NodeGroupInput', 'NodeGroupOutput'}
@@ -454,9 +496,21 @@ class UpdateTree(SearchTree):
 
         # print(f"UPDATE NODES {event.type=}, {event.tree.name=}")
         up_tree = cls.get(tree, refresh_tree=True)
-        if update_nodes:
+        if tracing := update_nodes and tracer.enabled:
+            tracer.begin(tree.name)
+        if update_nodes and tree.sv_parallel_update:
+            from sverchok.settings import get_param
+            try:
+                yield from up_tree._parallel_update(get_param('max_update_workers', 0) or None)
+            except CancelError:
+                pass
+            finally:
+                if tracing:
+                    tracer.finish()
+        elif update_nodes:
             walker = up_tree._walk()
             # walker = up_tree._debug_color(walker)
+            consumers = dict()
             try:
                 for node, prev_socks in walker:
                     with AddStatistic(node):
@@ -464,9 +518,13 @@ class UpdateTree(SearchTree):
                         prepare_input_data(prev_socks, node.inputs)
                         if error := node.dependency_error:
                             raise error
-                        node.process()
+                        process_node(node)
+                    up_tree._release_data(node, prev_socks, consumers)
             except CancelError:
                 pass
+            finally:
+                if tracing:
+                    tracer.finish()
 
         if update_interface:
             if up_tree._tree.show_time_mode == "Cumulative":
@@ -524,6 +582,8 @@ class UpdateTree(SearchTree):
 
         # https://stackoverflow.com/a/68550238
         self._sort_nodes = lru_cache(maxsize=1)(self.__sort_nodes)
+        self._node_rank: Optional[dict[SvNode, int]] = None  # global order of execution
+        self._next_rank = 0
 
         self._copy_attrs = [
             'is_updated',
@@ -578,6 +638,110 @@ class UpdateTree(SearchTree):
             else:
                 node[UPDATE_KEY] = False
 
+    def _parallel_update(self, max_workers: int = None) -> Generator['SvNode', None, None]:
+        """Updates outdated nodes like the main_update method does but instead
+        of following static order it processes nodes as soon as all their
+        previous nodes are ready. Nodes with is_thread_safe flag are sent into
+        a pool of threads, all other nodes are processed in the main thread.
+        Input data of all nodes is prepared in the main thread. It yields nodes
+        which are processed or which results are got from the threads.
+        :max_workers: maximum number of threads, None means number of CPUs"""
+        if self._outdated_nodes is None:
+            outdated = None
+            self._outdated_nodes = set()
+        else:
+            outdated = frozenset(self._outdated_nodes)
+            self._outdated_nodes.clear()
+
+        prev_socks = dict(self._sort_nodes(outdated))
+        sorter = TopologicalSorter({n: {_n for _n in self._from_nodes[n] if _n in prev_socks}
+                                    for n in prev_socks})
+        sorter.prepare()
+
+        def is_ready(node_):
+            return all(n.get(UPDATE_KEY, True) for sock in prev_socks[node_]
+                       if (n := self._sock_node.get(sock)))
+
+        consumers = dict()
+
+        def finish(node_):
+            if node_.get(ERROR_KEY, False):
+                self._outdated_nodes.add(node_)
+            self._release_data(node_, prev_socks[node_], consumers)
+            sorter.done(node_)
+
+        pool = ThreadPoolExecutor(max_workers, thread_name_prefix='sv_update')
+        running: dict = dict()  # future: (node, memo key, preparation time)
+        try:
+            while sorter.is_active():
+                main_nodes = []
+                for node in sorter.get_ready():
+                    if not is_ready(node):
+                        node[UPDATE_KEY] = False
+                        sorter.done(node)
+                    elif getattr(node, 'is_thread_safe', False):
+                        start = perf_counter()
+                        with AddStatistic(node):
+                            prepare_input_data(prev_socks[node], node.inputs)
+                            if error := node.dependency_error:
+                                raise error
+                            key = node_memo.key(node)
+                            if not node_memo.restore(node, key):
+                                future = pool.submit(_timed_process, node)
+                                running[future] = node, key, perf_counter() - start
+                                continue
+                        finish(node)  # the node is restored or preparation has failed
+                    else:
+                        main_nodes.append(node)
+
+                for node in main_nodes:
+                    with AddStatistic(node):
+                        yield node
+                        prepare_input_data(prev_socks[node], node.inputs)
+                        if error := node.dependency_error:
+                            raise error
+                        process_node(node)
+                    finish(node)
+
+                if running and not main_nodes:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node, key, prep_time = running.pop(future)
+                        duration, error = future.result()
+                        with AddStatistic(node, duration=prep_time + duration):
+                            if error is not None:
+                                raise error
+                            node_memo.store(node, key)
+                        finish(node)
+                    yield node
+        finally:
+            for future in running:
+                future.cancel()
+            pool.shutdown(wait=True)
+
+    def _release_data(self, node: 'SvNode', prev_socks: list[Optional[NodeSocket]],
+                      consumers: dict[NodeSocket, int]):
+        """Should be called after the node was processed. It tells the socket
+        data cache which data won't be read anymore during current update so
+        it can be evicted if the cache is out of its memory budget. These are
+        input data of the node, output data which was read by all connected
+        nodes and output data which is not connected.
+        :consumers: number of connected nodes which did not read data of the
+        output sockets yet, it should be shared between calls of one update"""
+        if not socket_data_cache.budget:
+            return
+        for in_s, out_s in zip(node.inputs, prev_socks):
+            if out_s is None:
+                continue
+            socket_data_cache.release(in_s.socket_id, partial(prepare_input_data, [out_s], [in_s]))
+            left = consumers.get(out_s, len(self._to_socks[out_s])) - 1
+            consumers[out_s] = left
+            if left == 0:
+                socket_data_cache.release(out_s.socket_id, partial(_recalculate, self._sock_node[out_s]))
+        for out_s in node.outputs:
+            if out_s not in self._to_socks:
+                socket_data_cache.release(out_s.socket_id, partial(_recalculate, node))
+
     def __sort_nodes(self,
                      from_nodes: frozenset['SvNode'] = None,
                      to_nodes: frozenset['SvNode'] = None)\
@@ -608,12 +772,162 @@ class UpdateTree(SearchTree):
                     walk_structure[n] = {_n for _n in self._from_nodes[n]
                                          if _n in nodes_to_walk}
 
+        try:
+            ranks = self._ranks()
+        except CycleError:  # let the sorter below to decide whether the cycle is in the walk
+            pass
+        else:
+            if walk_structure is self._from_nodes:
+                nodes_to_walk = self._from_nodes.keys()
+            nodes_to_walk = sorted((n for n in nodes_to_walk if n in ranks), key=ranks.__getitem__)
+            return [(node, [self._from_sock.get(s) for s in node.inputs]) for node in nodes_to_walk]
+
         nodes = []
         if walk_structure:
             for node in TopologicalSorter(walk_structure).static_order():
                 nodes.append((node, [self._from_sock.get(s) for s in node.inputs]))
         return nodes
 
+    def _ranks(self) -> dict['SvNode', int]:
+        """Returns position of each node in the order of execution of the whole
+        tree. The order is calculated once and then is repaired locally by the
+        _update_topology method. Raises CycleError if the tree has cycles"""
+        if self._node_rank is None:
+            order = TopologicalSorter(self._from_nodes).static_order()
+            self._node_rank = {n: i for i, n in enumerate(order)}
+            self._next_rank = len(self._node_rank)
+        return self._node_rank
+
+    def _update_topology(self, tree: NodeTree) -> Optional[set['SvNode']]:
+        """Applies changes of the tree topology in place instead of rebuilding
+        the whole structure. It compares links and nodes of the tree with
+        their previous state and adds or removes only changed ones. The order
+        of execution is repaired only around new links. Returns nodes which
+        should be updated the same way as the _update_difference method does.
+        Returns None if the changes can't be applied incrementally because
+        reroutes, wifi or muted nodes are involved or because too much was
+        changed (undo event for example), in this case the tree should be
+        rebuilt from scratch.
+        :tree: fresh tree object, previous can be invalid after undo"""
+        links, nodes, special = _topology_snapshot(tree)
+        if special != self._special_nodes:
+            return None
+        old_links = self._raw_links
+        added_links = links.keys() - old_links.keys()
+        removed_links = old_links.keys() - links.keys()
+        added_nodes = nodes - self._raw_nodes
+        removed_nodes = self._raw_nodes - nodes
+        changes_num = len(added_links) + len(removed_links) + len(added_nodes) + len(removed_nodes)
+        if changes_num * 2 > len(links) + len(nodes):
+            return None
+        for key in chain(added_links, removed_links):
+            from_n, to_n = links[key] if key in links else old_links[key]
+            if from_n in special or to_n in special:
+                return None
+
+        self._tree = tree
+        self._raw_links, self._raw_nodes = links, nodes
+        self._sort_nodes.cache_clear()
+        changed_nodes = set()
+
+        # attributes of removed nodes should not be read, they can be invalid
+        for node in removed_nodes:
+            for sock in self._node_socks.pop(node, ()):
+                del self._sock_node[sock]
+            if node not in self._from_nodes:
+                continue  # frame node
+            for from_n in self._from_nodes.pop(node):
+                self._to_nodes[from_n].discard(node)
+            for to_n in self._to_nodes.pop(node):
+                self._from_nodes[to_n].discard(node)
+            if self._node_rank is not None:
+                self._node_rank.pop(node, None)
+
+        for from_s, to_s in removed_links:
+            from_n, to_n = old_links[from_s, to_s]
+            if to_n not in removed_nodes:
+                changed_nodes.add(to_n)
+            if self._from_sock.get(to_s) != from_s:
+                continue
+            if from_n in removed_nodes or to_n in removed_nodes:
+                del self._from_sock[to_s]
+                self._to_socks[from_s].discard(to_s)
+                if not self._to_socks[from_s]:
+                    del self._to_socks[from_s]
+                self._links.discard((from_s, to_s))
+            else:
+                self._remove_link(from_s, to_s)
+
+        for node in added_nodes:
+            if node.bl_idname == 'NodeFrame':
+                continue
+            self._from_nodes[node] = set()
+            self._to_nodes[node] = set()
+            if self._node_rank is not None:
+                self._node_rank[node] = self._next_rank
+                self._next_rank += 1
+            changed_nodes.add(node)
+
+        for from_s, to_s in added_links:
+            from_n, to_n = links[from_s, to_s]
+            self._sock_node[from_s] = from_n
+            self._sock_node[to_s] = to_n
+            self._node_socks[from_n].add(from_s)
+            self._node_socks[to_n].add(to_s)
+            if from_s not in self._from_sock:  # socket was not connected
+                changed_nodes.add(from_n)
+            else:
+                changed_nodes.add(to_n)
+            is_new_dependency = to_n not in self._to_nodes[from_n]
+            self._add_link(from_s, to_s)
+            if is_new_dependency and self._node_rank is not None:
+                self._repair_order(from_n, to_n)
+
+        return changed_nodes
+
+    def _repair_order(self, from_node: 'SvNode', to_node: 'SvNode'):
+        """Repairs order of execution after new dependency between given nodes
+        was added. Only nodes between the two nodes in current order are
+        reordered (Pearce-Kelly algorithm). If the new link creates a cycle the
+        order is reset."""
+        ranks = self._node_rank
+        lower, upper = ranks[to_node], ranks[from_node]
+        if lower > upper:
+            return
+
+        # nodes after to_node which should go after from_node
+        forward = []
+        visited = {to_node}
+        stack = [to_node]
+        while stack:
+            node = stack.pop()
+            forward.append(node)
+            for next_n in self._to_nodes[node]:
+                if next_n == from_node:
+                    self._node_rank = None  # cycle
+                    return
+                if next_n not in visited and ranks[next_n] < upper:
+                    visited.add(next_n)
+                    stack.append(next_n)
+
+        # nodes before from_node which should go before to_node
+        backward = []
+        visited = {from_node}
+        stack = [from_node]
+        while stack:
+            node = stack.pop()
+            backward.append(node)
+            for prev_n in self._from_nodes[node]:
+                if prev_n not in visited and ranks[prev_n] > lower:
+                    visited.add(prev_n)
+                    stack.append(prev_n)
+
+        backward.sort(key=ranks.__getitem__)
+        forward.sort(key=ranks.__getitem__)
+        free_ranks = sorted(ranks[n] for n in chain(backward, forward))
+        for node, rank in zip(chain(backward, forward), free_ranks):
+            ranks[node] = rank
+
     def _update_difference(self, old: 'UpdateTree') -> set['SvNode']:
         """Returns nodes which should be updated according to changes in the
         tree topology
@@ -677,6 +991,25 @@ class UpdateTree(SearchTree):
             yield node, *args
 
 
+def _topology_snapshot(tree: NodeTree) -> tuple[dict, set, dict]:
+    """Returns state of the tree topology as it is in Blender: not muted links
+    with their nodes, all nodes and nodes which require special handling by
+    the SearchTree (reroutes, wifi and muted nodes) with their state"""
+    links = {(li.from_socket, li.to_socket): (li.from_node, li.to_node)
+             for li in tree.links if not li.is_muted}
+    nodes = set(tree.nodes)
+    special = dict()
+    util_nodes = {'NodeFrame', 'NodeReroute', 'NodeGroupInput'}
+    for node in nodes:
+        if node.bl_idname == 'NodeReroute':
+            special[node] = ('NodeReroute', )
+        elif (var := getattr(node, 'var_name', None)) is not None:
+            special[node] = (node.bl_idname, var, node.mute)
+        elif node.mute and node.bl_idname not in util_nodes:
+            special[node] = (node.bl_idname, True)
+    return links, nodes, special
+
+
 class AddStatistic:
     """It caches errors during execution of process method of a node and saves
     update time, update status and error"""
@@ -684,20 +1017,33 @@ class AddStatistic:
     # this probably can be inside the Node class as an update method
     # using context manager from contextlib has big overhead
     # https://stackoverflow.com/questions/26152934/why-the-staggering-overhead-50x-of-contextlib-and-the-with-statement-in-python
-    def __init__(self, node: 'SvNode', supress=True):
-        """:supress: if True any errors during node execution will be suppressed"""
+    def __init__(self, node: 'SvNode', supress=True, duration=None):
+        """:supress: if True any errors during node execution will be suppressed
+        :duration: execution time of the node measured somewhere else, it is
+        used for nodes processed in worker threads"""
         self._node = node
         self._start = perf_counter()
         self._supress = supress
+        self._duration = duration
 
     def __enter__(self):
         return None
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if tracer.enabled and self._duration is None:
+            tracer.add(self._node.name, 'node', self._start,
+                       node=self._node.bl_idname,
+                       input_size=_data_size(self._node.inputs),
+                       output_size=_data_size(self._node.outputs),
+                       error=None if exc_val is None else repr(exc_val))
+
         if exc_type is None:
             self._node[UPDATE_KEY] = True
             self._node[ERROR_KEY] = None
-            self._node[TIME_KEY] = perf_counter() - self._start
+            if self._duration is None:
+                self._node[TIME_KEY] = perf_counter() - self._start
+            else:
+                self._node[TIME_KEY] = self._duration
         else:
             node_error_logger.error(exc_val, exc_info=True)
             self._node[UPDATE_KEY] = False
@@ -709,11 +1055,43 @@ class AddStatistic:
             return issubclass(exc_type, Exception)
 
 
+def process_node(node: 'SvNode'):
+    """Calls process method of the node unless its outputs can be restored
+    from the node memo"""
+    key = node_memo.key(node)
+    if not node_memo.restore(node, key):
+        node.process()
+        node_memo.store(node, key)
+
+
+def _recalculate(node: 'SvNode'):
+    """Updates the node to restore its evicted output data"""
+    UpdateTree.get(node.id_data).update_node(node)
+
+
+def _timed_process(node: 'SvNode') -> tuple[float, Optional[Exception]]:
+    """Calls process method of the given node in a worker thread. Errors are
+    returned instead of raising so the node statistics could be recorded in
+    the main thread"""
+    start = perf_counter()
+    try:
+        node.process()
+    except Exception as e:
+        return perf_counter() - start, e
+    finally:
+        if tracer.enabled:
+            tracer.add(node.name, 'process', start, node=node.bl_idname)
+    return perf_counter() - start, None
+
+
 def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
                        input_socks: list[NodeSocket]):
     """Reads data from given outputs socket make it conversion if necessary and
     put data into input given socket"""
     # this can be a socket method
+    trace = tracer.enabled
+    if trace:
+        start = perf_counter()
     for ps, ns in zip(prev_socks, input_socks):
         if ps is None:
             continue
@@ -725,10 +1103,25 @@ def prepare_input_data(prev_socks: list[Optional[NodeSocket]],
         else:
             # cast data
             if ps.bl_idname != ns.bl_idname:
+                if isinstance(data, SvRaggedArray):  # conversions work with nested lists
+                    data = data.to_list()
                 implicit_conversion = conversions[ns.default_conversion_name]
+                if trace:
+                    conversion_start = perf_counter()
                 data = implicit_conversion.convert(ns, ps, data)
+                if trace:
+                    tracer.add(f'{ps.bl_idname} -> {ns.bl_idname}', 'conversion',
+                               conversion_start, socket=ns.name)
 
             ns.sv_set(data)
+    if trace:
+        tracer.add('prepare_input_data', 'prepare', start)
+
+
+def _data_size(sockets: Iterable[NodeSocket]) -> int:
+    """Approximate size of data of given sockets in bytes, for tracing"""
+    return sum(estimate_size(data) for s in sockets
+               if (data := socket_data_cache.get(s.socket_id)) is not None)
 
 
 def update_ui(tree: NodeTree, times: Iterable[float] = None):
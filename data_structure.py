@@ -37,6 +37,7 @@ from numpy import (
     float64,
     int32, int64)
 from sverchok.utils.sv_logging import sv_logger
+from sverchok.utils.ragged_array import SvRaggedArray
 import numpy as np
 
 
@@ -132,6 +133,9 @@ def match_long_repeat(lsts):
         if not hasattr(l, '__len__'):
             raise TypeError(f"Cannot perform data matching: input of type {type(l)} is not a list or tuple, but an atomic object")
         max_l = max(max_l, len(l))
+    if all(len(l) for l in lsts):
+        # the same as below but without transposing of the data
+        return [list(l) if len(l) == max_l else list(l) + [l[-1]] * (max_l - len(l)) for l in lsts]
     for l in lsts:
         if len(l) == max_l:
             tmp.append(l)
@@ -530,7 +534,7 @@ def get_data_nesting_level(data, data_types=SIMPLE_DATA_TYPES):
         """ Needed only for better error reporting. """
         if isinstance(data, data_types):
             return 0
-        elif isinstance(data, (list, tuple, ndarray)):
+        elif isinstance(data, (list, tuple, ndarray, SvRaggedArray)):
             if len(data) == 0:
                 return 1
             else:
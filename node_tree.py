@@ -41,6 +41,7 @@ import sverchok
 from sverchok.core.sv_custom_exceptions import SvNoDataError, DependencyError
 import sverchok.core.events as ev
 from sverchok.core.event_system import handle_event
+from sverchok.core.socket_data import node_memo
 from sverchok.data_structure import classproperty, post_load_call
 from sverchok.utils.sv_node_utils import recursive_framed_location_finder
 from sverchok.utils.docstring import SvDocstring
@@ -224,6 +225,16 @@ class SverchCustomTree(NodeTree, SvNodeTreeCommon):
       - etc.
     """
 
+    sv_parallel_update: BoolProperty(
+        name="Parallel update",
+        description="Process independent thread safe nodes simultaneously",
+        default=False,
+        options=set())
+    """If enabled nodes with `UpdateNodes.is_thread_safe` flag will be processed
+    in a pool of worker threads as soon as all their previous nodes are
+    updated. Other nodes are still processed in the main thread. Number of
+    workers can be limited in the add-on preferences."""
+
     def update(self):
         """This method is called if collection of nodes or links of the tree was changed"""
         handle_event(ev.TreeEvent(self))
@@ -335,6 +346,20 @@ class UpdateNodes:
     
     ![image](https://user-images.githubusercontent.com/28003269/193507101-60a28c3f-50a1-4117-a66f-25b0b4e07e13.png)"""
 
+    is_thread_safe = False
+    """If enabled the node can be processed in a worker thread when
+    `SverchCustomTree.sv_parallel_update` is on. It should be set only for nodes
+    whose `process` method does not touch Blender data except reading and
+    writing its own sockets, e.g. nodes doing pure NumPy calculations. Scene
+    dependent nodes and viewers should always keep it disabled."""
+
+    is_memoizable = False
+    """If enabled output data of the node can be restored from memory instead
+    of calling the `process` method when the node gets the same input data and
+    has the same properties as during one of its previous updates. It's useful
+    for expensive nodes whose output depends only on their inputs and
+    properties. The memory is limited in the add-on preferences."""
+
     def sv_init(self, context):
         """
         This method will be called during node creation
@@ -468,8 +493,10 @@ class UpdateNodes:
 
         # show update timing
         if update_time is not None:
-            update_time = int(update_time * 1000)
-            sv_bgl.draw_text(self, f'{update_time}ms', update_pref + self.node_id, align="UP", dynamic_location=False)
+            text = f'{int(update_time * 1000)}ms'
+            if (memo_stats := node_memo.stats(self)) is not None:
+                text += f' (memo hits {memo_stats[0]}, misses {memo_stats[1]})'
+            sv_bgl.draw_text(self, text, update_pref + self.node_id, align="UP", dynamic_location=False)
         else:
             sv_bgl.callback_disable(update_pref + self.node_id)
 
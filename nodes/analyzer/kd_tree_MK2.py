@@ -84,7 +84,7 @@ class SvKDTreeNodeMK2(SverchCustomTreeNode, bpy.types.Node):
         so = self.outputs
         if not (any(s.is_linked for s in so) and si[0].is_linked):
             return
-        V1, V2, N, R = mlr([i.sv_get() for i in si])
+        V1, V2, N, R = mlr([i.sv_get(deepcopy=False) for i in si])
         out = []
         Co, ind, dist = so
         find_n = self.mode == "find_n"
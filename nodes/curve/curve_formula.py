@@ -8,8 +8,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, StringProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (updateNode, zip_long_repeat,
                                      match_long_repeat, ensure_nesting_level)
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
-from sverchok.utils.script_importhelper import safe_names_np
+from sverchok.utils.modules.eval_formula import get_variables, compile_formula
 from sverchok.utils.math import (
         from_cylindrical, from_spherical,
         from_cylindrical_np, from_spherical_np,
@@ -87,9 +86,7 @@ class SvCurveFormulaNode(SverchCustomTreeNode, bpy.types.Node):
         layout.prop(self, "output_mode", expand=True)
 
     def make_function(self, variables):
-        compiled1 = sv_compile(self.formula1)
-        compiled2 = sv_compile(self.formula2)
-        compiled3 = sv_compile(self.formula3)
+        formulas = [compile_formula(f) for f in [self.formula1, self.formula2, self.formula3]]
 
         if self.output_mode == 'XYZ':
             def out_coordinates(x, y, z):
@@ -103,17 +100,13 @@ class SvCurveFormulaNode(SverchCustomTreeNode, bpy.types.Node):
 
         def function(t):
             variables.update(dict(t=t))
-            v1 = safe_eval_compiled(compiled1, variables)
-            v2 = safe_eval_compiled(compiled2, variables)
-            v3 = safe_eval_compiled(compiled3, variables)
+            v1, v2, v3 = [formula.evaluate(variables) for formula in formulas]
             return np.array(out_coordinates(v1, v2, v3))
 
         return function
 
     def make_function_vector(self, variables):
-        compiled1 = sv_compile(self.formula1)
-        compiled2 = sv_compile(self.formula2)
-        compiled3 = sv_compile(self.formula3)
+        formulas = [compile_formula(f) for f in [self.formula1, self.formula2, self.formula3]]
 
         if self.output_mode == 'XYZ':
             def out_coordinates(x, y, z):
@@ -126,18 +119,7 @@ class SvCurveFormulaNode(SverchCustomTreeNode, bpy.types.Node):
                 return from_spherical_np(rho, phi, theta, mode='radians')
 
         def function(t):
-            variables.update(dict(t=t))
-            v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
-            v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
-            v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
-
-            if not isinstance(v1, np.ndarray):
-                v1 = np.full_like(t, v1)
-            if not isinstance(v2, np.ndarray):
-                v2 = np.full_like(t, v2)
-            if not isinstance(v3, np.ndarray):
-                v3 = np.full_like(t, v3)
-
+            v1, v2, v3 = [formula.evaluate_array(dict(t=t), variables) for formula in formulas]
             r = np.array(out_coordinates(v1, v2, v3)).T
             return r
 
@@ -7,6 +7,7 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_level
 from sverchok.utils.curve import SvCurve
+from sverchok.utils.curve.nurbs import SvNurbsCurve
 
 class SvEvalCurveNode(SverchCustomTreeNode, bpy.types.Node):
         """
@@ -91,18 +92,20 @@ class SvEvalCurveNode(SverchCustomTreeNode, bpy.types.Node):
                 new_verts = []
                 new_edges = []
                 new_tangents = []
+                curves_to_eval = []
+                ts_to_eval = []
                 for curve, ts, samples in zip_long_repeat(curves, ts_i, samples_i):
                     if self.eval_mode == 'AUTO':
                         t_min, t_max = curve.get_u_bounds()
                         ts = np.linspace(t_min, t_max, num=int(samples), dtype=np.float64)
                     else:
-                        ts = np.array(ts)
+                        ts = np.array(ts, dtype=np.float64)
+                    curves_to_eval.append(curve)
+                    ts_to_eval.append(ts)
 
-                    if len(ts) == 1:
-                        v = curve.evaluate(ts[0])
-                        curve_verts = np.array([v])
-                    else:
-                        curve_verts = curve.evaluate_array(ts)
+                # NURBS curves with the same knotvectors are evaluated together
+                verts_list = SvNurbsCurve.evaluate_many(curves_to_eval, ts_to_eval)
+                for curve, ts, curve_verts in zip(curves_to_eval, ts_to_eval, verts_list):
                     curve_verts = curve_verts.tolist()
                     n = len(ts)
                     curve_edges = [(i,i+1) for i in range(n-1)]
@@ -172,7 +172,7 @@ class SvAttractorFieldNodeMk2(SverchCustomTreeNode, bpy.types.Node):
             vfields = [SvVectorFieldPointDistance(center, falloff=falloff, metric=metric_single, power=self.get_power()) for center in centers]
             vfield = SvAverageVectorField(vfields)
         elif self.merge_mode == 'MIN':
-            kdt = SvKdTree.new(SvKdTree.best_available_implementation(), centers, power=self.get_power())
+            kdt = SvKdTree.cached(SvKdTree.best_available_implementation(), centers, power=self.get_power())
             vfield = SvKdtVectorField(kdt=kdt, falloff=falloff)
             sfield = SvKdtScalarField(kdt=kdt, falloff=falloff)
         else: # SEP
@@ -249,7 +249,7 @@ class SvAttractorFieldNodeMk2(SverchCustomTreeNode, bpy.types.Node):
         if not any(socket.is_linked for socket in self.outputs):
             return
 
-        center_s = self.inputs['Center'].sv_get()
+        center_s = self.inputs['Center'].sv_get(deepcopy=False)
         edges_s = self.inputs['Edges'].sv_get(default=[[]])
         faces_s = self.inputs['Faces'].sv_get(default=[[]])
         directions_s = self.inputs['Direction'].sv_get()
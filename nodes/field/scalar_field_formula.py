@@ -6,8 +6,7 @@ from bpy.props import EnumProperty, BoolProperty, StringProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat, match_long_repeat
-from sverchok.utils.modules.eval_formula import get_variables, sv_compile, safe_eval_compiled
-from sverchok.utils.script_importhelper import safe_names_np
+from sverchok.utils.modules.eval_formula import get_variables, compile_formula
 from sverchok.utils.math import (
         to_cylindrical, to_spherical,
         to_cylindrical_np, to_spherical_np,
@@ -60,11 +59,11 @@ class SvScalarFieldFormulaNode(SverchCustomTreeNode, bpy.types.Node):
         layout.prop(self, 'use_numpy_function')
 
     def make_function(self, variables):
-        compiled = sv_compile(self.formula)
+        formula = compile_formula(self.formula)
 
         def cartesian(x, y, z, V):
             variables.update(dict(x=x, y=y, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables)
+            r = formula.evaluate(variables)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -72,7 +71,7 @@ class SvScalarFieldFormulaNode(SverchCustomTreeNode, bpy.types.Node):
         def cylindrical(x, y, z, V):
             rho, phi, z = to_cylindrical((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables)
+            r = formula.evaluate(variables)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -80,7 +79,7 @@ class SvScalarFieldFormulaNode(SverchCustomTreeNode, bpy.types.Node):
         def spherical(x, y, z, V):
             rho, phi, theta = to_spherical((x, y, z), mode='radians')
             variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            r = safe_eval_compiled(compiled, variables)
+            r = formula.evaluate(variables)
             if not isinstance(r, np.ndarray):
                 r = np.full_like(x, r)
             return r
@@ -95,30 +94,18 @@ class SvScalarFieldFormulaNode(SverchCustomTreeNode, bpy.types.Node):
         return function
 
     def make_function_vector(self, variables):
-        compiled = sv_compile(self.formula)
+        formula = compile_formula(self.formula)
 
         def cartesian(x, y, z, V):
-            variables.update(dict(x=x, y=y, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
-            if not isinstance(r, np.ndarray):
-                r = np.full_like(x, r)
-            return r
+            return formula.evaluate_array(dict(x=x, y=y, z=z, V=V), variables)
 
         def cylindrical(x, y, z, V):
             rho, phi, z = to_cylindrical_np((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, z=z, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
-            if not isinstance(r, np.ndarray):
-                r = np.full_like(x, r)
-            return r
+            return formula.evaluate_array(dict(rho=rho, phi=phi, z=z, V=V), variables)
 
         def spherical(x, y, z, V):
             rho, phi, theta = to_spherical_np((x, y, z), mode='radians')
-            variables.update(dict(rho=rho, phi=phi, theta=theta, V=V))
-            r = safe_eval_compiled(compiled, variables, allowed_names = safe_names_np)
-            if not isinstance(r, np.ndarray):
-                r = np.full_like(x, r)
-            return r
+            return formula.evaluate_array(dict(rho=rho, phi=phi, theta=theta, V=V), variables)
 
         if self.input_mode == 'XYZ':
             function = cartesian
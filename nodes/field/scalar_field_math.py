@@ -40,6 +40,34 @@ operations = [
     ('GAUSS', "Gauss - Exp(-x*x/2)", lambda x: np.exp(-x*x/2.0))
 ]
 
+# the same operations written as expressions, which the field planner can fuse
+expressions = {
+    'ADD': "{0} + {1}",
+    'SUB': "{0} - {1}",
+    'MUL': "{0} * {1}",
+    'AVG': "({0} + {1}) / 2",
+    'DIV': "{0} / {1}",
+    'POW': "{0} ** {1}",
+    'SQR': "{0} * {0}",
+    'SQRT': "sqrt({0})",
+    'INV': "1.0 / {0}",
+    'SIN': "sin({0})",
+    'COS': "cos({0})",
+    'TAN': "tan({0})",
+    'ASIN': "arcsin({0})",
+    'ACOS': "arccos({0})",
+    'ATAN': "arctan({0})",
+    'EXP': "exp({0})",
+    'LOG': "log({0})",
+    'SINH': "sinh({0})",
+    'COSH': "cosh({0})",
+    'TANH': "tanh({0})",
+    'ASINH': "arcsinh({0})",
+    'ACOSH': "arccosh({0})",
+    'ATANH': "arctanh({0})",
+    'GAUSS': "exp(-{0} * {0} / 2.0)"
+}
+
 binary_ops = {'ADD', 'SUB', 'MUL', 'MIN', 'MAX', 'AVG', 'DIV', 'POW'}
 
 vectorized_ops = {'SIN', 'COS', 'TAN', 'ASIN', 'ACOS', 'ATAN', 'EXP', 'LOG',
@@ -98,14 +126,15 @@ class SvScalarFieldMathNode(SverchCustomTreeNode, bpy.types.Node):
                 fields_b = [fields_b]
             for field_a, field_b in zip_long_repeat(fields_a, fields_b):
                 operation = get_operation(self.operation)
+                expression = expressions.get(self.operation)
                 if self.operation == 'NEG':
                     field_c = SvNegatedScalarField(field_a)
                 elif self.operation == 'ABS':
                     field_c = SvAbsScalarField(field_a)
                 elif self.operation in vectorized_ops:
-                    field_c = SvScalarFieldVectorizedFunction(field_a, operation)
+                    field_c = SvScalarFieldVectorizedFunction(field_a, operation, expression)
                 elif self.operation in binary_ops:
-                    field_c = SvScalarFieldBinOp(field_a, field_b, operation)
+                    field_c = SvScalarFieldBinOp(field_a, field_b, operation, expression)
                 else:
                     raise Exception("Unsupported operation: " + self.operation)
                 fields_out.append(field_c)
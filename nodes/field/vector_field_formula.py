@@ -148,11 +148,11 @@ class SvVectorFieldFormulaNode(SverchCustomTreeNode, bpy.types.Node):
             v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
             v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
             v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
-            if not isinstance(v1, np.ndarray):
+            if np.isscalar(v1):
                 v1 = np.full_like(x, v1)
-            if not isinstance(v2, np.ndarray):
+            if np.isscalar(v2):
                 v2 = np.full_like(x, v2)
-            if not isinstance(v3, np.ndarray):
+            if np.isscalar(v3):
                 v3 = np.full_like(x, v3)
             return out_coordinates(v1, v2, v3)
 
@@ -162,11 +162,11 @@ class SvVectorFieldFormulaNode(SverchCustomTreeNode, bpy.types.Node):
             v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
             v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
             v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
-            if not isinstance(v1, np.ndarray):
+            if np.isscalar(v1):
                 v1 = np.full_like(x, v1)
-            if not isinstance(v2, np.ndarray):
+            if np.isscalar(v2):
                 v2 = np.full_like(x, v2)
-            if not isinstance(v3, np.ndarray):
+            if np.isscalar(v3):
                 v3 = np.full_like(x, v3)
             return out_coordinates(v1, v2, v3)
 
@@ -176,11 +176,11 @@ class SvVectorFieldFormulaNode(SverchCustomTreeNode, bpy.types.Node):
             v1 = safe_eval_compiled(compiled1, variables, allowed_names = safe_names_np)
             v2 = safe_eval_compiled(compiled2, variables, allowed_names = safe_names_np)
             v3 = safe_eval_compiled(compiled3, variables, allowed_names = safe_names_np)
-            if not isinstance(v1, np.ndarray):
+            if np.isscalar(v1):
                 v1 = np.full_like(x, v1)
-            if not isinstance(v2, np.ndarray):
+            if np.isscalar(v2):
                 v2 = np.full_like(x, v2)
-            if not isinstance(v3, np.ndarray):
+            if np.isscalar(v3):
                 v3 = np.full_like(x, v3)
             return out_coordinates(v1, v2, v3)
 
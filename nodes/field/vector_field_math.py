@@ -47,6 +47,13 @@ operations = [
     ('REL', "Absolute -> Relative", None, [("VFieldA", "Absolute")], [("VFieldC", "Relative")], "Given the vector field VF, return the vector field which maps point X to VF(X) - X" ),
 ]
 
+# the same operations written for one vector component, so that the field planner can fuse them
+expressions = {
+    'ADD': "{0} + {1}",
+    'SUB': "{0} - {1}",
+    'AVG': "({0} + {1}) / 2"
+}
+
 operation_modes = [ (id, name, description, i) for i, (id, name, fn, _, _, description) in enumerate(operations) ]
 
 def get_operation(op_id):
@@ -161,7 +168,7 @@ class SvVectorFieldMathNode(SverchCustomTreeNode, bpy.types.Node):
                     vfields_c_out.append(field_c)
                 else:
                     operation = get_operation(self.operation)
-                    field_c = SvVectorFieldBinOp(vfield_a, vfield_b, operation)
+                    field_c = SvVectorFieldBinOp(vfield_a, vfield_b, operation, expressions.get(self.operation))
                     vfields_c_out.append(field_c)
 
         self.outputs[V_FIELD_C.idx].sv_set(vfields_c_out)
@@ -55,7 +55,7 @@ class SvVoronoiFieldNode(SverchCustomTreeNode, bpy.types.Node):
         if not any(socket.is_linked for socket in self.outputs):
             return
 
-        vertices_s = self.inputs['Vertices'].sv_get()
+        vertices_s = self.inputs['Vertices'].sv_get(deepcopy=False)
 
         sfields_out = []
         vfields_out = []
@@ -22,6 +22,7 @@ from bpy.props import EnumProperty, BoolProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, match_long_cycle as mlr
 from sverchok.utils.csg_core import CSG
+from sverchok.utils.mesh_boolean import mesh_boolean
 from sverchok.utils.nodes_mixins.sockets_config import ModifierLiteNode
 
 
@@ -66,6 +67,18 @@ class SvCSGBooleanNodeMK2(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node
         default="ITX",
         update=updateNode)
 
+    algorithm_options = [
+        ("BVH", "BVH", "Faces are cut only where they intersect, fast with big meshes", 0),
+        ("BSP", "BSP", "Old algorithm based on BSP trees, slow with big meshes", 1)
+    ]
+
+    algorithm: EnumProperty(
+        name="Algorithm",
+        items=algorithm_options,
+        description="Algorithm of boolean operations",
+        default="BSP",
+        update=updateNode)
+
     def update_mode(self, context):
         self.inputs['Verts A'].hide_safe = self.nest_objs
         self.inputs['Polys A'].hide_safe = self.nest_objs
@@ -96,6 +109,7 @@ class SvCSGBooleanNodeMK2(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node
         self.inputs.new('SvStringsSocket',  'Polys Nested').hide_safe = True
         self.outputs.new('SvVerticesSocket', 'Vertices')
         self.outputs.new('SvStringsSocket', 'Polygons')
+        self.algorithm = 'BVH'  # nodes of old files keep BSP which is default
 
     @property
     def sv_internal_links(self):
@@ -115,29 +129,37 @@ class SvCSGBooleanNodeMK2(ModifierLiteNode, SverchCustomTreeNode, bpy.types.Node
         if self.nest_objs:
             col.prop(self, "out_last", toggle=True)
 
+    def draw_buttons_ext(self, context, layout):
+        layout.prop(self, 'algorithm')
+        self.draw_buttons(context, layout)
+
+    def boolean(self, verts_a, polys_a, verts_b, polys_b):
+        if self.algorithm == 'BVH':
+            return list(mesh_boolean(verts_a, polys_a, verts_b, polys_b, self.selected_mode))
+        return Boolean(verts_a, polys_a, verts_b, polys_b, self.selected_mode)
+
     def process(self):
         OutV, OutP = self.outputs
         if not OutV.is_linked:
             return
         VertA, PolA, VertB, PolB, VertN, PolN = self.inputs
-        SMode = self.selected_mode
         out = []
         recursionlimit = sys.getrecursionlimit()
         sys.setrecursionlimit(10000)
         if not self.nest_objs:
             for v1, p1, v2, p2 in zip(*mlr([VertA.sv_get(), PolA.sv_get(), VertB.sv_get(), PolB.sv_get()])):
-                out.append(Boolean(v1, p1, v2, p2, SMode))
+                out.append(self.boolean(v1, p1, v2, p2))
         else:
             vnest, pnest = VertN.sv_get(), PolN.sv_get()
-            First = Boolean(vnest[0], pnest[0], vnest[1], pnest[1], SMode)
+            First = self.boolean(vnest[0], pnest[0], vnest[1], pnest[1])
             if not self.out_last:
                 out.append(First)
                 for i in range(2, len(vnest)):
-                    out.append(Boolean(First[0], First[1], vnest[i], pnest[i], SMode))
+                    out.append(self.boolean(First[0], First[1], vnest[i], pnest[i]))
                     First = out[-1]
             else:
                 for i in range(2, len(vnest)):
-                    First = Boolean(First[0], First[1], vnest[i], pnest[i], SMode)
+                    First = self.boolean(First[0], First[1], vnest[i], pnest[i])
                 out.append(First)
         sys.setrecursionlimit(recursionlimit)
         OutV.sv_set([i[0] for i in out])
@@ -57,6 +57,7 @@ class SvGenNumberRange(SverchCustomTreeNode, bpy.types.Node):
     bl_idname = 'SvGenNumberRange'
     bl_label = 'Number Range'
     bl_icon = 'IPO_LINEAR'
+    is_thread_safe = True
 
     start_float: FloatProperty(
         name='start', description='start',
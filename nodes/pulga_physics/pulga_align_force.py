@@ -20,9 +20,8 @@ import bpy
 from bpy.props import EnumProperty, FloatProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import (zip_long_repeat, enum_item_4, updateNode)
-from sverchok.utils.pulga_physics_modular_core import SvAlignForce
-from sverchok.dependencies import scipy, Cython
+from sverchok.data_structure import (zip_long_repeat, updateNode)
+from sverchok.utils.pulga_physics_modular_core import SvAlignForce, NEIGHBOURS_MODES
 
 class SvPulgaAlignForceNode(SverchCustomTreeNode, bpy.types.Node):
     """
@@ -47,7 +46,7 @@ class SvPulgaAlignForceNode(SverchCustomTreeNode, bpy.types.Node):
     mode: EnumProperty(
         name='Mode',
         description='Algorithm used for calculation',
-        items=enum_item_4(['Brute Force', 'Kd-tree']),
+        items=NEIGHBOURS_MODES,
         default='Kd-tree', update=updateNode)
 
 
@@ -59,8 +58,7 @@ class SvPulgaAlignForceNode(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvPulgaForceSocket', "Force")
 
     def draw_buttons(self, context, layout):
-        if scipy is not None and Cython is not None:
-            layout.prop(self, 'mode')
+        layout.prop(self, 'mode')
 
     def process(self):
 
@@ -69,13 +67,13 @@ class SvPulgaAlignForceNode(SverchCustomTreeNode, bpy.types.Node):
         strength = self.inputs["Strength"].sv_get(deepcopy=False)
         decay = self.inputs["Decay"].sv_get(deepcopy=False)
         max_distance = self.inputs["Max. Distance"].sv_get(deepcopy=False)
-        use_kdtree = self.mode in "Kd-tree" and scipy is not None and Cython is not None
+        use_grid = self.mode == "Kd-tree"
 
         forces_out = []
 
         for force in zip_long_repeat(strength, decay, max_distance):
 
-            forces_out.append(SvAlignForce(*force, use_kdtree=use_kdtree))
+            forces_out.append(SvAlignForce(*force, use_grid=use_grid))
 
 
         self.outputs[0].sv_set([forces_out])
@@ -20,9 +20,8 @@ import bpy
 from bpy.props import EnumProperty, FloatProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
-from sverchok.data_structure import (enum_item_4, updateNode)
-from sverchok.utils.pulga_physics_modular_core import SvCollisionForce
-from sverchok.dependencies import scipy, Cython
+from sverchok.data_structure import updateNode
+from sverchok.utils.pulga_physics_modular_core import SvCollisionForce, NEIGHBOURS_MODES
 
 class SvPulgaCollisionForceNode(SverchCustomTreeNode, bpy.types.Node):
     """
@@ -40,7 +39,7 @@ class SvPulgaCollisionForceNode(SverchCustomTreeNode, bpy.types.Node):
     mode: EnumProperty(
         name='Mode',
         description='Algorithm used for calculation',
-        items=enum_item_4(['Brute Force', 'Kd-tree']),
+        items=NEIGHBOURS_MODES,
         default='Kd-tree', update=updateNode)
 
 
@@ -50,8 +49,7 @@ class SvPulgaCollisionForceNode(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvPulgaForceSocket', "Force")
 
     def draw_buttons(self, context, layout):
-        if scipy is not None and Cython is not None:
-            layout.prop(self, 'mode')
+        layout.prop(self, 'mode')
 
     def process(self):
 
@@ -60,9 +58,9 @@ class SvPulgaCollisionForceNode(SverchCustomTreeNode, bpy.types.Node):
         forces_in = self.inputs["Strength"].sv_get(deepcopy=False)
 
         forces_out = []
-        use_kdtree = self.mode in "Kd-tree" and scipy is not None and Cython is not None
+        use_grid = self.mode == "Kd-tree"
         for force in forces_in:
-            forces_out.append(SvCollisionForce(force, use_kdtree=use_kdtree))
+            forces_out.append(SvCollisionForce(force, use_grid=use_grid))
         self.outputs[0].sv_set([forces_out])
 
 
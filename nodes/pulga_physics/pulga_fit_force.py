@@ -20,8 +20,7 @@ import bpy
 from bpy.props import  FloatProperty, EnumProperty
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import (enum_item_4, updateNode)
-from sverchok.utils.pulga_physics_modular_core import SvFitForce
-from sverchok.dependencies import scipy, Cython
+from sverchok.utils.pulga_physics_modular_core import SvFitForce, NEIGHBOURS_MODES
 
 class SvPulgaFitForceNode(SverchCustomTreeNode, bpy.types.Node):
     """
@@ -48,7 +47,7 @@ class SvPulgaFitForceNode(SverchCustomTreeNode, bpy.types.Node):
     algorithm: EnumProperty(
         name='Algorithm',
         description='Algorithm used for calculation',
-        items=enum_item_4(['Brute Force', 'Kd-tree']),
+        items=NEIGHBOURS_MODES,
         default='Kd-tree', update=updateNode)
 
     def sv_init(self, context):
@@ -60,8 +59,7 @@ class SvPulgaFitForceNode(SverchCustomTreeNode, bpy.types.Node):
 
     def draw_buttons(self, context, layout):
         layout.prop(self, 'mode')
-        if scipy is not None and Cython is not None:
-            layout.prop(self, 'algorithm')
+        layout.prop(self, 'algorithm')
 
     def process(self):
 
@@ -71,9 +69,9 @@ class SvPulgaFitForceNode(SverchCustomTreeNode, bpy.types.Node):
         min_rad_in = self.inputs["Min Radius"].sv_get(deepcopy=False)
         max_rad_in = self.inputs["Max Radius"].sv_get(deepcopy=False)
         forces_out = []
-        use_kdtree = self.algorithm == "Kd-tree" and scipy is not None and Cython is not None
+        use_grid = self.algorithm == "Kd-tree"
         for force in zip(forces_in, min_rad_in, max_rad_in):
-            forces_out.append(SvFitForce(*force, self.mode, use_kdtree=use_kdtree))
+            forces_out.append(SvFitForce(*force, self.mode, use_grid=use_grid))
         self.outputs[0].sv_set([forces_out])
 
 
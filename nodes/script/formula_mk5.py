@@ -18,7 +18,7 @@ from sverchok.data_structure import (updateNode,
                                      list_match_func, numpy_list_match_modes,
                                      enum_item_4)
 
-from sverchok.utils.modules.eval_formula import get_variables, safe_eval
+from sverchok.utils.modules.eval_formula import get_variables, safe_eval, compile_formula
 from sverchok.utils.sv_itertools import recurse_f_level_control
 
 def transform_data(data, transform):
@@ -41,22 +41,51 @@ def ensure_list(value):
         return value.tolist()
     return list(value)
 
+def numeric_arrays(parameters):
+    """Returns parameters as 1D arrays if all of them are lists of numbers, otherwise None"""
+    arrays = []
+    for values in parameters:
+        if not isinstance(values, np.ndarray):
+            if not (isinstance(values, (list, tuple)) and values and isinstance(values[0], (int, float))):
+                return None
+            try:
+                values = np.array(values)
+            except ValueError:
+                return None
+        if values.ndim != 1 or values.dtype.kind not in 'biuf':
+            return None
+        arrays.append(values)
+    return arrays
+
+def formula_func_vectorized(formulas, separate, var_names, arrays):
+    arrays = dict(zip(var_names, arrays))
+    results = [formula.evaluate_array(arrays, strict=True).tolist() for formula in formulas]
+    if separate:
+        return [list(values) for values in zip(*results)]
+    return [value for values in zip(*results) for value in values]
+
 def formula_func(parameters, constant, matching_f):
 
     formulas, separate, var_names, transformations, as_list = constant
 
+    parameters = matching_f(parameters)
+    compiled = [compile_formula(formula) for formula in formulas if formula]
+    if all(tr == 'As_is' for tr in transformations) and all(f.vectorizable for f in compiled):
+        arrays = numeric_arrays(parameters)
+        if arrays is not None:
+            return formula_func_vectorized(compiled, separate, var_names, arrays)
+
     object_results = []
-    for values in zip(*matching_f(parameters)):
+    for values in zip(*parameters):
         vals = [transform_data(d, tr) for d, tr in zip(values, transformations)]
         variables = dict(zip(var_names, vals))
         vector = []
-        for formula in formulas:
-            if formula:
-                value = safe_eval(formula, variables)
-                if as_list:
-                    vector.append(ensure_list(value))
-                else:
-                    vector.append(value)
+        for formula in compiled:
+            value = formula.evaluate(variables)
+            if as_list:
+                vector.append(ensure_list(value))
+            else:
+                vector.append(value)
         if separate:
             object_results.append(vector)
         else:
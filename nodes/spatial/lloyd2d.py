@@ -10,7 +10,8 @@ from bpy.props import FloatProperty, EnumProperty, IntProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, ensure_nesting_level, zip_long_repeat, get_data_nesting_level
-from sverchok.utils.voronoi import lloyd2d
+from sverchok.utils.voronoi import lloyd2d, FORTUNE, SCIPY
+from sverchok.dependencies import scipy
 from sverchok.utils.field.scalar import SvScalarField
 
 class SvLloyd2dNode(SverchCustomTreeNode, bpy.types.Node):
@@ -39,6 +40,16 @@ class SvLloyd2dNode(SverchCustomTreeNode, bpy.types.Node):
         default = 'BOX',
         update = updateNode)
 
+    implementations = [(FORTUNE, "Fortune", "Pure Python implementation of Fortune's algorithm", 0)]
+    if scipy is not None:
+        implementations.append((SCIPY, "SciPy", "SciPy (Qhull) implementation, much faster on big sets of points", 1))
+
+    implementation: EnumProperty(
+        name = "Implementation",
+        items = implementations,
+        default = FORTUNE,
+        update = updateNode)
+
     iterations : IntProperty(
         name = "Iterations",
         description = "Number of Lloyd algorithm iterations",
@@ -51,8 +62,11 @@ class SvLloyd2dNode(SverchCustomTreeNode, bpy.types.Node):
         self.inputs.new('SvStringsSocket', 'Iterations').prop_name = 'iterations'
         self.inputs.new('SvScalarFieldSocket', 'Weights').enable_input_link_menu = False
         self.outputs.new('SvVerticesSocket', "Vertices")
+        if scipy is not None:
+            self.implementation = SCIPY
 
     def draw_buttons(self, context, layout):
+        layout.prop(self, "implementation", text='')
         layout.label(text="Bounds mode:")
         layout.prop(self, "bound_mode", text='')
     
@@ -82,7 +96,8 @@ class SvLloyd2dNode(SverchCustomTreeNode, bpy.types.Node):
             new_verts = []
             for verts, iterations, weights in zip_long_repeat(*params):
                 iter_verts = lloyd2d(self.bound_mode, verts, iterations,
-                                clip = self.clip, weight_field = weights)
+                                clip = self.clip, weight_field = weights,
+                                implementation = self.implementation)
                 new_verts.append(iter_verts)
             if nested_output:
                 verts_out.append(new_verts)
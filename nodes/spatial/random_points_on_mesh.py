@@ -17,9 +17,8 @@ from mathutils.geometry import tessellate_polygon, area_tri
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, numpy_full_list
-from sverchok.utils.bvh_tree import bvh_tree_from_polygons
+from sverchok.utils.bvh_tree import bvh_tree_from_polygons, bvh_points_inside
 from sverchok.utils.geom import calc_bounds
-from sverchok.utils.sv_mesh_utils import point_inside_mesh
 
 def np_calc_tris_areas(v_pols):
     perp = np.cross(v_pols[:, 1]- v_pols[:, 0], v_pols[:, 2]- v_pols[:, 0])/2
@@ -75,8 +74,8 @@ def populate_mesh(verts, faces, count, seed, all_triangles, safe_check):
         if iterations > MAX_ITERATIONS:
             raise Exception("Iterations limit is reached")
         max_pts = max(count, count-done)
-        points = np.random.uniform(low, high, size=(max_pts, 3)).tolist()
-        points = [p for p in points if point_inside_mesh(bvh, p)]
+        points = np.random.uniform(low, high, size=(max_pts, 3))
+        points = points[bvh_points_inside(bvh, points)].tolist()
         n = len(points)
         result.extend(points)
         done += n
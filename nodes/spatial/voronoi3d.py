@@ -5,8 +5,6 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
-from collections import defaultdict
-
 import bpy
 from bpy.props import FloatProperty, EnumProperty, BoolProperty
 import bmesh
@@ -16,6 +14,7 @@ from sverchok.data_structure import updateNode, zip_long_repeat, get_data_nestin
 from sverchok.utils.sv_mesh_utils import polygons_to_edges, mesh_join
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata, bmesh_clip
 from sverchok.utils.geom import calc_bounds
+from sverchok.utils.voronoi3d import voronoi3d_regions
 from sverchok.dependencies import scipy
 
 if scipy is not None:
@@ -95,63 +94,6 @@ class SvExVoronoi3DNode(SverchCustomTreeNode, bpy.types.Node):
         layout.prop(self, "do_clip")
         layout.prop(self, "join")
 
-    def make_regions(self, diagram):
-        faces_per_site = defaultdict(list)
-        nsites = len(diagram.point_region)
-        nridges = len(diagram.ridge_points)
-        open_sites = set()
-        for ridge_idx in range(nridges):
-            site_idx_1, site_idx_2 = diagram.ridge_points[ridge_idx]
-            face = diagram.ridge_vertices[ridge_idx]
-            if -1 in face:
-                open_sites.add(site_idx_1)
-                open_sites.add(site_idx_2)
-                continue
-            faces_per_site[site_idx_1].append(face)
-            faces_per_site[site_idx_2].append(face)
-
-        new_verts = []
-        new_edges = []
-        new_faces = []
-
-        for site_idx in sorted(faces_per_site.keys()):
-            if self.closed_only and site_idx in open_sites:
-                continue
-            done_verts = dict()
-            bm = bmesh.new()
-            new_vert = bm.verts.new
-            new_face = bm.faces.new
-            for face in faces_per_site[site_idx]:
-                face_bm_verts = []
-                for vertex_idx in face:
-                    if vertex_idx not in done_verts:
-                        bm_vert = new_vert(diagram.vertices[vertex_idx])
-                        done_verts[vertex_idx] = bm_vert
-                    else:
-                        bm_vert = done_verts[vertex_idx]
-                    face_bm_verts.append(bm_vert)
-                new_face(face_bm_verts)
-            bm.verts.index_update()
-            bm.verts.ensure_lookup_table()
-            bm.faces.index_update()
-            bm.edges.index_update()
-
-            if self.closed_only and any (v.is_boundary for v in bm.verts):
-                bm.free()
-                continue
-
-            if self.normals:
-                bm.normal_update()
-                bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
-
-            region_verts, region_edges, region_faces = pydata_from_bmesh(bm)
-            bm.free()
-            new_verts.append(region_verts)
-            new_edges.append(region_edges)
-            new_faces.append(region_faces)
-
-        return new_verts, new_edges, new_faces
-
     def split_ridges(self, vertices, edges, faces):
         result_verts = []
         result_edges = []
@@ -211,11 +153,10 @@ class SvExVoronoi3DNode(SverchCustomTreeNode, bpy.types.Node):
             if isinstance(clipping, (list, tuple)):
                 clipping = clipping[0]
 
-            diagram = Voronoi(sites)
-            if self.do_clip:
-                bounds = calc_bounds(sites, clipping)
-
             if self.out_mode == 'RIDGES':
+                diagram = Voronoi(sites)
+                if self.do_clip:
+                    bounds = calc_bounds(sites, clipping)
                 new_verts = diagram.vertices.tolist()
                 new_faces = [e for e in diagram.ridge_vertices if not -1 in e]
                 new_edges = polygons_to_edges([new_faces], True)[0]
@@ -233,14 +174,15 @@ class SvExVoronoi3DNode(SverchCustomTreeNode, bpy.types.Node):
                     edges_out.extend(new_edges)
                     faces_out.extend(new_faces)
             else: # REGIONS
-                new_verts, new_edges, new_faces = self.make_regions(diagram)
+                new_verts, new_edges, new_faces = voronoi3d_regions(sites,
+                        closed_only = self.closed_only,
+                        recalc_normals = self.normals,
+                        do_clip = self.do_clip, clipping = clipping)
                 if self.join:
                     new_verts, new_edges, new_faces = mesh_join(new_verts, new_edges, new_faces)
                     new_verts = [new_verts]
                     new_edges = [new_edges]
                     new_faces = [new_faces]
-                if self.do_clip:
-                    new_verts, new_edges, new_faces = self.clip_mesh(bounds, new_verts, new_edges, new_faces, fill=True)
                 verts_out.extend(new_verts)
                 edges_out.extend(new_edges)
                 faces_out.extend(new_faces)
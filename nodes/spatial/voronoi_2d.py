@@ -21,7 +21,8 @@ from bpy.props import FloatProperty, EnumProperty, BoolProperty, IntProperty
 
 from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode, zip_long_repeat
-from sverchok.utils.voronoi import voronoi_bounded
+from sverchok.utils.voronoi import voronoi_bounded, FORTUNE, SCIPY
+from sverchok.dependencies import scipy
 
 
 class Voronoi2DNode(SverchCustomTreeNode, bpy.types.Node):
@@ -50,6 +51,16 @@ class Voronoi2DNode(SverchCustomTreeNode, bpy.types.Node):
         default = 'BOX',
         update = updateNode)
 
+    implementations = [(FORTUNE, "Fortune", "Pure Python implementation of Fortune's algorithm", 0)]
+    if scipy is not None:
+        implementations.append((SCIPY, "SciPy", "SciPy (Qhull) implementation, much faster on big sets of points", 1))
+
+    implementation: EnumProperty(
+        name = "Implementation",
+        items = implementations,
+        default = FORTUNE,
+        update = updateNode)
+
     draw_bounds: BoolProperty(
         name = "Draw Bounds",
         description = "Draw bounding edges",
@@ -94,9 +105,12 @@ class Voronoi2DNode(SverchCustomTreeNode, bpy.types.Node):
         self.outputs.new('SvVerticesSocket', "Vertices")
         self.outputs.new('SvStringsSocket', "Edges")
         self.outputs.new('SvStringsSocket', "Faces")
+        if scipy is not None:
+            self.implementation = SCIPY
         self.update_sockets(context)
 
     def draw_buttons(self, context, layout):
+        layout.prop(self, "implementation", text='')
         layout.label(text="Bounds mode:")
         layout.prop(self, "bound_mode", text='')
         layout.prop(self, "draw_bounds")
@@ -138,7 +152,8 @@ class Voronoi2DNode(SverchCustomTreeNode, bpy.types.Node):
                         draw_hangs = self.draw_hangs,
                         make_faces = self.make_faces,
                         ordered_faces = self.ordered_faces,
-                        max_sides = max_sides)
+                        max_sides = max_sides,
+                        implementation = self.implementation)
 
             pts_out.append(new_vertices)
             edges_out.append(edges)
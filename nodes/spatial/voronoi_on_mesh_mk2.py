@@ -24,7 +24,7 @@ from sverchok.data_structure import updateNode, zip_long_repeat, ensure_nesting_
     ensure_min_nesting
 from sverchok.utils.sv_bmesh_utils import recalc_normals
 from sverchok.utils.sv_mesh_utils import mesh_join
-from sverchok.utils.voronoi3d import voronoi_on_mesh
+from sverchok.utils.voronoi3d import voronoi_on_mesh, CAN_CUT_CELLS_IN_PROCESSES
 import numpy as np
 
 
@@ -38,6 +38,7 @@ class SvVoronoiOnMeshNodeMK3(SverchCustomTreeNode, bpy.types.Node):
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_VORONOI'
     sv_dependencies = {'scipy'}
+    is_memoizable = True
 
     modes = [
             ('VOLUME', "Split Volume", "Split volume of the mesh into regions of Voronoi diagram", 0),
@@ -112,6 +113,13 @@ class SvVoronoiOnMeshNodeMK3(SverchCustomTreeNode, bpy.types.Node):
             min = 1,
             update = updateNode)
 
+    processes : IntProperty(
+            name = "Processes",
+            description = "Number of processes to cut the cells in parallel. It works only on Linux",
+            default = 1,
+            min = 1,
+            update = updateNode)
+
     def sv_init(self, context):
         self.inputs.new('SvVerticesSocket', 'Vertices')
         self.inputs.new('SvStringsSocket', 'Faces')
@@ -140,6 +148,8 @@ class SvVoronoiOnMeshNodeMK3(SverchCustomTreeNode, bpy.types.Node):
     def draw_buttons_ext(self, context, layout):
         self.draw_buttons(context, layout)
         layout.prop(self, 'accuracy')
+        if CAN_CUT_CELLS_IN_PROCESSES:
+            layout.prop(self, 'processes')
 
     def process(self):
 
@@ -218,7 +228,8 @@ class SvVoronoiOnMeshNodeMK3(SverchCustomTreeNode, bpy.types.Node):
                             mode = self.mode,
                             normal_update = self.normals,
                             precision = precision,
-                            mask = mask
+                            mask = mask,
+                            processes = self.processes
                             )
 
                 if self.join_mode == 'FLAT':
@@ -251,7 +251,7 @@ class SvExMarchingCubesNode(DraftMode, SverchCustomTreeNode, bpy.types.Node):
             else: # python
                 new_verts, new_faces = isosurface_np(func_values, value)
                 new_verts = self.scale_back(b1n, b2n, samples_x, samples_y, samples_z, new_verts)
-                new_verts = new_verts.tolist()
+                new_verts, new_faces = new_verts.tolist(), new_faces.tolist()
                 new_normals = []
 
             prev_field = field
@@ -20,6 +20,7 @@ class SvNurbsLoftNode(SverchCustomTreeNode, bpy.types.Node):
     bl_label = 'NURBS Loft'
     bl_icon = 'OUTLINER_OB_EMPTY'
     sv_icon = 'SV_SURFACE_FROM_CURVES'
+    is_memoizable = True
 
     u_knots_modes = [
             ('UNIFY', "Unify", "Unify knot vectors of curves by inserting knots into curves where needed", 0),
@@ -8,6 +8,7 @@
 
 from itertools import cycle
 
+import numpy as np
 from mathutils import Vector, Matrix
 from mathutils.geometry import tessellate_polygon as tessellate
 from mathutils.noise import random, seed_set
@@ -61,30 +62,75 @@ default_fragment_shader = '''
     }
 '''
 
+def convex_polygons_mask(points):
+    """
+    points: array of shape (n, k, 3), vertices of n polygons with k sides;
+    returns mask of polygons which are convex (all turns in the same
+    direction as the polygon's normal)
+    """
+    next_points = np.roll(points, -1, axis=1)
+    edges = next_points - points
+    normals = np.cross(points, next_points).sum(axis=1)
+    turns = np.einsum('nki,ni->nk', np.cross(edges, np.roll(edges, -1, axis=1)), normals)
+    tolerance = 1e-9 * np.abs(turns).max(axis=1, keepdims=True)
+    return np.all(turns >= -tolerance, axis=1)
+
+
 def ensure_triangles(coords, indices, handle_concave_quads):
     """
-    this fully tesselates the incoming topology into tris,
-    not optimized for meshes that don't contain ngons
+    this fully tesselates the incoming topology into tris.
+    Polygons of the same size are split into fans of triangles at once,
+    only concave polygons are tessellated one by one; quads are assumed
+    to be convex unless handle_concave_quads is set.
+    returns array of triangles and array of indices of their polygons
     """
+    if isinstance(indices, np.ndarray) and indices.ndim == 2:
+        groups = [(indices.shape[1], np.arange(len(indices)), indices)]
+    else:
+        lengths = np.fromiter(map(len, indices), dtype=np.int64, count=len(indices))
+        sizes = np.unique(lengths)
+        if len(sizes) == 1:
+            groups = [(sizes[0], np.arange(len(indices)), np.array(indices, dtype=np.int64))]
+        else:
+            groups = []
+            for num_verts in sizes:
+                face_idx = np.flatnonzero(lengths == num_verts)
+                groups.append((num_verts, face_idx, np.array([indices[i] for i in face_idx], dtype=np.int64)))
+
     new_indices = []
     face_index = []
-    concat = new_indices.append
-    concat2 = new_indices.extend
-    for idf, idxset in enumerate(indices):
-        num_verts = len(idxset)
-        if num_verts == 3:
-            concat(tuple(idxset))
-            face_index.append(idf)
-        elif num_verts == 4 and not handle_concave_quads:
-            # a b c d  ->  [a, b, c], [a, c, d]
-            concat2([(idxset[0], idxset[1], idxset[2]), (idxset[0], idxset[2], idxset[3])])
-            face_index.extend([idf, idf])
-        else:
-            subcoords = [Vector(coords[idx]) for idx in idxset]
-            for pol in tessellate([subcoords]):
-                concat([idxset[i] for i in pol])
-                face_index.append(idf)
-    return new_indices, face_index
+    for num_verts, face_idx, polygons in groups:
+        if num_verts < 3:
+            continue
+        if num_verts > 4 or (num_verts == 4 and handle_concave_quads):
+            convex = convex_polygons_mask(np.asarray(coords, dtype=np.float64)[polygons])
+            for idf, idxset in zip(face_idx[~convex], polygons[~convex]):
+                subcoords = [Vector(coords[idx]) for idx in idxset]
+                tris = tessellate([subcoords])
+                new_indices.append(idxset[np.array(tris, dtype=np.int64).reshape(-1, 3)])
+                face_index.append(np.full(len(tris), idf))
+            face_idx, polygons = face_idx[convex], polygons[convex]
+        # a b c d e  ->  [a, b, c], [a, c, d], [a, d, e]
+        fan = np.arange(1, num_verts - 1)
+        tris = np.empty((len(polygons), num_verts - 2, 3), dtype=np.int64)
+        tris[:, :, 0] = polygons[:, :1]
+        tris[:, :, 1] = polygons[:, fan]
+        tris[:, :, 2] = polygons[:, fan + 1]
+        new_indices.append(tris.reshape(-1, 3))
+        face_index.append(np.repeat(face_idx, num_verts - 2))
+
+    if not new_indices:
+        return np.empty((0, 3), dtype=np.int64), np.empty(0, dtype=np.int64)
+    new_indices = np.concatenate(new_indices)
+    face_index = np.concatenate(face_index)
+    order = np.argsort(face_index, kind='stable')
+    return new_indices[order], face_index[order]
+
+
+def colors_array(colors):
+    """colors as array of shape (n, 4)"""
+    colors = np.asarray(colors, dtype=np.float32)
+    return colors.reshape(-1, colors.shape[-1]) if colors.size else colors.reshape(0, 4)
 
 
 def fill_points_colors(vectors_color, data, color_per_point, random_colors):
@@ -92,23 +138,20 @@ def fill_points_colors(vectors_color, data, color_per_point, random_colors):
     if color_per_point:
         for cols, sub_data in zip(cycle(vectors_color), data):
             if random_colors:
-                for  n in sub_data:
-                    points_color.append([random(), random(), random(), 1])
+                points_color.append(colors_array([[random(), random(), random(), 1] for n in sub_data]))
             else:
-                for col, n in zip(cycle(cols), sub_data):
-                    points_color.append(col)
+                cols = colors_array(cols)
+                points_color.append(cols[np.arange(len(sub_data)) % len(cols)])
 
     else:
         for nums, col in zip(data, cycle(vectors_color[0])):
             if random_colors:
-                r_color = [random(), random(), random(), 1]
-                for n in nums:
-                    points_color.append(r_color)
-            else:
-                for n in nums:
-                    points_color.append(col)
+                col = [random(), random(), random(), 1]
+            points_color.append(np.repeat(colors_array(col), len(nums), axis=0))
 
-    return points_color
+    if not points_color:
+        return np.empty((0, 4), dtype=np.float32)
+    return np.concatenate(points_color)
 
 def draw_matrix(context, args):
     """ this takes one or more matrices packed into an iterable """
@@ -120,36 +163,31 @@ def draw_matrix(context, args):
 
 def view_3d_geom(context, args):
     """
-    draws the batches
+    draws the batches, they are created by create_batches once per update
+    of the node, so redrawing viewport (camera orbits etc) only binds
+    shaders and draws
     """
 
     geom, config = args
 
     bgl.glEnable(bgl.GL_BLEND)
 
-    if config.draw_polys:
+    if config.draw_polys and geom.p_batch is not None:
         if config.draw_gl_wireframe:
             bgl.glPolygonMode(bgl.GL_FRONT_AND_BACK, bgl.GL_LINE)
         if config.draw_gl_polygonoffset:
             bgl.glEnable(bgl.GL_POLYGON_OFFSET_FILL)
             bgl.glPolygonOffset(1.0, 1.0)
 
+        config.p_shader.bind()
         if config.shade_mode == 'fragment':
-            p_batch = batch_for_shader(config.p_shader, 'TRIS', {"position": geom.p_vertices}, indices=geom.p_indices)
-            config.p_shader.bind()
             matrix = context.region_data.perspective_matrix
             config.p_shader.uniform_float("viewProjectionMatrix", matrix)
             config.p_shader.uniform_float("brightness", 0.5)
-        else:
-            if config.uniform_pols:
-                p_batch = batch_for_shader(config.p_shader, 'TRIS', {"pos": geom.p_vertices}, indices=geom.p_indices)
-                config.p_shader.bind()
-                config.p_shader.uniform_float("color", config.poly_color[0][0])
-            else:
-                p_batch = batch_for_shader(config.p_shader, 'TRIS', {"pos": geom.p_vertices, "color": geom.p_vertex_colors}, indices=geom.p_indices)
-                config.p_shader.bind()
+        elif config.uniform_pols:
+            config.p_shader.uniform_float("color", config.poly_color[0][0])
 
-        p_batch.draw(config.p_shader)
+        geom.p_batch.draw(config.p_shader)
 
         if config.draw_gl_polygonoffset:
             bgl.glDisable(bgl.GL_POLYGON_OFFSET_FILL)
@@ -157,12 +195,11 @@ def view_3d_geom(context, args):
             bgl.glPolygonMode(bgl.GL_FRONT_AND_BACK, bgl.GL_FILL)
 
 
-    if config.draw_edges:
+    if config.draw_edges and geom.e_batch is not None:
         bgl.glLineWidth(config.line_width)
 
         if config.draw_dashed:
             shader = config.dashed_shader
-            batch = batch_for_shader(shader, 'LINES', {"inPos" : geom.e_vertices}, indices=geom.e_indices)
             shader.bind()
             matrix = context.region_data.perspective_matrix
             shader.uniform_float("u_mvp", matrix)
@@ -170,153 +207,83 @@ def view_3d_geom(context, args):
             shader.uniform_float("u_dashSize", config.u_dash_size)
             shader.uniform_float("u_gapSize", config.u_gap_size)
             shader.uniform_float("m_color", geom.e_vertex_colors[0])
-            batch.draw(shader)
+            geom.e_batch.draw(shader)
         else:
+            config.e_shader.bind()
             if config.uniform_edges:
-                e_batch = batch_for_shader(config.e_shader, 'LINES', {"pos": geom.e_vertices}, indices=geom.e_indices)
-                config.e_shader.bind()
                 config.e_shader.uniform_float("color", config.edge_color[0][0])
-                e_batch.draw(config.e_shader)
-            else:
-                e_batch = batch_for_shader(config.e_shader, 'LINES', {"pos": geom.e_vertices, "color": geom.e_vertex_colors}, indices=geom.e_indices)
-                config.e_shader.bind()
-                e_batch.draw(config.e_shader)
+            geom.e_batch.draw(config.e_shader)
 
         bgl.glLineWidth(1)
 
-    if config.draw_verts:
-        if geom.v_vertices and (len(geom.v_vertices[0])==3):
-            bgl.glPointSize(config.point_size)
-            if config.uniform_verts:
-                v_batch = batch_for_shader(config.v_shader, 'POINTS', {"pos": geom.v_vertices})
-                config.v_shader.bind()
-                config.v_shader.uniform_float("color", config.vector_color[0][0])
-            else:
-                v_batch = batch_for_shader(config.v_shader, 'POINTS', {"pos": geom.v_vertices, "color": geom.points_color})
-                config.v_shader.bind()
+    if config.draw_verts and geom.v_batch is not None:
+        bgl.glPointSize(config.point_size)
+        config.v_shader.bind()
+        if config.uniform_verts:
+            config.v_shader.uniform_float("color", config.vector_color[0][0])
 
-            v_batch.draw(config.v_shader)
-            bgl.glPointSize(1)
+        geom.v_batch.draw(config.v_shader)
+        bgl.glPointSize(1)
 
     bgl.glDisable(bgl.GL_BLEND)
 
 
 def splitted_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset):
     '''geometry of the splitted polygons (splitted to assign colors)'''
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-    cols_len = len(cols)
-    indices_append = indices.append
-    p_vertices_extend = p_vertices.extend
-    vertex_colors_extend = vertex_colors.extend
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices_extend([v_path[c] for c in pol])
-        color = cols[idx % cols_len]
-        # vertex_colors.extend([cols[idx % cols_len] for c in pol])
-        vertex_colors_extend([color, color, color])
-        pol_offset = idx_offset + total_p_verts
-        indices_append([pol_offset, pol_offset + 1, pol_offset + 2])
-        total_p_verts += 3
+    cols = colors_array(cols)
+    p_vertices = v_path[polygon_indices].reshape(-1, 3)
+    vertex_colors = np.repeat(cols[original_idx % len(cols)], 3, axis=0)
+    total_p_verts = len(p_vertices)
+    indices = np.arange(idx_offset, idx_offset + total_p_verts).reshape(-1, 3)
 
     return p_vertices, vertex_colors, indices, total_p_verts
 
 
 def splitted_facet_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset, light_factor):
     '''geometry of the splitted polygons (splitted to assign colors* normals)'''
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-    cols_len = len(cols)
-    indices_append = indices.append
-    p_vertices_extend = p_vertices.extend
-    vertex_colors_extend = vertex_colors.extend
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices_extend([v_path[c] for c in pol])
-        factor = light_factor[idx]
-
-        col = cols[idx % cols_len]
-        col_pol = [col[0] * factor, col[1] * factor, col[2] * factor, col[3]]
-
-        vertex_colors_extend([col_pol, col_pol, col_pol])
-        pol_offset = idx_offset + total_p_verts
-
-        indices_append([pol_offset, pol_offset + 1, pol_offset + 2])
-        total_p_verts += 3
+    p_vertices, vertex_colors, indices, total_p_verts = splitted_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset)
+    vertex_colors[:, :3] *= np.repeat(light_factor[original_idx], 3)[:, np.newaxis]
 
     return p_vertices, vertex_colors, indices, total_p_verts
 
 
 def splitted_facet_polygons_geom_v_cols(polygon_indices, original_idx, v_path, cols, idx_offset, light_factor):
     '''geometry of the splitted polygons (splitted to assign vertex_colors * face_normals)'''
-
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-    cols_len = len(cols)
-    indices_append = indices.append
-    p_vertices_extend = p_vertices.extend
-    vertex_colors_extend = vertex_colors.extend
-
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices_extend([v_path[c] for c in pol])
-        factor = light_factor[idx]
-        colors = []
-
-        for c in pol:
-            col = cols[c % cols_len]
-            colors.append([col[0] * factor, col[1] * factor, col[2] * factor, col[3]])
-
-        vertex_colors_extend(colors)
-        pol_offset = idx_offset + total_p_verts
-        indices_append([pol_offset, pol_offset + 1, pol_offset + 2])
-        total_p_verts += 3
+    cols = colors_array(cols)
+    p_vertices = v_path[polygon_indices].reshape(-1, 3)
+    vertex_colors = cols[polygon_indices.ravel() % len(cols)]
+    vertex_colors[:, :3] *= np.repeat(light_factor[original_idx], 3)[:, np.newaxis]
+    total_p_verts = len(p_vertices)
+    indices = np.arange(idx_offset, idx_offset + total_p_verts).reshape(-1, 3)
 
     return p_vertices, vertex_colors, indices, total_p_verts
 
 
 def splitted_smooth_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset, light_factor):
     '''geometry of the splitted polygons (splitted to assign face_colors * vertex_normals)'''
-
-    total_p_verts = 0
-    p_vertices, vertex_colors, indices = [], [], []
-    cols_len = len(cols)
-    indices_append = indices.append
-    p_vertices_extend = p_vertices.extend
-    vertex_colors_extend = vertex_colors.extend
-
-    for pol, idx in zip(polygon_indices, original_idx):
-        p_vertices_extend([v_path[c] for c in pol])
-        colors = []
-        col = cols[idx % cols_len]
-        for c in pol:
-
-            factor = light_factor[c]
-            colors.append([col[0] * factor, col[1] * factor, col[2] * factor, col[3]])
-
-        vertex_colors_extend(colors)
-        pol_offset = idx_offset + total_p_verts
-        indices_append([pol_offset, pol_offset + 1, pol_offset + 2])
-        total_p_verts += 3
-
+    p_vertices, vertex_colors, indices, total_p_verts = splitted_polygons_geom(polygon_indices, original_idx, v_path, cols, idx_offset)
+    vertex_colors[:, :3] *= light_factor[polygon_indices.ravel()][:, np.newaxis]
 
     return p_vertices, vertex_colors, indices, total_p_verts
 
 
 
 def face_light_factor(vecs, polygons, light):
-    return (np_dot(pols_normals(vecs, polygons, output_numpy=True), light)*0.5+0.5).tolist()
+    return np_dot(pols_normals(vecs, polygons, output_numpy=True), light)*0.5+0.5
 
 def vert_light_factor(vecs, polygons, light):
-    return (np_dot(np_vertex_normals(vecs, polygons, output_numpy=True), light)*0.5+0.5).tolist()
+    return np_dot(np_vertex_normals(vecs, polygons, output_numpy=True), light)*0.5+0.5
 
 def polygons_geom(config, vecs, polygons, p_vertices, p_vertex_colors, p_indices, v_path, p_cols, idx_p_offset, points_colors):
     '''generates polygons geometry'''
 
-    if (config.color_per_polygon and not config.polygon_use_vertex_color) or config.shade_mode == 'facet':
-        if config.all_triangles:
-            polygon_indices = polygons
-            original_idx = list(range(len(polygons)))
-        else:
-            polygon_indices, original_idx = ensure_triangles(vecs, polygons, config.handle_concave_quads)
+    if config.all_triangles:
+        polygon_indices = np.asarray(polygons, dtype=np.int64).reshape(-1, 3)
+        original_idx = np.arange(len(polygon_indices))
+    else:
+        polygon_indices, original_idx = ensure_triangles(vecs, polygons, config.handle_concave_quads)
 
+    if (config.color_per_polygon and not config.polygon_use_vertex_color) or config.shade_mode == 'facet':
 
         if config.shade_mode == 'facet':
             light_factor = face_light_factor(vecs, polygons, config.vector_light)
@@ -327,73 +294,65 @@ def polygons_geom(config, vecs, polygons, p_vertices, p_vertex_colors, p_indices
                 p_v, v_c, idx, total_p_verts = splitted_facet_polygons_geom(polygon_indices, original_idx, v_path, p_cols, idx_p_offset[0], light_factor)
 
         elif config.shade_mode == 'smooth':
-
             light_factor = vert_light_factor(vecs, polygons, config.vector_light)
             p_v, v_c, idx, total_p_verts = splitted_smooth_polygons_geom(polygon_indices, original_idx, v_path, p_cols, idx_p_offset[0], light_factor)
 
         else:
             p_v, v_c, idx, total_p_verts = splitted_polygons_geom(polygon_indices, original_idx, v_path, p_cols, idx_p_offset[0])
 
-        p_vertices.extend(p_v)
-        p_vertex_colors.extend(v_c)
-        p_indices.extend(idx)
+        p_vertices.append(p_v)
+        p_vertex_colors.append(v_c)
+        p_indices.append(idx)
     else:
-        if config.all_triangles:
-            polygon_indices = polygons
-            original_idx = list(range(len(polygons)))
-        else:
-            polygon_indices, original_idx = ensure_triangles(vecs, polygons, config.handle_concave_quads)
-        p_vertices.extend(v_path)
+        p_vertices.append(v_path)
 
         if config.shade_mode == 'smooth':
 
             light_factor = vert_light_factor(vecs, polygons, config.vector_light)
-            colors = []
             if config.polygon_use_vertex_color:
-                for l_factor, col in zip(light_factor, points_colors):
-                    colors.append([col[0]*l_factor, col[1]*l_factor, col[2]*l_factor, col[3]])
+                n = min(len(light_factor), len(points_colors))
+                colors = points_colors[:n].copy()
+                light_factor = light_factor[:n]
             else:
-                col = p_cols
-                for l_factor in light_factor:
-                    # factor = normal_v.dot(config.vector_light)*0.5+0.5
-                    colors.append([col[0]*l_factor, col[1]*l_factor, col[2]*l_factor, col[3]])
-            p_vertex_colors.extend(colors)
-        else:
-            if not config.uniform_pols:
-                p_vertex_colors.extend([p_cols for v in v_path])
-        if idx_p_offset[0]:
-            p_indices.extend([[c + idx_p_offset[0] for c in p] for p in polygon_indices])
+                colors = np.repeat(colors_array(p_cols), len(light_factor), axis=0)
+            colors[:, :3] *= light_factor[:, np.newaxis]
+            p_vertex_colors.append(colors)
         else:
-            p_indices.extend(polygon_indices)
+            if not config.uniform_pols and not config.polygon_use_vertex_color:
+                p_vertex_colors.append(np.repeat(colors_array(p_cols), len(v_path), axis=0))
+        p_indices.append(polygon_indices + idx_p_offset[0])
         total_p_verts = len(vecs)
     idx_p_offset[0] += total_p_verts
 
 
 def edges_geom(config, edges, e_col, v_path, e_vertices, e_vertex_colors, e_indices, idx_e_offset):
     '''generates edges geometry'''
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
     if config.color_per_edge and not config.edges_use_vertex_color:
-        start_idx = len(e_vertices)
-        for (idx0, idx1), col in zip(edges, cycle(e_col)):
-            e_vertices.extend([v_path[idx0], v_path[idx1]])
-            e_vertex_colors.extend([col, col])
-            e_indices.append([start_idx, start_idx+1])
-            start_idx +=2
+        e_col = colors_array(e_col)
+        e_vertices.append(v_path[edges].reshape(-1, 3))
+        e_vertex_colors.append(np.repeat(e_col[np.arange(len(edges)) % len(e_col)], 2, axis=0))
+        e_indices.append(np.arange(idx_e_offset[0], idx_e_offset[0] + 2 * len(edges)).reshape(-1, 2))
+        idx_e_offset[0] += 2 * len(edges)
 
     else:
-        e_vertices.extend(v_path)
-        if not config.edges_use_vertex_color or not config.uniform_edges:
-            e_vertex_colors.extend([e_col for v in v_path])
-        if idx_e_offset[0]:
-            offset = idx_e_offset[0]
-            e_indices.extend([[c + offset for c in e] for e in edges])
-        else:
-            e_indices.extend(edges)
+        e_vertices.append(v_path)
+        if not config.edges_use_vertex_color:
+            e_vertex_colors.append(np.repeat(colors_array(e_col), len(v_path), axis=0))
+        e_indices.append(edges + idx_e_offset[0])
 
         idx_e_offset[0] += len(v_path)
 
 
+def pack(arrays, shape, dtype):
+    """concatenates parts of geometry into one contiguous array"""
+    if not arrays:
+        return np.empty((0, ) + shape, dtype=dtype)
+    return np.ascontiguousarray(np.concatenate(arrays), dtype=dtype)
+
+
 def generate_mesh_geom(config, vecs_in):
-    '''generates drawing from mesh data'''
+    '''generates drawing from mesh data, as contiguous arrays'''
     geom = lambda: None
 
     if not config.color_per_point and len(config.vector_color) == 1 and len(config.vector_color[0]) == 1:
@@ -440,14 +399,16 @@ def generate_mesh_geom(config, vecs_in):
     if (config.draw_verts and not config.uniform_verts) or (config.draw_edges and config.edges_use_vertex_color) or (config.draw_polys and config.polygon_use_vertex_color):
         points_color = fill_points_colors(config.vector_color, vecs_in, config.color_per_point, config.random_colors)
     else:
-        points_color = []
+        points_color = np.empty((0, 4), dtype=np.float32)
 
     for vecs, mat, polygons, edges, p_cols, e_col in zip(vecs_in, mats_in, cycle(polygons_s), cycle(edges_s), cycle(pol_color), cycle(edge_color)):
+        v_path = np.asarray(vecs, dtype=np.float64)
+        if not v_path.size:
+            v_path = v_path.reshape(0, 3)
         if use_matrix:
-            v_path = [(mat @ Vector(v))[:] for v in vecs]
-        else:
-            v_path = vecs
-        v_vertices.extend(v_path)
+            mat = np.array(mat)
+            v_path = v_path @ mat[:3, :3].T + mat[:3, 3]
+        v_vertices.append(v_path)
         if config.draw_edges:
             edges_geom(config, edges, e_col, v_path, e_vertices, e_vertex_colors, e_indices, idx_e_offset)
         if config.draw_polys:
@@ -460,9 +421,15 @@ def generate_mesh_geom(config, vecs_in):
         else:
             shader_name = f'{"3D_" if bpy.app.version < (3, 4) else ""}SMOOTH_COLOR'
             config.v_shader = gpu.shader.from_builtin(shader_name)
-        geom.v_vertices, geom.points_color = v_vertices, points_color
+        geom.points_color = points_color
+        if all(v.ndim == 2 and v.shape[1] == 3 for v in v_vertices):
+            geom.v_vertices = pack(v_vertices, (3, ), np.float32)
+        else:
+            # points which are not 3D are not drawn
+            geom.v_vertices = np.empty((0, 3), dtype=np.float32)
 
     if config.draw_edges:
+        e_vertex_colors = pack(e_vertex_colors, (4, ), np.float32)
         if config.edges_use_vertex_color and e_vertices:
             e_vertex_colors = points_color
         if config.uniform_edges:
@@ -471,37 +438,73 @@ def generate_mesh_geom(config, vecs_in):
         else:
             shader_name = f'{"3D_" if bpy.app.version < (3, 4) else ""}SMOOTH_COLOR'
             config.e_shader = gpu.shader.from_builtin(shader_name)
-        geom.e_vertices, geom.e_vertex_colors, geom.e_indices = e_vertices, e_vertex_colors, e_indices
+        geom.e_vertices = pack(e_vertices, (3, ), np.float32)
+        geom.e_vertex_colors = e_vertex_colors
+        geom.e_indices = pack(e_indices, (2, ), np.int32)
 
+    if config.draw_polys:
+        p_vertex_colors = pack(p_vertex_colors, (4, ), np.float32)
+        if config.shade_mode != 'fragment':
+            if config.uniform_pols:
+                shader_name = f'{"3D_" if bpy.app.version < (3, 4) else ""}UNIFORM_COLOR'
+                config.p_shader = gpu.shader.from_builtin(shader_name)
+            else:
+                if config.polygon_use_vertex_color and config.shade_mode not in ['facet', 'smooth']:
+                    p_vertex_colors = points_color
+                shader_name = f'{"3D_" if bpy.app.version < (3, 4) else ""}SMOOTH_COLOR'
+                config.p_shader = gpu.shader.from_builtin(shader_name)
 
-    if config.draw_polys and config.shade_mode != 'fragment':
-        if config.uniform_pols:
-            shader_name = f'{"3D_" if bpy.app.version < (3, 4) else ""}UNIFORM_COLOR'
-            config.p_shader = gpu.shader.from_builtin(shader_name)
         else:
-            if config.polygon_use_vertex_color and config.shade_mode not in ['facet', 'smooth']:
-                p_vertex_colors = points_color
-            shader_name = f'{"3D_" if bpy.app.version < (3, 4) else ""}SMOOTH_COLOR'
-            config.p_shader = gpu.shader.from_builtin(shader_name)
-        geom.p_vertices, geom.p_vertex_colors, geom.p_indices = p_vertices, p_vertex_colors, p_indices
+            config.draw_fragment_function = None
+
+            # double reload, for testing.
+            ND = config.node.node_dict.get(hash(config.node))
+            if not ND:
+                if config.node.custom_shader_location in bpy.data.texts:
+                    config.node.populate_node_with_custom_shader_from_text()
+                    ND = config.node.node_dict.get(hash(config.node))
+
+            if ND and ND.get('draw_fragment'):
+                config.draw_fragment_function = ND.get('draw_fragment')
+                config.p_shader = gpu.types.GPUShader(config.node.custom_vertex_shader, config.node.custom_fragment_shader)
+            else:
+                config.p_shader = gpu.types.GPUShader(default_vertex_shader, default_fragment_shader)
+        geom.p_vertices = pack(p_vertices, (3, ), np.float32)
+        geom.p_vertex_colors = p_vertex_colors
+        geom.p_indices = pack(p_indices, (3, ), np.int32)
+
+    return geom
 
-    elif config.shade_mode == 'fragment' and config.draw_polys:
 
-        config.draw_fragment_function = None
+def create_batches(config, geom):
+    '''
+    uploads geometry to GPU batches, it's done once per update of the node,
+    not on each redraw of the viewport
+    '''
+    geom.p_batch = geom.e_batch = geom.v_batch = None
 
-        # double reload, for testing.
-        ND = config.node.node_dict.get(hash(config.node))
-        if not ND:
-            if config.node.custom_shader_location in bpy.data.texts:
-                config.node.populate_node_with_custom_shader_from_text()
-                ND = config.node.node_dict.get(hash(config.node))
+    if config.draw_polys and len(geom.p_indices):
+        if config.shade_mode == 'fragment':
+            content = {"position": geom.p_vertices}
+        elif config.uniform_pols:
+            content = {"pos": geom.p_vertices}
+        else:
+            content = {"pos": geom.p_vertices, "color": geom.p_vertex_colors}
+        geom.p_batch = batch_for_shader(config.p_shader, 'TRIS', content, indices=geom.p_indices)
 
-        if ND and ND.get('draw_fragment'):
-            config.draw_fragment_function = ND.get('draw_fragment')
-            config.p_shader = gpu.types.GPUShader(config.node.custom_vertex_shader, config.node.custom_fragment_shader)
+    if config.draw_edges and len(geom.e_indices):
+        if config.draw_dashed:
+            geom.e_batch = batch_for_shader(config.dashed_shader, 'LINES', {"inPos" : geom.e_vertices}, indices=geom.e_indices)
+        elif config.uniform_edges:
+            geom.e_batch = batch_for_shader(config.e_shader, 'LINES', {"pos": geom.e_vertices}, indices=geom.e_indices)
+        else:
+            geom.e_batch = batch_for_shader(config.e_shader, 'LINES', {"pos": geom.e_vertices, "color": geom.e_vertex_colors}, indices=geom.e_indices)
+
+    if config.draw_verts and len(geom.v_vertices):
+        if config.uniform_verts:
+            geom.v_batch = batch_for_shader(config.v_shader, 'POINTS', {"pos": geom.v_vertices})
         else:
-            config.p_shader = gpu.types.GPUShader(default_vertex_shader, default_fragment_shader)
-        geom.p_vertices, geom.p_vertex_colors, geom.p_indices = p_vertices, p_vertex_colors, p_indices
+            geom.v_batch = batch_for_shader(config.v_shader, 'POINTS', {"pos": geom.v_vertices, "color": geom.points_color})
 
     return geom
 
@@ -922,6 +925,7 @@ class SvViewerDrawMk4(SverchCustomTreeNode, bpy.types.Node):
                 config.edges = polygons_to_edges_np(polygons, unique_edges=True)
 
             geom = generate_mesh_geom(config, vecs)
+            create_batches(config, geom)
 
 
             draw_data = {
@@ -29,6 +29,10 @@ else:
 # names from other modules
 sv_dependencies, pip, ensurepip, draw_message, get_icon = [None] * 5
 set_frame_change = None
+set_socket_copy_mode = None
+set_socket_cache_budget = None
+set_node_memo_size = None
+set_tracing_buffer_size = None
 draw_extra_addons = None
 apply_theme, rebuild_color_cache, color_callback = [None] * 3
 
@@ -213,6 +217,18 @@ class SverchokPreferences(AddonPreferences):
     def set_frame_change(self, context):
         set_frame_change(self.frame_change_mode)
 
+    def set_socket_copy_mode(self, context):
+        set_socket_copy_mode(self.socket_copy_mode)
+
+    def set_socket_cache_budget(self, context):
+        set_socket_cache_budget(self.socket_cache_budget)
+
+    def set_node_memo_size(self, context):
+        set_node_memo_size(self.node_memo_size)
+
+    def set_tracing_buffer_size(self, context):
+        set_tracing_buffer_size(self.tracing_buffer_size)
+
     def update_theme(self, context):
         rebuild_color_cache()
         if self.auto_apply_theme:
@@ -255,6 +271,11 @@ class SverchokPreferences(AddonPreferences):
             description = "Show some additional panels or features useful for Sverchok developers only",
             default = False)
 
+    tracing_buffer_size: IntProperty(name = "Traced updates",
+            description = "Number of last tree updates kept by the update tracer",
+            default = 10, min = 1,
+            update = set_tracing_buffer_size)
+
     #  theme settings
     themes = [("default_theme", "Default", "Default"),
               ("nipon_blossom", "Nipon Blossom", "Nipon Blossom"),
@@ -320,6 +341,43 @@ class SverchokPreferences(AddonPreferences):
         default="POST",
         update=set_frame_change)
 
+    #  tree update
+
+    max_update_workers: IntProperty(
+        name="Max update workers",
+        default=0, min=0,
+        description="Maximum number of threads used by parallel update of node trees, "
+                    "0 means to use number of CPU cores")
+
+    socket_copy_modes = [
+        ("DEEP_COPY", "Deep copy", "Nodes get full copy of input data", 0),
+        ("COPY_ON_WRITE", "Copy on write",
+         "Nested lists are copied only when a node accesses them, arrays are read only", 1),
+        ("DEBUG", "Debug", "Copy on write and log nodes which change their input data", 2),
+    ]
+
+    socket_copy_mode: EnumProperty(
+        items=socket_copy_modes,
+        name="Input data",
+        description="How input data of nodes is protected from changes",
+        default="DEEP_COPY",
+        update=set_socket_copy_mode)
+
+    socket_cache_budget: IntProperty(
+        name="Socket data budget (MB)",
+        default=0, min=0,
+        description="Approximate maximum of memory used by socket data. Data which is not "
+                    "needed by other nodes is removed and recalculated when it is read again. "
+                    "0 means unlimited",
+        update=set_socket_cache_budget)
+
+    node_memo_size: IntProperty(
+        name="Node memo size (MB)",
+        default=0, min=0,
+        description="Memory for remembering outputs of expensive nodes to skip their "
+                    "recalculation when inputs and properties repeat. 0 disables the memo",
+        update=set_node_memo_size)
+
     #  Menu settings
 
     show_icons: BoolProperty(
@@ -492,11 +550,16 @@ class SverchokPreferences(AddonPreferences):
         col2 = col_split.split().column()
         col2.label(text="Frame change handler:")
         col2.row().prop(self, "frame_change_mode", expand=True)
+        col2.prop(self, "max_update_workers")
+        col2.prop(self, "socket_copy_mode")
+        col2.prop(self, "socket_cache_budget")
+        col2.prop(self, "node_memo_size")
         col2.separator()
 
         col2box = col2.box()
         col2box.label(text="Debug:")
         col2box.prop(self, "developer_mode")
+        col2box.prop(self, "tracing_buffer_size")
 
         log_box = col2.box()
         log_box.label(text="Logging:")
@@ -0,0 +1,25 @@
+import sverchok.core.tasks as ts
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.batch_evaluation import BatchEvaluator
+
+
+class BatchEvaluationTests(SverchokTestCase):
+    def test_evaluate(self):
+        with self.temporary_node_tree("BatchTree") as tree:
+            # the evaluator should suppress tree events without turning processing off
+            tree.sv_process = True
+            range_node = tree.nodes.new('SvGenNumberRange')
+            range_node.name = 'Range'
+            map_node = tree.nodes.new('SvMapRangeNode')
+            tree.links.new(range_node.outputs[0], map_node.inputs['Value'])
+            ts.tasks.cancel()
+
+            evaluator = BatchEvaluator(tree, ['Range|Range'])
+            data = evaluator.evaluate({'nodes': {'Range': {'stop_float': 3}}})
+            self.assertEqual(data, {'Range|Range': [[0.0, 1.0, 2.0]]})
+            data = evaluator.evaluate({'nodes': {'Range': {'stop_float': 2}}})
+            self.assertEqual(data, {'Range|Range': [[0.0, 1.0]]})
+            self.assertEqual(evaluator.evaluate(), data)
+
+            self.assertTrue(tree.sv_process)
+            self.assertFalse(ts.tasks)  # the tree was not scheduled for evaluation
@@ -0,0 +1,35 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.bvh_tree import bvh_tree_from_polygons, bvh_find_nearest, bvh_ray_cast, bvh_points_inside
+
+
+class BvhBatchedQueriesTests(SverchokTestCase):
+    verts = [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    points = np.array([(0, 0, 0), (0.2, -0.5, 0.1), (2, 0, 0), (0, -3, 0.5), (1.5, 1.5, 1.5)])
+
+    def setUp(self):
+        self.bvh = bvh_tree_from_polygons(self.verts, self.faces)
+
+    def test_find_nearest(self):
+        locations, normals, indices, distances = bvh_find_nearest(self.bvh, self.points[1:])
+        expected = [(0.2, -1, 0.1), (1, 0, 0), (0, -1, 0.5), (1, 1, 1)]
+        self.assert_numpy_arrays_equal(locations, np.array(expected), precision=6)
+        self.assert_numpy_arrays_equal(distances, np.array([0.5, 1, 2, 0.75 ** 0.5]), precision=6)
+        self.assertTrue((indices >= 0).all())
+
+    def test_find_nearest_distance(self):
+        locations, normals, indices, distances = bvh_find_nearest(self.bvh, self.points, distance=1.5)
+        self.assertEqual(list(indices >= 0), [True, True, True, False, True])
+        self.assertTrue(np.isnan(locations[3]).all())
+        self.assertEqual(distances[3], np.inf)
+
+    def test_ray_cast(self):
+        locations, normals, indices, distances = bvh_ray_cast(self.bvh, self.points, (0, 0, 1))
+        self.assertEqual(list(indices >= 0), [True, True, False, False, False])
+        self.assert_numpy_arrays_equal(locations[:2], np.array([(0, 0, 1), (0.2, -0.5, 1)]), precision=6)
+
+    def test_points_inside(self):
+        inside = bvh_points_inside(self.bvh, self.points)
+        self.assertEqual(list(inside), [True, True, False, False, False])
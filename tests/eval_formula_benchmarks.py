@@ -0,0 +1,32 @@
+"""
+Benchmarks are not run together with tests, use
+$ ./run_tests.sh "eval_formula_benchmarks.py"
+"""
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.modules.eval_formula import compile_formula
+
+
+class CompiledFormulaBenchmark(SverchokTestCase):
+    points_number = [1000, 100000, 1000000]
+    formulas = ["sin(x) * y + x ** 2", "x if x > y else y * a"]
+
+    def test_evaluate_array(self):
+        for string in self.formulas:
+            formula = compile_formula(string)
+            for number in self.points_number:
+                xs, ys = np.random.default_rng(0).random((2, number))
+
+                start = perf_counter()
+                formula.evaluate_array(dict(x=xs, y=ys), dict(a=2), strict=True)
+                vectorized_time = perf_counter() - start
+
+                start = perf_counter()
+                formula._evaluate_elements(dict(x=xs, y=ys), dict(a=2), xs.shape)
+                elementwise_time = perf_counter() - start
+
+                self.info(f"'{string}', points={number}: vectorized={vectorized_time * 1000:.1f}ms, "
+                          f"per element={elementwise_time * 1000:.1f}ms")
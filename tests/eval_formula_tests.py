@@ -0,0 +1,66 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.modules.eval_formula import compile_formula, get_variables, safe_eval
+
+
+class CompiledFormulaTests(SverchokTestCase):
+    xs = np.linspace(-1, 2, 31)
+    ys = np.linspace(3, 0, 31)
+
+    def assert_same_as_elementwise(self, string):
+        formula = compile_formula(string)
+        result = formula.evaluate_array(dict(x=self.xs, y=self.ys), dict(a=2), strict=True)
+        expected = [safe_eval(string, dict(x=x, y=y, a=2)) for x, y in zip(self.xs.tolist(), self.ys.tolist())]
+        self.assertEqual(result.shape, self.xs.shape)
+        for value, expected_value in zip(result.tolist(), expected):
+            self.assertEqual(type(value), type(expected_value))
+            self.assertAlmostEqual(value, expected_value, places=12)
+        return formula
+
+    def test_vectorizable(self):
+        for string in ["x * a + sin(y)", "x if x > y else -y", "0 < x <= 1 and not y > 2",
+                       "max(x, y, 0.5) + floor(x)", "log(y + 1, a)", "abs(x) or y", "a"]:
+            with self.subTest(string=string):
+                formula = self.assert_same_as_elementwise(string)
+                self.assertTrue(formula.vectorizable)
+
+    def test_not_vectorizable(self):
+        for string in ["[x, y][1] + a", "sum([x, y])", "factorial(a) * x"]:
+            with self.subTest(string=string):
+                formula = self.assert_same_as_elementwise(string)
+                self.assertFalse(formula.vectorizable)
+
+    def test_strict_errors(self):
+        formula = compile_formula("1 / x")
+        with self.assertRaises(ZeroDivisionError):
+            formula.evaluate_array(dict(x=np.arange(3)), strict=True)
+        with np.errstate(divide='ignore'):
+            self.assertEqual(formula.evaluate_array(dict(x=np.arange(3))).tolist(), [np.inf, 1.0, 0.5])
+
+    def test_integers(self):
+        # int64 arrays would wrap around, python integers do not
+        result = compile_formula("x ** 40").evaluate_array(dict(x=np.arange(4)))
+        self.assertEqual(result.tolist(), [x ** 40 for x in range(4)])
+        big = np.array([3000000, 2**40, -2**63, 2**63 - 1])
+        for string in ["x * x * x", "x * y", "abs(y)", "-y", "x + 1", "sign(x) * x // 7"]:
+            for strict in [True, False]:
+                with self.subTest(string=string, strict=strict):
+                    result = compile_formula(string).evaluate_array(dict(x=big, y=big[::-1]), strict=strict)
+                    expected = [safe_eval(string, dict(x=x, y=y)) for x, y in zip(big.tolist(), big[::-1].tolist())]
+                    self.assertEqual(result.tolist(), expected)
+
+    def test_invalid_integers(self):
+        for string, x in [("x // 0", np.arange(3)), ("x % 0", np.arange(3)),
+                          ("int(x)", np.array([1.5, np.nan])), ("floor(x)", np.array([1.5, np.inf]))]:
+            with self.subTest(string=string):
+                with self.assertRaises((ArithmeticError, ValueError)):
+                    compile_formula(string).evaluate_array(dict(x=x))
+        result = compile_formula("sign(x)").evaluate_array(dict(x=np.array([-2.0, np.nan, 3.0])))
+        self.assertEqual(result.tolist(), [-1, 0, 1])
+
+    def test_variables(self):
+        self.assertEqual(get_variables("x + sin(y) + [g * 2 for g in z]"), {'x', 'y', 'z'})
+        self.assertIs(compile_formula("x + 1"), compile_formula("x + 1"))
+        with self.assertRaises(Exception):
+            compile_formula("x.__class__")
@@ -0,0 +1,42 @@
+"""
+Benchmarks are not run together with tests, use
+$ ./run_tests.sh "field_gradient_benchmarks.py"
+"""
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.field.scalar import (SvScalarField, SvScalarFieldPointDistance,
+            SvScalarFieldLaplacian, ScalarFieldCurvatureCalculator)
+
+
+class NumericField(SvScalarField):
+    """The same field without analytic derivatives"""
+    def __init__(self, field):
+        self.field = field
+
+    def evaluate_grid(self, xs, ys, zs):
+        return self.field.evaluate_grid(xs, ys, zs)
+
+
+class FieldGradientBenchmark(SverchokTestCase):
+    grid_sizes = [20, 50, 100]
+
+    def measure(self, name, function, *args):
+        start = perf_counter()
+        function(*args)
+        duration = perf_counter() - start
+        self.info(f"{name}: {duration * 1000:.1f}ms")
+
+    def test_distance_field(self):
+        falloff = lambda d: np.exp(-d * d)
+        field = SvScalarFieldPointDistance(np.array([0.5, 0.5, 0.5]), falloff=falloff)
+        for size in self.grid_sizes:
+            xs, ys, zs = [c.ravel() for c in np.meshgrid(*[np.linspace(0, 1, size)] * 3)]
+            for title, f in [("analytic", field), ("numeric", NumericField(field))]:
+                self.measure(f"Grid={size}^3, {title} gradient", f.gradient_grid, xs, ys, zs)
+                self.measure(f"Grid={size}^3, {title} laplacian",
+                             SvScalarFieldLaplacian(f, 0.001).evaluate_grid, xs, ys, zs)
+                self.measure(f"Grid={size}^3, {title} curvature",
+                             ScalarFieldCurvatureCalculator(f, 0.001).prepare, xs, ys, zs)
@@ -0,0 +1,109 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.modules.eval_formula import compile_formula
+from sverchok.utils.field.dual import SvDual, finite_differences
+from sverchok.utils.field.scalar import (SvScalarField, SvCoordinateScalarField,
+            SvScalarFieldBinOp, SvScalarFieldVectorizedFunction, SvScalarFieldPointDistance,
+            SvScalarFieldLambda, SvNegatedScalarField, SvScalarFieldLaplacian,
+            ScalarFieldCurvatureCalculator)
+from sverchok.utils.field.vector import (SvComposedVectorField, SvVectorFieldCrossProduct,
+            SvVectorFieldRotor)
+
+
+class CountingField(SvScalarField):
+    """Field which can be differentiated only numerically"""
+    def __init__(self, field):
+        self.field = field
+        self.calls = 0
+
+    def evaluate_grid(self, xs, ys, zs):
+        self.calls += 1
+        return self.field.evaluate_grid(xs, ys, zs)
+
+
+class FieldGradientTests(SverchokTestCase):
+    def setUp(self):
+        self.x, self.y, self.z = [SvCoordinateScalarField(c) for c in 'XYZ']
+        self.points = np.random.default_rng(0).random((100, 3)) + 0.1
+
+    def mul(self, field1, field2):
+        return SvScalarFieldBinOp(field1, field2, lambda a, b: a * b, "{0} * {1}")
+
+    def sin(self, field):
+        return SvScalarFieldVectorizedFunction(field, np.sin, "sin({0})")
+
+    def assert_close(self, arr1, arr2, tolerance):
+        self.assertLess(np.max(np.abs(arr1 - arr2)), tolerance)
+
+    def test_analytic_matches_numeric(self):
+        falloff = lambda d: np.exp(-d * d)
+        fields = [self.mul(self.x, self.sin(self.mul(self.y, self.z))),
+                  SvScalarFieldPointDistance(np.array([0.5, -1.0, 2.0]), falloff=falloff),
+                  SvScalarFieldPointDistance(np.array([0.5, -1.0, 2.0]), metric='CUSTOM', power=3),
+                  SvCoordinateScalarField('SPH_THETA')]
+        for field in fields:
+            with self.subTest(field=field):
+                expected = CountingField(field).hessian_grid(*self.points.T, step=1e-4)
+                value = field.hessian_grid(*self.points.T, step=1e-4)
+                self.assert_close(value.value, expected.value, 1e-12)
+                self.assert_close(value.grad, expected.grad, 1e-6)
+                self.assert_close(value.hess, expected.hess, 1e-3)
+
+    def test_numeric_fallback(self):
+        field = CountingField(self.mul(self.x, self.y))
+        dx, dy, dz = field.gradient_grid(*self.points.T)
+        self.assertEqual(field.calls, 7)
+        xs, ys, zs = self.points.T
+        self.assert_numpy_arrays_equal(dx, ys, precision=8)
+        self.assert_numpy_arrays_equal(dy, xs, precision=8)
+        self.assert_numpy_arrays_equal(dz, np.zeros_like(zs), precision=8)
+
+    def test_formula(self):
+        formula = compile_formula("x * exp(y) + z ** 2")
+        function = lambda x, y, z, V: formula.evaluate_array(dict(x=x, y=y, z=z, V=V), {})
+        field = SvScalarFieldLambda(None, ['x', 'y', 'z'], None, function)
+        dx, dy, dz = field.gradient_grid(*self.points.T)
+        xs, ys, zs = self.points.T
+        self.assert_numpy_arrays_equal(dx, np.exp(ys), precision=12)
+        self.assert_numpy_arrays_equal(dy, xs * np.exp(ys), precision=12)
+        self.assert_numpy_arrays_equal(dz, 2 * zs, precision=12)
+
+    def test_formula_conditions(self):
+        # and, or with operands which are not booleans
+        formula = compile_formula("(x and y) * z + (x or z) * y + (z if y else x)")
+        function = lambda x, y, z, V: formula.evaluate_array(dict(x=x, y=y, z=z, V=V), {})
+        field = SvScalarFieldLambda(None, ['x', 'y', 'z'], None, function)
+        points = np.vstack((self.points, [[0.0, 0.5, 0.7]]))
+        dx, dy, dz = field.gradient_grid(*points.T)
+        xs, ys, zs = points.T
+        self.assert_numpy_arrays_equal(dx, np.where(xs != 0, ys, zs), precision=12)
+        self.assert_numpy_arrays_equal(dy, np.where(xs != 0, zs + xs, zs), precision=12)
+        self.assert_numpy_arrays_equal(dz, ys + 1, precision=12)
+
+    def test_dual_composition(self):
+        v1 = SvComposedVectorField('CYL', self.x, self.y, self.z)
+        v2 = SvComposedVectorField('XYZ', self.z, self.sin(self.x), self.y)
+        field = SvVectorFieldCrossProduct(v1, v2)
+        coordinates = SvDual.coordinates(*self.points.T)
+        values = field.evaluate_dual(*coordinates)
+        expected = finite_differences(lambda xs, ys, zs: list(field.evaluate_grid(xs, ys, zs)), *coordinates, 1e-6)
+        for value, expected_value in zip(values, expected):
+            self.assert_close(value.grad, expected_value.grad, 1e-6)
+
+    def test_operators(self):
+        xs, ys, zs = self.points.T
+        r2 = self.mul(self.x, self.x)
+        # Laplacian of x^2 * y is 2y
+        laplacian = SvScalarFieldLaplacian(self.mul(r2, self.y), 0.001)
+        self.assert_numpy_arrays_equal(laplacian.evaluate_grid(xs, ys, zs), 2 * ys, precision=10)
+        # rotor of (-y, x, 0) is (0, 0, 2)
+        rotation = SvComposedVectorField('XYZ', SvNegatedScalarField(self.y), self.x, self.z)
+        rx, ry, rz = SvVectorFieldRotor(rotation, 0.001).evaluate_grid(xs, ys, zs)
+        self.assert_numpy_arrays_equal(rz, np.full_like(zs, 2.0), precision=8)
+        # gauss curvature of sphere of radius r is 1/r^2
+        sphere = SvScalarFieldPointDistance(np.zeros(3))
+        calculator = ScalarFieldCurvatureCalculator(sphere, 0.001)
+        calculator.prepare(xs, ys, zs)
+        r = np.linalg.norm(self.points, axis=1)
+        self.assert_numpy_arrays_equal(calculator.gauss(), 1 / r**2, precision=8)
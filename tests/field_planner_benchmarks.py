@@ -0,0 +1,43 @@
+"""
+Benchmarks are not run together with tests, use
+$ ./run_tests.sh "field_planner_benchmarks.py"
+"""
+from time import perf_counter
+import tracemalloc
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.dependencies import numexpr
+from sverchok.utils.field.planner import SvFieldPlanner
+from sverchok.utils.field.scalar import SvCoordinateScalarField, SvScalarFieldBinOp, SvScalarFieldVectorizedFunction
+
+
+class FieldPlannerBenchmark(SverchokTestCase):
+    grid_sizes = [50, 100, 200]
+    depth = 6
+
+    def build_field(self, depth):
+        x, y, z = [SvCoordinateScalarField(c) for c in 'XYZ']
+        if depth == 0:
+            return SvScalarFieldBinOp(SvScalarFieldBinOp(x, y, lambda a, b: a * b, "{0} * {1}"),
+                                      z, lambda a, b: a - b, "{0} - {1}")
+        field1 = self.build_field(depth - 1)
+        field2 = SvScalarFieldVectorizedFunction(self.build_field(depth - 1), np.sin, "sin({0})")
+        return SvScalarFieldBinOp(field1, field2, lambda a, b: a + b, "{0} + {1}")
+
+    def test_deep_field(self):
+        field = self.build_field(self.depth)
+        plan = SvFieldPlanner.plan(field)
+        modes = [False, True] if numexpr is not None else [False]
+        for size in self.grid_sizes:
+            xs, ys, zs = [c.ravel() for c in np.meshgrid(*[np.linspace(0, 1, size)] * 3)]
+            for use_numexpr in modes:
+                tracemalloc.start()
+                start = perf_counter()
+                plan.evaluate(xs, ys, zs, use_numexpr=use_numexpr)
+                duration = perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                self.info(f"Grid={size}^3, numexpr={use_numexpr}: {duration * 1000:.1f}ms, "
+                          f"peak memory {peak / 2**20:.0f}MB, result {xs.nbytes / 2**20:.0f}MB")
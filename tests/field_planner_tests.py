@@ -0,0 +1,100 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.dependencies import numexpr
+from sverchok.utils.field.planner import SvFieldPlanner, EXPRESSION, GRID
+from sverchok.utils.field.scalar import (SvScalarField, SvCoordinateScalarField,
+            SvScalarFieldBinOp, SvScalarFieldVectorizedFunction, SvMergedScalarField,
+            SvConstantScalarField, SvVectorFieldDecomposed)
+from sverchok.utils.field.vector import (SvComposedVectorField, SvVectorFieldCrossProduct,
+            SvVectorFieldsLerp, SvVectorFieldTangent, SvConstantVectorField,
+            SvVectorFieldComposition)
+
+
+class CountingField(SvScalarField):
+    """Field which is not known to the planner"""
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, x, y, z):
+        return x * y - z
+
+    def evaluate_grid(self, xs, ys, zs):
+        self.calls += 1
+        return xs * ys - zs
+
+
+class FieldPlannerTests(SverchokTestCase):
+    def setUp(self):
+        self.x, self.y, self.z = [SvCoordinateScalarField(c) for c in 'XYZ']
+        self.points = np.random.default_rng(0).random((100, 3))
+
+    def add(self, field1, field2):
+        return SvScalarFieldBinOp(field1, field2, lambda a, b: a + b, "{0} + {1}")
+
+    def mul(self, field1, field2):
+        return SvScalarFieldBinOp(field1, field2, lambda a, b: a * b, "{0} * {1}")
+
+    def assert_matches_points(self, field, values):
+        expected = np.array([field.evaluate(*point) for point in self.points]).T
+        self.assert_numpy_arrays_equal(np.array(values), expected, precision=10)
+
+    def test_common_subexpression(self):
+        leaf = CountingField()
+        field = self.mul(self.add(leaf, self.x), SvScalarFieldVectorizedFunction(leaf, np.sin, "sin({0})"))
+        plan = SvFieldPlanner.plan(field)
+        self.assertEqual([step.kind for step in plan.steps].count(GRID), 1)
+        values = field.evaluate_grid(*self.points.T)
+        self.assertEqual(leaf.calls, 1)
+        self.assert_matches_points(field, values)
+
+    def test_fusion(self):
+        field = self.x
+        for i in range(10):
+            field = self.add(self.mul(field, self.y), self.z)
+        field = SvMergedScalarField('AVG', [field, self.x])
+        plan = SvFieldPlanner.plan(field)
+        self.assertEqual(len(plan.steps), 1)
+        self.assertEqual(plan.steps[0].kind, EXPRESSION)
+        self.assert_matches_points(field, field.evaluate_grid(*self.points.T))
+
+    def test_chunks(self):
+        v1 = SvComposedVectorField('CYL', self.x, self.y, CountingField())
+        v2 = SvComposedVectorField('XYZ', self.z, self.add(self.x, self.y), self.y)
+        field = SvVectorFieldsLerp(SvVectorFieldCrossProduct(v1, v2), SvVectorFieldTangent(v1, v2), self.x)
+        plan = SvFieldPlanner.plan(field)
+        expected = plan.evaluate(*self.points.T)
+        plan.chunk_size = 7
+        self.assert_numpy_arrays_equal(np.array(plan.evaluate(*self.points.T)), np.array(expected))
+        self.assert_matches_points(field, expected)
+
+    def test_grid_shape(self):
+        field = self.add(self.x, SvMergedScalarField('MIN', [self.y, self.z]))
+        xs, ys, zs = np.meshgrid(np.linspace(0, 1, 3), np.linspace(0, 1, 4), np.linspace(0, 1, 5))
+        values = field.evaluate_grid(xs, ys, zs)
+        self.assertEqual(values.shape, xs.shape)
+        self.assert_numpy_arrays_equal(values, xs + np.minimum(ys, zs))
+
+    def test_constants(self):
+        constant = SvConstantScalarField(2.5)
+        vector = SvConstantVectorField([1.0, 2.0, 3.0])
+        fields = [SvMergedScalarField(mode, [constant, self.x]) for mode in ['MIN', 'MAX', 'MINDIFF']]
+        fields.append(SvMergedScalarField('MIN', [constant, SvConstantScalarField(1.0)]))
+        fields.extend(SvVectorFieldDecomposed(vector, 'SPH', axis) for axis in range(3))
+        fields.append(SvVectorFieldDecomposed(SvComposedVectorField('XYZ', constant, constant, self.y), 'SPH', 1))
+        fields.append(SvVectorFieldComposition(vector, SvComposedVectorField('CYL', self.x, self.y, self.z)))
+        for field in fields:
+            with self.subTest(field=field):
+                plan = SvFieldPlanner.plan(field)
+                expected = plan.evaluate(*self.points.T)
+                plan.chunk_size = 7
+                self.assert_numpy_arrays_equal(np.array(plan.evaluate(*self.points.T)), np.array(expected))
+                self.assert_matches_points(field, field.evaluate_grid(*self.points.T))
+
+    @requires(numexpr)
+    def test_numexpr(self):
+        field = self.mul(self.add(self.x, SvScalarFieldVectorizedFunction(self.y, np.exp, "exp({0})")), self.z)
+        plan = SvFieldPlanner.plan(field)
+        with_numexpr, = plan.evaluate(*self.points.T, use_numexpr=True)
+        without_numexpr, = plan.evaluate(*self.points.T, use_numexpr=False)
+        self.assert_numpy_arrays_equal(with_numexpr, without_numexpr, precision=12)
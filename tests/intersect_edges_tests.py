@@ -1,4 +1,8 @@
+import numpy as np
+
 from sverchok.utils.testing import *
+from sverchok.utils.intersect_edges import (intersect_edges_2d_np, intersect_edges_2d_np_big, intersect_edges_3d_np,
+            overlapping_boxes)
 
 
 class IntersectEdgesTest2(ReferenceTreeTestCase):
@@ -19,3 +23,39 @@ class IntersectEdgesTest2(ReferenceTreeTestCase):
         # self.assert_sverchok_data_equals_file(result_verts, "intersecting_planes_result_verts.txt", precision=8)
         # #self.store_reference_sverchok_data("intersecting_planes_result_faces.txt", result_edges)
         # self.assert_sverchok_data_equals_file(result_edges, "intersecting_planes_result_faces.txt", precision=8)
+
+
+class IntersectEdgesNumpyTest(SverchokTestCase):
+    def geometry(self, verts, edges):
+        verts = np.round(np.array(verts), 6)
+        return sorted(tuple(sorted((tuple(verts[i]), tuple(verts[j])))) for i, j in edges)
+
+    def test_big_2d_as_brute_force(self):
+        rng = np.random.default_rng(0)
+        verts = rng.random((200, 3))
+        verts[:, 2] = 0
+        edges = np.arange(200).reshape(-1, 2)
+        edges[5] = [0, 12]  # sharing a vertex with the first edge
+        expected = intersect_edges_2d_np(verts, edges, 1e-5)
+        result = intersect_edges_2d_np_big(verts, edges, 1e-5)
+        self.assertEqual(len(result[0]), len(expected[0]))
+        self.assertEqual(self.geometry(*result), self.geometry(*expected))
+
+    def test_3d_touching(self):
+        verts = [(0, 0, 1), (2, 0, 1), (1, -1, 1), (1, 0, 1), (0, 1, 0), (2, 1, 0)]
+        edges = [(0, 1), (2, 3), (4, 5)]
+        verts_out, edges_out = intersect_edges_3d_np(verts, edges, 1e-5)
+        self.assert_sverchok_data_equal(verts_out, [list(map(float, v)) for v in verts] + [[1.0, 0.0, 1.0]])
+        self.assertEqual(edges_out, [[0, 6], [6, 1], [2, 6], [6, 3], [4, 5]])
+
+    def test_overlapping_boxes(self):
+        rng = np.random.default_rng(0)
+        corners = rng.random((300, 3))
+        sizes = rng.random((300, 3)) * rng.choice([0.02, 0.5], size=(300, 1), p=[0.9, 0.1])
+        box_min, box_max = corners, corners + sizes
+        box_min[0], box_max[0] = (0, 0, 0), (1, 1, 1)  # long diagonal edge
+        overlap = np.all((box_min[:, np.newaxis] <= box_max) & (box_max[:, np.newaxis] >= box_min), axis=2)
+        expected = {(i, j) for i, j in zip(*np.nonzero(np.triu(overlap, 1)))}
+        pairs = np.concatenate(list(overlapping_boxes(box_min, box_max, batch_size=1000, max_box_cells=8)))
+        self.assertEqual(len(pairs), len(expected))
+        self.assertEqual({(i, j) for i, j in pairs}, expected)
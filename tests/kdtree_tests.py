@@ -0,0 +1,38 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.dependencies import scipy
+from sverchok.utils.kdtree import SvKdTree, SvBruteforceKdTree
+
+
+class KdTreeTests(SverchokTestCase):
+    points = np.random.default_rng(0).random((50, 3))
+    needles = np.random.default_rng(1).random((20, 3))
+
+    def check_query_array(self, tree, count):
+        locs, idxs, distances = tree.query_array(self.needles, count=count)
+        for needle, loc, idx, distance in zip(self.needles, locs, idxs, distances):
+            expected = tree.query(needle, count=count)
+            self.assert_numpy_arrays_equal(loc, np.asarray(expected[0]), precision=8)
+            self.assert_numpy_arrays_equal(np.asarray(idx), np.asarray(expected[1]))
+            self.assert_numpy_arrays_equal(np.asarray(distance), np.asarray(expected[2]), precision=8)
+
+    def test_blender_query_array(self):
+        for count in [1, 3]:
+            self.check_query_array(SvKdTree.new(SvKdTree.BLENDER, self.points), count)
+
+    def test_bruteforce_query_array(self):
+        for power in [1, 2, 3, np.inf]:
+            for count in [1, 3]:
+                self.check_query_array(SvBruteforceKdTree(self.points, power=power), count)
+
+    @requires(scipy)
+    def test_scipy_query_array(self):
+        for count in [1, 3]:
+            self.check_query_array(SvKdTree.new(SvKdTree.SCIPY, self.points), count)
+
+    def test_cached(self):
+        tree = SvKdTree.cached(SvKdTree.BLENDER, self.points)
+        self.assertIs(SvKdTree.cached(SvKdTree.BLENDER, self.points), tree)
+        self.assertIsNot(SvKdTree.cached(SvKdTree.BLENDER, self.points.copy()), tree)
+        self.assertIsNot(SvKdTree.cached(SvKdTree.BLENDER, self.points, power=1), tree)
@@ -0,0 +1,28 @@
+from collections import Counter
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.marching_cubes import isosurface_np
+
+
+class MarchingCubesTests(SverchokTestCase):
+    def test_sphere(self):
+        coords = np.linspace(-1, 1, 11)
+        xs, ys, zs = np.meshgrid(coords, coords, coords, indexing='ij')
+        verts, faces = isosurface_np(xs**2 + ys**2 + zs**2, 0.5)
+
+        # vertices are on the edges of the grid, between 0 and 10
+        points = verts * 0.2 - 1
+        radiuses = np.linalg.norm(points, axis=1)
+        self.assertTrue((abs(radiuses - np.sqrt(0.5)) < 0.05).all())
+
+        # vertices are shared by adjacent cubes so the surface is closed
+        edges = Counter(tuple(sorted((f[i - 1], f[i]))) for f in faces.tolist() for i in range(3))
+        self.assertEqual(set(edges.values()), {2})
+        self.assertEqual(faces.max(), len(verts) - 1)
+
+    def test_empty(self):
+        verts, faces = isosurface_np(np.ones((4, 4, 4)), 0.5)
+        self.assertEqual(verts.shape, (0, 3))
+        self.assertEqual(faces.shape, (0, 3))
@@ -0,0 +1,51 @@
+"""
+Benchmarks are not run together with tests, use
+$ ./run_tests.sh "mesh_boolean_benchmarks.py"
+"""
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.mesh_boolean import mesh_boolean
+from sverchok.nodes.modifier_make.csg_booleanMK2 import Boolean
+
+
+def uv_sphere(center, segments):
+    rings = segments // 2
+    u, v = np.meshgrid(np.linspace(0, 2 * np.pi, segments, endpoint=False),
+                       np.linspace(0, np.pi, rings + 1)[1:-1], indexing='ij')
+    verts = np.stack((np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), np.cos(v)), axis=-1).reshape(-1, 3)
+    verts = np.concatenate((verts, [[0, 0, 1], [0, 0, -1]])) + center
+    idx = np.arange(segments * (rings - 1)).reshape(segments, rings - 1)
+    idx = np.concatenate((idx, idx[:1]))
+    quads = np.stack((idx[:-1, :-1], idx[:-1, 1:], idx[1:, 1:], idx[1:, :-1]), axis=-1).reshape(-1, 4)
+    top = np.stack((np.full(segments, len(verts) - 2), idx[:-1, 0], idx[1:, 0]), axis=-1)
+    bottom = np.stack((np.full(segments, len(verts) - 1), idx[1:, -1], idx[:-1, -1]), axis=-1)
+    return verts.tolist(), quads.tolist() + top.tolist() + bottom.tolist()
+
+
+class MeshBooleanBenchmark(SverchokTestCase):
+    segments_number = [16, 32, 64, 128, 256]
+    bsp_max_segments = 32
+
+    def test_join_spheres(self):
+        for segments in self.segments_number:
+            a = uv_sphere((0, 0, 0), segments)
+            b = uv_sphere((0.5, 0.3, 0.2), segments - 3)
+
+            start = perf_counter()
+            mesh_boolean(*a, *b, 'JOIN')
+            bvh_time = perf_counter() - start
+
+            bsp_time = float('nan')
+            if segments <= self.bsp_max_segments:
+                recursion_limit = sys.getrecursionlimit()
+                sys.setrecursionlimit(10000)
+                start = perf_counter()
+                Boolean(*a, *b, 'JOIN')
+                bsp_time = perf_counter() - start
+                sys.setrecursionlimit(recursion_limit)
+
+            self.info(f"Faces={len(a[1]) + len(b[1])}: BVH={bvh_time * 1000:.1f}ms, BSP={bsp_time * 1000:.1f}ms")
@@ -0,0 +1,88 @@
+import itertools
+from collections import Counter
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.dependencies import scipy
+from sverchok.utils.mesh_boolean import mesh_boolean
+
+if scipy is not None:
+    from scipy.optimize import linprog
+    from scipy.spatial import ConvexHull, HalfspaceIntersection
+
+
+def cube(origin, size):
+    verts = np.array(list(itertools.product([0, 1], repeat=3))) * size + origin
+    faces = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+    return verts.tolist(), faces
+
+
+def convex_hull(points):
+    hull = ConvexHull(points)
+    faces = hull.simplices
+    normals = np.cross(points[faces[:, 1]] - points[faces[:, 0]], points[faces[:, 2]] - points[faces[:, 0]])
+    outward = np.einsum('ij,ij->i', normals, hull.equations[:, :3]) > 0
+    return (points.tolist(), np.where(outward[:, np.newaxis], faces, faces[:, ::-1]).tolist()), hull
+
+
+def intersection_volume(hull_a, hull_b):
+    """Volume of intersection of convex hulls computed from their half spaces"""
+    halfspaces = np.concatenate((hull_a.equations, hull_b.equations))
+    # center of the largest ball inside of the intersection
+    result = linprog([0, 0, 0, -1], A_ub=np.column_stack((halfspaces[:, :3], np.ones(len(halfspaces)))),
+                     b_ub=-halfspaces[:, 3], bounds=[(None, None)] * 3 + [(0, None)])
+    if result.x[3] < 1e-9:
+        return 0.0
+    return ConvexHull(HalfspaceIntersection(halfspaces, result.x[:3]).intersections).volume
+
+
+def signed_volume(verts, faces):
+    verts = np.asarray(verts)
+    volume = 0.0
+    for face in faces:
+        for i in range(1, len(face) - 1):
+            volume += np.dot(verts[face[0]], np.cross(verts[face[i]], verts[face[i + 1]])) / 6.0
+    return volume
+
+
+class MeshBooleanTests(SverchokTestCase):
+    def assert_closed(self, faces):
+        edges = Counter((face[i - 1], face[i]) for face in faces for i in range(len(face)))
+        self.assertEqual(set(edges.values()), {1})
+        self.assertTrue(all((v, u) in edges for u, v in edges))
+
+    def check(self, a, b, volumes, places=7):
+        for operation, volume in zip(['ITX', 'JOIN', 'DIFF'], volumes):
+            with self.subTest(operation=operation):
+                verts, faces = mesh_boolean(*a, *b, operation)
+                self.assertAlmostEqual(signed_volume(verts, faces), volume, places=places)
+                if faces:
+                    self.assert_closed(faces)
+
+    def test_overlapping_cubes(self):
+        self.check(cube(0, 2), cube(1, 2), [1, 15, 7])
+
+    def test_coplanar_faces(self):
+        self.check(cube(0, 2), cube([1, 0, 0], 2), [4, 12, 4])
+
+    def test_touching_cubes(self):
+        self.check(cube(0, 2), cube([2, 0, 0], 2), [0, 16, 8])
+
+    def test_same_cubes(self):
+        self.check(cube(0, 2), cube(0, 2), [8, 8, 0])
+
+    def test_separate_cubes(self):
+        self.check(cube(0, 1), cube(2, 1), [0, 2, 1])
+
+    @requires(scipy)
+    def test_random_convex_hulls(self):
+        # intersection curves of such meshes pass close to their vertices and
+        # leave thin triangles and T-junctions after welding
+        rng = np.random.default_rng(6)
+        for i in range(20):
+            a, hull_a = convex_hull(rng.random((30, 3)))
+            b, hull_b = convex_hull(rng.random((30, 3)) + 0.3)
+            itx = intersection_volume(hull_a, hull_b)
+            with self.subTest(case=i):
+                self.check(a, b, [itx, hull_a.volume + hull_b.volume - itx, hull_a.volume - itx], places=9)
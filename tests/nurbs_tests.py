@@ -61,6 +61,21 @@ class NurbsCurveTests(SverchokTestCase):
 
         self.assert_numpy_arrays_equal(expected, d2s, precision=8)
 
+    def test_span_basis(self):
+        "Test that span basis gives the same values as separate basis functions"
+        knotvector = [0, 0, 0, 0.25, 0.5, 0.5, 0.75, 1, 1, 1]
+        degree = 2
+        n_funcs = len(knotvector) - degree - 1
+        ts = np.linspace(-0.1, 1.1, num=50)
+        functions = SvNurbsBasisFunctions(knotvector)
+        indices, values = functions.span_basis(degree, ts, deriv_order=2)
+        for k in range(3):
+            expected = np.array([functions.derivative(i, degree, k)(ts) for i in range(n_funcs)]).T
+            dense = np.zeros((len(ts), n_funcs))
+            for j in range(degree+1):
+                np.add.at(dense, (np.arange(len(ts)), indices[:,j]), values[k][:,j])
+            self.assert_numpy_arrays_equal(dense, expected, precision=8)
+
     #@unittest.skip
     @requires(geomdl)
     def test_curve_eval(self):
@@ -70,6 +85,18 @@ class NurbsCurveTests(SverchokTestCase):
         t2s = native_curve.evaluate_array(self.ts)
         self.assert_numpy_arrays_equal(t1s, t2s, precision=8)
 
+    def test_evaluate_many(self):
+        "Test that batched evaluation of curves gives the same points as separate evaluation"
+        control_points = np.array(self.control_points)
+        curves = [SvNativeNurbsCurve(self.degree, self.knotvector, control_points + [0, 0, i], [1.0, 1.0 + i, 2.0, 1.0])
+                  for i in range(3)]
+        curves.append(SvNativeNurbsCurve(2, [0, 0, 0, 0.5, 1, 1, 1], control_points))
+        for ts in [self.ts, [self.ts, self.ts[:5], self.ts[::2], self.ts[-1:]]]:
+            results = SvNurbsCurve.evaluate_many(curves, ts)
+            ts_list = ts if isinstance(ts, list) else [ts] * len(curves)
+            for curve, curve_ts, result in zip(curves, ts_list, results):
+                self.assert_numpy_arrays_equal(result, curve.evaluate_array(curve_ts), precision=8)
+
     #@unittest.skip
     @requires(geomdl)
     def test_curve_eval_2(self):
@@ -0,0 +1,51 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.pulga_physics_modular_core import (
+    grid_neighbour_pairs, PulgaSystem, SvCollisionForce, SvAttractionForce, SvAlignForce, SvFitForce)
+
+
+class GridNeighbourPairsTests(SverchokTestCase):
+    def test_pairs(self):
+        verts = np.random.default_rng(0).random((300, 3))
+        verts[:, 2] *= 0.01
+        dist = np.linalg.norm(verts[:, np.newaxis] - verts[np.newaxis], axis=2)
+        for radius in [0.01, 0.1, 0.5, 2]:
+            pairs = grid_neighbour_pairs(verts, radius)
+            expected = set(zip(*np.nonzero(np.triu(dist <= radius, 1))))
+            self.assertEqual(len(pairs), len(expected))
+            self.assertEqual(set(map(tuple, np.sort(pairs, axis=1))), expected)
+
+    def test_outlier(self):
+        verts = np.concatenate((np.random.default_rng(2).random((2000, 3)), [[1e9, 0, 0]]))
+        dist = np.linalg.norm(verts[:, np.newaxis] - verts[np.newaxis], axis=2)
+        pairs = grid_neighbour_pairs(verts, 0.05, batch_size=1000)
+        expected = set(zip(*np.nonzero(np.triu(dist <= 0.05, 1))))
+        self.assertEqual(len(pairs), len(expected))
+        self.assertEqual(set(map(tuple, np.sort(pairs, axis=1))), expected)
+
+    def test_no_pairs(self):
+        self.assertEqual(grid_neighbour_pairs(np.zeros((1, 3)), 1).shape, (0, 2))
+        self.assertEqual(grid_neighbour_pairs(np.eye(3), 0.5).shape, (0, 2))
+
+
+class PulgaNeighbourForcesTests(SverchokTestCase):
+    @staticmethod
+    def simulate(use_grid):
+        rng = np.random.default_rng(1)
+        forces = [SvFitForce([0.01], [0.01], [0.4], 'Absolute', use_grid=use_grid),
+                  SvCollisionForce([0.1], use_grid=use_grid),
+                  SvAttractionForce([0.01], [1.0], [0.8], stop_on_collide=True, use_grid=use_grid),
+                  SvAlignForce([0.1], [1.0], [0.5], use_grid=use_grid)]
+        ps = PulgaSystem([rng.random((200, 3)) * 3, None, rng.random(200) * 0.2, rng.random((200, 3)) * 0.01,
+                          [0], [1], forces])
+        ps.setup_forces()
+        for _ in range(5):
+            ps.iterate()
+        return ps
+
+    def test_grid_matches_brute_force(self):
+        brute = self.simulate(False)
+        grid = self.simulate(True)
+        self.assert_numpy_arrays_equal(grid.verts, brute.verts, precision=8)
+        self.assert_numpy_arrays_equal(grid.rads, brute.rads, precision=8)
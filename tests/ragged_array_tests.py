@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.ragged_array import SvRaggedArray
+from sverchok.core.socket_data import sv_set_socket, sv_get_socket, sv_forget_socket, estimate_size
+from sverchok.data_structure import get_data_nesting_level
+
+
+class RaggedArrayTests(SverchokTestCase):
+    vertices = [[[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 2, 0]], [], [[0, 0, 1], [1, 0, 1], [0, 1, 1]]]
+    faces = [[[0, 1, 2, 3], [2, 4, 3]], [], [[0, 1, 2]]]
+
+    def test_vertices(self):
+        packed = SvRaggedArray.from_list(self.vertices, dtype=np.float64)
+        self.assertEqual(packed.values.shape, (8, 3))
+        self.assertEqual(packed.offsets.tolist(), [0, 5, 5, 8])
+        self.assertEqual(packed.to_list(), self.vertices)
+        self.assertEqual(len(packed), 3)
+        self.assertEqual(packed[2].tolist(), self.vertices[2])
+        self.assertEqual(packed[-1].tolist(), self.vertices[2])
+        self.assertEqual(packed.row_indices().tolist(), [0] * 5 + [2] * 3)
+        self.assertEqual(get_data_nesting_level(packed), 3)
+
+    def test_faces(self):
+        packed = SvRaggedArray.from_list(self.faces)
+        self.assertIsInstance(packed.values, SvRaggedArray)
+        self.assertEqual(packed.values.values.tolist(), [0, 1, 2, 3, 2, 4, 3, 0, 1, 2])
+        self.assertEqual(packed.values.offsets.tolist(), [0, 4, 7, 10])
+        self.assertEqual(packed.to_list(), self.faces)
+        self.assertEqual(packed[0].to_list(), self.faces[0])
+
+    def test_arrays(self):
+        arrays = [np.array(verts, dtype=np.float64).reshape(-1, 3) for verts in self.vertices]
+        packed = SvRaggedArray.from_list(arrays)
+        self.assertEqual(packed, SvRaggedArray.from_list(self.vertices, dtype=np.float64))
+
+    def test_slice(self):
+        packed = SvRaggedArray.from_list(self.faces)
+        self.assertEqual(packed[1:].to_list(), self.faces[1:])
+        self.assertEqual(packed[:1].to_list(), self.faces[:1])
+        self.assertEqual(packed[3:].to_list(), [])
+
+    def test_empty(self):
+        packed = SvRaggedArray.from_list([[], []], item_shape=(3,))
+        self.assertEqual(packed.values.shape, (0, 3))
+        self.assertEqual(packed.to_list(), [[], []])
+
+
+class PackedSocketDataTests(SverchokTestCase):
+    def test_lazy_unpacking(self):
+        socket = SimpleNamespace(socket_id='ragged_array_tests')
+        packed = SvRaggedArray.from_list(RaggedArrayTests.vertices, dtype=np.float64)
+        sv_set_socket(socket, packed)
+        try:
+            self.assertEqual(sv_get_socket(socket), RaggedArrayTests.vertices)
+            self.assertIs(sv_get_socket(socket, deepcopy=False, packed=True), packed)
+            self.assertEqual(sv_get_socket(socket, packed=True), packed)
+            self.assertEqual(estimate_size(packed), packed.values.nbytes + packed.offsets.nbytes)
+        finally:
+            sv_forget_socket(socket)
@@ -0,0 +1,176 @@
+from threading import Thread
+from types import SimpleNamespace
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.socket_data import (LazyCopyList, SocketDataCache, NodeMemo,
+            sv_set_socket, sv_get_socket, sv_forget_socket)
+
+
+class LazyCopyListTests(SverchokTestCase):
+    def test_nested(self):
+        source = [[[1, 2], [3]], [[4]]]
+        data = LazyCopyList(source)
+        data[0][0].append(5)
+        data[1].append([6])
+        for item in data:
+            item.clear()
+        self.assertEqual(source, [[[1, 2], [3]], [[4]]])
+
+    def test_repeated_items(self):
+        sub = [1, 2]
+        source = [sub, sub, [sub, sub]]
+        data = LazyCopyList(source)
+        self.assertIsNot(data[0], sub)
+        self.assertIsNot(data[1], sub)
+        self.assertIsNot(data[2][1], sub)
+        data[1].append(3)
+        data[2][0].append(4)
+        self.assertEqual(sub, [1, 2])
+        self.assertTrue(all(item is not sub for item in data))
+        self.assertTrue(all(item is not sub for item in data[2]))
+
+    def test_repeated_by_multiplication(self):
+        sub = [0]
+        data = LazyCopyList([sub] * 3)
+        for i, item in enumerate(data):
+            item.append(i)
+        self.assertEqual(sub, [0])
+        self.assertEqual(data.pop(), [0, 0, 1, 2])  # items are copied like by deepcopy
+
+    def test_arrays(self):
+        array = np.zeros(3)
+        data = LazyCopyList([array, array])
+        for item in data:
+            self.assertFalse(item.flags.writeable)
+        with self.assertRaises(ValueError):
+            data[1][0] = 1
+        self.assertTrue(array.flags.writeable)
+
+
+class SocketDataCacheTests(SverchokTestCase):
+    def setUp(self):
+        self.cache = SocketDataCache()
+        self.cache.budget = 2000
+        self.restored = []
+
+    def restore_function(self, key, value):
+        def restore():
+            self.restored.append(key)
+            self.cache[key] = value
+        return restore
+
+    def test_shared_size(self):
+        array = np.zeros(100)
+        self.cache['a'] = array
+        self.cache['b'] = array
+        self.assertEqual(self.cache.total_size, array.nbytes)
+        del self.cache['a']
+        self.assertEqual(self.cache.total_size, array.nbytes)
+        self.cache.pop('b')
+        self.assertEqual(self.cache.total_size, 0)
+
+    def test_release_restore(self):
+        arrays = {key: np.full(100, i) for i, key in enumerate('abc')}
+        for key, array in arrays.items():
+            self.cache[key] = array
+        self.cache.release('a', self.restore_function('a', arrays['a']))
+        self.cache.release('b', self.restore_function('b', arrays['b']))
+        self.assertNotIn('a', self.cache)  # the oldest released data is evicted first
+        self.assertIn('b', self.cache)
+        self.assertLessEqual(self.cache.total_size, self.cache.budget)
+
+        self.assertTrue(self.cache.restore('a'))
+        self.assertIs(self.cache['a'], arrays['a'])
+        self.assertEqual(self.restored, ['a'])
+        self.assertFalse(self.cache.restore('a'))  # it's not evicted anymore
+        self.assertFalse(self.cache.restore('c'))  # it was never evicted
+
+    def test_set_evicted(self):
+        self.cache['a'] = np.zeros(300)
+        self.cache.release('a', self.restore_function('a', None))
+        self.assertNotIn('a', self.cache)
+        self.cache['a'] = np.ones(10)  # new data cancels restoring
+        self.assertFalse(self.cache.restore('a'))
+        self.assertEqual(self.restored, [])
+
+    def test_restore_in_thread(self):
+        array = np.zeros(300)
+        self.cache['a'] = array
+        self.cache.release('a', self.restore_function('a', array))
+        results = []
+        thread = Thread(target=lambda: results.append(self.cache.restore('a')))
+        thread.start()
+        thread.join()
+        self.assertEqual(results, [False])
+        self.assertEqual(self.restored, [])
+        self.assertTrue(self.cache.restore('a'))
+
+
+def property_(identifier):
+    return SimpleNamespace(identifier=identifier, type='FLOAT', is_array=False)
+
+
+class NodeMemoTests(SverchokTestCase):
+    def setUp(self):
+        socket_rna = SimpleNamespace(properties=[property_('default_property')])
+        self.input = SimpleNamespace(socket_id='memo_in', is_linked=True, bl_rna=socket_rna,
+                                     default_property=0.0)
+        self.default_input = SimpleNamespace(socket_id='memo_default', is_linked=False,
+                                             bl_rna=socket_rna, default_property=1.0)
+        self.output = SimpleNamespace(socket_id='memo_out', is_linked=True, bl_rna=socket_rna,
+                                      default_property=0.0)
+        self.node = SimpleNamespace(node_id='memo_node', is_memoizable=True, factor=1.0,
+                                    bl_rna=SimpleNamespace(properties=[property_('factor')]),
+                                    inputs=[self.input, self.default_input], outputs=[self.output])
+        self.memo = NodeMemo()
+        self.memo.size = 2 ** 20
+        self.calls = 0
+
+    def tearDown(self):
+        for socket in [self.input, self.default_input, self.output]:
+            sv_forget_socket(socket)
+
+    def update(self):
+        key = self.memo.key(self.node)
+        if not self.memo.restore(self.node, key):
+            self.calls += 1
+            data = [[v * self.node.factor + self.default_input.default_property for v in self.input_data[0]]]
+            sv_set_socket(self.output, data)
+            self.memo.store(self.node, key)
+        return sv_get_socket(self.output, deepcopy=False)
+
+    def set_input(self, data):
+        self.input_data = data
+        sv_set_socket(self.input, data)
+
+    def test_identity_of_inputs(self):
+        self.set_input([[1, 2, 3]])
+        first = self.update()
+        self.assertIs(self.update(), first)
+        self.assertEqual(self.calls, 1)
+        self.set_input([[1, 2, 3]])  # equal data but new object
+        self.update()
+        self.assertEqual(self.calls, 2)
+
+    def test_properties(self):
+        self.set_input([[1, 2, 3]])
+        self.assertEqual(self.update(), [[2, 3, 4]])
+        self.node.factor = 2.0
+        self.assertEqual(self.update(), [[3, 5, 7]])
+        self.default_input.default_property = 0.0  # value of unlinked socket
+        self.assertEqual(self.update(), [[2, 4, 6]])
+        self.node.factor = 1.0
+        self.default_input.default_property = 1.0
+        self.assertEqual(self.update(), [[2, 3, 4]])
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(self.memo.stats(self.node), (1, 3))
+
+    def test_size_limit(self):
+        self.memo.size = 1
+        self.set_input([[1, 2, 3]])
+        self.update()
+        self.update()
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.memo.total_size, 0)
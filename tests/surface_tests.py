@@ -0,0 +1,39 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.curve import knotvector as sv_knotvector
+from sverchok.utils.curve.nurbs import SvNativeNurbsCurve
+from sverchok.utils.surface.algorithms import SvRevolutionSurface, SvCurveLerpSurface, SvExtrudeCurvePointSurface
+
+
+class AnalyticDerivativesTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        control_points = np.array([[1, 0, 0], [2, 1, 0.5], [1.5, 2, 1], [3, 3, 0], [2, 4, 1]], dtype=np.float64)
+        self.curve1 = SvNativeNurbsCurve(3, sv_knotvector.generate(3, 5), control_points)
+        self.curve2 = SvNativeNurbsCurve(3, sv_knotvector.generate(3, 5), control_points[::-1] + [0, 0, 2])
+        self.ts = np.linspace(0.03, 0.97, num=11)
+
+    def check_surface(self, surface):
+        self.assertTrue(surface.has_analytic_derivatives())
+        u_min, u_max = surface.get_u_bounds()
+        v_min, v_max = surface.get_v_bounds()
+        us = u_min + (u_max - u_min) * self.ts
+        vs = v_min + (v_max - v_min) * self.ts[::-1]
+        data = surface.derivatives_data_array(us, vs)
+        h = 1e-6
+        expected_du = (surface.evaluate_array(us + h, vs) - surface.evaluate_array(us - h, vs)) / (2*h)
+        expected_dv = (surface.evaluate_array(us, vs + h) - surface.evaluate_array(us, vs - h)) / (2*h)
+        self.assert_numpy_arrays_equal(data.points, surface.evaluate_array(us, vs), precision=8)
+        self.assert_numpy_arrays_equal(data.du, expected_du, precision=4)
+        self.assert_numpy_arrays_equal(data.dv, expected_dv, precision=4)
+
+    def test_revolution(self):
+        surface = SvRevolutionSurface(self.curve1, np.array([0.5, 0, 0]), np.array([0, 0.2, 1]), global_origin=False)
+        self.check_surface(surface)
+
+    def test_ruled(self):
+        self.check_surface(SvCurveLerpSurface(self.curve1, self.curve2))
+
+    def test_extrude_to_point(self):
+        self.check_surface(SvExtrudeCurvePointSurface(self.curve1, np.array([0, 0, 5])))
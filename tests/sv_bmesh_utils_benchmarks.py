@@ -0,0 +1,68 @@
+"""
+Benchmarks are not run together with tests, use
+$ ./run_tests.sh "sv_bmesh_utils_benchmarks.py"
+"""
+from time import perf_counter
+from unittest.mock import patch
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils import sv_bmesh_utils
+from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh, numpy_data_from_bmesh
+
+
+class BmeshFromPydataBenchmark(SverchokTestCase):
+    faces_number = [1000, 10000, 100000, 1000000]
+
+    def test_bmesh_from_pydata(self):
+        for number in self.faces_number:
+            verts, edges, faces = self._grid(number)
+
+            start = perf_counter()
+            bm = bmesh_from_pydata(verts, edges, faces)
+            bulk_time = perf_counter() - start
+            bulk_data = pydata_from_bmesh(bm)
+            bm.free()
+
+            with patch.object(sv_bmesh_utils, 'BULK_MESH_SIZE', float('inf')):
+                start = perf_counter()
+                bm = bmesh_from_pydata(verts, edges, faces)
+                one_by_one_time = perf_counter() - start
+                data = pydata_from_bmesh(bm)
+                bm.free()
+
+            self.assertEqual(bulk_data, data)
+            self.info(f"Faces={number}: bulk={bulk_time * 1000:.1f}ms, "
+                      f"one by one={one_by_one_time * 1000:.1f}ms")
+
+    def test_numpy_data_from_bmesh(self):
+        for number in self.faces_number:
+            verts, edges, faces = self._grid(number)
+            bm = bmesh_from_pydata(verts, edges, faces)
+
+            start = perf_counter()
+            bulk_data = numpy_data_from_bmesh(bm, [True, True, True, False])
+            bulk_time = perf_counter() - start
+
+            with patch.object(sv_bmesh_utils, 'BULK_MESH_SIZE', float('inf')):
+                start = perf_counter()
+                data = numpy_data_from_bmesh(bm, [True, True, True, False])
+                one_by_one_time = perf_counter() - start
+            bm.free()
+
+            for bulk_array, array in zip(bulk_data[:3], data[:3]):
+                np.testing.assert_array_equal(bulk_array, array)
+            self.info(f"Faces={number}: bulk={bulk_time * 1000:.1f}ms, "
+                      f"one by one={one_by_one_time * 1000:.1f}ms")
+
+    @staticmethod
+    def _grid(faces_number):
+        """Grid of quads with a few loose edges"""
+        size = int(np.sqrt(faces_number))
+        xs, ys = np.meshgrid(np.arange(size + 1), np.arange(size + 1), indexing='ij')
+        verts = np.stack((xs.ravel(), ys.ravel(), np.zeros(xs.size)), axis=1)
+        idx = np.arange((size + 1) ** 2).reshape(size + 1, size + 1)
+        faces = np.stack((idx[:-1, :-1], idx[1:, :-1], idx[1:, 1:], idx[:-1, 1:]), axis=-1).reshape(-1, 4)
+        edges = np.stack((idx[0, :-1], idx[-1, 1:]), axis=1)
+        return verts.tolist(), edges.tolist(), faces.tolist()
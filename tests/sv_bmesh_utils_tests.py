@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils import sv_bmesh_utils
+from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh
+
+
+class BmeshFromPydataTests(SverchokTestCase):
+    def setUp(self):
+        super().setUp()
+        # grid of quads with a row of triangles and a few loose edges
+        size = 40
+        xs, ys = np.meshgrid(np.arange(size + 1), np.arange(size + 1), indexing='ij')
+        self.verts = np.stack((xs.ravel(), ys.ravel(), np.zeros(xs.size)), axis=1).tolist()
+        idx = np.arange((size + 1) ** 2).reshape(size + 1, size + 1)
+        quads = np.stack((idx[:-2, :-1], idx[1:-1, :-1], idx[1:-1, 1:], idx[:-2, 1:]), axis=-1).reshape(-1, 4)
+        tris = np.stack((idx[-2, :-1], idx[-1, :-1], idx[-1, 1:]), axis=-1)
+        self.faces = quads.tolist() + tris.tolist()
+        self.edges = [[idx[0, 0], idx[-1, -1]], [idx[0, -1], idx[-1, 0]], [0, 1]]
+
+    def one_by_one(self, verts, edges, faces):
+        with patch.object(sv_bmesh_utils, 'BULK_MESH_SIZE', float('inf')):
+            bm = bmesh_from_pydata(verts, edges, faces)
+        data = pydata_from_bmesh(bm)
+        bm.free()
+        return data
+
+    def test_bulk_as_one_by_one(self):
+        bm = bmesh_from_pydata(self.verts, self.edges, self.faces)
+        data = pydata_from_bmesh(bm)
+        bm.free()
+        self.assertEqual(data, self.one_by_one(self.verts, self.edges, self.faces))
+
+    def test_duplicated_faces(self):
+        for duplicate in [self.faces[5][::-1], self.faces[5][2:] + self.faces[5][:2], self.faces[-1][::-1]]:
+            with self.subTest(face=duplicate):
+                with self.assertRaises(ValueError):
+                    bmesh_from_pydata(self.verts, self.edges, self.faces + [duplicate])
+
+    def test_invalid_indices(self):
+        with self.assertRaises(IndexError):
+            bmesh_from_pydata(self.verts, self.edges, self.faces + [[0, 1, len(self.verts)]])
+
+    def test_restricted_context(self):
+        restricted_bpy = SimpleNamespace(data=SimpleNamespace(), app=sv_bmesh_utils.bpy.app)
+        with patch.object(sv_bmesh_utils, 'bpy', restricted_bpy):
+            bm = bmesh_from_pydata(self.verts, self.edges, self.faces)
+        data = pydata_from_bmesh(bm)
+        bm.free()
+        self.assertEqual(data, self.one_by_one(self.verts, self.edges, self.faces))
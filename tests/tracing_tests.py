@@ -0,0 +1,45 @@
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.utils.tracing import Tracer
+
+
+class TracingTest(SverchokTestCase):
+    def setUp(self):
+        self.tracer = Tracer(size=2)
+        self.tracer.enabled = True
+
+    def test_ring_buffer(self):
+        for name in ['A', 'B', 'C']:
+            self.tracer.begin(name)
+            self.tracer.finish()
+        self.assertEqual([t.tree_name for t in self.tracer.traces], ['B', 'C'])
+
+    def test_nested_updates(self):
+        self.tracer.begin('A')
+        self.tracer.begin('B')
+        self.tracer.add('span', 'node', 0, 1)
+        self.tracer.finish()
+        self.tracer.add('span', 'node', 1, 2)
+        self.tracer.finish()
+        self.tracer.add('ignored', 'node', 2, 3)
+        self.assertEqual(len(self.tracer.traces), 1)
+        self.assertEqual(len(self.tracer.traces[0].spans), 2)
+
+    def test_chrome_trace(self):
+        self.tracer.begin('A')
+        self.tracer.add('node', 'node', 1, 2, thread=1, input_size=10)
+        self.tracer.finish()
+        events = [e for e in self.tracer.to_chrome_trace()['traceEvents'] if e['ph'] == 'X']
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['dur'], 1e6)
+        self.assertEqual(events[0]['args'], {'input_size': 10})
+
+    def test_speedscope_nesting(self):
+        self.tracer.begin('A')
+        self.tracer.add('node', 'node', 1, 4, thread=1)
+        self.tracer.add('prepare', 'prepare', 1, 2, thread=1)
+        self.tracer.add('copy', 'copy', 3, 4.5, thread=1)  # overlaps end of the node
+        self.tracer.finish()
+        profile = self.tracer.to_speedscope()['profiles'][0]
+        events = [(e['type'], e['frame'], e['at']) for e in profile['events']]
+        self.assertEqual(events, [
+            ('O', 0, 1e3), ('O', 1, 1e3), ('C', 1, 2e3), ('O', 2, 3e3), ('C', 2, 4e3), ('C', 0, 4e3)])
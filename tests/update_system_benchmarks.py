@@ -0,0 +1,60 @@
+"""
+Benchmarks are not run together with tests, use
+$ ./run_tests.sh "update_system_benchmarks.py"
+"""
+from random import Random
+from time import perf_counter
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.core.update_system import UpdateTree
+
+
+class TopologyUpdateBenchmark(SverchokTestCase):
+    nodes_number = [100, 1000, 3000]
+
+    def test_add_link(self):
+        for number in self.nodes_number:
+            with self.temporary_node_tree("BenchmarkTree") as tree:
+                random = Random(0)
+                nodes = self._make_tree(tree, number, random)
+                up_tree = UpdateTree.get(tree)
+                up_tree._sort_nodes(None)
+
+                # full rebuild
+                self._link_random(tree, nodes, random)
+                start = perf_counter()
+                new_tree = up_tree.copy(tree)
+                new_tree._update_difference(up_tree)
+                new_tree._sort_nodes(None)
+                rebuild_time = perf_counter() - start
+
+                # incremental update
+                up_tree = new_tree
+                self._link_random(tree, nodes, random)
+                start = perf_counter()
+                changed = up_tree._update_topology(tree)
+                up_tree._sort_nodes(None)
+                incremental_time = perf_counter() - start
+
+                UpdateTree.reset_tree(tree)
+                self.assertIsNotNone(changed)
+                self.info(f"Nodes={number}: rebuild={rebuild_time * 1000:.1f}ms, "
+                          f"incremental={incremental_time * 1000:.1f}ms")
+
+    @staticmethod
+    def _make_tree(tree, number, random):
+        """Creates tree where each node is connected to two random previous nodes"""
+        nodes = []
+        for i in range(number):
+            node = tree.nodes.new('SvScalarMathNodeMK4')
+            if nodes:
+                tree.links.new(random.choice(nodes).outputs[0], node.inputs[0])
+                tree.links.new(random.choice(nodes).outputs[0], node.inputs[1])
+            nodes.append(node)
+        return nodes
+
+    @staticmethod
+    def _link_random(tree, nodes, random):
+        from_i = random.randrange(len(nodes) // 2)
+        to_i = random.randrange(len(nodes) // 2, len(nodes))
+        tree.links.new(nodes[from_i].outputs[0], nodes[to_i].inputs[0])
@@ -1,7 +1,8 @@
 from typing import Iterable
 
 from sverchok.utils.testing import SverchokTestCase
-from sverchok.core.update_system import SearchTree
+from sverchok.core.socket_data import get_output_socket_data
+from sverchok.core.update_system import SearchTree, UpdateTree
 
 
 class TreeCleaningTest(SverchokTestCase):
@@ -76,6 +77,52 @@ class TreeCleaningTest(SverchokTestCase):
         self.assertSetEqual(f_ns, t_ns, msg=msg)
 
 
+class ParallelUpdateTest(SverchokTestCase):
+    def test_parallel_update(self):
+        with self.temporary_node_tree("ParallelTree") as tree:
+            tree.sv_process = False
+            maps = []
+            for i in range(10):
+                range_node = tree.nodes.new('SvGenNumberRange')
+                range_node.stop_float = 100 + i
+                map_node = tree.nodes.new('SvMapRangeNode')
+                map_node.new_max = i
+                tree.links.new(range_node.outputs[0], map_node.inputs['Value'])
+                if maps:
+                    tree.links.new(maps[-1].outputs[0], map_node.inputs['Old Max'])
+                maps.append(map_node)
+            last = tree.nodes.new('SvMapRangeNode')
+            tree.links.new(maps[-1].outputs[0], last.inputs['Value'])
+            self.assertTrue(all(n.is_thread_safe for n in tree.nodes))
+
+            results = []
+            for parallel in [False, True]:
+                tree.sv_parallel_update = parallel
+                UpdateTree.reset_tree(tree)
+                for _ in UpdateTree.main_update(tree, update_interface=False):
+                    pass
+                results.append([get_output_socket_data(n, 'Value') for n in maps])
+            self.assertEqual(results[0], results[1])
+
+
+class TopologyUpdateTest(SverchokTestCase):
+    def test_removed_node(self):
+        with self.temporary_node_tree("TopologyTree") as tree:
+            nodes = [tree.nodes.new('SvScalarMathNodeMK4') for _ in range(6)]
+            for from_n, to_n in zip(nodes, nodes[1:]):
+                tree.links.new(from_n.outputs[0], to_n.inputs[0])
+            up_tree = UpdateTree.get(tree)
+            up_tree._sort_nodes(None)
+            tree.nodes.remove(nodes.pop(2))
+            self.assertIsNotNone(up_tree._update_topology(tree))
+
+            # sockets of removed node should be forgotten without reading them
+            names = set(_to_names(nodes))
+            self.assertSetEqual(set(_to_names(up_tree._node_socks)), names)
+            self.assertLessEqual(set(_to_names(up_tree._sock_node.values())), names)
+            UpdateTree.reset_tree(tree)
+
+
 def _to_names(nodes: Iterable) -> Iterable[str]:
     for n in nodes:
         yield n.name
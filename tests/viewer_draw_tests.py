@@ -0,0 +1,29 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase
+from sverchok.nodes.viz.viewer_draw_mk4 import ensure_triangles, convex_polygons_mask
+
+
+class ViewerDrawTriangulationTests(SverchokTestCase):
+    def test_fan_triangulation(self):
+        verts = [(0, 0, 0), (1, 0, 0), (2, 1, 0), (1, 2, 0), (0, 1, 0), (1, 1, 1)]
+        faces = [[0, 1, 2, 3, 4], [0, 1, 5], [1, 2, 3, 4]]
+        triangles, face_index = ensure_triangles(verts, faces, False)
+        expected = [[0, 1, 2], [0, 2, 3], [0, 3, 4], [0, 1, 5], [1, 2, 3], [1, 3, 4]]
+        self.assert_numpy_arrays_equal(triangles, np.array(expected))
+        self.assert_numpy_arrays_equal(face_index, np.array([0, 0, 0, 1, 2, 2]))
+
+    def test_same_size_polygons(self):
+        faces = np.array([[0, 1, 2, 3], [4, 5, 6, 7]])
+        verts = np.random.default_rng(0).random((8, 3))
+        triangles, face_index = ensure_triangles(verts, faces, False)
+        self.assert_numpy_arrays_equal(triangles, np.array([[0, 1, 2], [0, 2, 3], [4, 5, 6], [4, 6, 7]]))
+        self.assert_numpy_arrays_equal(face_index, np.array([0, 0, 1, 1]))
+
+    def test_convex_mask(self):
+        square = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]
+        arrow = [(0, 0, 0), (2, 0, 0), (0.5, 0.5, 0), (0, 2, 0)]
+        hexagon = [(np.cos(a), 0, np.sin(a)) for a in np.linspace(0, 2 * np.pi, 7)[:-1]]
+        l_shape = [(0, 0, 0), (2, 0, 0), (2, 1, 0), (1, 1, 0), (1, 2, 0), (0, 2, 0)]
+        self.assertEqual(convex_polygons_mask(np.array([square, arrow])).tolist(), [True, False])
+        self.assertEqual(convex_polygons_mask(np.array([hexagon, hexagon[::-1], l_shape])).tolist(), [True, True, False])
@@ -0,0 +1,62 @@
+import itertools
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.dependencies import scipy
+from sverchok.utils.voronoi3d import voronoi3d_regions, voronoi_on_mesh, CAN_CUT_CELLS_IN_PROCESSES
+
+
+def signed_volume(verts, faces):
+    verts = np.asarray(verts)
+    volume = 0.0
+    for face in faces:
+        for i in range(1, len(face) - 1):
+            volume += np.dot(verts[face[0]], np.cross(verts[face[i]], verts[face[i + 1]])) / 6.0
+    return volume
+
+
+class Voronoi3DRegionsTests(SverchokTestCase):
+    # center cell is octahedron |x| + |y| + |z| <= 1.5, others are open
+    sites = [(0, 0, 0)] + list(itertools.product([-1, 1], [-1, 1], [-1, 1]))
+
+    @requires(scipy)
+    def test_octahedron(self):
+        verts, edges, faces = voronoi3d_regions(self.sites)
+        self.assertEqual(len(verts), 1)
+        self.assertEqual((len(verts[0]), len(edges[0]), len(faces[0])), (6, 12, 8))
+        self.assertAlmostEqual(signed_volume(verts[0], faces[0]), 4.5)
+
+    @requires(scipy)
+    def test_clipped_octahedron(self):
+        verts, edges, faces = voronoi3d_regions(self.sites, do_clip=True, clipping=0)
+        self.assertEqual(sorted(len(f) for f in faces[0]), [4] * 6 + [6] * 8)
+        self.assertAlmostEqual(signed_volume(verts[0], faces[0]), 4.0)
+
+    @requires(scipy)
+    def test_closed_regions(self):
+        sites = np.random.default_rng(0).random((50, 3))
+        regions = voronoi3d_regions(sites, do_clip=True, clipping=0.1, packed=True)
+        self.assertEqual(regions.vert_offsets[-1], len(regions.verts))
+        for verts, edges, faces in zip(*regions.split()):
+            counts = Counter(tuple(sorted((face[i - 1], face[i]))) for face in faces for i in range(len(face)))
+            self.assertEqual(set(counts.values()), {2})
+            self.assertEqual(set(counts), set(map(tuple, edges)))
+            self.assertGreater(signed_volume(verts, faces), 0)
+
+
+class VoronoiOnMeshTests(SverchokTestCase):
+    cube_verts = [list(v) for v in itertools.product([0, 1], repeat=3)]
+    cube_faces = [[0, 1, 3, 2], [4, 6, 7, 5], [0, 4, 5, 1], [2, 3, 7, 6], [0, 2, 6, 4], [1, 5, 7, 3]]
+
+    @requires(scipy)
+    @unittest.skipUnless(CAN_CUT_CELLS_IN_PROCESSES, "Cells are cut in processes only on Linux")
+    def test_parallel_cells(self):
+        sites = np.random.default_rng(0).random((30, 3)).tolist()
+        serial = voronoi_on_mesh(self.cube_verts, self.cube_faces, sites, 0, mode='VOLUME')
+        parallel = voronoi_on_mesh(self.cube_verts, self.cube_faces, sites, 0, mode='VOLUME', processes=3)
+        self.assertEqual(len(serial[0]), len(sites))
+        for serial_data, parallel_data in zip(serial, parallel):
+            self.assertEqual(serial_data, parallel_data)
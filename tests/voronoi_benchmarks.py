@@ -0,0 +1,27 @@
+"""
+Benchmarks are not run together with tests, use
+$ ./run_tests.sh "voronoi_benchmarks.py"
+"""
+from time import perf_counter
+
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.dependencies import scipy
+from sverchok.utils.voronoi import voronoi_bounded, FORTUNE, SCIPY
+
+
+class Voronoi2DBenchmark(SverchokTestCase):
+    sites_number = [100, 1000, 10000]
+
+    @requires(scipy)
+    def test_voronoi_bounded(self):
+        for number in self.sites_number:
+            sites = (np.random.default_rng(0).random((number, 3)) * [10, 10, 0]).tolist()
+            timings = dict()
+            for implementation in [FORTUNE, SCIPY]:
+                start = perf_counter()
+                voronoi_bounded(sites, 'BOX', draw_bounds=True, draw_hangs=True, implementation=implementation)
+                timings[implementation] = perf_counter() - start
+            self.info(f"Sites={number}: fortune={timings[FORTUNE] * 1000:.1f}ms, "
+                      f"scipy={timings[SCIPY] * 1000:.1f}ms")
@@ -0,0 +1,49 @@
+import numpy as np
+
+from sverchok.utils.testing import SverchokTestCase, requires
+from sverchok.dependencies import scipy
+from sverchok.utils.voronoi import voronoi_bounded, FORTUNE, SCIPY
+
+
+def edge_segments(verts, edges):
+    verts = np.asarray(verts)
+    return verts[np.asarray(edges).reshape(-1, 2)]
+
+
+def segments_distances(segments1, segments2):
+    """Distances between each pair of segments, with endpoints in any order"""
+    a, b = segments1[:, None], segments2[None, :]
+    direct = np.abs(a - b).max(axis=(2, 3))
+    swapped = np.abs(a - b[:, :, ::-1]).max(axis=(2, 3))
+    return np.minimum(direct, swapped)
+
+
+class Voronoi2DTests(SverchokTestCase):
+    sites = (np.random.default_rng(1).random((40, 3)) * [10, 10, 0]).tolist()
+
+    @requires(scipy)
+    def test_implementations_match(self):
+        for bound_mode in ['BOX', 'CIRCLE']:
+            for draw_bounds, draw_hangs in [(False, False), (False, True), (True, True)]:
+                with self.subTest(bound_mode=bound_mode, draw_bounds=draw_bounds, draw_hangs=draw_hangs):
+                    fortune_verts, fortune_edges, _ = voronoi_bounded(self.sites, bound_mode,
+                            draw_bounds=draw_bounds, draw_hangs=draw_hangs, implementation=FORTUNE)
+                    scipy_verts, scipy_edges, _ = voronoi_bounded(self.sites, bound_mode,
+                            draw_bounds=draw_bounds, draw_hangs=draw_hangs, implementation=SCIPY)
+                    # Fortune algorithm works with single precision floats
+                    scipy_segments = edge_segments(scipy_verts, scipy_edges)
+                    fortune_segments = edge_segments(fortune_verts, fortune_edges)
+                    self.assertEqual(len(scipy_segments), len(fortune_segments))
+                    distances = segments_distances(scipy_segments, fortune_segments)
+                    closest = distances.argmin(axis=1)
+                    self.assertEqual(sorted(closest), list(range(len(fortune_segments))))
+                    self.assertLess(distances.min(axis=1).max(), 1e-4)
+
+    @requires(scipy)
+    def test_triangle(self):
+        sites = [(0, 0, 0), (2, 0, 0), (1, 2, 0)]
+        verts, edges, _ = voronoi_bounded(sites, 'BOX', clip=1.0, draw_bounds=False, draw_hangs=True, implementation=SCIPY)
+        self.assertEqual(len(edges), 3)
+        # all three rays start at the circumcenter
+        self.assertEqual(len(set(i for edge in edges for i in edge)), 4)
+        self.assert_sverchok_data_equal(verts[0], (1.0, 0.75, 0.0), precision=8)
@@ -8,8 +8,10 @@
 import bpy
 from bpy.props import EnumProperty, BoolProperty
 
+import sverchok.settings as settings
 from sverchok.utils.sv_logging import sv_logger
 import sverchok.utils.profile as prof
+from sverchok.utils.tracing import tracer
 
 
 class SvProfilingToggle(bpy.types.Operator):
@@ -85,12 +87,64 @@ class SvProfileReset(bpy.types.Operator):
         return {'FINISHED'}
 
 
-classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset]
+class SvTracingToggle(bpy.types.Operator):
+    """Toggle recording of node tree updates on/off"""
+    bl_idname = "node.sverchok_tracing_toggle"
+    bl_label = "Toggle tracing"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        tracer.enabled = not tracer.enabled
+        sv_logger.info("Tracing is set to %s", tracer.enabled)
+        return {'FINISHED'}
+
+
+class SvTracingSave(bpy.types.Operator):
+    """Save recorded updates of node trees to file"""
+    bl_idname = "node.sverchok_tracing_save"
+    bl_label = "Save traced updates"
+    bl_options = {'INTERNAL'}
+
+    file_formats = [
+        ("CHROME", "Chrome trace", "Can be opened by chrome://tracing or Perfetto", 0),
+        ("SPEEDSCOPE", "Speedscope", "Can be opened by https://www.speedscope.app", 1),
+    ]
+
+    file_format: EnumProperty(name="Format", items=file_formats, default="CHROME")
+    filepath: bpy.props.StringProperty(subtype="FILE_PATH")
+
+    def execute(self, context):
+        tracer.save(self.filepath, self.file_format)
+        sv_logger.info("Traced updates saved to %s", self.filepath)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+
+class SvTracingReset(bpy.types.Operator):
+    """Remove recorded updates of node trees"""
+    bl_idname = "node.sverchok_tracing_reset"
+    bl_label = "Reset traced updates"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        tracer.clear()
+        return {'FINISHED'}
+
+
+classes = [SvProfilingToggle, SvProfileDump, SvProfileSave, SvProfileReset,
+           SvTracingToggle, SvTracingSave, SvTracingReset]
+
+
+settings.set_tracing_buffer_size = tracer.set_size
 
 
 def register():
     for class_name in classes:
         bpy.utils.register_class(class_name)
+    tracer.set_size(settings.get_param('tracing_buffer_size', 10))
 
 
 def unregister():
@@ -20,6 +20,7 @@ import bpy
 
 import sverchok
 from sverchok.utils import profile
+from sverchok.utils.tracing import tracer
 from sverchok.ui.development import displaying_sverchok_nodes
 from sverchok.utils.context_managers import sv_preferences
 from sverchok.utils.handle_blender_data import BlTrees
@@ -70,6 +71,7 @@ class SV_PT_ActiveTreePanel(SverchokPanels, bpy.types.Panel):
         col.prop(ng, 'sv_scene_update', text="Scene", icon='SCENE_DATA')
         col.prop(ng, 'sv_process', text="Live update", toggle=True)
         col.prop(ng, "sv_draft", text="Draft mode", toggle=True)
+        col.prop(ng, "sv_parallel_update", text="Parallel", toggle=True)
 
 
 class SV_PT_TreeTimingsPanel(SverchokPanels, bpy.types.Panel):
@@ -145,6 +147,16 @@ class SV_PT_ProfilingPanel(SverchokPanels, bpy.types.Panel):
         col_save.operator("node.sverchok_profile_save", text="Save data", icon="FILE_TICK")
         col_save.operator("node.sverchok_profile_reset", text="Reset data", icon="X")
 
+        col.separator()
+        if tracer.enabled:
+            col.operator("node.sverchok_tracing_toggle", text="Stop tracing", icon="CANCEL")
+        else:
+            col.operator("node.sverchok_tracing_toggle", text="Start tracing", icon="TIME")
+        col_trace = col.column()
+        col_trace.active = tracer.has_traces()
+        col_trace.operator("node.sverchok_tracing_save", text="Save traces", icon="FILE_TICK")
+        col_trace.operator("node.sverchok_tracing_reset", text="Reset traces", icon="X")
+
 
 class SV_PT_SverchokUtilsPanel(SverchokPanels, bpy.types.Panel):
     bl_idname = "SV_PT_SverchokUtilsPanel"
@@ -0,0 +1,178 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Headless evaluation of node trees. Unlike the update system triggered by
+Blender events it does not use timers, does not slice the evaluation by time
+and does not update the UI. It's intended for render farms and parameter
+sweeps. The module can be used as a script:
+
+    $ blender -b file.blend --addons sverchok --python utils/batch_evaluation.py -- \\
+        --tree NodeTree --params params.json --output out_dir --chunk 0 --chunks 4
+
+or instead of a tree in a blend file, a JSON export of a tree can be given:
+
+    $ blender -b --addons sverchok --python utils/batch_evaluation.py -- \\
+        --json tree.json --params params.json --output out_dir
+
+The parameters file should keep list of parameter sets like this:
+
+    [{"frame": 1, "nodes": {"A Number": {"float_": 0.5}}},
+     {"frame": 2, "nodes": {"A Number": {"float_": 1.5}}}]
+
+Both keys are optional. For each parameter set a JSON file with data of output
+sockets is written into the output folder. Several Blender processes can share
+the parameters file by giving each of them its own chunk.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+from time import perf_counter
+from typing import TYPE_CHECKING, Union, Iterable, Optional
+
+import bpy
+from sverchok.core.socket_data import get_output_socket_data
+from sverchok.core.sv_custom_exceptions import SvNoDataError
+from sverchok.core.update_system import UpdateTree, ERROR_KEY, headless_update
+from sverchok.utils.sv_json_import import JSONImporter
+from sverchok.utils.sv_logging import sv_logger
+
+if TYPE_CHECKING:
+    from sverchok.node_tree import SverchCustomTree
+    SverchCustomTree = Union[SverchCustomTree, bpy.types.NodeTree]
+
+
+class BatchEvaluator:
+    """Evaluates given tree for a sequence of parameter sets. Only nodes
+    affected by changed parameters are recalculated between the sets."""
+    def __init__(self, tree: SverchCustomTree, outputs: Iterable[str] = None):
+        """:outputs: sockets to save in format "node name|socket name", if
+        not given outputs of the nodes which outputs are not linked are saved"""
+        self.tree = tree
+        self.outputs = list(outputs) if outputs else None
+
+    @classmethod
+    def from_json(cls, path: str, tree_name: str = 'BatchTree', outputs: Iterable[str] = None) -> BatchEvaluator:
+        """Creates new tree from JSON export of a tree"""
+        importer = JSONImporter.init_from_path(path)
+        tree = bpy.data.node_groups.new(tree_name, 'SverchCustomTreeType')
+        tree.sv_process = False
+        importer.import_into_tree(tree, print_log=False)
+        if importer.has_fails:
+            sv_logger.warning(f"Tree is imported with errors: {importer.fail_massage}")
+        return cls(tree, outputs)
+
+    def evaluate(self, parameters: dict = None) -> dict[str, list]:
+        """Applies parameters to the tree, updates outdated nodes and returns
+        data of output sockets.
+        :parameters: {"frame": int, "nodes": {node_name: {property: value}}}"""
+        parameters = parameters or dict()
+        with headless_update(self.tree):
+            up_tree = UpdateTree.get(self.tree)
+            if (frame := parameters.get('frame')) is not None:
+                bpy.context.scene.frame_set(frame)
+                up_tree.is_animation_updated = False
+            for node_name, properties in parameters.get('nodes', dict()).items():
+                node = self.tree.nodes[node_name]
+                for prop_name, value in properties.items():
+                    setattr(node, prop_name, value)  # marks the node as outdated
+
+            gc.disable()  # for performance
+            try:
+                for _ in UpdateTree.main_update(self.tree, update_interface=False):
+                    pass
+            finally:
+                gc.enable()
+
+        for node in self.tree.nodes:
+            if error := node.get(ERROR_KEY):
+                sv_logger.warning(f'Node "{node.name}" has error: {error}')
+        return self.outputs_data()
+
+    def outputs_data(self) -> dict[str, list]:
+        """Returns data of output sockets which should be saved"""
+        data = dict()
+        for node_name, socket_name in self._output_addresses():
+            try:
+                data[f'{node_name}|{socket_name}'] = get_output_socket_data(
+                    self.tree.nodes[node_name], socket_name)
+            except SvNoDataError:
+                pass
+        return data
+
+    def run(self, parameter_sets: list[dict], output_dir: str, chunk: int = 0, chunks: int = 1):
+        """Evaluates the tree with every parameter set of given chunk and
+        writes results into the output folder, one file per set
+        :chunk: index of the part of parameter sets to evaluate
+        :chunks: number of parts the parameter sets are split into"""
+        os.makedirs(output_dir, exist_ok=True)
+        for index in range(chunk, len(parameter_sets), chunks):
+            start = perf_counter()
+            data = self.evaluate(parameter_sets[index])
+            path = os.path.join(output_dir, f'{index:05d}.json')
+            with open(path, 'w') as file:
+                json.dump({'parameters': parameter_sets[index], 'outputs': data}, file,
+                          default=_json_default)
+            sv_logger.info(f'Parameter set {index} is evaluated and saved into "{path}" '
+                           f'in {int((perf_counter() - start) * 1000)}ms')
+
+    def _output_addresses(self) -> list[tuple[str, str]]:
+        if self.outputs is not None:
+            return [tuple(address.split('|', 1)) for address in self.outputs]
+        return [(n.name, s.name) for n in self.tree.nodes for s in n.outputs
+                if not any(o.is_linked for o in n.outputs)]
+
+
+def _json_default(obj):
+    """Converts data which can't be serialized by json module"""
+    if hasattr(obj, 'tolist'):  # NumPy arrays and scalars
+        return obj.tolist()
+    try:
+        return list(obj)  # mathutils vectors and matrices
+    except TypeError:
+        return repr(obj)
+
+
+def _parse_args(argv: list[str]):
+    import argparse
+    parser = argparse.ArgumentParser(prog="batch_evaluation.py",
+                                     description="Evaluate Sverchok tree for a set of parameters")
+    tree = parser.add_mutually_exclusive_group(required=True)
+    tree.add_argument('--tree', help="Name of a tree in the opened blend file")
+    tree.add_argument('--json', help="Path to JSON export of a tree")
+    parser.add_argument('--params', help="Path to JSON file with list of parameter sets")
+    parser.add_argument('--output', required=True, help="Folder to save results")
+    parser.add_argument('--sockets', nargs='*', help='Output sockets to save as "node name|socket name"')
+    parser.add_argument('--chunk', type=int, default=0, help="Index of part of parameter sets to evaluate")
+    parser.add_argument('--chunks', type=int, default=1, help="Number of parts of parameter sets")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None):
+    import sys
+    if argv is None:
+        argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    args = _parse_args(argv)
+
+    if args.json:
+        evaluator = BatchEvaluator.from_json(args.json, outputs=args.sockets)
+    else:
+        evaluator = BatchEvaluator(bpy.data.node_groups[args.tree], args.sockets)
+
+    if args.params:
+        with open(args.params) as file:
+            parameter_sets = json.load(file)
+    else:
+        parameter_sets = [dict()]
+    evaluator.run(parameter_sets, args.output, args.chunk, args.chunks)
+
+
+if __name__ == "__main__":
+    main()
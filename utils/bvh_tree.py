@@ -28,3 +28,56 @@ def bvh_tree_from_polygons(vertices, polygons, all_triangles=False, epsilon=0.0,
     if isinstance(polygons, np.ndarray):
         polygons = polygons.tolist()
     return BVHTree.FromPolygons(vertices, polygons, all_triangles=all_triangles, epsilon=epsilon)
+
+# Batched queries. BVHTree answers one point at a time, these functions take and return
+# contiguous (n, 3) arrays, so callers do not convert between tuples, Vectors and arrays.
+
+def bvh_find_nearest(bvh, points, distance=None):
+    """
+    Find nearest points of the tree for each of (n, 3) points.
+    Returns locations (n, 3), normals (n, 3), face indices (n,) and distances (n,).
+    Points without nearest point within the distance get nan location and normal,
+    -1 index and infinite distance.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    args = () if distance is None else (distance,)
+    find_nearest = bvh.find_nearest
+    found = [find_nearest(point, *args) for point in points.tolist()]
+    return _stack_bvh_results(found, len(points))
+
+def bvh_ray_cast(bvh, origins, directions, distance=None):
+    """
+    Cast rays from each of (n, 3) origins along one direction or (n, 3) directions.
+    Returns the same arrays as bvh_find_nearest, for the first hit of each ray.
+    """
+    origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+    directions = np.broadcast_to(np.asarray(directions, dtype=np.float64), origins.shape)
+    args = () if distance is None else (distance,)
+    ray_cast = bvh.ray_cast
+    found = [ray_cast(origin, direction, *args)
+             for origin, direction in zip(origins.tolist(), directions.tolist())]
+    return _stack_bvh_results(found, len(origins))
+
+def bvh_points_inside(bvh, points, axis=(1, 0, 0)):
+    """
+    Check which of (n, 3) points are inside of closed mesh of the tree.
+    A point is inside if the first face hit by a ray from it looks away from it.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    locations, normals, indices, _ = bvh_ray_cast(bvh, points, axis)
+    inside = indices >= 0
+    inside[inside] = np.einsum('ij,ij->i', normals[inside], points[inside] - locations[inside]) < 0
+    return inside
+
+def _stack_bvh_results(found, n):
+    locations = np.full((n, 3), np.nan)
+    normals = np.full((n, 3), np.nan)
+    indices = np.full(n, -1, dtype=np.int64)
+    distances = np.full(n, np.inf)
+    hits = [i for i, result in enumerate(found) if result[2] is not None]
+    if hits:
+        locations[hits] = [found[i][0][:] for i in hits]
+        normals[hits] = [found[i][1][:] for i in hits]
+        indices[hits] = [found[i][2] for i in hits]
+        distances[hits] = [found[i][3] for i in hits]
+    return locations, normals, indices, distances
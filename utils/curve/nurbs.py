@@ -9,6 +9,7 @@
 Definition of Sverchok NURBS curve abstract class and some implementations.
 """
 
+from collections import defaultdict
 from copy import deepcopy
 import numpy as np
 from math import pi
@@ -74,6 +75,63 @@ class SvNurbsCurve(SvCurve):
                 pass
         return None
 
+    @staticmethod
+    def evaluate_many(curves, ts):
+        """
+        Evaluate a list of curves. NURBS curves which have the same degree and
+        knotvector are evaluated together, by one tensor contraction, which is
+        much faster than calling evaluate_array() for each of many small
+        curves. Other curves are evaluated one by one.
+
+        Args:
+            curves: list of SvCurve.
+            ts: np.array of shape (n,) - parameter values for all curves; or
+                list of np.arrays, one for each curve.
+
+        Returns:
+            list of np.arrays of shape (n_i, 3), one for each curve.
+        """
+        shared_ts = isinstance(ts, np.ndarray) and ts.ndim == 1
+        if shared_ts:
+            ts_list = [ts] * len(curves)
+        else:
+            ts_list = [np.asarray(t, dtype=np.float64) for t in ts]
+            if len(ts_list) != len(curves):
+                raise Exception(f"Number of parameter arrays ({len(ts_list)}) does not match number of curves ({len(curves)})")
+
+        result = [None] * len(curves)
+        groups = defaultdict(list)
+        for i, curve in enumerate(curves):
+            if isinstance(curve, SvNurbsCurve):
+                knotvector = np.asarray(curve.get_knotvector(), dtype=np.float64)
+                groups[(curve.get_degree(), knotvector.tobytes())].append(i)
+            else:
+                result[i] = curve.evaluate_array(ts_list[i])
+
+        for (degree, _), idxs in groups.items():
+            knotvector = np.asarray(curves[idxs[0]].get_knotvector(), dtype=np.float64)
+            control_points = np.array([curves[i].get_control_points() for i in idxs]) # (m, k, 3)
+            weights = np.array([curves[i].get_weights() for i in idxs]) # (m, k)
+            basis = SvNurbsBasisFunctions(knotvector)
+            if shared_ts:
+                # basis functions are the same for all curves of the group
+                indices, ns = basis.span_basis(degree, ts) # (n, p+1)
+                coeffs = ns[0] * weights[:, indices] # (m, n, p+1)
+                points = control_points[:, indices] # (m, n, p+1, 3)
+                lens = [len(ts)] * len(idxs)
+            else:
+                lens = [len(ts_list[i]) for i in idxs]
+                indices, ns = basis.span_basis(degree, np.concatenate([ts_list[i] for i in idxs])) # (N, p+1)
+                curve_idxs = np.repeat(np.arange(len(idxs)), lens)[np.newaxis].T # (N, 1)
+                coeffs = ns[0] * weights[curve_idxs, indices] # (N, p+1)
+                points = control_points[curve_idxs, indices] # (N, p+1, 3)
+            numerator = (coeffs[..., np.newaxis] * points).sum(axis=-2).reshape((-1, 3))
+            denominator = coeffs.sum(axis=-1).reshape((-1, 1))
+            evaluated = nurbs_divide(numerator, denominator)
+            for i, verts in zip(idxs, np.split(evaluated, np.cumsum(lens)[:-1])):
+                result[i] = verts
+        return result
+
     def copy(self, implementation = None, knotvector = None, control_points = None, weights = None, normalize_knots=False):
         if implementation is None:
             implementation = self.get_nurbs_implementation()
@@ -1154,30 +1212,19 @@ class SvNativeNurbsCurve(SvNurbsCurve):
             return numerator / denominator
 
     def fraction(self, deriv_order, ts):
-        n = len(ts)
         p = self.degree
-        k = len(self.control_points)
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts) for i in range(k)]) # (k, n)
-        coeffs = ns * self.weights[np.newaxis].T # (k, n)
-        coeffs_t = coeffs[np.newaxis].T # (n, k, 1)
-        numerator = (coeffs_t * self.control_points) # (n, k, 3)
+        # only p+1 basis functions are non-zero at each t
+        indices, ns = self.basis.span_basis(p, ts, deriv_order) # (n, p+1), (deriv_order+1, n, p+1)
+        coeffs = ns[deriv_order] * self.weights[indices] # (n, p+1)
+        numerator = (coeffs[:,:,np.newaxis] * self.control_points[indices]) # (n, p+1, 3)
         numerator = numerator.sum(axis=1) # (n, 3)
-        denominator = coeffs.sum(axis=0) # (n,)
+        denominator = coeffs.sum(axis=1) # (n,)
 
         return numerator, denominator[np.newaxis].T
 
     def fraction_single(self, deriv_order, t):
-        p = self.degree
-        k = len(self.control_points)
-        ts = np.array([t])
-        ns = np.array([self.basis.derivative(i, p, deriv_order)(ts)[0] for i in range(k)]) # (k,)
-        coeffs = ns * self.weights # (k, )
-        coeffs_t = coeffs[np.newaxis].T
-        numerator = (coeffs_t * self.control_points) # (k, 3)
-        numerator = numerator.sum(axis=0) # (3,)
-        denominator = coeffs.sum(axis=0) # ()
-
-        return numerator, denominator
+        numerator, denominator = self.fraction(deriv_order, np.array([t]))
+        return numerator[0], denominator[0,0]
 
     def evaluate_array(self, ts):
         if self.is_bezier() and not self.is_rational():
@@ -0,0 +1,396 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Forward-mode automatic differentiation of fields.
+
+SvDual is an array of values together with arrays of their derivatives by
+coordinates of points where fields are evaluated (and, optionally, second
+derivatives). Arithmetic operators and NumPy functions applied to SvDual
+calculate derivatives of the results by the chain rule, so evaluating a field
+once with SvDual coordinates gives its gradient (and Hessian) at all points:
+
+    xs, ys, zs = SvDual.coordinates(xs, ys, zs)
+    value = np.sqrt(xs*xs + ys*ys)  # value.grad[0] is d(value)/dx
+
+Fields which are not written in terms of such operations can calculate their
+derivatives by finite differences, see finite_differences.
+"""
+
+import numpy as np
+
+
+def _outer(grad1, grad2):
+    return grad1[:, np.newaxis] * grad2[np.newaxis, :]
+
+def _is_zero(coefficient):
+    # derivatives which are known to be zero are passed as scalar 0;
+    # skipping them saves operations on (3, 3) + shape arrays
+    return np.isscalar(coefficient) and coefficient == 0
+
+def _add_term(total, coefficient, term):
+    if _is_zero(coefficient):
+        return total
+    if not (np.isscalar(coefficient) and coefficient == 1):
+        term = coefficient * term
+    return term if total is None else total + term
+
+def _unary_derivatives(ufunc, u, value):
+    """First and second derivatives of NumPy function of one argument"""
+    if ufunc is np.sin:
+        return np.cos(u), -value
+    elif ufunc is np.cos:
+        return -np.sin(u), -value
+    elif ufunc is np.tan:
+        d = 1 + value * value
+        return d, 2 * value * d
+    elif ufunc is np.arcsin:
+        d = 1 / np.sqrt(1 - u * u)
+        return d, u * d ** 3
+    elif ufunc is np.arccos:
+        d = 1 / np.sqrt(1 - u * u)
+        return -d, -u * d ** 3
+    elif ufunc is np.arctan:
+        d = 1 / (1 + u * u)
+        return d, -2 * u * d * d
+    elif ufunc is np.sinh:
+        return np.cosh(u), value
+    elif ufunc is np.cosh:
+        return np.sinh(u), value
+    elif ufunc is np.tanh:
+        d = 1 - value * value
+        return d, -2 * value * d
+    elif ufunc is np.arcsinh:
+        d = 1 / np.sqrt(u * u + 1)
+        return d, -u * d ** 3
+    elif ufunc is np.arccosh:
+        d = 1 / np.sqrt(u * u - 1)
+        return d, -u * d ** 3
+    elif ufunc is np.arctanh:
+        d = 1 / (1 - u * u)
+        return d, 2 * u * d * d
+    elif ufunc is np.exp:
+        return value, value
+    elif ufunc is np.expm1:
+        d = value + 1
+        return d, d
+    elif ufunc is np.log:
+        return 1 / u, -1 / (u * u)
+    elif ufunc is np.log2:
+        return 1 / (u * np.log(2)), -1 / (u * u * np.log(2))
+    elif ufunc is np.log10:
+        return 1 / (u * np.log(10)), -1 / (u * u * np.log(10))
+    elif ufunc is np.log1p:
+        d = 1 / (1 + u)
+        return d, -d * d
+    elif ufunc is np.sqrt:
+        return 0.5 / value, -0.25 / (value * u)
+    elif ufunc is np.square:
+        return 2 * u, 2
+    elif ufunc is np.reciprocal:
+        return -value * value, 2 * value ** 3
+    elif ufunc in {np.absolute, np.fabs}:
+        return np.sign(u), 0
+    elif ufunc is np.negative:
+        return -1, 0
+    elif ufunc is np.positive:
+        return 1, 0
+    elif ufunc in {np.degrees, np.rad2deg}:
+        return 180 / np.pi, 0
+    elif ufunc in {np.radians, np.deg2rad}:
+        return np.pi / 180, 0
+    elif ufunc in {np.floor, np.ceil, np.trunc, np.rint, np.sign}:
+        return 0, 0
+    return None
+
+_binary_ufuncs = {np.add, np.subtract, np.multiply, np.true_divide, np.power,
+                  np.arctan2, np.hypot, np.maximum, np.minimum, np.fmax, np.fmin}
+
+# functions which are calculated for values only
+_value_ufuncs = {np.less, np.less_equal, np.greater, np.greater_equal,
+                 np.equal, np.not_equal, np.logical_not, np.logical_and,
+                 np.logical_or, np.isfinite, np.isinf, np.isnan}
+
+def value_of(x):
+    return x.value if isinstance(x, SvDual) else x
+
+class SvDual(object):
+    """
+    :value: array of values
+    :grad: array of first derivatives, grad[i] is derivative by i-th variable
+    :hess: array of second derivatives, hess[i, j] is derivative by i-th and
+        j-th variables; None if second derivatives are zero or not calculated
+    :order: 1 if only first derivatives are calculated, 2 if second ones are too
+    """
+    __slots__ = ('value', 'grad', 'hess', 'order')
+
+    def __init__(self, value, grad, hess=None, order=1):
+        self.value = value
+        self.grad = grad
+        self.hess = hess
+        self.order = order
+
+    @classmethod
+    def coordinates(cls, xs, ys, zs, order=1):
+        """
+        Coordinates of points as variables by which derivatives are calculated
+        """
+        xs, ys, zs = np.broadcast_arrays(*[np.asarray(c, dtype=np.float64) for c in (xs, ys, zs)])
+        result = []
+        for i, values in enumerate((xs, ys, zs)):
+            grad = np.zeros((3, ) + values.shape)
+            grad[i] = 1.0
+            result.append(cls(values, grad, order=order))
+        return result
+
+    @classmethod
+    def constant(cls, value, like):
+        """Value which does not depend on the variables of like"""
+        value = np.broadcast_to(value, like.value.shape)
+        return cls(value, np.zeros(like.grad.shape), order=like.order)
+
+    @classmethod
+    def lift(cls, value, like):
+        """Returns value as is if it is SvDual, otherwise as a constant"""
+        if isinstance(value, SvDual):
+            return value
+        return cls.constant(value, like)
+
+    @classmethod
+    def compose(cls, value, grad, hess, inputs):
+        """
+        Chain rule. Returns function of inputs, where
+        :value: values of the function
+        :grad: grad[i] is derivative of the function by its i-th argument
+        :hess: hess[i, j] is second derivative of the function by i-th and
+            j-th arguments, None for linear function; it's not used if
+            inputs are of first order
+        :inputs: list of SvDual, arguments of the function
+        """
+        order = max(x.order for x in inputs)
+        result_grad = sum(grad[i] * x.grad for i, x in enumerate(inputs))
+        result_hess = None
+        if order > 1:
+            result_hess = 0
+            for i, x in enumerate(inputs):
+                if x.hess is not None:
+                    result_hess = result_hess + grad[i] * x.hess
+                if hess is None:
+                    continue
+                for j, y in enumerate(inputs):
+                    result_hess = result_hess + hess[i, j] * _outer(x.grad, y.grad)
+        return cls(value, result_grad, result_hess, order)
+
+    @staticmethod
+    def where(condition, value1, value2):
+        """np.where for values which can be SvDual"""
+        # np.where with SvDual condition would call this method again
+        condition = value_of(condition)
+        if not isinstance(value1, SvDual) and not isinstance(value2, SvDual):
+            return np.where(condition, value1, value2)
+        like = value1 if isinstance(value1, SvDual) else value2
+        value1, value2 = SvDual.lift(value1, like), SvDual.lift(value2, like)
+        value = np.where(condition, value1.value, value2.value)
+        grad = np.where(condition, value1.grad, value2.grad)
+        hess = None
+        if value1.hess is not None or value2.hess is not None:
+            hess = np.where(condition,
+                        value1.hess if value1.hess is not None else 0,
+                        value2.hess if value2.hess is not None else 0)
+        return SvDual(value, grad, hess, max(value1.order, value2.order))
+
+    def __repr__(self):
+        return f"<SvDual: value={self.value!r}, order={self.order}>"
+
+    def _unary(self, value, d, d2):
+        grad = d * self.grad
+        hess = None
+        if self.order > 1:
+            if self.hess is not None:
+                hess = _add_term(hess, d, self.hess)
+            if not _is_zero(d2):
+                hess = _add_term(hess, d2, _outer(self.grad, self.grad))
+        return SvDual(value, grad, hess, self.order)
+
+    @staticmethod
+    def _binary(a, b, value, fa, fb, faa, fab, fbb):
+        """
+        Function of two arguments, one of which can be a constant;
+        fa, fb, faa, fab, fbb are its partial derivatives
+        """
+        if not isinstance(b, SvDual):
+            return a._unary(value, fa, faa)
+        if not isinstance(a, SvDual):
+            return b._unary(value, fb, fbb)
+        grad = fa * a.grad + fb * b.grad
+        order = max(a.order, b.order)
+        hess = None
+        if order > 1:
+            if not _is_zero(faa):
+                hess = _add_term(hess, faa, _outer(a.grad, a.grad))
+            if not _is_zero(fbb):
+                hess = _add_term(hess, fbb, _outer(b.grad, b.grad))
+            if not _is_zero(fab):
+                mixed = _outer(a.grad, b.grad)
+                hess = _add_term(hess, fab, mixed + mixed.swapaxes(0, 1))
+            if a.hess is not None:
+                hess = _add_term(hess, fa, a.hess)
+            if b.hess is not None:
+                hess = _add_term(hess, fb, b.hess)
+        return SvDual(value, grad, hess, order)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or kwargs:
+            return NotImplemented
+        if ufunc in _value_ufuncs:
+            return ufunc(*[value_of(x) for x in inputs])
+        if len(inputs) == 1:
+            u = self.value
+            value = ufunc(u)
+            derivatives = _unary_derivatives(ufunc, u, value)
+            if derivatives is None:
+                return NotImplemented
+            return self._unary(value, *derivatives)
+        if ufunc not in _binary_ufuncs:
+            return NotImplemented
+
+        a, b = inputs
+        u, v = value_of(a), value_of(b)
+        if ufunc is np.add:
+            return self._binary(a, b, u + v, 1, 1, 0, 0, 0)
+        elif ufunc is np.subtract:
+            return self._binary(a, b, u - v, 1, -1, 0, 0, 0)
+        elif ufunc is np.multiply:
+            return self._binary(a, b, u * v, v, u, 0, 1, 0)
+        elif ufunc is np.true_divide:
+            inv = 1 / v
+            return self._binary(a, b, u * inv, inv, -u * inv * inv, 0, -inv * inv, 2 * u * inv ** 3)
+        elif ufunc is np.power:
+            value = u ** v
+            if not isinstance(b, SvDual):
+                return a._unary(value, v * u ** (v - 1), v * (v - 1) * u ** (v - 2))
+            log_u = np.log(u)
+            return self._binary(a, b, value,
+                        v * u ** (v - 1), log_u * value,
+                        v * (v - 1) * u ** (v - 2), u ** (v - 1) * (1 + v * log_u), log_u * log_u * value)
+        elif ufunc is np.arctan2:
+            # arctan2(y, x)
+            r2 = u * u + v * v
+            return self._binary(a, b, np.arctan2(u, v), v / r2, -u / r2,
+                        -2 * u * v / (r2 * r2), (u * u - v * v) / (r2 * r2), 2 * u * v / (r2 * r2))
+        elif ufunc is np.hypot:
+            h = np.hypot(u, v)
+            h3 = h ** 3
+            return self._binary(a, b, h, u / h, v / h, v * v / h3, -u * v / h3, u * u / h3)
+        else: # maximum, minimum
+            if ufunc in {np.maximum, np.fmax}:
+                return SvDual.where(u >= v, a, b)
+            return SvDual.where(u <= v, a, b)
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func is np.where:
+            return SvDual.where(*args, **kwargs)
+        return NotImplemented
+
+    def astype(self, dtype):
+        # only integer parts are converted to other types, their derivatives are zero
+        return self.value.astype(dtype)
+
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.true_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.true_divide(other, self)
+
+    def __pow__(self, other):
+        return np.power(self, other)
+
+    def __rpow__(self, other):
+        return np.power(other, self)
+
+    def __neg__(self):
+        return np.negative(self)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    def __lt__(self, other):
+        return self.value < value_of(other)
+
+    def __le__(self, other):
+        return self.value <= value_of(other)
+
+    def __gt__(self, other):
+        return self.value > value_of(other)
+
+    def __ge__(self, other):
+        return self.value >= value_of(other)
+
+def finite_differences(evaluate, xs, ys, zs, step):
+    """
+    Derivatives of a function, which can be evaluated only for arrays of
+    values, by finite differences.
+    :evaluate: function of arrays xs, ys, zs which returns a list of arrays
+    :xs, ys, zs: SvDual, arguments
+    :return: list of SvDual
+    """
+    order = max(xs.order, ys.order, zs.order)
+    x, y, z = xs.value, ys.value, zs.value
+    values = evaluate(x, y, z)
+    plus = [evaluate(x + step, y, z), evaluate(x, y + step, z), evaluate(x, y, z + step)]
+    minus = [evaluate(x - step, y, z), evaluate(x, y - step, z), evaluate(x, y, z - step)]
+    if order > 1:
+        mixed = {(0, 1): evaluate(x + step, y + step, z),
+                 (1, 2): evaluate(x, y + step, z + step),
+                 (0, 2): evaluate(x + step, y, z + step)}
+
+    results = []
+    for k, value in enumerate(values):
+        grad = np.array([(plus[i][k] - minus[i][k]) / (2 * step) for i in range(3)])
+        hess = None
+        if order > 1:
+            hess = np.empty((3, 3) + np.shape(value))
+            for i in range(3):
+                hess[i, i] = (plus[i][k] - 2 * value + minus[i][k]) / (step * step)
+            for (i, j), mixed_values in mixed.items():
+                hess[i, j] = hess[j, i] = (mixed_values[k] - plus[i][k] - plus[j][k] + value) / (step * step)
+        results.append(SvDual.compose(value, grad, hess, [xs, ys, zs]))
+    return results
+
+def apply_numerically(function, value, step):
+    """
+    Applies to SvDual a function of one argument, which can be evaluated only
+    for arrays; its derivatives are calculated by finite differences.
+    """
+    u = value.value
+    result = function(u)
+    plus = function(u + step)
+    minus = function(u - step)
+    d = (plus - minus) / (2 * step)
+    d2 = (plus - 2 * result + minus) / (step * step) if value.order > 1 else 0
+    return value._unary(result, d, d2)
@@ -0,0 +1,300 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Evaluation plans of composed fields.
+
+Field nodes build trees of fields (sum of two fields, composition of vector
+and scalar fields and so on). Evaluating such tree recursively allocates
+full size arrays at each level of the tree, so deep trees evaluated on big
+grids require a lot of memory for the temporaries alone.
+
+Instead, fields which are compositions of other fields describe themselves
+to SvFieldPlanner (see add_to_plan methods of fields), and the planner
+flattens the whole tree into a list of steps:
+
+* a field which is referenced several times at the same points is
+  evaluated once;
+* chains of arithmetic expressions are fused into one expression, which is
+  evaluated by numexpr when it is available;
+* points are processed by chunks, so that temporaries take memory
+  proportional to chunk size, not to the number of points.
+
+Fields which know nothing about the planner are evaluated by their own
+evaluate_grid method as one step of the plan.
+"""
+
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+from sverchok.dependencies import numexpr
+
+CHUNK_SIZE = 1 << 16
+# numexpr can't handle expressions with too many operands
+MAX_OPERANDS = 24
+
+_numpy_names = dict(
+    sin = np.sin, cos = np.cos, tan = np.tan,
+    arcsin = np.arcsin, arccos = np.arccos, arctan = np.arctan, arctan2 = np.arctan2,
+    sinh = np.sinh, cosh = np.cosh, tanh = np.tanh,
+    arcsinh = np.arcsinh, arccosh = np.arccosh, arctanh = np.arctanh,
+    exp = np.exp, log = np.log, sqrt = np.sqrt, abs = np.abs, where = np.where,
+    __builtins__ = {})
+
+EXPRESSION = 'EXPRESSION'
+CALL = 'CALL'
+GRID = 'GRID'
+
+class SvPlanStep(object):
+    """
+    One step of the plan.
+    :kind: EXPRESSION - evaluate expression string with names s<slot>;
+        CALL - call function with the arrays of args;
+        GRID - call evaluate_grid of the field with the arrays of args.
+    :outputs: slots where the results are stored
+    Expressions of constants give scalars, CALL and GRID steps get them
+    as arrays of the size of the chunk.
+    """
+    __slots__ = ('kind', 'payload', 'args', 'outputs', 'code')
+
+    def __init__(self, kind, payload, args, outputs):
+        self.kind = kind
+        self.payload = payload
+        self.args = tuple(args)
+        self.outputs = tuple(outputs)
+        self.code = None
+
+    def __repr__(self):
+        outputs = ", ".join(f"s{slot}" for slot in self.outputs)
+        args = ", ".join(f"s{slot}" for slot in self.args)
+        if self.kind == EXPRESSION:
+            return f"{outputs} = {self.payload}"
+        return f"{outputs} = {self.kind}[{self.payload}]({args})"
+
+    def run(self, slots, size, use_numexpr):
+        args = [slots[slot] for slot in self.args]
+        if self.kind != EXPRESSION:
+            args = [np.full(size, arg) if np.ndim(arg) == 0 else arg for arg in args]
+        if self.kind == EXPRESSION:
+            names = {f"s{slot}": value for slot, value in zip(self.args, args)}
+            if use_numexpr and names:
+                results = numexpr.evaluate(self.payload, local_dict=names)
+            else:
+                if self.code is None:
+                    self.code = compile(self.payload, '<field expression>', 'eval')
+                results = eval(self.code, _numpy_names, names)
+        elif self.kind == CALL:
+            results = self.payload(*args)
+        else:
+            results = self.payload.evaluate_grid(*args)
+        if len(self.outputs) == 1:
+            results = (results, )
+        for slot, value in zip(self.outputs, results):
+            slots[slot] = value
+
+class SvFieldPlanner(object):
+    """
+    Builds evaluation plan of a field. Slots 0, 1, 2 are coordinates of
+    points where the field is evaluated; each add_* method returns tuple
+    of slots of the results.
+    """
+    def __init__(self):
+        self.steps = []
+        self.n_slots = 3
+        self._known = dict()
+        # fields are remembered by id, keep them alive while planning
+        self._fields = []
+
+    @classmethod
+    def plan(cls, field):
+        """Returns SvFieldPlan evaluating the field"""
+        planner = cls()
+        outputs = planner.add_field(field, (0, 1, 2))
+        return SvFieldPlan(planner.steps, outputs)
+
+    def _new_step(self, kind, payload, args, n_outputs):
+        outputs = tuple(range(self.n_slots, self.n_slots + n_outputs))
+        self.n_slots += n_outputs
+        self.steps.append(SvPlanStep(kind, payload, args, outputs))
+        return outputs
+
+    def add_field(self, field, coords):
+        """
+        Adds evaluation of the field at the points with coordinates in coords slots
+        """
+        key = (id(field), tuple(coords))
+        if key not in self._known:
+            self._fields.append(field)
+            self._known[key] = tuple(field.add_to_plan(self, tuple(coords)))
+        return self._known[key]
+
+    def add_grid(self, field, coords, n_outputs):
+        """
+        Adds evaluation of the field by its own evaluate_grid method
+        """
+        return self._new_step(GRID, field, coords, n_outputs)
+
+    def add_call(self, function, args, n_outputs=1):
+        """
+        Adds call of vectorized function, which returns one array, or
+        a tuple of n_outputs arrays
+        """
+        return self._new_step(CALL, function, args, n_outputs)
+
+    def add_expression(self, template, *args):
+        """
+        Adds expression, which is a format string with placeholders {0}, {1}...
+        for the args. It should be understood both by NumPy and numexpr, see
+        _numpy_names for available functions.
+        """
+        key = (template, args)
+        if key not in self._known:
+            self._known[key] = self._new_step(EXPRESSION, template, args, 1)
+        return self._known[key]
+
+    def add_constant(self, value):
+        value = float(value)
+        if not np.isfinite(value):
+            # inf and nan can't be written in expression
+            return self.add_call(lambda: value, ())
+        return self.add_expression(repr(value))
+
+class SvFieldPlan(object):
+    """
+    Flat list of steps evaluating a field, with fused expressions
+    """
+    def __init__(self, steps, outputs, chunk_size=CHUNK_SIZE):
+        self.outputs = tuple(outputs)
+        self.chunk_size = chunk_size
+        self.steps = self._fuse(steps)
+        self._free_after = self._liveness()
+
+    def __repr__(self):
+        steps = "\n".join(f"    {step}" for step in self.steps)
+        return f"<Field plan:\n{steps}\n    -> {self.outputs}>"
+
+    def _fuse(self, steps):
+        uses = Counter(slot for step in steps for slot in step.args)
+        uses.update(self.outputs)
+        expression_uses = Counter(slot for step in steps if step.kind == EXPRESSION for slot in step.args)
+
+        def can_inline(slot):
+            return slot not in self.outputs and uses[slot] == 1 and expression_uses[slot] == 1
+
+        fused = []
+        pending = dict()
+
+        def materialize(slot):
+            text, args = pending.pop(slot)
+            fused.append(SvPlanStep(EXPRESSION, text, sorted(args), (slot, )))
+
+        for step in steps:
+            if step.kind != EXPRESSION:
+                for slot in step.args:
+                    if slot in pending:
+                        materialize(slot)
+                fused.append(step)
+                continue
+            parts = []
+            args = set()
+            for i, slot in enumerate(step.args):
+                # expression used several times in the template would be calculated several times
+                inline = step.payload.count("{%s}" % i) == 1
+                if slot in pending and inline and len(args | pending[slot][1]) <= MAX_OPERANDS:
+                    text, slot_args = pending.pop(slot)
+                    parts.append(f"({text})")
+                    args |= slot_args
+                else:
+                    if slot in pending:
+                        materialize(slot)
+                    parts.append(f"s{slot}")
+                    args.add(slot)
+            text = step.payload.format(*parts)
+            output = step.outputs[0]
+            if can_inline(output):
+                pending[output] = (text, args)
+            else:
+                fused.append(SvPlanStep(EXPRESSION, text, sorted(args), (output, )))
+        return fused
+
+    def _liveness(self):
+        last_use = dict()
+        for i, step in enumerate(self.steps):
+            for slot in step.args:
+                last_use[slot] = i
+        for i, step in enumerate(self.steps):
+            for slot in step.outputs:
+                last_use.setdefault(slot, i)
+        free_after = [[] for step in self.steps]
+        for slot, i in last_use.items():
+            if slot not in self.outputs:
+                free_after[i].append(slot)
+        return free_after
+
+    def _run(self, xs, ys, zs, use_numexpr):
+        slots = {0: xs, 1: ys, 2: zs}
+        for step, free in zip(self.steps, self._free_after):
+            step.run(slots, len(xs), use_numexpr)
+            for slot in free:
+                del slots[slot]
+        return [slots[slot] for slot in self.outputs]
+
+    def evaluate(self, xs, ys, zs, use_numexpr=None):
+        """
+        Evaluates the field at points; returns a list of arrays of the same
+        shape as xs, one array for scalar field and three for vector field
+        """
+        if use_numexpr is None:
+            use_numexpr = numexpr is not None
+        xs, ys, zs = np.broadcast_arrays(xs, ys, zs)
+        shape = xs.shape
+        xs, ys, zs = xs.ravel(), ys.ravel(), zs.ravel()
+        n = xs.size
+        if n <= self.chunk_size:
+            results = self._run(xs, ys, zs, use_numexpr)
+            return [np.reshape(result, shape) if np.shape(result) == (n, )
+                        else np.full(n, result).reshape(shape)
+                    for result in results]
+
+        outputs = None
+        for start in range(0, n, self.chunk_size):
+            end = start + self.chunk_size
+            results = self._run(xs[start:end], ys[start:end], zs[start:end], use_numexpr)
+            if outputs is None:
+                outputs = [np.empty(n, dtype=np.asarray(result).dtype) for result in results]
+            for output, result in zip(outputs, results):
+                output[start:end] = result
+        return [output.reshape(shape) for output in outputs]
+
+@lru_cache(maxsize=256)
+def _compile_template(template, n_args):
+    return compile(template.format(*[f"v{i}" for i in range(n_args)]), '<field expression>', 'eval')
+
+def evaluate_expression(template, *values):
+    """
+    Evaluates expression in the form which is used by the planner (format
+    string with placeholders {0}, {1}...) for given values directly; values
+    can be arrays or other objects supporting NumPy functions, for example SvDual.
+    """
+    names = {f"v{i}": value for i, value in enumerate(values)}
+    return eval(_compile_template(template, len(values)), _numpy_names, names)
+
+def evaluate_planned(field, xs, ys, zs):
+    """
+    Evaluates field, which supports planning, at the grid of points. The plan
+    is built once and stored in the field, as fields are not changed after
+    they are created.
+    """
+    plan = field.__dict__.get('_grid_plan')
+    if plan is None:
+        plan = field._grid_plan = SvFieldPlanner.plan(field)
+    results = plan.evaluate(xs, ys, zs)
+    if len(results) == 1:
+        return results[0]
+    return tuple(results)
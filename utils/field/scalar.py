@@ -6,15 +6,18 @@
 # License-Filename: LICENSE
 
 import numpy as np
+from functools import reduce
 from math import copysign, sqrt, sin, cos, atan2, acos, pi
 
 from mathutils import Matrix, Vector
 from mathutils import kdtree
 from mathutils import bvhtree
 
-from sverchok.utils.math import from_cylindrical, from_spherical, to_cylindrical, to_spherical, np_dot
+from sverchok.utils.math import from_cylindrical, from_spherical, to_cylindrical, to_spherical, to_spherical_np, np_dot
 from sverchok.utils.geom import LineEquation, CircleEquation3D
 from sverchok.utils.kdtree import SvKdTree
+from sverchok.utils.field.planner import evaluate_planned, evaluate_expression
+from sverchok.utils.field.dual import SvDual, finite_differences, apply_numerically
 
 ##################
 #                #
@@ -22,6 +25,12 @@ from sverchok.utils.kdtree import SvKdTree
 #                #
 ##################
 
+def apply_falloff(falloff, value, step):
+    """Applies falloff function (if any) to SvDual"""
+    if falloff is None:
+        return value
+    return apply_numerically(falloff, value, step)
+
 class SvScalarField(object):
 
     def __repr__(self):
@@ -37,34 +46,39 @@ class SvScalarField(object):
     def evaluate_grid(self, xs, ys, zs):
         raise Exception("not implemented")
 
+    def add_to_plan(self, planner, coords):
+        """
+        Adds evaluation of the field at points with coordinates in coords
+        slots to SvFieldPlanner; returns tuple with the slot of the result.
+        Fields which are composed of other fields override this, so that the
+        whole composition is evaluated by one plan, see utils/field/planner.py.
+        """
+        return planner.add_grid(self, coords, 1)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        """
+        Evaluates the field at points with coordinates given as SvDual, i.e.
+        calculates values of the field together with their derivatives.
+        Fields override this to calculate derivatives analytically or by
+        automatic differentiation; by default they are calculated by finite
+        differences with the given step.
+        """
+        return finite_differences(lambda xs, ys, zs: [self.evaluate_grid(xs, ys, zs)], xs, ys, zs, step)[0]
+
     def gradient(self, point, step=0.001):
         x, y, z = point
-        v_dx_plus = self.evaluate(x+step,y,z)
-        v_dx_minus = self.evaluate(x-step,y,z)
-        v_dy_plus = self.evaluate(x, y+step, z)
-        v_dy_minus = self.evaluate(x, y-step, z)
-        v_dz_plus = self.evaluate(x, y, z+step)
-        v_dz_minus = self.evaluate(x, y, z-step)
-
-        dv_dx = (v_dx_plus - v_dx_minus) / (2*step)
-        dv_dy = (v_dy_plus - v_dy_minus) / (2*step)
-        dv_dz = (v_dz_plus - v_dz_minus) / (2*step)
-        return np.array([dv_dx, dv_dy, dv_dz])
+        dv_dx, dv_dy, dv_dz = self.gradient_grid(np.array([x]), np.array([y]), np.array([z]), step=step)
+        return np.array([dv_dx[0], dv_dy[0], dv_dz[0]])
 
     def gradient_grid(self, xs, ys, zs, step=0.001):
-        v_dx_plus = self.evaluate_grid(xs+step, ys,zs)
-        v_dx_minus = self.evaluate_grid(xs-step,ys,zs)
-        v_dy_plus = self.evaluate_grid(xs, ys+step, zs)
-        v_dy_minus = self.evaluate_grid(xs, ys-step, zs)
-        v_dz_plus = self.evaluate_grid(xs, ys, zs+step)
-        v_dz_minus = self.evaluate_grid(xs, ys, zs-step)
-
-        dv_dx = (v_dx_plus - v_dx_minus) / (2*step)
-        dv_dy = (v_dy_plus - v_dy_minus) / (2*step)
-        dv_dz = (v_dz_plus - v_dz_minus) / (2*step)
+        value = self.evaluate_dual(*SvDual.coordinates(xs, ys, zs), step=step)
+        return value.grad[0], value.grad[1], value.grad[2]
 
-        R = np.stack((dv_dx, dv_dy, dv_dz))
-        return R[0], R[1], R[2]
+    def hessian_grid(self, xs, ys, zs, step=0.001):
+        """
+        Returns SvDual with values, first and second derivatives of the field
+        """
+        return self.evaluate_dual(*SvDual.coordinates(xs, ys, zs, order=2), step=step)
 
 class SvConstantScalarField(SvScalarField):
     def __init__(self, value):
@@ -78,6 +92,12 @@ class SvConstantScalarField(SvScalarField):
         result = np.full_like(xs, self.value, dtype=np.float64)
         return result
 
+    def add_to_plan(self, planner, coords):
+        return planner.add_constant(self.value)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        return SvDual.constant(np.float64(self.value), xs)
+
 class SvVectorFieldDecomposed(SvScalarField):
     def __init__(self, vfield, coords, axis):
         self.vfield = vfield
@@ -97,17 +117,38 @@ class SvVectorFieldDecomposed(SvScalarField):
             return [rho, phi, theta][self.axis]
 
     def evaluate_grid(self, xs, ys, zs):
-        results = self.vfield.evaluate_grid(xs, ys, zs)
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vector = planner.add_field(self.vfield, coords)
         if self.coords == 'XYZ':
-            return results[self.axis]
+            return vector[self.axis],
         elif self.coords == 'CYL':
-            vectors = np.stack(results).T
-            vectors = np.apply_along_axis(lambda v: np.array(to_cylindrical(tuple(v), mode='radians')), 1, vectors)
-            return vectors[:, self.axis]
+            if self.axis == 0:
+                return planner.add_expression("sqrt({0} * {0} + {1} * {1})", *vector[:2])
+            elif self.axis == 1:
+                return planner.add_expression("arctan2({1}, {0})", *vector[:2])
+            else:
+                return vector[2],
+        else: # SPH
+            axis = self.axis
+            return planner.add_call(lambda *v: to_spherical_np(v, mode='radians')[axis], vector)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        x, y, z = self.vfield.evaluate_dual(xs, ys, zs, step)
+        if self.coords == 'XYZ':
+            return [x, y, z][self.axis]
+        elif self.coords == 'CYL':
+            return [np.sqrt(x*x + y*y), np.arctan2(y, x), z][self.axis]
         else: # SPH
-            vectors = np.stack(results).T
-            vectors = np.apply_along_axis(lambda v: np.array(to_spherical(tuple(v), mode='radians')), 1, vectors)
-            return vectors[:, self.axis]
+            if self.axis == 0:
+                return np.sqrt(x*x + y*y + z*z)
+            elif self.axis == 1:
+                return np.arctan2(y, x)
+            else:
+                rho = np.sqrt(x*x + y*y + z*z)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    return SvDual.where(rho.value == 0, 0.0, np.arccos(z / rho))
 
 class SvScalarFieldLambda(SvScalarField):
     __description__ = "Formula"
@@ -135,6 +176,21 @@ class SvScalarFieldLambda(SvScalarField):
             V = self.in_field.evaluate(x, y, z)
         return self.function(x, y, z, V)
 
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        # formulas are differentiated automatically, if they use only
+        # functions which support dual numbers
+        if self.function_numpy is not None:
+            if self.in_field is None:
+                Vs = np.zeros(xs.value.shape[0])
+            else:
+                Vs = self.in_field.evaluate_dual(xs, ys, zs, step)
+            try:
+                return SvDual.lift(self.function_numpy(xs, ys, zs, Vs), xs)
+            except Exception:
+                # finite differences need only values of the formula
+                pass
+        return super().evaluate_dual(xs, ys, zs, step)
+
 class SvScalarFieldPointDistance(SvScalarField):
     def __init__(self, center, metric='EUCLIDEAN', falloff=None, power=2):
         self.center = center
@@ -165,6 +221,22 @@ class SvScalarFieldPointDistance(SvScalarField):
         else:
             return norms
 
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        x0, y0, z0 = tuple(self.center)
+        xs, ys, zs = xs - x0, ys - y0, zs - z0
+        if self.metric == 'EUCLIDEAN':
+            norms = np.sqrt(xs*xs + ys*ys + zs*zs)
+        elif self.metric == 'CHEBYSHEV':
+            norms = np.maximum(np.maximum(abs(xs), abs(ys)), abs(zs))
+        elif self.metric == 'MANHATTAN':
+            norms = abs(xs) + abs(ys) + abs(zs)
+        elif self.metric == 'CUSTOM':
+            power = self.power
+            norms = (abs(xs)**power + abs(ys)**power + abs(zs)**power) ** (1.0 / power)
+        else:
+            raise Exception('Unknown metric')
+        return apply_falloff(self.falloff, norms, step)
+
     def evaluate(self, x, y, z):
         point = np.array([x, y, z]) - self.center
         if self.metric == 'EUCLIDEAN':
@@ -183,8 +255,14 @@ class SvScalarFieldPointDistance(SvScalarField):
             return norm
 
 class SvScalarFieldBinOp(SvScalarField):
-    def __init__(self, field1, field2, function):
+    """
+    :expression: optional expression doing the same as the function, with
+        placeholders {0} and {1} for the values of fields; it lets the
+        planner fuse the operation with neighbouring ones.
+    """
+    def __init__(self, field1, field2, function, expression=None):
         self.function = function
+        self.expression = expression
         self.field1 = field1
         self.field2 = field2
 
@@ -192,13 +270,31 @@ class SvScalarFieldBinOp(SvScalarField):
         return self.function(self.field1.evaluate(x, y, z), self.field2.evaluate(x, y, z))
 
     def evaluate_grid(self, xs, ys, zs):
-        return self.function(self.field1.evaluate_grid(xs, ys, zs), self.field2.evaluate_grid(xs, ys, zs))
-        #func = lambda xs, ys, zs : self.function(self.field1.evaluate_grid(xs, ys, zs), self.field2.evaluate_grid(xs, ys, zs))
-        #return np.vectorize(func, signature="(m),(m),(m)->(m)")(xs, ys, zs)
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        value1, = planner.add_field(self.field1, coords)
+        value2, = planner.add_field(self.field2, coords)
+        if self.expression is not None:
+            return planner.add_expression(self.expression, value1, value2)
+        return planner.add_call(self.function, (value1, value2))
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        if self.expression is None:
+            # arbitrary function can't be differentiated by the chain rule
+            return super().evaluate_dual(xs, ys, zs, step)
+        value1 = self.field1.evaluate_dual(xs, ys, zs, step)
+        value2 = self.field2.evaluate_dual(xs, ys, zs, step)
+        return evaluate_expression(self.expression, value1, value2)
 
 class SvScalarFieldVectorizedFunction(SvScalarField):
-    def __init__(self, field, function):
+    """
+    :expression: optional expression doing the same as the function, with
+        placeholder {0} for the value of the field.
+    """
+    def __init__(self, field, function, expression=None):
         self.function = function
+        self.expression = expression
         self.field = field
         self.__description__ = function.__name__
 
@@ -206,7 +302,18 @@ class SvScalarFieldVectorizedFunction(SvScalarField):
         return self.function(self.field.evaluate(x,y,z))
 
     def evaluate_grid(self, xs, ys, zs):
-        return self.function(self.field.evaluate_grid(xs,ys,zs))
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        value = planner.add_field(self.field, coords)
+        if self.expression is not None:
+            return planner.add_expression(self.expression, *value)
+        return planner.add_call(self.function, value)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        if self.expression is None:
+            return super().evaluate_dual(xs, ys, zs, step)
+        return evaluate_expression(self.expression, self.field.evaluate_dual(xs, ys, zs, step))
 
 class SvCoordinateScalarField(SvScalarField):
     def __init__(self, coordinate):
@@ -251,6 +358,42 @@ class SvCoordinateScalarField(SvScalarField):
         else:
             raise Exception("Unknown variable: " + self.coordinate)
 
+    def add_to_plan(self, planner, coords):
+        if self.coordinate == 'X':
+            return coords[0],
+        elif self.coordinate == 'Y':
+            return coords[1],
+        elif self.coordinate == 'Z':
+            return coords[2],
+        elif self.coordinate == 'CYL_RHO':
+            return planner.add_expression("sqrt({0} * {0} + {1} * {1})", *coords[:2])
+        elif self.coordinate == 'PHI':
+            return planner.add_expression("arctan2({1}, {0})", *coords[:2])
+        elif self.coordinate == 'SPH_RHO':
+            return planner.add_expression("sqrt({0} * {0} + {1} * {1} + {2} * {2})", *coords)
+        elif self.coordinate == 'SPH_THETA':
+            return planner.add_expression("arccos({2} / sqrt({0} * {0} + {1} * {1} + {2} * {2}))", *coords)
+        else:
+            raise Exception("Unknown variable: " + self.coordinate)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        if self.coordinate == 'X':
+            return xs
+        elif self.coordinate == 'Y':
+            return ys
+        elif self.coordinate == 'Z':
+            return zs
+        elif self.coordinate == 'CYL_RHO':
+            return np.sqrt(xs*xs + ys*ys)
+        elif self.coordinate == 'PHI':
+            return np.arctan2(ys, xs)
+        elif self.coordinate == 'SPH_RHO':
+            return np.sqrt(xs*xs + ys*ys + zs*zs)
+        elif self.coordinate == 'SPH_THETA':
+            return np.arccos(zs / np.sqrt(xs*xs + ys*ys + zs*zs))
+        else:
+            raise Exception("Unknown variable: " + self.coordinate)
+
 class SvNegatedScalarField(SvScalarField):
     def __init__(self, field):
         self.field = field
@@ -261,7 +404,13 @@ class SvNegatedScalarField(SvScalarField):
         return -x
 
     def evaluate_grid(self, xs, ys, zs):
-        return (- self.field.evaluate_grid(xs, ys, zs))
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        return planner.add_expression("-{0}", *planner.add_field(self.field, coords))
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        return - self.field.evaluate_dual(xs, ys, zs, step)
 
 class SvAbsScalarField(SvScalarField):
     def __init__(self, field):
@@ -273,7 +422,13 @@ class SvAbsScalarField(SvScalarField):
         return abs(v) 
 
     def evaluate_grid(self, xs, ys, zs):
-        return np.abs(self.field.evaluate_grid(xs, ys, zs))
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        return planner.add_expression("abs({0})", *planner.add_field(self.field, coords))
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        return abs(self.field.evaluate_dual(xs, ys, zs, step))
 
 class SvVectorFieldsScalarProduct(SvScalarField):
     def __init__(self, field1, field2):
@@ -287,12 +442,17 @@ class SvVectorFieldsScalarProduct(SvScalarField):
         return np.dot(v1, v2)
 
     def evaluate_grid(self, xs, ys, zs):
-        vx1, vy1, vz1 = self.field1.evaluate_grid(xs, ys, zs)
-        vx2, vy2, vz2 = self.field2.evaluate_grid(xs, ys, zs)
-        vectors1 = np.stack((vx1, vy1, vz1)).T
-        vectors2 = np.stack((vx2, vy2, vz2)).T
-        result = np.vectorize(np.dot, signature="(3),(3)->()")(vectors1, vectors2)
-        return result
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vector1 = planner.add_field(self.field1, coords)
+        vector2 = planner.add_field(self.field2, coords)
+        return planner.add_expression("{0} * {3} + {1} * {4} + {2} * {5}", *vector1, *vector2)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        x1, y1, z1 = self.field1.evaluate_dual(xs, ys, zs, step)
+        x2, y2, z2 = self.field2.evaluate_dual(xs, ys, zs, step)
+        return x1 * x2 + y1 * y2 + z1 * z2
 
 class SvVectorFieldNorm(SvScalarField):
     def __init__(self, field):
@@ -304,10 +464,15 @@ class SvVectorFieldNorm(SvScalarField):
         return np.linalg.norm(v)
 
     def evaluate_grid(self, xs, ys, zs):
-        vx, vy, vz = self.field.evaluate_grid(xs, ys, zs)
-        vectors = np.stack((vx, vy, vz)).T
-        result = np.linalg.norm(vectors, axis=1)
-        return result
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vector = planner.add_field(self.field, coords)
+        return planner.add_expression("sqrt({0} * {0} + {1} * {1} + {2} * {2})", *vector)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        x, y, z = self.field.evaluate_dual(xs, ys, zs, step)
+        return np.sqrt(x*x + y*y + z*z)
 
 class SvMergedScalarField(SvScalarField):
     def __init__(self, mode, fields):
@@ -336,15 +501,36 @@ class SvMergedScalarField(SvScalarField):
         return value
 
     def evaluate_grid(self, xs, ys, zs):
-        values = np.array([field.evaluate_grid(xs, ys, zs) for field in self.fields])
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        values = [planner.add_field(field, coords)[0] for field in self.fields]
+        if self.mode in {'SUM', 'AVG'}:
+            expression = " + ".join("{%s}" % i for i in range(len(values)))
+            if self.mode == 'AVG':
+                expression = "({}) / {}".format(expression, len(values))
+            return planner.add_expression(expression, *values)
+        return planner.add_call(self._merge_grid, values)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        if self.mode == 'MINDIFF':
+            return super().evaluate_dual(xs, ys, zs, step)
+        values = [field.evaluate_dual(xs, ys, zs, step) for field in self.fields]
+        if self.mode == 'MIN':
+            return reduce(np.minimum, values)
+        elif self.mode == 'MAX':
+            return reduce(np.maximum, values)
+        result = reduce(lambda a, b: a + b, values)
+        if self.mode == 'AVG':
+            result = result / len(values)
+        return result
+
+    def _merge_grid(self, *values):
+        values = np.array(values)
         if self.mode == 'MIN':
             value = np.min(values, axis=0)
         elif self.mode == 'MAX':
             value = np.max(values, axis=0)
-        elif self.mode == 'SUM':
-            value = np.sum(values, axis=0)
-        elif self.mode == 'AVG':
-            value = np.mean(values, axis=0)
         elif self.mode == 'MINDIFF':
             value = self._minimal_diff(values, axis=0)
         else:
@@ -359,7 +545,7 @@ class SvKdtScalarField(SvScalarField):
         if kdt is not None:
             self.kdt = kdt
         elif vertices is not None:
-            self.kdt = SvKdTree.new(SvKdTree.best_available_implementation(), vertices, power=power)
+            self.kdt = SvKdTree.cached(SvKdTree.best_available_implementation(), vertices, power=power)
         else:
             raise Exception("Either kdt or vertices must be provided")
 
@@ -380,6 +566,17 @@ class SvKdtScalarField(SvScalarField):
         else:
             return distances
 
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        if getattr(self.kdt, 'power', 2) != 2:
+            return super().evaluate_dual(xs, ys, zs, step)
+        # distance to the nearest point is differentiated as distance to fixed point
+        points = np.stack((xs.value, ys.value, zs.value)).T
+        locs, idxs, distances = self.kdt.query_array(points)
+        locs = np.asarray(locs)
+        dxs, dys, dzs = xs - locs[:,0], ys - locs[:,1], zs - locs[:,2]
+        distances = np.sqrt(dxs*dxs + dys*dys + dzs*dzs)
+        return apply_falloff(self.falloff, distances, step)
+
 class SvLineAttractorScalarField(SvScalarField):
     __description__ = "Line Attractor"
 
@@ -412,6 +609,15 @@ class SvLineAttractorScalarField(SvScalarField):
         else:
             return norms
 
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        direction = self.direction
+        direction2 = np.dot(direction, direction)
+        to_center = [c - v for c, v in zip(self.center, (xs, ys, zs))]
+        dot = sum(v * d for v, d in zip(to_center, direction))
+        vectors = [v - dot * (d / direction2) for v, d in zip(to_center, direction)]
+        norms = np.sqrt(sum(v * v for v in vectors))
+        return apply_falloff(self.falloff, norms, step)
+
 class SvPlaneAttractorScalarField(SvScalarField):
     __description__ = "Plane Attractor"
 
@@ -444,6 +650,13 @@ class SvPlaneAttractorScalarField(SvScalarField):
         else:
             return norms
 
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        direction = self.direction
+        direction2 = np.dot(direction, direction)
+        dot = sum((c - v) * d for c, v, d in zip(self.center, (xs, ys, zs), direction))
+        norms = abs(dot) * (sqrt(direction2) / direction2)
+        return apply_falloff(self.falloff, norms, step)
+
 class SvCircleAttractorScalarField(SvScalarField):
     __description__ = "Circle Attractor"
 
@@ -469,6 +682,17 @@ class SvCircleAttractorScalarField(SvScalarField):
         else:
             return distances
 
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        # distance to the circle is sqrt(h^2 + (r - R)^2), where h is
+        # distance to the plane of the circle and r is distance to its axis
+        normal = self.circle.normal / np.linalg.norm(self.circle.normal)
+        vs = [v - c for v, c in zip((xs, ys, zs), self.circle.center)]
+        height = sum(v * n for v, n in zip(vs, normal))
+        radial = [v - height * n for v, n in zip(vs, normal)]
+        r = np.sqrt(sum(v * v for v in radial))
+        distances = np.sqrt(height * height + (r - self.circle.radius) ** 2)
+        return apply_falloff(self.falloff, distances, step)
+
 class SvBvhAttractorScalarField(SvScalarField):
     __description__ = "BVH Attractor (faces)"
 
@@ -608,6 +832,21 @@ class SvEdgeAttractorScalarField(SvScalarField):
         else:
             return distances
 
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        v1 = np.array(self.v1)
+        v2 = np.array(self.v2)
+        edge = v2 - v1
+        dv1 = [v - c for v, c in zip((xs, ys, zs), v1)]
+        dv2 = [v - c for v, c in zip((xs, ys, zs), v2)]
+        dot1 = sum(v * e for v, e in zip(dv1, edge))
+        dot2 = -sum(v * e for v, e in zip(dv2, edge))
+        to_v1 = np.sqrt(sum(v * v for v in dv1))
+        to_v2 = np.sqrt(sum(v * v for v in dv2))
+        perpendicular = [v - dot1 * (e / np.dot(edge, edge)) for v, e in zip(dv1, edge)]
+        to_line = np.sqrt(sum(v * v for v in perpendicular))
+        distances = SvDual.where(dot1.value < 0, to_v1, SvDual.where(dot2.value < 0, to_v2, to_line))
+        return apply_falloff(self.falloff, distances, step)
+
 class SvVectorScalarFieldComposition(SvScalarField):
     __description__ = "Composition"
 
@@ -621,8 +860,14 @@ class SvVectorScalarFieldComposition(SvScalarField):
         return v2
     
     def evaluate_grid(self, xs, ys, zs):
-        vx1, vy1, vz1 = self.vfield.evaluate_grid(xs, ys, zs)
-        return self.sfield.evaluate_grid(vx1, vy1, vz1)
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vector = planner.add_field(self.vfield, coords)
+        return planner.add_field(self.sfield, vector)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        return self.sfield.evaluate_dual(*self.vfield.evaluate_dual(xs, ys, zs, step), step)
 
 class SvVectorFieldDivergence(SvScalarField):
     def __init__(self, field, step):
@@ -646,19 +891,8 @@ class SvVectorFieldDivergence(SvScalarField):
         return dx_dx + dy_dy + dz_dz
     
     def evaluate_grid(self, xs, ys, zs):
-        step = self.step
-        xs_dx_plus, _, _ = self.field.evaluate_grid(xs+step, ys,zs)
-        xs_dx_minus, _, _ = self.field.evaluate_grid(xs-step,ys,zs)
-        _, ys_dy_plus, _ = self.field.evaluate_grid(xs, ys+step, zs)
-        _, ys_dy_minus, _ = self.field.evaluate_grid(xs, ys-step, zs)
-        _, _, zs_dz_plus = self.field.evaluate_grid(xs, ys, zs+step)
-        _, _, zs_dz_minus = self.field.evaluate_grid(xs, ys, zs-step)
-
-        dx_dx = (xs_dx_plus - xs_dx_minus) / (2*step)
-        dy_dy = (ys_dy_plus - ys_dy_minus) / (2*step)
-        dz_dz = (zs_dz_plus - zs_dz_minus) / (2*step)
-
-        return dx_dx + dy_dy + dz_dz
+        vx, vy, vz = self.field.evaluate_dual(*SvDual.coordinates(xs, ys, zs), self.step)
+        return vx.grad[0] + vy.grad[1] + vz.grad[2]
 
 class SvScalarFieldLaplacian(SvScalarField):
     def __init__(self, field, step):
@@ -677,22 +911,14 @@ class SvScalarFieldLaplacian(SvScalarField):
         v0 = self.field.evaluate(x, y, z)
 
         sides = v_dx_plus + v_dx_minus + v_dy_plus + v_dy_minus + v_dz_plus + v_dz_minus
-        result = (sides - 6*v0) / (8 * step * step * step)
+        result = (sides - 6*v0) / (step * step)
         return result
     
     def evaluate_grid(self, xs, ys, zs):
-        step = self.step
-        v_dx_plus = self.field.evaluate_grid(xs+step, ys,zs)
-        v_dx_minus = self.field.evaluate_grid(xs-step,ys,zs)
-        v_dy_plus = self.field.evaluate_grid(xs, ys+step, zs)
-        v_dy_minus = self.field.evaluate_grid(xs, ys-step, zs)
-        v_dz_plus = self.field.evaluate_grid(xs, ys, zs+step)
-        v_dz_minus = self.field.evaluate_grid(xs, ys, zs-step)
-        v0 = self.field.evaluate_grid(xs, ys, zs)
-
-        sides = v_dx_plus + v_dx_minus + v_dy_plus + v_dy_minus + v_dz_plus + v_dz_minus
-        result = (sides - 6*v0) / (8 * step * step * step)
-        return result
+        value = self.field.hessian_grid(xs, ys, zs, self.step)
+        if value.hess is None:
+            return np.zeros_like(value.value)
+        return value.hess[0, 0] + value.hess[1, 1] + value.hess[2, 2]
 
 class ScalarFieldCurvatureCalculator(object):
     # Ref.: Curvature formulas for implicit curves and surfaces // Ron Goldman // doi:10.1016/j.cagd.2005.06.005
@@ -708,33 +934,20 @@ class ScalarFieldCurvatureCalculator(object):
         self.prev_ys = ys
         self.prev_zs = zs
 
-        step = self.step
-        step2 = step*step
         n = self.n = len(xs)
-        v_dx_plus = self.field.evaluate_grid(xs+step, ys,zs)
-        v_dx_minus = self.field.evaluate_grid(xs-step,ys,zs)
-        v_dy_plus = self.field.evaluate_grid(xs, ys+step, zs)
-        v_dy_minus = self.field.evaluate_grid(xs, ys-step, zs)
-        v_dz_plus = self.field.evaluate_grid(xs, ys, zs+step)
-        v_dz_minus = self.field.evaluate_grid(xs, ys, zs-step)
-
-        v_dxy_plus = self.field.evaluate_grid(xs+step, ys+step, zs)
-        v_dyz_plus = self.field.evaluate_grid(xs, ys+step, zs+step)
-        v_dxz_plus = self.field.evaluate_grid(xs+step, ys, zs+step)
-
-        v0 = self.v0 = self.field.evaluate_grid(xs, ys, zs)
-
-        self.dx = (v_dx_plus - v0) / step
-        self.dy = (v_dy_plus - v0) / step
-        self.dz = (v_dz_plus - v0) / step
-
-        self.dxx = (v_dx_plus - 2*v0 + v_dx_minus) / step2
-        self.dyy = (v_dy_plus - 2*v0 + v_dy_minus) / step2
-        self.dzz = (v_dz_plus - 2*v0 + v_dz_minus) / step2
-
-        self.dxy = (v_dxy_plus - v_dx_plus - v_dy_plus + v0) / step2
-        self.dyz = (v_dyz_plus - v_dy_plus - v_dz_plus + v0) / step2
-        self.dxz = (v_dxz_plus - v_dx_plus - v_dz_plus + v0) / step2
+        value = self.field.hessian_grid(xs, ys, zs, self.step)
+        hess = value.hess if value.hess is not None else np.zeros((3, 3, n))
+        self.v0 = value.value
+
+        self.dx, self.dy, self.dz = value.grad
+
+        self.dxx = hess[0, 0]
+        self.dyy = hess[1, 1]
+        self.dzz = hess[2, 2]
+
+        self.dxy = hess[0, 1]
+        self.dyz = hess[1, 2]
+        self.dxz = hess[0, 2]
 
     def gauss(self):
         n = self.n
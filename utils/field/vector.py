@@ -17,6 +17,8 @@ from sverchok.utils.geom import LineEquation, CircleEquation3D
 from sverchok.utils.math import from_cylindrical, from_spherical, np_dot
 from sverchok.utils.kdtree import SvKdTree
 from sverchok.utils.field.voronoi import SvVoronoiFieldData
+from sverchok.utils.field.planner import evaluate_planned, evaluate_expression
+from sverchok.utils.field.dual import SvDual, finite_differences
 
 ##################
 #                #
@@ -38,6 +40,31 @@ class SvVectorField(object):
     def evaluate_grid(self, xs, ys, zs):
         raise Exception("not implemented")
 
+    def add_to_plan(self, planner, coords):
+        """
+        Adds evaluation of the field at points with coordinates in coords
+        slots to SvFieldPlanner; returns tuple of slots of vector components.
+        Fields which are composed of other fields override this, see
+        utils/field/planner.py.
+        """
+        return planner.add_grid(self, coords, 3)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        """
+        Evaluates the field at points with coordinates given as SvDual;
+        returns three SvDual, components of the vectors with their
+        derivatives. By default derivatives are calculated by finite
+        differences with the given step.
+        """
+        return finite_differences(lambda xs, ys, zs: list(self.evaluate_grid(xs, ys, zs)), xs, ys, zs, step)
+
+    def jacobian_grid(self, xs, ys, zs, step=0.001):
+        """
+        Returns array of shape (3, 3) + xs.shape, derivatives of i-th
+        component of the field by j-th coordinate.
+        """
+        return np.array([v.grad for v in self.evaluate_dual(*SvDual.coordinates(xs, ys, zs), step=step)])
+
     def evaluate_array(self, points):
         xs = points[:,0]
         ys = points[:,1]
@@ -56,11 +83,24 @@ class SvMatrixVectorField(SvVectorField):
         return np.array(v)
 
     def evaluate_grid(self, xs, ys, zs):
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
         matrix = np.array(self.matrix.to_3x3())
         translation = np.array(self.matrix.translation)
-        points = np.stack((xs, ys, zs)).T
-        R = np.apply_along_axis(lambda v : matrix @ v + translation - v, 1, points).T
-        return R[0], R[1], R[2]
+        result = []
+        for i in range(3):
+            (m0, m1, m2), t = matrix[i].tolist(), float(translation[i])
+            expression = f"{m0!r} * {{0}} + {m1!r} * {{1}} + {m2!r} * {{2}} + {t!r} - {{{i}}}"
+            result.extend(planner.add_expression(expression, *coords))
+        return result
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        matrix = np.array(self.matrix.to_3x3())
+        translation = np.array(self.matrix.translation)
+        vs = (xs, ys, zs)
+        return [matrix[i, 0] * xs + matrix[i, 1] * ys + matrix[i, 2] * zs + translation[i] - vs[i]
+                    for i in range(3)]
 
 class SvConstantVectorField(SvVectorField):
 
@@ -78,6 +118,12 @@ class SvConstantVectorField(SvVectorField):
         rz = np.full_like(zs, z)
         return rx, ry, rz
 
+    def add_to_plan(self, planner, coords):
+        return [planner.add_constant(v)[0] for v in self.vector]
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        return [SvDual.constant(np.float64(v), xs) for v in self.vector]
+
 class SvComposedVectorField(SvVectorField):
     def __init__(self, coords, sfield1, sfield2, sfield3):
         self.coords = coords
@@ -98,19 +144,34 @@ class SvComposedVectorField(SvVectorField):
             return np.array(from_spherical(v1, v2, v3, mode='radians'))
 
     def evaluate_grid(self, xs, ys, zs):
-        v1s = self.sfield1.evaluate_grid(xs, ys, zs)
-        v2s = self.sfield2.evaluate_grid(xs, ys, zs)
-        v3s = self.sfield3.evaluate_grid(xs, ys, zs)
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        v1, = planner.add_field(self.sfield1, coords)
+        v2, = planner.add_field(self.sfield2, coords)
+        v3, = planner.add_field(self.sfield3, coords)
         if self.coords == 'XYZ':
-            return v1s, v2s, v3s
+            return v1, v2, v3
         elif self.coords == 'CYL':
-            vectors = np.stack((v1s, v2s, v3s)).T
-            vectors = np.apply_along_axis(lambda v: np.array(from_cylindrical(*tuple(v), mode='radians')), 1, vectors).T
-            return vectors[0], vectors[1], vectors[2]
+            x, = planner.add_expression("{0} * cos({1})", v1, v2)
+            y, = planner.add_expression("{0} * sin({1})", v1, v2)
+            return x, y, v3
         else: # SPH:
-            vectors = np.stack((v1s, v2s, v3s)).T
-            vectors = np.apply_along_axis(lambda v: np.array(from_spherical(*tuple(v), mode='radians')), 1, vectors).T
-            return vectors[0], vectors[1], vectors[2]
+            x, = planner.add_expression("{0} * sin({2}) * cos({1})", v1, v2, v3)
+            y, = planner.add_expression("{0} * sin({2}) * sin({1})", v1, v2, v3)
+            z, = planner.add_expression("{0} * cos({1})", v1, v3)
+            return x, y, z
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        v1 = self.sfield1.evaluate_dual(xs, ys, zs, step)
+        v2 = self.sfield2.evaluate_dual(xs, ys, zs, step)
+        v3 = self.sfield3.evaluate_dual(xs, ys, zs, step)
+        if self.coords == 'XYZ':
+            return [v1, v2, v3]
+        elif self.coords == 'CYL':
+            return [v1 * np.cos(v2), v1 * np.sin(v2), v3]
+        else: # SPH:
+            return [v1 * np.sin(v3) * np.cos(v2), v1 * np.sin(v3) * np.sin(v2), v1 * np.cos(v3)]
 
 class SvAbsoluteVectorField(SvVectorField):
     def __init__(self, field):
@@ -122,8 +183,15 @@ class SvAbsoluteVectorField(SvVectorField):
         return r + np.array([x, y, z])
 
     def evaluate_grid(self, xs, ys, zs):
-        rxs, rys, rzs = self.field.evaluate_grid(xs, ys, zs)
-        return rxs + xs, rys + ys, rzs + zs
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vector = planner.add_field(self.field, coords)
+        return [planner.add_expression("{0} + {1}", v, c)[0] for v, c in zip(vector, coords)]
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        vector = self.field.evaluate_dual(xs, ys, zs, step)
+        return [v + c for v, c in zip(vector, (xs, ys, zs))]
 
 class SvRelativeVectorField(SvVectorField):
     def __init__(self, field):
@@ -135,8 +203,15 @@ class SvRelativeVectorField(SvVectorField):
         return r - np.array([x, y, z])
 
     def evaluate_grid(self, xs, ys, zs):
-        rxs, rys, rzs = self.field.evaluate_grid(xs, ys, zs)
-        return rxs - xs, rys - ys, rzs - zs
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vector = planner.add_field(self.field, coords)
+        return [planner.add_expression("{0} - {1}", v, c)[0] for v, c in zip(vector, coords)]
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        vector = self.field.evaluate_dual(xs, ys, zs, step)
+        return [v - c for v, c in zip(vector, (xs, ys, zs))]
 
 class SvVectorFieldLambda(SvVectorField):
 
@@ -161,6 +236,19 @@ class SvVectorFieldLambda(SvVectorField):
             Vs = Vs.T
             return self.function_numpy(xs, ys, zs, Vs)
 
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        # see SvScalarFieldLambda.evaluate_dual
+        if self.function_numpy is not None:
+            if self.in_field is None:
+                Vs = np.zeros(xs.value.shape[0])
+            else:
+                Vs = self.in_field.evaluate_dual(xs, ys, zs, step)
+            try:
+                return [SvDual.lift(v, xs) for v in self.function_numpy(xs, ys, zs, Vs)]
+            except TypeError:
+                pass
+        return super().evaluate_dual(xs, ys, zs, step)
+
     def evaluate(self, x, y, z):
         if self.in_field is None:
             V = None
@@ -169,8 +257,15 @@ class SvVectorFieldLambda(SvVectorField):
         return np.array(self.function(x, y, z, V))
 
 class SvVectorFieldBinOp(SvVectorField):
-    def __init__(self, field1, field2, function):
+    """
+    :expression: optional expression doing the same as the function for one
+        vector component, with placeholders {0} and {1} for components of
+        vectors of the fields; it lets the planner fuse the operation with
+        neighbouring ones.
+    """
+    def __init__(self, field1, field2, function, expression=None):
         self.function = function
+        self.expression = expression
         self.field1 = field1
         self.field2 = field2
         self.__description__ = f"<BinOp ({field1}, {field2})>"
@@ -179,12 +274,25 @@ class SvVectorFieldBinOp(SvVectorField):
         return self.function(self.field1.evaluate(x, y, z), self.field2.evaluate(x, y, z))
 
     def evaluate_grid(self, xs, ys, zs):
-        def func(xs, ys, zs):
-            vx1, vy1, vz1 = self.field1.evaluate_grid(xs, ys, zs)
-            vx2, vy2, vz2 = self.field2.evaluate_grid(xs, ys, zs)
-            R = self.function(np.array([vx1, vy1, vz1]), np.array([vx2, vy2, vz2]))
-            return R[0], R[1], R[2]
-        return np.vectorize(func, signature="(m),(m),(m)->(m),(m),(m)")(xs, ys, zs)
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vector1 = planner.add_field(self.field1, coords)
+        vector2 = planner.add_field(self.field2, coords)
+        if self.expression is not None:
+            return [planner.add_expression(self.expression, v1, v2)[0] for v1, v2 in zip(vector1, vector2)]
+        return planner.add_call(self._apply, vector1 + vector2, n_outputs=3)
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        if self.expression is None:
+            return super().evaluate_dual(xs, ys, zs, step)
+        vector1 = self.field1.evaluate_dual(xs, ys, zs, step)
+        vector2 = self.field2.evaluate_dual(xs, ys, zs, step)
+        return [evaluate_expression(self.expression, v1, v2) for v1, v2 in zip(vector1, vector2)]
+
+    def _apply(self, vx1, vy1, vz1, vx2, vy2, vz2):
+        R = self.function(np.array([vx1, vy1, vz1]), np.array([vx2, vy2, vz2]))
+        return R[0], R[1], R[2]
 
 class SvAverageVectorField(SvVectorField):
 
@@ -197,16 +305,18 @@ class SvAverageVectorField(SvVectorField):
         return np.mean(vectors, axis=0)
 
     def evaluate_grid(self, xs, ys, zs):
-        def func(xs, ys, zs):
-            data = []
-            for field in self.fields:
-                vx, vy, vz = field.evaluate_grid(xs, ys, zs)
-                vectors = np.stack((vx, vy, vz)).T
-                data.append(vectors)
-            data = np.array(data)
-            mean = np.mean(data, axis=0).T
-            return mean[0], mean[1], mean[2]
-        return np.vectorize(func, signature="(m),(m),(m)->(m),(m),(m)")(xs, ys, zs)
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vectors = [planner.add_field(field, coords) for field in self.fields]
+        n = len(vectors)
+        expression = "({}) / {}".format(" + ".join("{%s}" % i for i in range(n)), n)
+        return [planner.add_expression(expression, *components)[0] for components in zip(*vectors)]
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        vectors = [field.evaluate_dual(xs, ys, zs, step) for field in self.fields]
+        n = len(vectors)
+        return [sum(components) / n for components in zip(*vectors)]
 
 class SvVectorFieldCrossProduct(SvVectorField):
     def __init__(self, field1, field2):
@@ -220,12 +330,20 @@ class SvVectorFieldCrossProduct(SvVectorField):
         return np.cross(v1, v2)
 
     def evaluate_grid(self, xs, ys, zs):
-        vx1, vy1, vz1 = self.field1.evaluate_grid(xs, ys, zs)
-        vx2, vy2, vz2 = self.field2.evaluate_grid(xs, ys, zs)
-        vectors1 = np.stack((vx1, vy1, vz1)).T
-        vectors2 = np.stack((vx2, vy2, vz2)).T
-        R = np.cross(vectors1, vectors2).T
-        return R[0], R[1], R[2]
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vector1 = planner.add_field(self.field1, coords)
+        vector2 = planner.add_field(self.field2, coords)
+        x, = planner.add_expression("{1} * {5} - {2} * {4}", *vector1, *vector2)
+        y, = planner.add_expression("{2} * {3} - {0} * {5}", *vector1, *vector2)
+        z, = planner.add_expression("{0} * {4} - {1} * {3}", *vector1, *vector2)
+        return x, y, z
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        x1, y1, z1 = self.field1.evaluate_dual(xs, ys, zs, step)
+        x2, y2, z2 = self.field2.evaluate_dual(xs, ys, zs, step)
+        return [y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2]
 
 class SvVectorFieldMultipliedByScalar(SvVectorField):
     def __init__(self, vector_field, scalar_field):
@@ -239,13 +357,17 @@ class SvVectorFieldMultipliedByScalar(SvVectorField):
         return scalar * vector
 
     def evaluate_grid(self, xs, ys, zs):
-        def product(xs, ys, zs):
-            scalars = self.scalar_field.evaluate_grid(xs, ys, zs)
-            vx, vy, vz = self.vector_field.evaluate_grid(xs, ys, zs)
-            vectors = np.stack((vx, vy, vz))
-            R = (scalars * vectors)
-            return R[0], R[1], R[2]
-        return np.vectorize(product, signature="(m),(m),(m)->(m),(m),(m)")(xs, ys, zs)
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        scalar, = planner.add_field(self.scalar_field, coords)
+        vector = planner.add_field(self.vector_field, coords)
+        return [planner.add_expression("{0} * {1}", scalar, v)[0] for v in vector]
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        scalar = self.scalar_field.evaluate_dual(xs, ys, zs, step)
+        vector = self.vector_field.evaluate_dual(xs, ys, zs, step)
+        return [scalar * v for v in vector]
 
 class SvVectorFieldsLerp(SvVectorField):
 
@@ -262,13 +384,20 @@ class SvVectorFieldsLerp(SvVectorField):
         return (1 - scalar) * vector1 + scalar * vector2
 
     def evaluate_grid(self, xs, ys, zs):
-            scalars = self.scalar_field.evaluate_grid(xs, ys, zs)
-            vx1, vy1, vz1 = self.vfield1.evaluate_grid(xs, ys, zs)
-            vectors1 = np.stack((vx1, vy1, vz1))
-            vx2, vy2, vz2 = self.vfield2.evaluate_grid(xs, ys, zs)
-            vectors2 = np.stack((vx2, vy2, vz2))
-            R = (1 - scalars) * vectors1 + scalars * vectors2
-            return R[0], R[1], R[2]
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        scalar, = planner.add_field(self.scalar_field, coords)
+        vector1 = planner.add_field(self.vfield1, coords)
+        vector2 = planner.add_field(self.vfield2, coords)
+        return [planner.add_expression("(1 - {0}) * {1} + {0} * {2}", scalar, v1, v2)[0]
+                    for v1, v2 in zip(vector1, vector2)]
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        scalar = self.scalar_field.evaluate_dual(xs, ys, zs, step)
+        vector1 = self.vfield1.evaluate_dual(xs, ys, zs, step)
+        vector2 = self.vfield2.evaluate_dual(xs, ys, zs, step)
+        return [(1 - scalar) * v1 + scalar * v2 for v1, v2 in zip(vector1, vector2)]
 
 class SvNoiseVectorField(SvVectorField):
     def __init__(self, noise_type, seed):
@@ -297,7 +426,7 @@ class SvKdtVectorField(SvVectorField):
         if kdt is not None:
             self.kdt = kdt
         elif vertices is not None:
-            self.kdt = SvKdTree.new(SvKdTree.best_available_implementation(), vertices, power=power)
+            self.kdt = SvKdTree.cached(SvKdTree.best_available_implementation(), vertices, power=power)
         else:
             raise Exception("Either kdt or vertices must be provided")
         self.__description__ = "KDT Attractor"
@@ -726,17 +855,20 @@ class SvVectorFieldTangent(SvVectorField):
         return projection
 
     def evaluate_grid(self, xs, ys, zs):
-        vx1, vy1, vz1 = self.field1.evaluate_grid(xs, ys, zs)
-        vx2, vy2, vz2 = self.field2.evaluate_grid(xs, ys, zs)
-        vectors1 = np.stack((vx1, vy1, vz1)).T
-        vectors2 = np.stack((vx2, vy2, vz2)).T
+        return evaluate_planned(self, xs, ys, zs)
 
-        def project(v1, v2):
-            projection = np.dot(v1, v2) * v2 / np.dot(v2, v2)
-            vx, vy, vz = projection
-            return vx, vy, vz
+    def add_to_plan(self, planner, coords):
+        vector1 = planner.add_field(self.field1, coords)
+        vector2 = planner.add_field(self.field2, coords)
+        dot, = planner.add_expression("{0} * {3} + {1} * {4} + {2} * {5}", *vector1, *vector2)
+        norm2, = planner.add_expression("{0} * {0} + {1} * {1} + {2} * {2}", *vector2)
+        return [planner.add_expression("{0} * {1} / {2}", dot, v2, norm2)[0] for v2 in vector2]
 
-        return np.vectorize(project, signature="(3),(3)->(),(),()")(vectors1, vectors2)
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        vector1 = self.field1.evaluate_dual(xs, ys, zs, step)
+        vector2 = self.field2.evaluate_dual(xs, ys, zs, step)
+        coefficient = sum(v1 * v2 for v1, v2 in zip(vector1, vector2)) / sum(v2 * v2 for v2 in vector2)
+        return [coefficient * v2 for v2 in vector2]
 
 class SvVectorFieldCotangent(SvVectorField):
 
@@ -752,18 +884,21 @@ class SvVectorFieldCotangent(SvVectorField):
         return v1 - projection
 
     def evaluate_grid(self, xs, ys, zs):
-        vx1, vy1, vz1 = self.field1.evaluate_grid(xs, ys, zs)
-        vx2, vy2, vz2 = self.field2.evaluate_grid(xs, ys, zs)
-        vectors1 = np.stack((vx1, vy1, vz1)).T
-        vectors2 = np.stack((vx2, vy2, vz2)).T
-
-        def project(v1, v2):
-            projection = np.dot(v1, v2) * v2 / np.dot(v2, v2)
-            coprojection = v1 - projection
-            vx, vy, vz = coprojection
-            return vx, vy, vz
-
-        return np.vectorize(project, signature="(3),(3)->(),(),()")(vectors1, vectors2)
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        vector1 = planner.add_field(self.field1, coords)
+        vector2 = planner.add_field(self.field2, coords)
+        dot, = planner.add_expression("{0} * {3} + {1} * {4} + {2} * {5}", *vector1, *vector2)
+        norm2, = planner.add_expression("{0} * {0} + {1} * {1} + {2} * {2}", *vector2)
+        return [planner.add_expression("{0} - {1} * {2} / {3}", v1, dot, v2, norm2)[0]
+                    for v1, v2 in zip(vector1, vector2)]
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        vector1 = self.field1.evaluate_dual(xs, ys, zs, step)
+        vector2 = self.field2.evaluate_dual(xs, ys, zs, step)
+        coefficient = sum(v1 * v2 for v1, v2 in zip(vector1, vector2)) / sum(v2 * v2 for v2 in vector2)
+        return [v1 - coefficient * v2 for v1, v2 in zip(vector1, vector2)]
 
 class SvVectorFieldComposition(SvVectorField):
 
@@ -778,9 +913,13 @@ class SvVectorFieldComposition(SvVectorField):
         return v2
 
     def evaluate_grid(self, xs, ys, zs):
-        r = self.field1.evaluate_grid(xs, ys, zs)
-        vx1, vy1, vz1 = r
-        return self.field2.evaluate_grid(vx1, vy1, vz1)
+        return evaluate_planned(self, xs, ys, zs)
+
+    def add_to_plan(self, planner, coords):
+        return planner.add_field(self.field2, planner.add_field(self.field1, coords))
+
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        return self.field2.evaluate_dual(*self.field1.evaluate_dual(xs, ys, zs, step), step)
 
 class SvScalarFieldGradient(SvVectorField):
     def __init__(self, field, step):
@@ -794,6 +933,16 @@ class SvScalarFieldGradient(SvVectorField):
     def evaluate_grid(self, xs, ys, zs):
         return self.field.gradient_grid(xs, ys, zs, step=self.step)
 
+    def evaluate_dual(self, xs, ys, zs, step=0.001):
+        inputs = [xs, ys, zs]
+        if max(x.order for x in inputs) > 1:
+            # third derivatives of the scalar field would be required
+            return super().evaluate_dual(xs, ys, zs, step)
+        # derivatives of the gradient are second derivatives of the field
+        value = self.field.hessian_grid(xs.value, ys.value, zs.value, step=self.step)
+        hess = value.hess if value.hess is not None else np.zeros((3, ) + value.grad.shape)
+        return [SvDual.compose(value.grad[i], hess[i], None, inputs) for i in range(3)]
+
 class SvVectorFieldRotor(SvVectorField):
     def __init__(self, field, step):
         self.field = field
@@ -823,26 +972,11 @@ class SvVectorFieldRotor(SvVectorField):
         return np.array([rx, ry, rz])
 
     def evaluate_grid(self, xs, ys, zs):
-        step = self.step
-        _, y_dx_plus, z_dx_plus = self.field.evaluate_grid(xs+step,ys,zs)
-        _, y_dx_minus, z_dx_minus = self.field.evaluate_grid(xs-step,ys,zs)
-        x_dy_plus, _, z_dy_plus = self.field.evaluate_grid(xs, ys+step, zs)
-        x_dy_minus, _, z_dy_minus = self.field.evaluate_grid(xs, ys-step, zs)
-        x_dz_plus, y_dz_plus, _ = self.field.evaluate_grid(xs, ys, zs+step)
-        x_dz_minus, y_dz_minus, _ = self.field.evaluate_grid(xs, ys, zs-step)
-
-        dy_dx = (y_dx_plus - y_dx_minus) / (2*step)
-        dz_dx = (z_dx_plus - z_dx_minus) / (2*step)
-        dx_dy = (x_dy_plus - x_dy_minus) / (2*step)
-        dz_dy = (z_dy_plus - z_dy_minus) / (2*step)
-        dx_dz = (x_dz_plus - x_dz_minus) / (2*step)
-        dy_dz = (y_dz_plus - y_dz_minus) / (2*step)
-
-        rx = dz_dy - dy_dz
-        ry = - (dz_dx - dx_dz)
-        rz = dy_dx - dx_dy
-        R = np.stack((rx, ry, rz))
-        return R[0], R[1], R[2]
+        jacobian = self.field.jacobian_grid(xs, ys, zs, step=self.step)
+        rx = jacobian[2, 1] - jacobian[1, 2]
+        ry = jacobian[0, 2] - jacobian[2, 0]
+        rz = jacobian[1, 0] - jacobian[0, 1]
+        return rx, ry, rz
 
 class SvBendAlongCurveField(SvVectorField):
 
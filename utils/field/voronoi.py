@@ -26,7 +26,7 @@ class SvVoronoiFieldData(object):
             raise Exception("Unsupported metric")
 
         self.implementation = SvKdTree.best_available_implementation()
-        self.kdtree = SvKdTree.new(self.implementation, sites, power=self.power)
+        self.kdtree = SvKdTree.cached(self.implementation, sites, power=self.power)
 
     def query(self, point):
         if self.implementation == SvKdTree.SCIPY or self.metric == 'DISTANCE':
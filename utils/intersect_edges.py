@@ -195,24 +195,117 @@ def intersect_edges_3d(verts_in, edges_in, s_epsilon):
     bm.free()
     return verts_out, edges_out
 
-# adapted from
-# https://stackoverflow.com/a/18994296
-# distance point line https://stackoverflow.com/a/39840218
-def intersect_edges_3d_np(verts, edges, s_epsilon, only_touching=True):
-    '''Brute force Numpy implementation of edges intersections'''
-    indices = cross_indices_np(len(edges))
-    np_verts = verts if isinstance(verts, np.ndarray) else np.array(verts)
-    np_edges = edges if isinstance(edges, np.ndarray) else np.array(edges)
-    eds = np_edges[indices].reshape(-1, 4)
+def overlapping_boxes(box_min, box_max, batch_size=1000000, max_box_cells=64):
+    '''
+    Broad phase of intersections. Yields arrays of pairs of indices (i < j) of
+    axis aligned boxes which overlap, in batches of about batch_size pairs.
+    Boxes are put into cells of uniform grid which size is about mean size of
+    the boxes, only boxes sharing a cell are tested. A pair is reported only in
+    the cell which contains the min corner of the overlap of its boxes.
+    Boxes which would cover more than max_box_cells cells are not put into the
+    grid, they are tested against all other boxes directly.
+    '''
+    n, dim = box_min.shape
+    if n < 2:
+        return
+    origin = box_min.min(axis=0)
+    extent = (box_max.max(axis=0) - origin).max()
+    cell_size = max((box_max - box_min).max(axis=1).mean(), extent / 2**16, 1e-12)
+    lo = np.floor((box_min - origin) / cell_size).astype(np.int64)
+    spans = np.floor((box_max - origin) / cell_size).astype(np.int64) - lo + 1
+
+    # cells of each box
+    n_cells = np.prod(spans.astype(np.float64), axis=1)
+    big = n_cells > max_box_cells
+    if big.any():
+        yield from _overlapping_big_boxes(box_min, box_max, np.flatnonzero(big), batch_size)
+        n_cells[big] = 0
+        if n - big.sum() < 2:
+            return
+    n_cells = n_cells.astype(np.int64)
+    boxes = np.repeat(np.arange(n), n_cells)
+    local = np.arange(len(boxes)) - np.repeat(np.cumsum(n_cells) - n_cells, n_cells)
+    cells = np.empty((len(boxes), dim), dtype=np.int64)
+    for axis in reversed(range(dim)):
+        axis_spans = spans[boxes, axis]
+        cells[:, axis] = lo[boxes, axis] + local % axis_spans
+        local //= axis_spans
+    keys = np.zeros(len(boxes), dtype=np.int64)
+    for axis, size in enumerate(cells.max(axis=0) + 1):
+        keys = keys * size + cells[:, axis]
+    order = np.argsort(keys, kind='stable')
+    boxes, cells, keys = boxes[order], cells[order], keys[order]
+
+    # pairs of boxes in each cell
+    group_ends = np.searchsorted(keys, keys, side='right')
+    counts = group_ends - np.arange(1, len(keys) + 1)
+    cum_counts = np.cumsum(counts)
+    bounds = np.searchsorted(cum_counts, np.arange(batch_size, cum_counts[-1], batch_size))
+    bounds = np.unique(np.concatenate([[0], bounds, [len(keys)]]))
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        batch_counts = counts[start:stop]
+        rows = np.repeat(np.arange(start, stop), batch_counts)
+        row_starts = np.cumsum(batch_counts) - batch_counts
+        cols = rows + 1 + np.arange(len(rows)) - np.repeat(row_starts, batch_counts)
+        i, j = boxes[rows], boxes[cols]
+        corner = np.maximum(box_min[i], box_min[j])
+        good = np.all([np.all(corner <= box_max[i], axis=1),
+                       np.all(corner <= box_max[j], axis=1),
+                       np.all(np.floor((corner - origin) / cell_size).astype(np.int64) == cells[rows], axis=1)],
+                      axis=0)
+        i, j = i[good], j[good]
+        yield np.stack((np.minimum(i, j), np.maximum(i, j)), axis=-1)
+
+def _overlapping_big_boxes(box_min, box_max, big_idx, batch_size):
+    '''
+    Pairs of overlapping boxes where at least one box is from given big ones,
+    each big box is compared with all boxes.
+    '''
+    n = len(box_min)
+    chunk_size = max(1, batch_size // n)
+    for start in range(0, len(big_idx), chunk_size):
+        rows = big_idx[start:start + chunk_size]
+        overlap = np.all((box_min[np.newaxis] <= box_max[rows, np.newaxis])
+                         & (box_max[np.newaxis] >= box_min[rows, np.newaxis]), axis=2)
+        # pair of two big boxes is reported by the box with smaller index
+        overlap[:, big_idx] &= big_idx[np.newaxis] > rows[:, np.newaxis]
+        i, j = np.nonzero(overlap)
+        i = rows[i]
+        yield np.stack((np.minimum(i, j), np.maximum(i, j)), axis=-1)
+
+def remove_pairs_sharing_vertex(np_edges, pairs):
+    eds = np_edges[pairs].reshape(-1, 4)
     mask = np.invert(np.any([eds[:, 0] == eds[:, 2],
                              eds[:, 0] == eds[:, 3],
                              eds[:, 1] == eds[:, 2],
                              eds[:, 1] == eds[:, 3]],
                             axis=0))
-    eds2 = eds[mask]
-    indices_m = indices[mask]
-
-    seg_v = np_verts[eds2]
+    return pairs[mask]
+
+def split_edges(np_edges, n_verts, pairs, coefs):
+    '''
+    Splits edges by intersections in one pass.
+    pairs: indices of intersecting edges, one pair per intersection
+    coefs: position of intersection along each of the two edges
+    New vertices are expected to be numbered from n_verts in order of pairs.
+    '''
+    n = len(np_edges)
+    new_idx = np.repeat(np.arange(len(pairs)) + n_verts, 2)
+    edge_idx = np.concatenate([np.arange(n), pairs.ravel(), np.arange(n)])
+    positions = np.concatenate([np.full(n, -np.inf), coefs.ravel(), np.full(n, np.inf)])
+    points = np.concatenate([np_edges[:, 0], new_idx, np_edges[:, 1]])
+    order = np.lexsort((positions, edge_idx))
+    edge_idx, points = edge_idx[order], points[order]
+    same_edge = edge_idx[1:] == edge_idx[:-1]
+    return np.stack((points[:-1][same_edge], points[1:][same_edge]), axis=-1)
+
+def intersect_edge_pairs_3d(np_verts, np_edges, pairs, s_epsilon, only_touching=True):
+    '''
+    Exact test of given pairs of edges.
+    Returns intersecting pairs, positions of intersections along the edges of
+    the pairs (as distances from first vertices of the edges) and intersection points.
+    '''
+    seg_v = np_verts[np_edges[pairs]].reshape(-1, 4, np_verts.shape[1])
 
     direc_a = seg_v[:, 1] - seg_v[:, 0]
     direc_b = seg_v[:, 3] - seg_v[:, 2]
@@ -246,29 +339,72 @@ def intersect_edges_3d_np(verts, edges, s_epsilon, only_touching=True):
         valid_inter = np.all([t0 > 0, t0 < magA , t1 > 0, t1 < magB], axis=0)
     pA = seg_v[:, 0] + (_A * t0[:, np.newaxis]) # Projected closest point on segment A
     # pB = seg_v[:,2] + (_B * t1[:, np.newaxis]) # Projected closest point on segment B
-    inters = pA[valid_inter]
-
-    n_a_m = t0[valid_inter]
-    n_b_m = t1[valid_inter]
-    all_coefs = np.concatenate([[n_a_m], [n_b_m]], axis=0).T.ravel()
 
-    indices_m2 = indices_m[non_parallel][co_planar][valid_inter]
-    i_ravel = indices_m2.ravel()
-    new_idx = np.repeat(np.arange(len(inters)) + len(np_verts), 2)
-
-    new_edges = []
-    for i in range(len(edges)):
-        intersect_mask = i_ravel == i
-        coef = all_coefs[intersect_mask]
-        n_i = new_idx[intersect_mask]
-        iid = np.argsort(coef)
-        n_i_sorted = n_i[iid]
-        new_eds = np.concatenate([[np_edges[i, 0]],
-                                  np.repeat(n_i_sorted, 2),
-                                  [np_edges[i, 1]]]).reshape(-1,2)
-        new_edges.append(new_eds)
+    coefs = np.stack((t0[valid_inter], t1[valid_inter]), axis=-1)
+    return pairs[non_parallel][co_planar][valid_inter], coefs, pA[valid_inter]
+
+def intersect_edge_pairs_2d(np_verts, np_edges, pairs, epsilon, only_touching=True):
+    '''
+    Exact test of given pairs of edges in XY plane.
+    Returns intersecting pairs, positions of intersections along the edges of
+    the pairs (as fractions of the edges) and intersection points.
+    '''
+    seg_a = np_verts[np_edges[pairs[:, 0]]]
+    seg_b = np_verts[np_edges[pairs[:, 1]]]
+    direc_a = seg_a[:, 1] - seg_a[:, 0]
+    direc_b = seg_b[:, 1] - seg_b[:, 0]
+    dp = seg_a[:, 0, :2] - seg_b[:, 0, :2]
+
+    perp_direc_a = perp(direc_a[:, :2])
+    denom_a = np_dot(perp_direc_a, direc_b[:, :2])
+    perp_direc_b = perp(direc_b[:, :2])
+    denom_b = np_dot(perp_direc_b, direc_a[:, :2])
+    parallel_mask = np.all([denom_a != 0, denom_b != 0], axis=0)
+
+    pairs = pairs[parallel_mask]
+    dp = dp[parallel_mask]
+    direc_b = direc_b[parallel_mask]
+    n_a = np_dot(perp_direc_a[parallel_mask], dp) / denom_a[parallel_mask].astype(float)
+    n_b = np_dot(perp_direc_b[parallel_mask], -dp) / denom_b[parallel_mask].astype(float)
+    if only_touching:
+        valid_inter = np.all([n_a > -epsilon, n_a < 1+epsilon, n_b > -epsilon, n_b < 1+epsilon], axis=0)
+    else:
+        valid_inter = np.all([n_a > 0, n_a < 1, n_b > 0, n_b < 1], axis=0)
+    inters = n_a[valid_inter, np.newaxis] * direc_b[valid_inter] + seg_b[parallel_mask][valid_inter, 0]
+
+    coefs = np.stack((n_b[valid_inter], n_a[valid_inter]), axis=-1)
+    return pairs[valid_inter], coefs, inters
+
+def intersect_edges_pairwise(np_verts, np_edges, box_min, box_max, intersect_pairs):
+    '''Broad phase by bounding boxes of edges, exact test of candidate pairs
+    and splitting of the edges'''
+    pairs_s, coefs_s, inters_s = [np.zeros((0, 2), dtype=np.int64)], [np.zeros((0, 2))], [np.zeros((0, np_verts.shape[1]))]
+    for pairs in overlapping_boxes(box_min, box_max):
+        pairs = remove_pairs_sharing_vertex(np_edges, pairs)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pairs, coefs, inters = intersect_pairs(pairs)
+        pairs_s.append(pairs)
+        coefs_s.append(coefs)
+        inters_s.append(inters)
+    pairs, coefs, inters = np.concatenate(pairs_s), np.concatenate(coefs_s), np.concatenate(inters_s)
+    new_edges = split_edges(np_edges, len(np_verts), pairs, coefs)
+    return np.concatenate([np_verts, inters]).tolist(), new_edges.tolist()
 
-    return np.concatenate([np_verts, inters]).tolist(), np.concatenate(new_edges).tolist()
+# adapted from
+# https://stackoverflow.com/a/18994296
+# distance point line https://stackoverflow.com/a/39840218
+def intersect_edges_3d_np(verts, edges, s_epsilon, only_touching=True):
+    '''Numpy implementation of edges intersections. Only pairs of edges with
+    overlapping bounding boxes are tested'''
+    np_verts = np.asarray(verts, dtype=float)
+    np_edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    segs = np_verts[np_edges]
+    # closest points of two edges can be in s_epsilon distance from each other
+    # and in s_epsilon distance from ends of the edges
+    box_min = segs.min(axis=1) - 2 * s_epsilon
+    box_max = segs.max(axis=1) + 2 * s_epsilon
+    return intersect_edges_pairwise(np_verts, np_edges, box_min, box_max,
+        lambda pairs: intersect_edge_pairs_3d(np_verts, np_edges, pairs, s_epsilon, only_touching))
 
 def edges_from_ed_inter_double_removal(ed_inter):
     '''create edges from intersections library'''
@@ -474,87 +610,18 @@ def intersect_edges_2d_np(verts, edges, epsilon, only_touching=True):
     return np.concatenate([np_verts, inters]).tolist(), np.concatenate(new_edges).tolist()
 
 def intersect_edges_2d_np_big(verts, edges, epsilon, only_touching=True):
-    '''Brute force Numpy implementation of edges intersections. Avoids to do to it all at once to prevent stack overflow'''
-    np_verts = verts if isinstance(verts, np.ndarray) else np.array(verts)
-    np_edges = edges if isinstance(edges, np.ndarray) else np.array(edges)
-    n = len(edges)
-    n_as, n_bs, indices_m2s, inters_s = [], [], [], []
-    for i in range(n-1):
-
-        np_j = np.arange(i+1, n, dtype=np.int32)
-        edgs_i = np_edges[i]
-        eds_j = np_edges[np_j]
-        mask = np.invert(np.any([edgs_i[np.newaxis, 0] == eds_j[:, 0],
-                                 edgs_i[np.newaxis, 0] == eds_j[:, 1],
-                                 edgs_i[np.newaxis, 1] == eds_j[:, 0],
-                                 edgs_i[np.newaxis, 1] == eds_j[:, 1]],
-                                axis=0))
-        eds_j2 = eds_j[mask]
-        indices_j_m = np_j[mask]
-        seg_j = np_verts[eds_j2]
-        direc_b = seg_j[:, 1] - seg_j[:, 0]
-
-
-        np_i = np.full(len(indices_j_m), i, dtype=np.int32)
-        indices_m = np.stack((np_i, indices_j_m), axis=-1)
-
-        seg_a = np_verts[edgs_i]
-        direc_a = seg_a[1, :]- seg_a[0, :]
-        perp_direc_a = perp_single(direc_a)
-
-        dp = seg_a[np.newaxis, 0, :] - seg_j[:, 0]
-
-        denom_a = np_dot(perp_direc_a[np.newaxis, :], direc_b)
-        perp_direc_b = perp(direc_b)
-        denom_b = np_dot(perp_direc_b, direc_a[np.newaxis, :])
-        parallel_mask = np.all([denom_a != 0, denom_b != 0], axis=0)
-
-        dp = dp[parallel_mask]
-        denom_a = denom_a[parallel_mask]
-        direc_b = direc_b[parallel_mask]
-        num_a = np_dot(perp_direc_a[np.newaxis, :], dp)
-
-        n_a = (num_a / denom_a.astype(float))
-        perp_direc_b = perp_direc_b[parallel_mask]
-        denom_b = denom_b[parallel_mask]
-        num_b = np_dot(perp_direc_b, -dp)
-        n_b = (num_b / denom_b.astype(float))
-        inter = n_a[:, np.newaxis] * direc_b + seg_j[parallel_mask, 0]
-        if only_touching:
-            valid_inter = np.all([n_a > -epsilon, n_a < 1+epsilon, n_b > -epsilon, n_b < 1+epsilon], axis=0)
-        else:
-            valid_inter = np.all([n_a > 0, n_a < 1, n_b > 0, n_b < 1], axis=0)
-        n_a_m = n_a[valid_inter]
-        n_b_m = n_b[valid_inter]
-        indices_m2 = indices_m[parallel_mask][valid_inter]
-        inters = inter[valid_inter]
-        n_as.append(n_a_m)
-        n_bs.append(n_b_m)
-        indices_m2s.append(indices_m2)
-        inters_s.append(inters)
-
-    c_n_as = np.concatenate(n_as)
-    c_n_bs = np.concatenate(n_bs)
-    c_indices_m2s = np.concatenate(indices_m2s)
-    c_inters_s = np.concatenate(inters_s)
-    all_coefs = np.concatenate([[c_n_bs], [c_n_as]], axis=0).T.ravel()
-    i_ravel = c_indices_m2s.ravel()
-
-    new_idx = np.repeat(np.arange(len(c_inters_s)) + len(np_verts), 2)
-
-    new_edges = []
-    for i in range(len(edges)):
-        intersect_mask = i_ravel == i
-        coef = all_coefs[intersect_mask]
-        n_i = new_idx[intersect_mask]
-        iid = np.argsort(coef)
-        n_i_sorted = n_i[iid]
-        new_eds = np.concatenate([[np_edges[i, 0]],
-                                  np.repeat(n_i_sorted, 2),
-                                  [np_edges[i, 1]]]).reshape(-1, 2)
-        new_edges.append(new_eds)
-
-    return np.concatenate([np_verts, c_inters_s]).tolist(), np.concatenate(new_edges).tolist()
+    '''Numpy implementation of edges intersections for big amount of edges.
+    Only pairs of edges with overlapping bounding boxes are tested, in batches
+    to limit memory usage'''
+    np_verts = np.asarray(verts, dtype=float)
+    np_edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    segs = np_verts[np_edges][:, :, :2]
+    # intersections can be out of the edges for epsilon part of their length
+    margin = epsilon * np.linalg.norm(segs[:, 1] - segs[:, 0], axis=1)[:, np.newaxis]
+    box_min = segs.min(axis=1) - margin
+    box_max = segs.max(axis=1) + margin
+    return intersect_edges_pairwise(np_verts, np_edges, box_min, box_max,
+        lambda pairs: intersect_edge_pairs_2d(np_verts, np_edges, pairs, epsilon, only_touching))
 
 
 def remove_doubles_from_edgenet(verts_in, edges_in, distance):
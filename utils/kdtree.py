@@ -5,15 +5,28 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+import re
+from collections import OrderedDict
+
 import numpy as np
 
 from mathutils import kdtree
 
 from sverchok.dependencies import scipy
 
+# keyword arguments of SciPy queries to run them in all threads
+SCIPY_ALL_THREADS = {}
+
 if scipy is not None:
     from scipy.spatial import cKDTree
 
+    # it was named 'n_jobs' before SciPy 1.6
+    _scipy_version = tuple(int(n) for n in re.findall(r'\d+', scipy.__version__)[:2])
+    SCIPY_ALL_THREADS = {'workers': -1} if _scipy_version >= (1, 6) else {'n_jobs': -1}
+
+# the number of distances computed at once by the brute force queries
+BRUTEFORCE_CHUNK_SIZE = 1_000_000
+
 class SvKdTree(object):
     SCIPY = 'SCIPY'
     BLENDER = 'BLENDER'
@@ -28,6 +41,15 @@ class SvKdTree(object):
             else:
                 return SvBruteforceKdTree(points, power=power)
 
+    @staticmethod
+    def cached(implementation, points, power=2):
+        """
+        The same as new but the tree is reused while the same points object is passed.
+        Sverchok does not change socket data in place, so the object identity is
+        enough to tell that static points of animated scenes do not need a new tree.
+        """
+        return _trees_cache.get(implementation, points, power)
+
     @staticmethod
     def best_available_implementation():
         if scipy is not None:
@@ -70,8 +92,15 @@ class SvBlenderKdTree(SvKdTree):
             return locs, idxs, distances
 
     def query_array(self, needle, count=1, **kwargs):
-        res = [self.query(item, count) for item in needle]
-        locs = [loc for loc, idx, distance in res]
+        needle = np.asarray(needle, dtype=np.float64).tolist()
+        if count == 1:
+            find = self.kdtree.find
+            res = [find(item) for item in needle]
+            locs = [loc[:] for loc, idx, distance in res]
+        else:
+            find_n = self.kdtree.find_n
+            res = [list(zip(*find_n(item, count))) for item in needle]
+            locs = [[loc[:] for loc in locs] for locs, idxs, distances in res]
         idxs = [idx for loc, idx, distance in res]
         distances = [distance for loc, idx, distance in res]
 
@@ -95,6 +124,7 @@ class SvSciPyKdTree(SvKdTree):
         return loc, idx, distance
 
     def query_array(self, needle, count=1, **kwargs):
+        kwargs = {**SCIPY_ALL_THREADS, **kwargs}
         distances, idxs = self.kdtree.query(needle, k=count, p=self.power, **kwargs)
         locs = self.points[idxs]
         return locs, idxs, distances
@@ -123,9 +153,58 @@ class SvBruteforceKdTree(SvKdTree):
             return locs, idxs, distances
 
     def query_array(self, needle, count=1):
+        needle = np.asarray(needle, dtype=np.float64)
+        n_points = len(self.points)
+        k = min(count, n_points)
+        chunk = max(1, BRUTEFORCE_CHUNK_SIZE // n_points)
+        idxs = np.empty((len(needle), k), dtype=np.int64)
+        distances = np.empty((len(needle), k))
+        for start in range(0, len(needle), chunk):
+            dvs = np.abs(self.points[np.newaxis, :, :] - needle[start:start + chunk, np.newaxis, :])
+            chunk_distances = self._power_sums(dvs)
+            if k < n_points:
+                nearest = np.argpartition(chunk_distances, k - 1, axis=1)[:, :k]
+            else:
+                nearest = np.broadcast_to(np.arange(n_points), chunk_distances.shape)
+            nearest_distances = np.take_along_axis(chunk_distances, nearest, axis=1)
+            order = np.argsort(nearest_distances, axis=1, kind='stable')
+            idxs[start:start + chunk] = np.take_along_axis(nearest, order, axis=1)
+            distances[start:start + chunk] = np.take_along_axis(nearest_distances, order, axis=1)
+        if self.power not in (1, np.inf):
+            distances **= 1 / self.power
         if count == 1:
-            return np.vectorize(self.query, signature='(3)->(3),(),()')(needle)
-        else:
-            qry = lambda p: self.query(p, count=count)
-            return np.vectorize(qry, signature='(n,3)->(k,3),(k),(k)')(needle)
-
+            idxs, distances = idxs[:, 0], distances[:, 0]
+        return self.points[idxs], idxs, distances
+
+    def _power_sums(self, dvs):
+        # the same order as distances, without the root
+        if self.power == np.inf:
+            return dvs.max(axis=2)
+        elif self.power == 1:
+            return dvs.sum(axis=2)
+        elif self.power == 2:
+            return np.einsum('ijk,ijk->ij', dvs, dvs)
+        return (dvs ** self.power).sum(axis=2)
+
+class SvKdTreeCache(object):
+    """Last built trees, each is kept together with its points object to compare identity"""
+    def __init__(self, size=16):
+        self.size = size
+        self.trees = OrderedDict()
+
+    def get(self, implementation, points, power=2):
+        key = (id(points), implementation, power)
+        item = self.trees.get(key)
+        if item is not None and item[0] is points:
+            self.trees.move_to_end(key)
+            return item[1]
+        tree = SvKdTree.new(implementation, points, power=power)
+        self.trees[key] = (points, tree)
+        if len(self.trees) > self.size:
+            self.trees.popitem(last=False)
+        return tree
+
+    def clear(self):
+        self.trees.clear()
+
+_trees_cache = SvKdTreeCache()
@@ -1,6 +1,6 @@
 """
-Pure Python implementation of marching cubes algorithm
-Adapted from https://github.com/mutantbob/blender-marching-cubes/blob/master/marching-cube.py
+NumPy implementation of marching cubes algorithm
+Tables are adapted from https://github.com/mutantbob/blender-marching-cubes/blob/master/marching-cube.py
 """
 """
    
@@ -44,18 +44,8 @@ __email__ = "blender@thoth.purplefrog.com"
 __status__ = "alpha"
 
 
-import time
-import math
-from math import sqrt,sin,cos,tan
-import mathutils
-import bpy
-from itertools import chain
-import bmesh
 import numpy as np
 
-vec=mathutils.Vector
-ABS=abs
-
 edgetable=(0x0  , 0x109, 0x203, 0x30a, 0x406, 0x50f, 0x605, 0x70c,
             0x80c, 0x905, 0xa0f, 0xb06, 0xc0a, 0xd03, 0xe09, 0xf00,
             0x190, 0x99 , 0x393, 0x29a, 0x596, 0x49f, 0x795, 0x69c,
@@ -346,143 +336,75 @@ tritable = [[-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
         [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1]
 ]
 
-class Polygoniser(object):
-    def __init__(self, isolevel):
-        self.isolevel = isolevel
-        self.cache = dict()
-        self.vertices = []
-
-    def vertexinterp_cached(self, p1, p2, v1, v2):
-        key1 = (tuple(p1), tuple(p2))
-        key2 = (tuple(p2), tuple(p1))
-        cached = self.cache.get(key1, None)
-        if cached is not None:
-            return cached
-        else:
-            vertex = vertexinterp(self.isolevel, p1, p2, v1, v2)
-            #print(f"V[{p1}][{p2}] := {vertex}")
-            n = len(self.vertices)
-            self.vertices.append(vertex)
-            self.cache[key1] = n
-            self.cache[key2] = n
-            return n
-
-    def polygonise(self, cornervalues, x1, y1, z1, x2, y2, z2):
-
-        #   Determine the index into the edge table which
-        #   tells us which vertices are inside of the surface
-        cubeindex = 0
-        if cornervalues[0] < self.isolevel: cubeindex = cubeindex | 1
-        if cornervalues[1] < self.isolevel: cubeindex = cubeindex | 2
-        if cornervalues[2] < self.isolevel: cubeindex = cubeindex | 4
-        if cornervalues[3] < self.isolevel: cubeindex = cubeindex | 8
-        if cornervalues[4] < self.isolevel: cubeindex = cubeindex | 16
-        if cornervalues[5] < self.isolevel: cubeindex = cubeindex | 32
-        if cornervalues[6] < self.isolevel: cubeindex = cubeindex | 64
-        if cornervalues[7] < self.isolevel: cubeindex = cubeindex | 128
-
-        # Cube is entirely in/out of the surface
-        if edgetable[cubeindex] == 0: return []
-
-        vertlist=[[]]*12
-        # Find the vertices where the surface intersects the cube
-        if (edgetable[cubeindex] & 1):    vertlist[0]  = self.vertexinterp_cached([x1,y1,z1],[x1,y2,z1],cornervalues[0],cornervalues[1])
-        if (edgetable[cubeindex] & 2):    vertlist[1]  = self.vertexinterp_cached([x1,y2,z1],[x2,y2,z1],cornervalues[1],cornervalues[2])
-        if (edgetable[cubeindex] & 4):    vertlist[2]  = self.vertexinterp_cached([x2,y2,z1],[x2,y1,z1],cornervalues[2],cornervalues[3])
-        if (edgetable[cubeindex] & 8):    vertlist[3]  = self.vertexinterp_cached([x2,y1,z1],[x1,y1,z1],cornervalues[3],cornervalues[0])
-        if (edgetable[cubeindex] & 16):   vertlist[4]  = self.vertexinterp_cached([x1,y1,z2],[x1,y2,z2],cornervalues[4],cornervalues[5])
-        if (edgetable[cubeindex] & 32):   vertlist[5]  = self.vertexinterp_cached([x1,y2,z2],[x2,y2,z2],cornervalues[5],cornervalues[6])
-        if (edgetable[cubeindex] & 64):   vertlist[6]  = self.vertexinterp_cached([x2,y2,z2],[x2,y1,z2],cornervalues[6],cornervalues[7])
-        if (edgetable[cubeindex] & 128):  vertlist[7]  = self.vertexinterp_cached([x2,y1,z2],[x1,y1,z2],cornervalues[7],cornervalues[4])
-        if (edgetable[cubeindex] & 256):  vertlist[8]  = self.vertexinterp_cached([x1,y1,z1],[x1,y1,z2],cornervalues[0],cornervalues[4])
-        if (edgetable[cubeindex] & 512):  vertlist[9]  = self.vertexinterp_cached([x1,y2,z1],[x1,y2,z2],cornervalues[1],cornervalues[5])
-        if (edgetable[cubeindex] & 1024): vertlist[10] = self.vertexinterp_cached([x2,y2,z1],[x2,y2,z2],cornervalues[2],cornervalues[6])
-        if (edgetable[cubeindex] & 2048): vertlist[11] = self.vertexinterp_cached([x2,y1,z1],[x2,y1,z2],cornervalues[3],cornervalues[7])
-
-        #Create the triangle
-        triangles = []
-        #for (i=0;triTable[cubeindex][i]!=-1;i+=3) {
-        i=0
-        while tritable[cubeindex][i] != -1:
-            triangles.append([vertlist[tritable[cubeindex][i  ]],
-                                       vertlist[tritable[cubeindex][i+1]],
-                                       vertlist[tritable[cubeindex][i+2]]])
-            i+=3
+# corners of a cube as offsets from its first corner, in the order of the tables
+cube_corners = np.array([(0,0,0), (0,1,0), (1,1,0), (1,0,0), (0,0,1), (0,1,1), (1,1,1), (1,0,1)])
+# edges of a cube as (axis, offset of the first corner of the edge)
+cube_edges = [(1, (0,0,0)), (0, (0,1,0)), (1, (1,0,0)), (0, (0,0,0)),
+              (1, (0,0,1)), (0, (0,1,1)), (1, (1,0,1)), (0, (0,0,1)),
+              (2, (0,0,0)), (2, (0,1,0)), (2, (1,1,0)), (2, (1,0,0))]
 
-        return triangles
-
-def vertexinterp(isolevel,p1,p2,valp1,valp2):
-   if (ABS(isolevel-valp1) < 0.00001):
-      return p1
-   if (ABS(isolevel-valp2) < 0.00001):
-      return p2
-   if (ABS(valp1-valp2) < 0.00001):
-      return p1
-   mu = (isolevel - valp1) / (valp2 - valp1);
-   x = p1[0] + mu * (p2[0] - p1[0]);
-   y = p1[1] + mu * (p2[1] - p1[1]);
-   z = p1[2] + mu * (p2[2] - p1[2]);
-
-   return x,y,z
+def isosurface_np(data, isolevel):
+    """
+    Marching cubes for the whole grid at once.
+    Each edge of the grid has an integer id, edges along X axis go first, then
+    edges along Y and Z. Vertices are interpolated once per intersected edge,
+    so they are shared by adjacent cubes.
 
-def create_mesh_for(objname,verts,faces):
-    me = bpy.data.meshes.new(objname)  # create a new mesh
-    me.from_pydata(verts,[],faces)
-    me.update()      # update the mesh with the new data
+    :param data: values of the field in shape (size x, size y, size z)
+    :return: vertices in grid coordinates (n, 3) and triangles (m, 3)
+    """
+    data = np.asarray(data, dtype=np.float64)
+    sx, sy, sz = data.shape
+    if sx < 2 or sy < 2 or sz < 2:
+        return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64)
+    edge_table = np.array(edgetable)
+    tri_table = np.array(tritable)
 
+    below = data < isolevel
+    cube_index = np.zeros((sx-1, sy-1, sz-1), dtype=np.int64)
+    for bit, (dx, dy, dz) in enumerate(cube_corners):
+        cube_index |= below[dx:sx-1+dx, dy:sy-1+dy, dz:sz-1+dz].astype(np.int64) << bit
 
-    bm = bmesh.new()
-    bm.from_mesh(me)
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.01)
-    bm.to_mesh(me)
+    # cubes are listed in Z, Y, X order
+    cube_index = cube_index.transpose(2, 1, 0).ravel()
+    active = np.flatnonzero(edge_table[cube_index])
+    cz, cy, cx = np.unravel_index(active, (sz-1, sy-1, sx-1))
+    cube_index = cube_index[active]
 
-    ob = bpy.data.objects.new(objname,me) # create a new object
-    ob.data = me          # link the mesh data to the object
-    return ob
+    edge_shapes = [(sx-1, sy, sz), (sx, sy-1, sz), (sx, sy, sz-1)]
+    edge_offsets = np.cumsum([0] + [np.prod(shape) for shape in edge_shapes])
+    edge_ids = np.empty((len(active), 12), dtype=np.int64)
+    for i, (axis, (dx, dy, dz)) in enumerate(cube_edges):
+        edge_ids[:, i] = edge_offsets[axis] + np.ravel_multi_index((cx+dx, cy+dy, cz+dz), edge_shapes[axis])
 
-def creategeometry(verts):
-    faces=[]
-    faceoffset=0
-    for ver in verts:
-        if len(ver)==4:
-            faces.append((faceoffset+0,faceoffset+1,faceoffset+2,faceoffset+3))
-            faceoffset+=4
-        elif len(ver)==3:
-            faces.append((faceoffset+0,faceoffset+1,faceoffset+2))
-            faceoffset+=3
-    return list(chain.from_iterable(verts)),faces
+    # vertices are numbered in order of their first appearance
+    cut_edges = (edge_table[cube_index][:, np.newaxis] >> np.arange(12)) & 1 == 1
+    edges, first = np.unique(edge_ids[cut_edges], return_index=True)
+    order = np.argsort(first)
+    vertex_index = np.empty(edge_offsets[-1], dtype=np.int64)
+    vertex_index[edges[order]] = np.arange(len(edges))
 
-def cornerloop(x,y,z):
-    for cz in (0,z):
-        for cy,cx in zip((0,y,y,0),(0,0,x,x)):
-             yield cx,cy,cz
+    triangles = tri_table[cube_index]
+    cube_idx, local_edges = np.nonzero(triangles >= 0)
+    faces = vertex_index[edge_ids[cube_idx, triangles[cube_idx, local_edges]]]
 
-def isosurface_np(data, isolevel):
-    triangles = []
-    z_a = 0
-    z_plane_a = data[:,:,z_a]
-    sx, sy, sz = data.shape
+    edges = edges[order]
+    axis = np.searchsorted(edge_offsets, edges, side='right') - 1
+    p1 = np.empty((len(edges), 3), dtype=np.int64)
+    for i, shape in enumerate(edge_shapes):
+        good = axis == i
+        p1[good] = np.stack(np.unravel_index(edges[good] - edge_offsets[i], shape), axis=1)
+    p2 = p1 + np.eye(3, dtype=np.int64)[axis]
+    v1 = data[p1[:,0], p1[:,1], p1[:,2]]
+    v2 = data[p2[:,0], p2[:,1], p2[:,2]]
 
-    polygoniser = Polygoniser(isolevel)
-    for z in range(sz-1):
-        z2 = z+1
-        z_plane_b = data[:,:,z2]
-        for y in range(sy-1):
-            y2 = y+1
-            for x in range(sx-1):
-                x2 = x+1
-                cornervalues = [
-                    z_plane_a[x][y],
-                    z_plane_a[x][y+1],
-                    z_plane_a[x+1][y+1],
-                    z_plane_a[x+1][y],
-                    z_plane_b[x][y],
-                    z_plane_b[x][y+1],
-                    z_plane_b[x+1][y+1],
-                    z_plane_b[x+1][y],
-                ]
-                triangles.extend(polygoniser.polygonise(cornervalues, x,y,z, x2, y2, z2))
-        z_plane_a = z_plane_b
+    # values close to the isolevel give the corner itself, as in Paul Bourke's VertexInterp
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mu = (isolevel - v1) / (v2 - v1)
+    mu[np.abs(v1 - v2) < 0.00001] = 0.0
+    mu[np.abs(isolevel - v2) < 0.00001] = 1.0
+    mu[np.abs(isolevel - v1) < 0.00001] = 0.0
+    verts = p1 + mu[:, np.newaxis] * (p2 - p1)
 
-    return np.array(polygoniser.vertices), triangles
+    return verts, faces.reshape((-1, 3))
 
@@ -0,0 +1,594 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Boolean operations on closed meshes.
+
+It is an alternative to BSP tree of csg_core which splits every polygon by
+planes of all polygons of the other mesh. Here triangles of one mesh are cut
+only by planes of triangles of the other mesh they really intersect with,
+candidates are found by broad phase of intersect_edges module. Pieces of faces
+are classified as inside or outside of the other mesh by ray casting with BVH
+tree. Geometry is kept in NumPy arrays, all geometry tests use tolerance
+relative to the size of the meshes.
+"""
+
+from itertools import chain
+
+import numpy as np
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+from sverchok.utils.intersect_edges import overlapping_boxes
+
+OUTSIDE, INSIDE, SAME, OPPOSITE = range(4)
+
+# not parallel to axes and diagonals not to hit edges of regular meshes
+RAY_DIRECTION = Vector((0.5377, 0.6932, 0.4798)).normalized()
+
+
+def mesh_boolean(verts_a, faces_a, verts_b, faces_b, operation, epsilon=1e-6):
+    '''
+    Boolean of two closed meshes with consistent normals.
+    operation: 'ITX' (intersection), 'JOIN' (union) or 'DIFF' (A minus B)
+    epsilon: tolerance relative to the size of the meshes
+    returns vertices and faces as lists
+    '''
+    verts_a = np.asarray(verts_a, dtype=np.float64).reshape(-1, 3)
+    verts_b = np.asarray(verts_b, dtype=np.float64).reshape(-1, 3)
+    if not len(faces_a) or not len(faces_b):
+        if operation == 'ITX':
+            return [], []
+        verts, faces = (verts_a, faces_a) if len(faces_a) or operation == 'DIFF' else (verts_b, faces_b)
+        return verts.tolist(), [list(f) for f in faces]
+
+    all_verts = np.concatenate((verts_a, verts_b))
+    eps = epsilon * max(np.ptp(all_verts, axis=0).max(), 1e-12)
+
+    tris_a, tri_faces_a = _triangulate(faces_a)
+    tris_b, tri_faces_b = _triangulate(faces_b)
+    coords_a, coords_b = verts_a[tris_a], verts_b[tris_b]
+    planes_a, planes_b = _planes(coords_a), _planes(coords_b)
+    cuts_a, cuts_b = _find_cuts(coords_a, coords_b, planes_a, planes_b, eps)
+
+    # vertices of the intersection found in both meshes differ by several eps
+    tolerance = 4 * eps
+    part_a = _cut_mesh(faces_a, tri_faces_a, coords_a, cuts_a, eps)
+    part_b = _cut_mesh(faces_b, tri_faces_b, coords_b, cuts_b, eps)
+    codes_a = _classify(part_a.triangles, verts_b, tris_b, eps, tolerance)
+    codes_b = _classify(part_b.triangles, verts_a, tris_a, eps, tolerance)
+
+    if operation == 'ITX':
+        keep_a, keep_b, flip_b = np.isin(codes_a, [INSIDE, SAME]), codes_b == INSIDE, False
+    elif operation == 'JOIN':
+        keep_a, keep_b, flip_b = np.isin(codes_a, [OUTSIDE, SAME]), codes_b == OUTSIDE, False
+    elif operation == 'DIFF':
+        keep_a, keep_b, flip_b = np.isin(codes_a, [OUTSIDE, OPPOSITE]), codes_b == INSIDE, True
+    else:
+        raise ValueError(f"Unknown boolean operation: {operation}")
+
+    flat_a, lengths_a, coords_out_a = part_a.select(keep_a, 0, len(all_verts), False)
+    flat_b, lengths_b, coords_out_b = part_b.select(keep_b, len(verts_a), len(all_verts) + len(coords_out_a), flip_b)
+    coords = np.concatenate((all_verts, coords_out_a, coords_out_b))
+    flat = np.concatenate((flat_a, flat_b))
+    lengths = np.concatenate((lengths_a, lengths_b))
+
+    coords, index = _weld(coords, tolerance)
+    flat, lengths = _remove_degenerate(coords, index[flat], lengths, eps)
+    flat, lengths = _insert_points_on_edges(coords, flat, lengths, tolerance)
+    flat, lengths = _remove_lone_vertices(coords, flat, lengths, tolerance)
+
+    used = np.zeros(len(coords), dtype=bool)
+    used[flat] = True
+    new_index = np.cumsum(used) - 1
+    faces = np.split(new_index[flat], np.cumsum(lengths)[:-1]) if len(lengths) else []
+    return coords[used].tolist(), [f.tolist() for f in faces]
+
+
+class _MeshPart:
+    """
+    Faces of one mesh which are not intersected with the other mesh and pieces of
+    intersected triangles, with triangles to classify them.
+    """
+    def __init__(self, faces, kept_faces, pieces, triangles):
+        self.faces = faces
+        self.kept_faces = kept_faces
+        self.pieces = pieces
+        self.triangles = triangles
+
+    def select(self, mask, vert_offset, coords_offset, flip):
+        """
+        Returns flat vertex indices of selected faces, their lengths and
+        coordinates of vertices of selected pieces which get indices from coords_offset
+        """
+        n_kept = len(self.kept_faces)
+        faces = [self.faces[i] for i in self.kept_faces[mask[:n_kept]]]
+        pieces = self.pieces[mask[n_kept:]]
+        lengths = np.array([len(f) for f in faces] + [3] * len(pieces), dtype=np.int64)
+        flat = np.fromiter(chain.from_iterable(f[::-1] if flip else f for f in faces),
+                           dtype=np.int64, count=lengths[:len(faces)].sum()) + vert_offset
+        piece_indices = np.arange(3 * len(pieces)).reshape(-1, 3) + coords_offset
+        if flip:
+            piece_indices = piece_indices[:, ::-1]
+        return np.concatenate((flat, piece_indices.ravel())), lengths, pieces.reshape(-1, 3)
+
+
+def _triangulate(faces):
+    """Fan triangulation of faces, returns triangles and indices of their faces"""
+    lengths = np.array([len(f) for f in faces], dtype=np.int64)
+    flat = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=lengths.sum())
+    starts = np.cumsum(lengths) - lengths
+    n_tris = np.maximum(lengths - 2, 0)
+    tri_faces = np.repeat(np.arange(len(faces)), n_tris)
+    corner = np.arange(len(tri_faces)) - np.repeat(np.cumsum(n_tris) - n_tris, n_tris) + 1
+    first = starts[tri_faces]
+    tris = np.stack((flat[first], flat[first + corner], flat[first + corner + 1]), axis=-1)
+    return tris, tri_faces
+
+
+def _planes(coords):
+    """Unit normals and offsets of planes of triangles, normals of degenerate triangles are zero"""
+    normals = np.cross(coords[:, 1] - coords[:, 0], coords[:, 2] - coords[:, 0])
+    length = np.linalg.norm(normals, axis=1)
+    normals /= np.where(length > 0, length, 1)[:, np.newaxis]
+    return normals, np.einsum('ij,ij->i', normals, coords[:, 0])
+
+
+def _signed_distances(coords, normals, offsets, eps):
+    """Distances of corners of triangles to planes, snapped to zero within eps"""
+    dist = np.einsum('ijk,ik->ij', coords, normals) - offsets[:, np.newaxis]
+    dist[np.abs(dist) < eps] = 0
+    return dist
+
+
+def _boxes(coords, eps):
+    return coords.min(axis=1) - eps, coords.max(axis=1) + eps
+
+
+def _candidate_pairs(coords_a, coords_b, eps):
+    """Pairs of triangles of different meshes which bounding boxes overlap"""
+    min_a, max_a = _boxes(coords_a, eps)
+    min_b, max_b = _boxes(coords_b, eps)
+    # only triangles close to the other mesh take part in broad phase
+    idx_a = np.flatnonzero(np.all((min_a <= max_b.max(axis=0)) & (max_a >= min_b.min(axis=0)), axis=1))
+    idx_b = np.flatnonzero(np.all((min_b <= max_a.max(axis=0)) & (max_b >= min_a.min(axis=0)), axis=1))
+    box_min = np.concatenate((min_a[idx_a], min_b[idx_b]))
+    box_max = np.concatenate((max_a[idx_a], max_b[idx_b]))
+    n_a = len(idx_a)
+    pairs = [p[(p[:, 0] < n_a) & (p[:, 1] >= n_a)] for p in overlapping_boxes(box_min, box_max)]
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(pairs)
+    return np.stack((idx_a[pairs[:, 0]], idx_b[pairs[:, 1] - n_a]), axis=-1)
+
+
+def _line_intervals(coords, dist, line):
+    """Intervals which triangles cover on lines of intersection with planes"""
+    points = [coords[:, i] for i in range(3)]
+    valid = [dist[:, i] == 0 for i in range(3)]
+    for i, j in ((0, 1), (1, 2), (2, 0)):
+        d_i, d_j = dist[:, i], dist[:, j]
+        crossing = d_i * d_j < 0
+        t = np.where(crossing, d_i / np.where(crossing, d_i - d_j, 1), 0)
+        points.append(coords[:, i] + (coords[:, j] - coords[:, i]) * t[:, np.newaxis])
+        valid.append(crossing)
+    proj = np.stack([np.einsum('ij,ij->i', p, line) for p in points], axis=1)
+    valid = np.stack(valid, axis=1)
+    return np.where(valid, proj, np.inf).min(axis=1), np.where(valid, proj, -np.inf).max(axis=1)
+
+
+def _edge_planes(coords, normals):
+    """Planes through edges of triangles perpendicular to them, shape (n, 3)"""
+    edges = np.roll(coords, -1, axis=1) - coords
+    edge_normals = np.cross(normals[:, np.newaxis], edges)
+    length = np.linalg.norm(edge_normals, axis=2)
+    edge_normals /= np.where(length > 0, length, 1)[:, :, np.newaxis]
+    return edge_normals, np.einsum('ijk,ijk->ij', edge_normals, coords)
+
+
+def _find_cuts(coords_a, coords_b, planes_a, planes_b, eps):
+    '''
+    Narrow phase of intersection of triangles. Returns cuts of triangles of
+    both meshes: indices of triangles, normals and offsets of cutting planes
+    and bounding boxes of cutting triangles. Triangles are cut by planes of
+    triangles they intersect with or by edges of coplanar triangles.
+    '''
+    pairs = _candidate_pairs(coords_a, coords_b, eps)
+    ia, ib = pairs.T
+    ta, tb = coords_a[ia], coords_b[ib]
+    (na, da), (nb, db) = (planes_a[0][ia], planes_a[1][ia]), (planes_b[0][ib], planes_b[1][ib])
+    dist_a = _signed_distances(ta, nb, db, eps)
+    dist_b = _signed_distances(tb, na, da, eps)
+    valid = np.any(na != 0, axis=1) & np.any(nb != 0, axis=1)
+    separated = (np.all(dist_a > 0, axis=1) | np.all(dist_a < 0, axis=1)
+                 | np.all(dist_b > 0, axis=1) | np.all(dist_b < 0, axis=1))
+    coplanar = valid & np.all(dist_a == 0, axis=1) & np.all(dist_b == 0, axis=1)
+    crossing = np.flatnonzero(valid & ~separated & ~coplanar)
+
+    # triangles crossing planes of each other should overlap on the line of the planes
+    line = np.cross(na[crossing], nb[crossing])
+    lo_a, hi_a = _line_intervals(ta[crossing], dist_a[crossing], line)
+    lo_b, hi_b = _line_intervals(tb[crossing], dist_b[crossing], line)
+    crossing = crossing[(lo_a <= hi_b + eps) & (lo_b <= hi_a + eps)]
+    coplanar = np.flatnonzero(coplanar)
+
+    cuts = []
+    for tris, normals, coords, others, other_normals, other_coords in (
+            (ia, na, ta, ib, nb, tb), (ib, nb, tb, ia, na, ta)):
+        edge_normals, edge_offsets = _edge_planes(other_coords[coplanar], other_normals[coplanar])
+        box_min, box_max = _boxes(other_coords, eps)
+        cut_tris = np.concatenate((tris[crossing], np.repeat(tris[coplanar], 3)))
+        cut_normals = np.concatenate((other_normals[crossing], edge_normals.reshape(-1, 3)))
+        cut_offsets = np.concatenate((np.einsum('ij,ij->i', other_normals[crossing], other_coords[crossing, 0]),
+                                      edge_offsets.ravel()))
+        cut_min = np.concatenate((box_min[crossing], np.repeat(box_min[coplanar], 3, axis=0)))
+        cut_max = np.concatenate((box_max[crossing], np.repeat(box_max[coplanar], 3, axis=0)))
+        cuts.append((cut_tris, cut_normals, cut_offsets, cut_min, cut_max))
+    return cuts
+
+
+def _edge_points(u, v, du, dv):
+    """Points where edges cross the plane, computed the same way for both directions of edges"""
+    swap = (u[:, 0] > v[:, 0]) | ((u[:, 0] == v[:, 0]) & (
+        (u[:, 1] > v[:, 1]) | ((u[:, 1] == v[:, 1]) & (u[:, 2] > v[:, 2]))))
+    u, v = np.where(swap[:, np.newaxis], v, u), np.where(swap[:, np.newaxis], u, v)
+    du, dv = np.where(swap, dv, du), np.where(swap, du, dv)
+    return u + (v - u) * (du / (du - dv))[:, np.newaxis]
+
+
+def _split_triangles(coords, dist):
+    '''
+    Splits triangles which have corners on both sides of planes into two or
+    three triangles keeping their orientation. Returns new triangles and
+    indices of triangles they are made of.
+    '''
+    sign = np.sign(dist).astype(np.int64)
+    zero = sign == 0
+    has_zero = np.any(zero, axis=1)
+    # corner lying on the plane or alone on its side of the plane goes first
+    lone = np.where(has_zero, np.argmax(zero, axis=1),
+                    np.argmax(sign == -sign.sum(axis=1, keepdims=True), axis=1))
+    rows = np.arange(len(coords))[:, np.newaxis]
+    order = (lone[:, np.newaxis] + np.arange(3)) % 3
+    coords, dist = coords[rows, order], dist[rows, order]
+    a, b, c = coords[:, 0], coords[:, 1], coords[:, 2]
+
+    two = np.flatnonzero(has_zero)
+    q = _edge_points(b[two], c[two], dist[two, 1], dist[two, 2])
+    halves = [np.stack((a[two], b[two], q), axis=1), np.stack((a[two], q, c[two]), axis=1)]
+
+    three = np.flatnonzero(~has_zero)
+    q1 = _edge_points(a[three], b[three], dist[three, 0], dist[three, 1])
+    q2 = _edge_points(a[three], c[three], dist[three, 0], dist[three, 2])
+    thirds = [np.stack((a[three], q1, q2), axis=1), np.stack((q1, b[three], c[three]), axis=1),
+              np.stack((q1, c[three], q2), axis=1)]
+    return np.concatenate(halves + thirds), np.concatenate([two] * 2 + [three] * 3)
+
+
+def _cut_triangles(coords, cuts, eps):
+    '''
+    Cuts triangles by planes, every triangle only by its own planes. Pieces are
+    cut only when their bounding box overlaps the box of the cutting triangle.
+    Returns pieces and indices of triangles they belong to.
+    '''
+    cut_tris, normals, offsets, cut_min, cut_max = cuts
+    order = np.argsort(cut_tris, kind='stable')
+    cut_tris, normals, offsets, cut_min, cut_max = (
+        cut_tris[order], normals[order], offsets[order], cut_min[order], cut_max[order])
+    rank = np.arange(len(cut_tris)) - np.searchsorted(cut_tris, cut_tris)
+
+    pieces, piece_tris = coords, np.arange(len(coords))
+    cut_of_tri = np.empty(len(coords), dtype=np.int64)
+    for step in range(rank.max() + 1 if len(rank) else 0):
+        current = np.flatnonzero(rank == step)
+        cut_of_tri[:] = -1
+        cut_of_tri[cut_tris[current]] = current
+        cut = cut_of_tri[piece_tris]
+        active = np.flatnonzero(cut >= 0)
+        cut = cut[active]
+        piece_min, piece_max = pieces[active].min(axis=1), pieces[active].max(axis=1)
+        close = np.all((piece_min <= cut_max[cut]) & (piece_max >= cut_min[cut]), axis=1)
+        active, cut = active[close], cut[close]
+        dist = _signed_distances(pieces[active], normals[cut], offsets[cut], eps)
+        split = np.any(dist > 0, axis=1) & np.any(dist < 0, axis=1)
+        if not np.any(split):
+            continue
+        active = active[split]
+        new_pieces, source = _split_triangles(pieces[active], dist[split])
+        keep = np.ones(len(pieces), dtype=bool)
+        keep[active] = False
+        pieces = np.concatenate((pieces[keep], new_pieces))
+        piece_tris = np.concatenate((piece_tris[keep], piece_tris[active][source]))
+    return pieces, piece_tris
+
+
+def _cut_mesh(faces, tri_faces, coords, cuts, eps):
+    """Faces of the mesh without intersections are kept as is, other faces are cut into triangles"""
+    cut_faces = np.zeros(len(faces), dtype=bool)
+    cut_faces[tri_faces[cuts[0]]] = True
+    has_tris = np.bincount(tri_faces, minlength=len(faces)) > 0
+    kept_faces = np.flatnonzero(~cut_faces & has_tris)
+    # the first triangle of face is used to classify the face
+    first_tris = np.searchsorted(tri_faces, kept_faces)
+
+    tris = np.flatnonzero(cut_faces[tri_faces])
+    tri_index = np.full(len(coords), -1)
+    tri_index[tris] = np.arange(len(tris))
+    cut_tris, *cut_planes = cuts
+    pieces, piece_tris = _cut_triangles(coords[tris], (tri_index[cut_tris], *cut_planes), eps)
+    piece_tris = tris[piece_tris]
+
+    return _MeshPart(faces, kept_faces, pieces, np.concatenate((coords[first_tris], pieces)))
+
+
+def _classify(triangles, verts, tris, eps, tolerance):
+    '''
+    Classifies triangles which do not cross the mesh as inside or outside of it
+    or lying on its faces with the same or opposite normal. Triangles close to
+    the mesh are classified by the side of the nearest face their farthest
+    corner is on, other ones by ray casting from their centers.
+    '''
+    codes = np.full(len(triangles), OUTSIDE)
+    if not len(triangles):
+        return codes
+    centers = triangles.mean(axis=1)
+    normals = _planes(triangles)[0]
+    box_min, box_max = verts.min(axis=0) - tolerance, verts.max(axis=0) + tolerance
+    candidates = np.flatnonzero(np.all((centers >= box_min) & (centers <= box_max), axis=1))
+    bvh = BVHTree.FromPolygons(verts.tolist(), tris.tolist(), all_triangles=True)
+    for i in candidates:
+        center = Vector(centers[i])
+        location, normal, index, distance = bvh.find_nearest(center, tolerance)
+        if index is not None:
+            dist = (triangles[i] - np.array(location)) @ np.array(normal)
+            farthest = dist[np.argmax(np.abs(dist))]
+            if abs(farthest) < eps:
+                codes[i] = SAME if normal.dot(Vector(normals[i])) > 0 else OPPOSITE
+            elif farthest < 0:
+                codes[i] = INSIDE
+            continue
+        location, normal, index, distance = bvh.ray_cast(center, RAY_DIRECTION)
+        if index is not None and normal.dot(RAY_DIRECTION) > 0:
+            codes[i] = INSIDE
+    return codes
+
+
+def _weld(coords, distance):
+    """Merges vertices closer than distance, keeps order and coordinates of the first vertices"""
+    labels = np.arange(len(coords))
+    pairs = list(overlapping_boxes(coords - distance / 2, coords + distance / 2))
+    if pairs:
+        i, j = np.concatenate(pairs).T
+        close = np.linalg.norm(coords[i] - coords[j], axis=1) < distance
+        i, j = i[close], j[close]
+        # connected components get the smallest index of their vertices
+        while True:
+            new_labels = labels.copy()
+            smallest = np.minimum(labels[i], labels[j])
+            np.minimum.at(new_labels, i, smallest)
+            np.minimum.at(new_labels, j, smallest)
+            new_labels = new_labels[new_labels]
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+    first = labels == np.arange(len(labels))
+    return coords[first], (np.cumsum(first) - 1)[labels]
+
+
+def _face_ids(lengths):
+    return np.repeat(np.arange(len(lengths)), lengths)
+
+
+def _next_corners(lengths):
+    """Index of the next corner in the face for each corner of flat faces"""
+    starts = np.cumsum(lengths) - lengths
+    corners = np.arange(lengths.sum())
+    next_corners = corners + 1
+    last = starts + lengths - 1
+    next_corners[last[lengths > 0]] = starts[lengths > 0]
+    return next_corners
+
+
+def _remove_degenerate(coords, flat, lengths, eps):
+    '''
+    Removes repeated neighbour vertices of faces, faces with less than three
+    vertices, triangles which height is less than eps and pairs of triangles
+    with the same vertices and opposite normals
+    '''
+    repeated = flat == flat[_next_corners(lengths)]
+    face_ids = _face_ids(lengths)
+    flat, face_ids = flat[~repeated], face_ids[~repeated]
+    lengths = np.bincount(face_ids, minlength=len(lengths))
+    good = lengths >= 3
+    tris = np.flatnonzero(lengths == 3)
+    corners = coords[flat[(np.cumsum(lengths) - lengths)[tris, np.newaxis] + np.arange(3)]]
+    edges = np.roll(corners, -1, axis=1) - corners
+    double_area = np.linalg.norm(np.cross(edges[:, 0], edges[:, 1]), axis=1)
+    good[tris[double_area < eps * np.linalg.norm(edges, axis=2).max(axis=1)]] = False
+
+    if len(tris):
+        tri_verts = flat[(np.cumsum(lengths) - lengths)[tris, np.newaxis] + np.arange(3)]
+        a, b, c = tri_verts.T
+        odd = ((a > b).astype(np.int64) + (a > c) + (b > c)) % 2
+        _, group = np.unique(np.sort(tri_verts, axis=1), axis=0, return_inverse=True)
+        group = group.ravel()
+        n_odd = np.bincount(group, weights=odd).astype(np.int64)
+        n_even = np.bincount(group) - n_odd
+        good[tris[(n_odd[group] == 1) & (n_even[group] == 1)]] = False
+    return flat[good[face_ids]], lengths[good]
+
+
+def _insert_points_on_edges(coords, flat, lengths, tolerance):
+    '''
+    Fixes T-junctions. Edges of faces without the opposite edge of other face
+    get vertices of such edges which lie on them. It's repeated while the
+    number of such edges decreases.
+    '''
+    n_open = len(flat) + 1
+    while True:
+        open_corners = _open_corners(len(coords), flat, lengths)
+        if not 0 < len(open_corners) < n_open:
+            return flat, lengths
+        n_open = len(open_corners)
+        flat, lengths = _insert_points(coords, flat, lengths, open_corners, tolerance)
+
+
+def _open_corners(n, flat, lengths):
+    """Corners which edges to the next corner have no opposite edge"""
+    u, v = flat, flat[_next_corners(lengths)]
+    return np.flatnonzero(_count(np.sort(u * n + v), v * n + u) == 0)
+
+
+def _count(sorted_keys, keys):
+    """Numbers of occurrences of keys in sorted array, it's faster than np.isin for large arrays"""
+    return np.searchsorted(sorted_keys, keys, side='right') - np.searchsorted(sorted_keys, keys)
+
+
+def _insert_points(coords, flat, lengths, open_corners, tolerance):
+    n = len(coords)
+    u, v = flat, flat[_next_corners(lengths)]
+    points = np.unique(np.concatenate((u[open_corners], v[open_corners])))
+    start, end = coords[u[open_corners]], coords[v[open_corners]]
+    box_min = np.concatenate((np.minimum(start, end), coords[points])) - tolerance
+    box_max = np.concatenate((np.maximum(start, end), coords[points])) + tolerance
+    n_edges = len(open_corners)
+    pairs = [p[(p[:, 0] < n_edges) & (p[:, 1] >= n_edges)] for p in overlapping_boxes(box_min, box_max)]
+    if not pairs:
+        return flat, lengths
+    pairs = np.concatenate(pairs)
+    corners, pair_points = open_corners[pairs[:, 0]], points[pairs[:, 1] - n_edges]
+    face_ids = _face_ids(lengths)
+    good = _count(np.sort(face_ids * n + flat), face_ids[corners] * n + pair_points) == 0
+    corners, pair_points = corners[good], pair_points[good]
+    start, direction = coords[u[corners]], coords[v[corners]] - coords[u[corners]]
+    t = np.einsum('ij,ij->i', coords[pair_points] - start, direction) / np.einsum('ij,ij->i', direction, direction)
+    dist = np.linalg.norm(start + direction * t[:, np.newaxis] - coords[pair_points], axis=1)
+    good = (t > 0) & (t < 1) & (dist < tolerance)
+    corners, pair_points, t, dist = corners[good], pair_points[good], t[good], dist[good]
+
+    # vertices of thin triangles can be close to several edges, first the points
+    # closing holes are inserted, other ones are inserted only if there are no such points
+    open_keys = u[open_corners] * n + v[open_corners]
+    closing = _on_open_paths(corners, pair_points, u[corners], v[corners], open_keys, n)
+    if np.any(closing):
+        corners, pair_points, t, dist = corners[closing], pair_points[closing], t[closing], dist[closing]
+
+    # point can be close to two edges of a face at sharp angles, it goes to the nearest
+    # one, or to both edges of the corner if the corner is thinner than the tolerance
+    corner_faces = face_ids[corners]
+    order = np.lexsort((dist, pair_points, corner_faces))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = ((corner_faces[order][1:] != corner_faces[order][:-1])
+                 | (pair_points[order][1:] != pair_points[order][:-1]))
+    second = np.zeros(len(order), dtype=bool)
+    second[1:] = ~first[1:] & first[:-1]
+    nearest = np.flatnonzero(second) - 1
+    next_corners = _next_corners(lengths)
+    second[second] = ((next_corners[corners[order][nearest]] == corners[order][second])
+                      | (next_corners[corners[order][second]] == corners[order][nearest]))
+    order = order[first | second]
+    corners, pair_points, t = corners[order], pair_points[order], t[order]
+    order = np.lexsort((t, corners))
+    corners, pair_points = corners[order], pair_points[order]
+
+    # each corner is followed by points of its edge
+    counts = np.bincount(corners, minlength=len(flat))
+    local = np.arange(len(corners)) - np.repeat(np.cumsum(counts) - counts, counts)
+    corner_starts = np.cumsum(counts + 1) - counts - 1
+    new_flat = np.empty(len(flat) + len(corners), dtype=np.int64)
+    new_flat[corner_starts] = flat
+    new_flat[corner_starts[corners] + 1 + local] = pair_points
+    new_lengths = lengths + np.bincount(face_ids, weights=counts, minlength=len(lengths)).astype(np.int64)
+
+    # thin triangle lying on the edge should not be repeated by edges with its top
+    # vertex, and point should not be inserted if the edge is already closed without it
+    is_inserted = np.ones(len(new_flat), dtype=bool)
+    is_inserted[corner_starts] = False
+    next_corners = _next_corners(new_lengths)
+    prev_corners = np.empty_like(next_corners)
+    prev_corners[next_corners] = np.arange(len(next_corners))
+    keys = new_flat * n + new_flat[next_corners]
+    sorted_keys = np.sort(keys)
+    counts = _count(sorted_keys, keys)
+    reverse_counts = _count(sorted_keys, new_flat[next_corners] * n + new_flat)
+    repeated = counts > 1
+    closed = (counts == 1) & (reverse_counts > 0)
+    open_keys = np.sort(keys[reverse_counts == 0])
+    shortcut = _count(open_keys, new_flat[next_corners] * n + new_flat[prev_corners]) > 0
+    fin = is_inserted & ((repeated & repeated[prev_corners])
+                         | (shortcut & ~(closed & closed[prev_corners])))
+    new_face_ids = _face_ids(new_lengths)
+    return _remove_spikes(new_flat[~fin], new_lengths - np.bincount(new_face_ids[fin], minlength=len(lengths)))
+
+
+def _on_open_paths(corners, points, u, v, open_keys, n):
+    '''
+    Marks points which lie on paths of open edges going from the end of the
+    edge of their corner back to its start through points of the same edge
+    '''
+    # pairs of points of the same edges connected by open edges
+    order = np.argsort(corners, kind='stable')
+    sorted_corners = corners[order]
+    starts = np.searchsorted(sorted_corners, sorted_corners)
+    counts = np.searchsorted(sorted_corners, sorted_corners, side='right') - starts
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    i, j = order[np.repeat(np.arange(len(order)), counts)], order[np.repeat(starts, counts) + local]
+    linked = np.isin(points[i] * n + points[j], open_keys)
+    i, j = i[linked], j[linked]
+
+    from_end = np.isin(v * n + points, open_keys)
+    to_start = np.isin(points * n + u, open_keys)
+    while True:
+        new_from_end, new_to_start = from_end.copy(), to_start.copy()
+        np.logical_or.at(new_from_end, j, from_end[i])
+        np.logical_or.at(new_to_start, i, to_start[j])
+        if np.array_equal(new_from_end, from_end) and np.array_equal(new_to_start, to_start):
+            return from_end & to_start
+        from_end, to_start = new_from_end, new_to_start
+
+
+def _remove_spikes(flat, lengths):
+    """Removes spikes of faces, corners which neighbours are the same vertex, with one of the neighbours"""
+    next_corners = _next_corners(lengths)
+    prev_corners = np.empty_like(next_corners)
+    prev_corners[next_corners] = np.arange(len(next_corners))
+    spike = (flat[prev_corners] == flat[next_corners]) & (next_corners != prev_corners)
+    if not np.any(spike):
+        return flat, lengths
+    keep = ~spike
+    keep[next_corners[spike]] = False
+    face_ids = _face_ids(lengths)[keep]
+    flat, lengths = flat[keep], np.bincount(face_ids, minlength=len(lengths))
+    good = lengths >= 3
+    return flat[good[face_ids]], lengths[good]
+
+
+def _remove_lone_vertices(coords, flat, lengths, tolerance):
+    '''
+    Vertices of closed mesh are shared by several faces. Vertices used by one
+    face which lie on the segment between their neighbours are left by thin
+    triangles and are removed, faces with less than three vertices are removed.
+    '''
+    while True:
+        next_corners = _next_corners(lengths)
+        prev_corners = np.empty_like(next_corners)
+        prev_corners[next_corners] = np.arange(len(next_corners))
+        lone = np.flatnonzero(np.bincount(flat, minlength=len(coords))[flat] == 1)
+        start, point = coords[flat[prev_corners[lone]]], coords[flat[lone]]
+        direction = coords[flat[next_corners[lone]]] - start
+        length = np.einsum('ij,ij->i', direction, direction)
+        t = np.einsum('ij,ij->i', point - start, direction) / np.where(length > 0, length, 1)
+        dist = np.linalg.norm(start + direction * t[:, np.newaxis] - point, axis=1)
+        lone = lone[(t > 0) & (t < 1) & (dist < tolerance)]
+        if not len(lone):
+            return flat, lengths
+        keep = np.ones(len(flat), dtype=bool)
+        keep[lone] = False
+        face_ids = _face_ids(lengths)[keep]
+        flat, lengths = flat[keep], np.bincount(face_ids, minlength=len(lengths))
+        good = lengths >= 3
+        flat, lengths = flat[good[face_ids]], lengths[good]
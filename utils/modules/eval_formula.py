@@ -17,9 +17,12 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import ast
+from functools import lru_cache, reduce
 
-from sverchok.utils.script_importhelper import safe_names
-from sverchok.utils import sv_logging
+import numpy as np
+
+from sverchok.utils.script_importhelper import safe_names, safe_names_np
+from sverchok.utils.sv_logging import sv_logger
 
 class VariableCollector(ast.NodeVisitor):
     """
@@ -105,19 +108,10 @@ def get_variables(string):
     string = string.strip()
     if not len(string):
         return set()
-    root = ast.parse(string, mode='eval')
-    visitor = VariableCollector()
-    visitor.visit(root)
-    result = visitor.variables
-    return result.difference(safe_names.keys())
+    return set(compile_formula(string).variables)
 
 def sv_compile(string):
-    try:
-        root = ast.parse(string, mode='eval')
-        return compile(root, "<expression>", 'eval')
-    except SyntaxError as e:
-        logging.exception(e)
-        raise Exception("Invalid expression syntax: " + str(e))
+    return compile_formula(string).code
 
 def safe_eval_compiled(compiled, variables, allowed_names = None):
     """
@@ -133,7 +127,7 @@ def safe_eval_compiled(compiled, variables, allowed_names = None):
         env["__builtins__"] = {}
         return eval(compiled, env)
     except SyntaxError as e:
-        sv_logging.exception(e)
+        sv_logger.exception(e)
         raise Exception("Invalid expression syntax: " + str(e))
 
 # It could be safer...
@@ -142,14 +136,302 @@ def safe_eval(string, variables):
     Evaluate expression, allowing only functions known to be "safe"
     to be used.
     """
-    try:
-        env = dict()
-        env.update(safe_names)
+    return compile_formula(string).evaluate(variables)
+
+
+def _to_int(x):
+    x = np.asarray(x)
+    if x.dtype.kind in 'biuO':
+        return x
+    if not np.all(np.abs(x) < 2.0 ** 63):
+        # int() of these values raises or gives numbers which do not fit into int64
+        raise ValueError("Value can't be converted to int64")
+    return x.astype(np.int64)
+
+def _as_int(function):
+    return lambda *args: _to_int(function(*args))
+
+def _sign(x):
+    x = np.sign(x)
+    return _to_int(np.where(x == x, x, 0))  # sign(nan) is 0
+
+def _as_float(function):
+    return lambda x, *args: function(np.asarray(x, dtype=np.float64), *args)
+
+def _log(x, base=None):
+    if base is None:
+        return np.log(x)
+    return np.log(x) / np.log(base)
+
+def _int(x):
+    return _to_int(np.trunc(x))
+
+# Elementwise NumPy versions of safe_names, their results have the same
+# types as results of the original functions
+vectorized_names = {name: safe_names_np[name] for name in [
+        'acos', 'acosh', 'asin', 'asinh', 'atan2', 'atanh', 'cos', 'cosh',
+        'degrees', 'exp', 'expm1', 'fabs', 'hypot', 'isfinite', 'isinf',
+        'isnan', 'ldexp', 'log10', 'log1p', 'log2', 'radians', 'sin', 'sinh',
+        'sqrt', 'tan', 'tanh', 'copysign']}
+vectorized_names.update({
+        'atan': np.arctan,
+        'log': _log,
+        'pow': _as_float(np.power),
+        'fmod': _as_float(np.fmod),
+        'ceil': _as_int(np.ceil),
+        'floor': _as_int(np.floor),
+        'trunc': _as_int(np.trunc),
+        'sign': _sign,
+        'abs': np.abs,
+        'max': lambda *args: reduce(np.maximum, args),
+        'min': lambda *args: reduce(np.minimum, args),
+        'int': _int,
+        'float': _as_float(np.asarray),
+        # replacements of operators which can't be applied to arrays
+        '_sv_where': np.where,
+        '_sv_and': lambda *args: reduce(lambda a, b: np.where(a, b, a), args),
+        '_sv_or': lambda *args: reduce(lambda a, b: np.where(a, a, b), args),
+        '_sv_not': np.logical_not,
+    })
+
+# elementwise functions of numpy module which can be called as np.<name>
+_numpy_elementwise = {'where', 'clip', 'round', 'around'}
+
+_variadic_names = {'max', 'min'}  # vectorized only with several arguments
+_single_argument_names = {'int', 'float'}
+
+
+class VectorizingTransformer(ast.NodeTransformer):
+    """
+    Makes from expression tree a tree which gives the same results when
+    variables are arrays of values, if it's possible. Operators which can't
+    be applied to arrays (and, or, not, if-else, chained comparison) are
+    replaced by calls of NumPy functions. If expression uses something which
+    does not work elementwise (list literals, indexing, attributes, unknown
+    functions...) `vectorizable` flag is set to False.
+    Please refer to ast.NodeTransformer class documentation for general reference.
+    """
+    def __init__(self, variables):
+        self.variables = variables
+        self.vectorizable = True
+        self.int_safe = True  # no operations which wrap around on int64 arrays
+
+    def _call(self, name, args, node):
+        call = ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=args, keywords=[])
+        return ast.copy_location(call, node)
+
+    def generic_visit(self, node):
+        if not isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.operator,
+                                 ast.unaryop, ast.cmpop, ast.expr_context)):
+            self.vectorizable = False
+        return super().generic_visit(node)
+
+    def visit_Constant(self, node):
+        if not isinstance(node.value, (bool, int, float)):
+            self.vectorizable = False
+        return node
+
+    def visit_Name(self, node):
+        if node.id not in self.variables and node.id not in {'pi', 'e'}:
+            self.vectorizable = False
+        return node
+
+    def visit_BinOp(self, node):
+        if isinstance(node.op, ast.MatMult):
+            self.vectorizable = False
+        if not isinstance(node.op, ast.Div):
+            self.int_safe = False
+        return self.generic_visit(node)
+
+    def visit_UnaryOp(self, node):
+        if isinstance(node.op, ast.Not):
+            return self._call('_sv_not', [self.visit(node.operand)], node)
+        if isinstance(node.op, ast.USub):
+            self.int_safe = False
+        return self.generic_visit(node)
+
+    def visit_BoolOp(self, node):
+        name = '_sv_and' if isinstance(node.op, ast.And) else '_sv_or'
+        return self._call(name, [self.visit(value) for value in node.values], node)
+
+    def visit_IfExp(self, node):
+        return self._call('_sv_where', [self.visit(node.test), self.visit(node.body), self.visit(node.orelse)], node)
+
+    def visit_Compare(self, node):
+        if any(isinstance(op, (ast.In, ast.NotIn, ast.Is, ast.IsNot)) for op in node.ops):
+            self.vectorizable = False
+            return node
+        left = self.visit(node.left)
+        comparators = [self.visit(c) for c in node.comparators]
+        if len(node.ops) == 1:
+            node.left, node.comparators = left, comparators
+            return node
+        pairs = []
+        for op, right in zip(node.ops, comparators):
+            pairs.append(ast.copy_location(ast.Compare(left=left, ops=[op], comparators=[right]), node))
+            left = right
+        return self._call('_sv_and', pairs, node)
+
+    def visit_Attribute(self, node):
+        # np.pi, np.e and so on
+        if not (isinstance(node.value, ast.Name) and node.value.id == 'np'
+                and not callable(getattr(np, node.attr, None))):
+            self.vectorizable = False
+        return node
+
+    def visit_Call(self, node):
+        func = node.func
+        if node.keywords or any(isinstance(arg, ast.Starred) for arg in node.args):
+            self.vectorizable = False
+        elif isinstance(func, ast.Name) and func.id not in self.variables:
+            if func.id not in vectorized_names or func.id.startswith('_sv_') \
+                    or (func.id in _variadic_names and len(node.args) < 2) \
+                    or (func.id in _single_argument_names and len(node.args) != 1):
+                self.vectorizable = False
+            if func.id in {'pow', 'abs'}:
+                self.int_safe = False
+        elif isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name) and func.value.id == 'np':
+            function = getattr(np, func.attr, None)
+            if not (isinstance(function, np.ufunc) or func.attr in _numpy_elementwise):
+                self.vectorizable = False
+            if func.attr not in _numpy_elementwise:
+                self.int_safe = False
+        else:
+            self.vectorizable = False
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+
+class SvCompiledFormula:
+    """
+    Expression which is parsed, checked and compiled only once, use
+    compile_formula function to get it.
+    It can be evaluated for one set of values of variables or for arrays of
+    values at once. In the latter case it's evaluated by NumPy when it's
+    possible and element by element otherwise.
+    """
+    def __init__(self, string):
+        self.string = string
+        try:
+            root = ast.parse(string, mode='eval')
+        except SyntaxError as e:
+            sv_logger.exception(e)
+            raise Exception("Invalid expression syntax: " + str(e))
+        for node in ast.walk(root):
+            if isinstance(node, ast.Attribute) and node.attr.startswith('__') \
+                    or isinstance(node, ast.Name) and node.id.startswith('__'):
+                raise Exception(f"Invalid expression: names starting with '__' are not allowed: {string}")
+        visitor = VariableCollector()
+        visitor.visit(root)
+        self.variables = frozenset(visitor.variables.difference(safe_names.keys()))
+        self.code = compile(root, "<expression>", 'eval')
+
+        transformer = VectorizingTransformer(self.variables)
+        vector_root = ast.fix_missing_locations(transformer.visit(ast.parse(string, mode='eval')))
+        self.vectorizable = transformer.vectorizable
+        self.int_safe = transformer.int_safe
+        self.vector_code = compile(vector_root, "<expression>", 'eval') if self.vectorizable else None
+
+    def __repr__(self):
+        return f"<Formula {self.string!r}{'' if self.vectorizable else ' (not vectorizable)'}>"
+
+    def evaluate(self, variables, allowed_names=None):
+        """Evaluates the expression with given values of variables"""
+        env = dict(safe_names if allowed_names is None else allowed_names)
         env.update(variables)
         env["__builtins__"] = {}
-        root = ast.parse(string, mode='eval')
-        return eval(compile(root, "<expression>", 'eval'), env)
-    except SyntaxError as e:
-        logging.exception(e)
-        raise Exception("Invalid expression syntax: " + str(e))
+        return eval(self.code, env)
 
+    def evaluate_array(self, arrays, constants=None, strict=False):
+        """
+        Evaluates the expression for all elements of given arrays at once.
+        :arrays: variable name -> array (or list) of values, shapes of arrays
+            should be broadcastable
+        :constants: variable name -> value which is the same for all elements
+        :strict: if True the results should be the same as if the
+            expression was evaluated for each element separately, including
+            errors, otherwise NumPy rules of handling of floating point errors
+            (inf, nan values) are used
+        :return: array of results with shape of broadcast arrays
+
+        Integer arrays are converted to arrays of python integers if the
+        expression has operations which can wrap around on int64 values.
+
+        Values which are not arrays but support NumPy functions (for example,
+        dual numbers used to differentiate fields) are passed to vectorized
+        expression as is; TypeError is raised if expression is not vectorizable
+        or uses functions which such values do not support.
+        """
+        constants = constants or dict()
+        if any(_is_array_like_object(value) for value in arrays.values()):
+            if not self.vectorizable:
+                raise TypeError(f"Expression `{self.string}` can't be evaluated for array-like objects")
+            env = dict(safe_names)
+            env.update(vectorized_names)
+            env.update(constants)
+            env.update(arrays)
+            env["__builtins__"] = {}
+            return eval(self.vector_code, env)
+        arrays = {name: np.asarray(value) for name, value in arrays.items()}
+        shape = np.broadcast_shapes(*[a.shape for a in arrays.values()])
+        numeric = all(a.dtype.kind in 'biuf' for a in arrays.values())
+        has_ints = any(a.dtype.kind in 'biu' for a in arrays.values())
+        if self.vectorizable and numeric:
+            env = dict(safe_names)
+            env.update(vectorized_names)
+            env.update(constants)
+            if has_ints and not self.int_safe:
+                env.update({name: a.astype(object) if a.dtype.kind in 'biu' else a
+                            for name, a in arrays.items()})
+            else:
+                env.update(arrays)
+            env["__builtins__"] = {}
+            try:
+                if strict:
+                    with np.errstate(all='raise'):
+                        result = np.asarray(eval(self.vector_code, env))
+                else:
+                    result = np.asarray(eval(self.vector_code, env))
+                if result.dtype == object:
+                    result = _results_array(result.ravel().tolist()).reshape(result.shape)
+                if result.dtype.kind in 'biufO':
+                    if result.shape == shape:
+                        return result
+                    return np.broadcast_to(result, shape).copy()
+            except (ArithmeticError, ValueError, TypeError):
+                # per-element evaluation will either raise the proper error or
+                # process the case which is not supported by numpy
+                pass
+        return self._evaluate_elements(arrays, constants, shape)
+
+    def _evaluate_elements(self, arrays, constants, shape):
+        names = list(arrays.keys())
+        values = [a.ravel().tolist() for a in np.broadcast_arrays(*arrays.values())]
+        results = []
+        env = dict(safe_names)
+        env.update(constants)
+        env["__builtins__"] = {}
+        for element in zip(*values) if values else [()]:
+            env.update(zip(names, element))
+            results.append(eval(self.code, env))
+        return _results_array(results).reshape(shape + np.shape(results[0]) if results else shape)
+
+
+def _results_array(values):
+    # numpy converts python integers which do not fit into int64 to floats
+    if any(type(value) is int and not -2**63 <= value < 2**63 for value in values):
+        return np.array(values, dtype=object)
+    return np.array(values)
+
+
+def _is_array_like_object(value):
+    return hasattr(value, '__array_ufunc__') and not isinstance(value, (np.ndarray, np.generic))
+
+
+@lru_cache(maxsize=256)
+def compile_formula(string):
+    """
+    Returns SvCompiledFormula for the expression, compiled formulas are
+    cached by their strings
+    """
+    return SvCompiledFormula(string)
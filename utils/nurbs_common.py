@@ -187,6 +187,94 @@ class SvNurbsBasisFunctions(object):
         self.knotvector = np.array(knotvector)
         self._cache = dict()
 
+    def span_basis(self, p, ts, deriv_order=0):
+        """
+        Evaluate all basis functions of degree p which are non-zero at given
+        parameter values, together with their derivatives. Only p+1 functions
+        are non-zero at any t, so the result is much more compact than
+        calculation of all functions with function() / derivative() methods.
+        The implementation follows algorithms A2.1 and A2.3 from The NURBS Book,
+        vectorized over parameter values.
+
+        Returns:
+        * indices: np.array of shape (n, p+1) - indices of basis functions (and so
+          of control points) which correspond to the values;
+        * values: np.array of shape (deriv_order+1, n, p+1); values[k] are k-th
+          derivatives of the basis functions.
+
+        Values at parameters outside of the knotvector range are zeros.
+        """
+        ts = np.asarray(ts, dtype=np.float64)
+        u = self.knotvector
+        n_funcs = len(u) - p - 1
+        # padding allows to process unclamped knotvectors the same way;
+        # functions which appear due to padding are zeroed below
+        padded = self._cache.get(('padded', p))
+        if padded is None:
+            padded = np.concatenate((np.full(p, u[0]), u, np.full(p, u[-1])))
+            self._cache[('padded', p)] = padded
+        U = padded
+
+        outside = (ts < u[0]) | (ts > u[-1])
+        ts = np.clip(ts, u[0], u[-1])
+        spans = np.searchsorted(U, ts, side='right') - 1
+        # the last knot belongs to the last non-empty span
+        last_span = np.searchsorted(U, u[-1], side='left') - 1
+        spans = np.where(ts >= u[-1], last_span, spans)
+
+        n = len(ts)
+        left = np.zeros((p+1, n))
+        right = np.zeros((p+1, n))
+        for j in range(1, p+1):
+            left[j] = ts - U[spans+1-j]
+            right[j] = U[spans+j] - ts
+
+        # ndu[r, j] (r <= j) - basis functions of degree j,
+        # ndu[j, r] (r < j) - knot differences
+        ndu = np.zeros((p+1, p+1, n))
+        ndu[0, 0] = 1.0
+        for j in range(1, p+1):
+            saved = 0.0
+            for r in range(j):
+                ndu[j, r] = right[r+1] + left[j-r]
+                temp = ndu[r, j-1] / ndu[j, r]
+                ndu[r, j] = saved + right[r+1] * temp
+                saved = left[j-r] * temp
+            ndu[j, j] = saved
+
+        values = np.zeros((deriv_order+1, n, p+1))
+        values[0] = ndu[:, p].T
+        for r in range(p+1):
+            a = np.zeros((2, p+1, n))
+            a[0, 0] = 1.0
+            s1, s2 = 0, 1
+            for k in range(1, min(deriv_order, p)+1):
+                d = np.zeros(n)
+                rk, pk = r - k, p - k
+                if r >= k:
+                    a[s2, 0] = a[s1, 0] / ndu[pk+1, rk]
+                    d += a[s2, 0] * ndu[rk, pk]
+                j1 = 1 if rk >= -1 else -rk
+                j2 = k-1 if r-1 <= pk else p-r
+                for j in range(j1, j2+1):
+                    a[s2, j] = (a[s1, j] - a[s1, j-1]) / ndu[pk+1, rk+j]
+                    d += a[s2, j] * ndu[rk+j, pk]
+                if r <= pk:
+                    a[s2, k] = -a[s1, k-1] / ndu[pk+1, r]
+                    d += a[s2, k] * ndu[r, pk]
+                values[k, :, r] = d
+                s1, s2 = s2, s1
+        factor = p
+        for k in range(1, min(deriv_order, p)+1):
+            values[k] *= factor
+            factor *= p - k
+
+        indices = (spans - 2*p)[np.newaxis].T + np.arange(p+1) # (n, p+1)
+        invalid = (indices < 0) | (indices >= n_funcs) | outside[np.newaxis].T
+        values[:, invalid] = 0.0
+        indices = np.clip(indices, 0, n_funcs-1)
+        return indices, values
+
     def function(self, i, p, reset_cache=True):
         if reset_cache:
             self._cache = dict()
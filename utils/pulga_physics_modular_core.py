@@ -5,6 +5,8 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
+from itertools import product
+
 import numpy as np
 from mathutils.bvhtree import BVHTree
 from sverchok.utils.modules.vector_math_utils import angle_between, unit_vector
@@ -13,7 +15,6 @@ if FreeCAD is not None:
     import Part
     from  FreeCAD import Base
 from sverchok.utils.surface.freecad import is_solid_face_surface
-from sverchok.dependencies import scipy
 from sverchok.utils.sv_mesh_utils import polygons_to_edges_np
 from sverchok.utils.modules.edge_utils import adjacent_faces_number
 
@@ -42,6 +43,85 @@ def cross_indices3(n):
     return ind
 
 
+# the cell itself and half of its neighbours, the other half finds the pairs from the other side
+HALF_NEIGHBOURHOOD = np.array([(0, 0, 0)] + [o for o in product((-1, 0, 1), repeat=3) if o > (0, 0, 0)])
+
+# enum items of the nodes, 'Kd-tree' identifier is kept to load files saved before the spatial hash
+NEIGHBOURS_MODES = [
+    ('Brute_Force', 'Brute Force', 'Check every pair of vertices', 0),
+    ('Kd-tree', 'Spatial Hash', 'Check only the vertices of neighbour grid cells', 1)]
+
+def grid_neighbour_pairs(verts, radius, batch_size=1000000):
+    '''
+    pairs of vertices closer than radius, found with a uniform grid of radius sized cells.
+    Cells are numbered by ranks of their coordinates, so only occupied rows of cells
+    count and far outliers do not blow up the grid. Candidate pairs are checked in
+    batches of about batch_size pairs.
+    '''
+    v_len = len(verts)
+    if v_len < 2 or not radius > 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    cells = np.floor((verts - np.amin(verts, axis=0)) / radius).astype(np.int64)
+    ranks = np.empty_like(cells)
+    values = []
+    for axis in range(3):
+        axis_values, ranks[:, axis] = np.unique(cells[:, axis], return_inverse=True)
+        values.append(axis_values)
+    dims = [len(v) for v in values]
+    keys = (ranks[:, 0] * dims[1] + ranks[:, 1]) * dims[2] + ranks[:, 2]
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    sorted_verts = verts[order]
+    sorted_cells = cells[order]
+    sorted_ranks = ranks[order]
+    ids = np.arange(v_len)
+
+    # searching with sorted keys is much faster, pairs are made of ranks and mapped back at the end
+    pairs = []
+    for offset in HALF_NEIGHBOURHOOD:
+        if offset.any():
+            # next rank is the neighbour cell only if its coordinate is the next one
+            target_ranks = sorted_ranks + offset
+            valid = np.ones(v_len, dtype=bool)
+            for axis in np.flatnonzero(offset):
+                axis_ranks = target_ranks[:, axis]
+                valid &= (axis_ranks >= 0) & (axis_ranks < dims[axis])
+                valid[valid] = values[axis][axis_ranks[valid]] == sorted_cells[valid, axis] + offset[axis]
+            target = (target_ranks[:, 0] * dims[1] + target_ranks[:, 1]) * dims[2] + target_ranks[:, 2]
+            start = np.searchsorted(sorted_keys, target, side='left')
+            counts = np.searchsorted(sorted_keys, target, side='right') - start
+            counts[~valid] = 0
+        else:
+            start = ids + 1
+            counts = np.searchsorted(sorted_keys, sorted_keys, side='right') - start
+        cum_counts = np.cumsum(counts)
+        if cum_counts[-1] == 0:
+            continue
+        bounds = np.searchsorted(cum_counts, np.arange(batch_size, cum_counts[-1], batch_size))
+        bounds = np.unique(np.concatenate([[0], bounds, [v_len]]))
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            batch_counts = counts[first:last]
+            total = np.sum(batch_counts)
+            if total == 0:
+                continue
+            id0 = np.repeat(ids[first:last], batch_counts)
+            id1 = np.repeat(start[first:last] - np.cumsum(batch_counts) + batch_counts, batch_counts) + np.arange(total)
+            dif_v = sorted_verts[id0] - sorted_verts[id1]
+            close = np_dot(dif_v, dif_v) <= radius * radius
+            pairs.append(order[np.stack((id0[close], id1[close]), axis=-1)])
+
+    if not pairs:
+        return np.zeros((0, 2), dtype=np.int64)
+    return np.concatenate(pairs)
+
+
+def scatter_add(target, indexes, values):
+    '''target[indexes] += values accumulating repeated indexes, faster than np.add.at'''
+    v_len = len(target)
+    for axis in range(target.shape[1]):
+        target[:, axis] += np.bincount(indexes, weights=values[:, axis], minlength=v_len)
+
+
 def numpy_match_long_repeat(p):
     '''match list length by repeating last one'''
     q = []
@@ -624,15 +704,14 @@ class SvRandomForce():
 
 
 class SvCollisionForce():
-    def __init__(self, magnitude, use_kdtree=False):
+    def __init__(self, magnitude, use_grid=False):
 
         self.magnitude = np.array(magnitude)
         self.uniform_magnitude = len(magnitude) < 2
-        self.needs = ['dif_v', 'dist', 'dist_cor', 'collide', 'normal_v']
-        self.use_kdtree = use_kdtree
-        if self.use_kdtree:
-            self.needs = ['kd_tree', 'max_radius', 'kd_collisions']
-            self.add = self.add_kdt
+        self.use_grid = use_grid
+        if self.use_grid:
+            self.needs = ['max_radius', 'neighbours', 'near_collide']
+            self.add = self.add_grid
         else:
             self.needs = ['indexes', 'sum_rad', 'dif_v', 'dist', 'dist_cor', 'collide', 'normal_v']
             self.add = self.add_brute_force
@@ -657,49 +736,41 @@ class SvCollisionForce():
         sf = self.f_magnitude[:, np.newaxis]
         len0, len1 = [sf, sf] if self.uniform_magnitude else [sf[id1], sf[id0]]
 
-        np.add.at(ps.force_resultant, id0, -no * le * len0)
-        np.add.at(ps.force_resultant, id1, no * le * len1)
+        scatter_add(ps.force_resultant, id0, -no * le * len0)
+        scatter_add(ps.force_resultant, id1, no * le * len1)
 
-    def add_kdt(self, ps):
+    def add_grid(self, ps):
         relations = ps.relations
-        if len(relations.kd_indexes) > 0:
-
-            id0 = relations.kd_indexes[:, 0]
-            id1 = relations.kd_indexes[:, 1]
-            sum_rad = relations.kd_sum_rad
-            dif_v = relations.kd_dif_v
-            dist = relations.kd_dist
-            mask = relations.kd_mask
-            dist_cor = np.clip(dist[mask], 1e-6, 1e4)
-
-            normal_v = dif_v[mask] / dist_cor[:, np.newaxis]
-
-
-
-            le = (dist[mask] - sum_rad[mask])[:, np.newaxis]
-
-            variable_coll = len(self.f_magnitude) > 1
-            sf = self.f_magnitude[:, np.newaxis]
-            len0, len1 = [sf[id1[mask]], sf[id0[mask]]] if variable_coll else [sf, sf]
+        mask = relations.near_mask
+        id0 = relations.near_indexes[mask, 0]
+        id1 = relations.near_indexes[mask, 1]
+        dist = relations.near_dist[mask]
+        dist_cor = np.clip(dist, 1e-6, 1e4)
+        normal_v = relations.near_dif_v[mask] / dist_cor[:, np.newaxis]
+        le = (dist - relations.near_sum_rad[mask])[:, np.newaxis]
 
+        sf = self.f_magnitude[:, np.newaxis]
+        len0, len1 = [sf, sf] if self.uniform_magnitude else [sf[id1], sf[id0]]
 
-            np.add.at(ps.force_resultant, id0[mask], -normal_v * le * len0)
-            np.add.at(ps.force_resultant, id1[mask], normal_v * le * len1)
+        scatter_add(ps.force_resultant, id0, -normal_v * le * len0)
+        scatter_add(ps.force_resultant, id1, normal_v * le * len1)
 
 
 class SvAttractionForce():
-    def __init__(self, magnitude, decay, max_distance, stop_on_collide=False, use_kdtree=False):
+    def __init__(self, magnitude, decay, max_distance, stop_on_collide=False, use_grid=False):
 
         self.magnitude = np.array(magnitude)
         self.uniform_magnitude = len(magnitude) < 2
 
         self.decay = np.array(decay[0])
-        self.use_kdtree = use_kdtree
+        self.use_grid = use_grid
         self.max_distance = max_distance[0]
         self.stop_on_collide = stop_on_collide
-        if self.use_kdtree:
-            self.needs = ['kd_tree']
-            self.add = self.add_kdt
+        if self.use_grid:
+            self.needs = ['neighbours']
+            if self.stop_on_collide:
+                self.needs.append('near_collide')
+            self.add = self.add_grid
         else:
             self.needs = ['indexes', 'sum_rad', 'mass_product', 'dif_v', 'dist', 'dist_cor', 'normal_v']
             if self.stop_on_collide:
@@ -710,6 +781,8 @@ class SvAttractionForce():
         ps.aware = True
         for need in self.needs:
             ps.relations.needed[need] = True
+        if self.use_grid:
+            ps.relations.search_distances.append(self.max_distance)
         if self.uniform_magnitude:
             self.f_magnitude = self.magnitude
         else:
@@ -732,44 +805,31 @@ class SvAttractionForce():
         att = self.f_magnitude
         len0, len1 = [att, att] if self.uniform_magnitude else [att[id1], att[id0]]
 
-        np.add.at(ps.force_resultant, id0, -direction * len0)
-        np.add.at(ps.force_resultant, id1, direction * len1)
+        scatter_add(ps.force_resultant, id0, -direction * len0)
+        scatter_add(ps.force_resultant, id1, direction * len1)
 
-    def add_kdt(self, ps):
+    def add_grid(self, ps):
         relations = ps.relations
-        indexes = relations.kd_tree.query_pairs(r=self.max_distance, output_type='ndarray')
-        if len(indexes) > 0:
-
-            id0 = indexes[:, 0]
-            id1 = indexes[:, 1]
-            dif_v = ps.verts[id0, :] - ps.verts[id1, :]
-
-            dist = np.linalg.norm(dif_v, axis=1)
-            if self.stop_on_collide:
-                collide_mask = dist > ps.mass[id0] * ps.mass[id1]
-                dist_cor = np.clip(dist[collide_mask], 1e-6, 1e4)
-                dist2 = np.power(dist[collide_mask], self.decay)[:, np.newaxis]
-                normal_v = dif_v[collide_mask] / dist_cor[:, np.newaxis]
-                id0 = indexes[collide_mask, 0]
-                id1 = indexes[collide_mask, 1]
-                mass_product = (ps.mass[id0] * ps.mass[id1])
-            else:
-
-                mass_product = ps.mass[id0] * ps.mass[id1]
-                dist_cor = np.clip(dist, 1e-6, 1e4)
-                dist2 = np.power(dist, self.decay)[:, np.newaxis]
-                normal_v = dif_v / dist_cor[:, np.newaxis]
-
-            direction = normal_v / dist2 * mass_product[:, np.newaxis]
+        mask = relations.near_dist < self.max_distance
+        if self.stop_on_collide:
+            mask[relations.near_mask] = False
+        id0 = relations.near_indexes[mask, 0]
+        id1 = relations.near_indexes[mask, 1]
+        dist = relations.near_dist[mask]
+        dist_cor = np.clip(dist, 1e-6, 1e4)
+        dist2 = np.power(dist, self.decay)[:, np.newaxis]
+        normal_v = relations.near_dif_v[mask] / dist_cor[:, np.newaxis]
+        mass_product = ps.mass[id0] * ps.mass[id1]
+        direction = normal_v / dist2 * mass_product[:, np.newaxis]
 
-            att = self.f_magnitude
-            len0, len1 = [att, att] if self.uniform_magnitude else [att[id1], att[id0]]
-            np.add.at(ps.force_resultant, id0, -direction * len0)
-            np.add.at(ps.force_resultant, id1, direction * len1)
+        att = self.f_magnitude
+        len0, len1 = [att, att] if self.uniform_magnitude else [att[id1], att[id0]]
+        scatter_add(ps.force_resultant, id0, -direction * len0)
+        scatter_add(ps.force_resultant, id1, direction * len1)
 
 
 class SvAlignForce():
-    def __init__(self, strength, decay, max_distance, use_kdtree=False):
+    def __init__(self, strength, decay, max_distance, use_grid=False):
 
         self.strength = np.array(strength)
         self.uniform_strength = len(strength) < 2
@@ -778,10 +838,10 @@ class SvAlignForce():
 
         self.f_strength = self.strength
         self.max_distance = np.array(max_distance[0])
-        self.use_kdtree = use_kdtree
-        if self.use_kdtree:
-            self.needs = ['kd_tree']
-            self.add = self.add_kdt
+        self.use_grid = use_grid
+        if self.use_grid:
+            self.needs = ['neighbours']
+            self.add = self.add_grid
         else:
             self.needs = ['indexes', 'dif_v', 'dist', 'dist_cor']
             self.add = self.add_brute_force
@@ -792,59 +852,45 @@ class SvAlignForce():
         ps.aware = True
         for need in self.needs:
             ps.relations.needed[need] = True
+        if self.use_grid:
+            ps.relations.search_distances.append(self.max_distance)
         if self.uniform_strength:
             self.f_strength = self.strength
         else:
             self.f_strength = numpy_fit_long_repeat([self.strength], ps.v_len)[0]
 
-
-
-    def add_brute_force(self, ps):
-        relations = ps.relations
-        mask = relations.dist_cor < self.max_distance
-        id0 = relations.indexes[mask, 0]
-        id1 = relations.indexes[mask, 1]
-        dist2 = np.power(relations.dist_cor[mask], self.decay)
-
+    def add_aligned(self, ps, id0, id1, dist_cor):
+        dist2 = np.power(dist_cor, self.decay)
 
         if self.uniform_strength:
             constant = (self.f_strength / (dist2 * ps.v_len))[:, np.newaxis]
-            np.add.at(ps.force_resultant, id0, ps.vel[id1, :] * constant)
-            np.add.at(ps.force_resultant, id1, ps.vel[id0, :] * constant)
+            scatter_add(ps.force_resultant, id0, ps.vel[id1, :] * constant)
+            scatter_add(ps.force_resultant, id1, ps.vel[id0, :] * constant)
 
         else:
             constant0 = (self.f_strength[id0] / (dist2 * ps.v_len))[:, np.newaxis]
             constant1 = (self.f_strength[id1] / (dist2 * ps.v_len))[:, np.newaxis]
-            np.add.at(ps.force_resultant, id0, ps.vel[id1, :] * constant0)
-            np.add.at(ps.force_resultant, id1, ps.vel[id0, :] * constant1)
-
-    def add_kdt(self, ps):
+            scatter_add(ps.force_resultant, id0, ps.vel[id1, :] * constant0)
+            scatter_add(ps.force_resultant, id1, ps.vel[id0, :] * constant1)
 
+    def add_brute_force(self, ps):
         relations = ps.relations
-        indexes = relations.kd_tree.query_pairs(r=self.max_distance, output_type='ndarray')
-        if len(indexes) > 0:
-            dif_v = ps.verts[indexes[:, 0], :] - ps.verts[indexes[:, 1], :]
-            dist = np.linalg.norm(dif_v, axis=1)
-            dist_cor = np.clip(dist, 1e-6, 1e4)
-            id0 = indexes[:, 0]
-            id1 = indexes[:, 1]
-            dist2 = np.power(dist_cor, self.decay)
-
-
-            if self.uniform_strength:
-                constant = (self.f_strength / (dist2 * ps.v_len))[:, np.newaxis]
-                np.add.at(ps.force_resultant, id0, ps.vel[id1, :] * constant)
-                np.add.at(ps.force_resultant, id1, ps.vel[id0, :] * constant)
+        mask = relations.dist_cor < self.max_distance
+        id0 = relations.indexes[mask, 0]
+        id1 = relations.indexes[mask, 1]
+        self.add_aligned(ps, id0, id1, relations.dist_cor[mask])
 
-            else:
-                constant0 = (self.f_strength[id0] / (dist2 * ps.v_len))[:, np.newaxis]
-                constant1 = (self.f_strength[id1] / (dist2 * ps.v_len))[:, np.newaxis]
-                np.add.at(ps.force_resultant, id0, ps.vel[id1, :] * constant0)
-                np.add.at(ps.force_resultant, id1, ps.vel[id0, :] * constant1)
+    def add_grid(self, ps):
+        relations = ps.relations
+        dist_cor = np.clip(relations.near_dist, 1e-6, 1e4)
+        mask = dist_cor < self.max_distance
+        id0 = relations.near_indexes[mask, 0]
+        id1 = relations.near_indexes[mask, 1]
+        self.add_aligned(ps, id0, id1, dist_cor[mask])
 
 
 class SvFitForce():
-    def __init__(self, magnitude, min_radius, max_radius, mode, use_kdtree=False):
+    def __init__(self, magnitude, min_radius, max_radius, mode, use_grid=False):
 
         self.magnitude = np.array(magnitude)
         self.uniform_magnitude = len(magnitude) < 2
@@ -858,17 +904,17 @@ class SvFitForce():
                 self.magnitude /= 100
 
         self.size_changer = True
-        self.use_kdtree = use_kdtree
-        if self.use_kdtree:
-            self.needs = ['kd_tree', 'max_radius', 'kd_collisions']
-            self.add = self.add_kdt
+        self.use_grid = use_grid
+        if self.use_grid:
+            self.needs = ['max_radius', 'neighbours', 'near_collide']
+            self.add = self.add_grid
         else:
             self.needs = ['indexes', 'sum_rad', 'dif_v', 'dist', 'collide']
             self.add = self.add_brute_force
 
     def setup(self, ps):
         ps.aware = True
-        self.all_range = np.arange(ps.v_len, dtype=np.int16)
+        self.all_range = np.arange(ps.v_len)
 
         for need in self.needs:
             ps.relations.needed[need] = True
@@ -877,9 +923,7 @@ class SvFitForce():
         else:
             self.f_magnitude = numpy_fit_long_repeat([self.magnitude], ps.v_len)[0]
 
-    def add_brute_force(self, ps):
-        rel = ps.relations
-        touch = np.unique(rel.index_inter)
+    def fit(self, ps, touch):
         free = np.setdiff1d(self.all_range, touch)
         u_grow = self.uniform_magnitude
         grow_un, grow_tou = [self.f_magnitude, self.f_magnitude] if u_grow else [self.f_magnitude[free], self.f_magnitude[touch]]
@@ -891,28 +935,12 @@ class SvFitForce():
             ps.rads[touch] -= grow_tou * ps.rads[touch]
         ps.rads = np.clip(ps.rads, self.min_radius, self.max_radius)
 
-    def add_kdt(self, ps):
-        relations = ps.relations
-        if len(relations.kd_indexes) > 0:
-            touch = np.unique(relations.kd_indexes[ps.relations.kd_mask])
-            free = np.setdiff1d(self.all_range, touch)
-            u_grow = self.uniform_magnitude
-            grow_un, grow_tou = [self.f_magnitude, self.f_magnitude] if u_grow else [self.f_magnitude[free], self.f_magnitude[touch]]
-            if self.absolute:
-                ps.rads[free] += grow_un
-                ps.rads[touch] -= grow_tou
-            else:
-                ps.rads[free] += grow_un * ps.rads[free]
-                ps.rads[touch] -= grow_tou * ps.rads[touch]
-            ps.rads = np.clip(ps.rads, self.min_radius, self.max_radius)
-        else:
-            if self.absolute:
-                ps.rads += self.f_magnitude
-
-            else:
-                ps.rads += self.f_magnitude * ps.rads
+    def add_brute_force(self, ps):
+        self.fit(ps, np.unique(ps.relations.index_inter))
 
-            ps.rads = np.clip(ps.rads, self.min_radius, self.max_radius)
+    def add_grid(self, ps):
+        relations = ps.relations
+        self.fit(ps, np.unique(relations.near_indexes[relations.near_mask]))
 
 
 class SvDragForce():
@@ -1142,8 +1170,8 @@ class SvSpringsForce():
         dif_v /= dist[:, np.newaxis]
         force = dif_v * (dif_l * self.spring_k)[:, np.newaxis]
 
-        np.subtract.at(ps.force_resultant, id0, force)
-        np.add.at(ps.force_resultant, id1, force)
+        scatter_add(ps.force_resultant, id0, -force)
+        scatter_add(ps.force_resultant, id1, force)
 
 
 class SvPolygonsAngleForce():
@@ -1195,8 +1223,8 @@ class SvPolygonsAngleForce():
 
         force = average_vector * ((self.rest_angles - act_angles) * self.spring_k)[:, np.newaxis]
 
-        np.add.at(ps.force_resultant, self.valid_edges[:, 0], force)
-        np.add.at(ps.force_resultant, self.valid_edges[:, 1], force)
+        scatter_add(ps.force_resultant, self.valid_edges[:, 0], force)
+        scatter_add(ps.force_resultant, self.valid_edges[:, 1], force)
 
 
 class SvEdgesAngleForce():
@@ -1262,7 +1290,7 @@ class SvEdgesAngleForce():
 
         average_vector = (v1_u + v2_u)/2
         f = average_vector * ((self.rest_ang - act_ang)*self.spring_k)[:, np.newaxis]
-        np.add.at(ps.force_resultant, self.target_v, f)
+        scatter_add(ps.force_resultant, self.target_v, f)
 
 
 class SvTimedForce():
@@ -1369,13 +1397,13 @@ class SvInflateForce():
         if p_regular:
             p_area = calc_area(pol_side_max, pol_v, pols_normal)[:, np.newaxis]
             for i in range(pol_side_max):
-                np.add.at(ps.force_resultant, np_pols[:, i], pols_normal * p_area)
+                scatter_add(ps.force_resultant, np_pols[:, i], pols_normal * p_area)
 
         else:
             p_area = calc_area_var_sides(pol_side_max, pols_sides, pol_v, pols_normal)[:, np.newaxis]
             for i in range(pol_side_max):
                 mask = pols_sides > i
-                np.add.at(ps.force_resultant, np_pols[mask, i], pols_normal[mask] * p_area[mask])
+                scatter_add(ps.force_resultant, np_pols[mask, i], pols_normal[mask] * p_area[mask])
 
 
 def limit_speed(np_vel, max_vel):
@@ -1404,6 +1432,7 @@ class PulgaSystem():
         self.goal_pins = True
         self.relations = lambda: None
         self.relations.needed = {}
+        self.relations.search_distances = []
         for force in self.forces:
             if hasattr(force, 'pin_force'):
                 self.pinned = True
@@ -1436,16 +1465,18 @@ class PulgaSystem():
     def relations_update(self):
         if 'max_radius' in self.relations.needed:
             self.relations.max_radius = np.amax(self.rads)
-        if 'kd_tree' in self.relations.needed:
-            self.relations.kd_tree = scipy.spatial.cKDTree(self.verts)
-        if 'kd_collisions' in self.relations.needed:
-            indexes = self.relations.kd_tree.query_pairs(r=self.relations.max_radius*2, output_type='ndarray')
-            self.relations.kd_indexes = indexes
-            if len(indexes) > 0:
-                self.relations.kd_dif_v = self.verts[indexes[:, 0], :] - self.verts[indexes[:, 1], :]
-                self.relations.kd_sum_rad = self.rads[indexes[:, 0]] + self.rads[indexes[:, 1]]
-                self.relations.kd_dist = np.linalg.norm(self.relations.kd_dif_v, axis=1)
-                self.relations.kd_mask = self.relations.kd_dist < self.relations.kd_sum_rad
+        if 'neighbours' in self.relations.needed:
+            radius = max(self.relations.search_distances, default=0)
+            if 'max_radius' in self.relations.needed:
+                radius = max(radius, self.relations.max_radius * 2)
+            indexes = grid_neighbour_pairs(self.verts, radius)
+            self.relations.near_indexes = indexes
+            self.relations.near_dif_v = self.verts[indexes[:, 0], :] - self.verts[indexes[:, 1], :]
+            self.relations.near_dist = np.linalg.norm(self.relations.near_dif_v, axis=1)
+        if 'near_collide' in self.relations.needed:
+            indexes = self.relations.near_indexes
+            self.relations.near_sum_rad = self.rads[indexes[:, 0]] + self.rads[indexes[:, 1]]
+            self.relations.near_mask = self.relations.near_dist < self.relations.near_sum_rad
         if self.size_change:
             if 'sum_rad' in self.relations.needed:
                 self.relations.sum_rad = self.rads[self.relations.indexes[:, 0]] + self.rads[self.relations.indexes[:, 1]]
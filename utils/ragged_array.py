@@ -0,0 +1,139 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Packed representation of nested lists which are passed through sockets.
+
+Usual socket data is a list of objects, each object is a list of items
+(vertices, edges, faces, numbers). Working with such data means creating and
+walking Python objects for each element. SvRaggedArray keeps items of all
+objects in one array and offsets of objects in another one, so the whole data
+is just a couple of NumPy arrays:
+
+    vertices: [[(0, 0, 0), (1, 0, 0)], [(0, 1, 0)]] ->
+        values = array([[0, 0, 0], [1, 0, 0], [0, 1, 0]]), offsets = array([0, 2, 3])
+
+Items which have different lengths (faces) are packed recursively, values
+of such array is SvRaggedArray itself:
+
+    faces: [[[0, 1, 2], [0, 2, 3, 4]], [[0, 1, 2]]] ->
+        values = SvRaggedArray(array([0, 1, 2, 0, 2, 3, 4, 0, 1, 2]), array([0, 3, 7, 10])),
+        offsets = array([0, 2, 3])
+
+Indices of faces and edges are kept relative to vertices of their objects
+as in the nested form.
+"""
+
+from itertools import chain
+
+import numpy as np
+
+
+class SvRaggedArray:
+    """
+    List of rows of different length packed into one array.
+    :values: items of all rows one after another, np.ndarray or SvRaggedArray
+    :offsets: start of each row in values, it has one more element than there
+        are rows, the last element is length of values
+    """
+    __slots__ = ('values', 'offsets')
+
+    def __init__(self, values, offsets):
+        self.values = values
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+
+    @classmethod
+    def from_list(cls, data, dtype=None, item_shape=()):
+        """
+        Packs nested lists. Rows can be lists or arrays. Items of rows which
+        have different lengths are packed into SvRaggedArray recursively.
+        :dtype: data type of values
+        :item_shape: shape of items, it's used only to give values correct
+            shape when there are no items at all
+        """
+        if isinstance(data, SvRaggedArray):
+            return data
+        lengths = [len(row) for row in data]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        if offsets[-1] == 0:
+            return cls(np.empty((0, ) + tuple(item_shape), dtype=dtype or np.float64), offsets)
+        if all(isinstance(row, np.ndarray) for row in data):
+            values = np.concatenate([row for row in data if len(row)])
+            return cls(values if dtype is None else values.astype(dtype, copy=False), offsets)
+        items = list(chain.from_iterable(data))
+        try:
+            values = np.array(items, dtype=dtype)
+        except ValueError:  # items have different lengths
+            values = cls.from_list(items, dtype)
+        else:
+            if values.dtype == object:
+                values = cls.from_list(items, dtype)
+        return cls(values, offsets)
+
+    def to_list(self):
+        """Returns the data in form of nested lists"""
+        values = self.values.to_list() if isinstance(self.values, SvRaggedArray) else self.values.tolist()
+        offsets = self.offsets.tolist()
+        return [values[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    @property
+    def lengths(self):
+        """Number of items of each row"""
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.offsets.nbytes
+
+    def row_indices(self):
+        """Index of row of each item of values"""
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def copy(self):
+        return SvRaggedArray(self.values.copy(), self.offsets.copy())
+
+    def read_only(self):
+        """Returns the same data which can't be modified"""
+        values = self.values.read_only() if isinstance(self.values, SvRaggedArray) else self.values.view()
+        offsets = self.offsets.view()
+        if isinstance(values, np.ndarray):
+            values.flags.writeable = False
+        offsets.flags.writeable = False
+        return SvRaggedArray(values, offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        """Row for an integer key, SvRaggedArray with the given rows for a slice"""
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                raise IndexError("SvRaggedArray supports only slices with step 1")
+            stop = max(start, stop)
+            offsets = self.offsets[start: stop + 1]
+            return SvRaggedArray(self.values[offsets[0]: offsets[-1]], offsets - offsets[0])
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(f"Row index {key} is out of range of {len(self)} rows")
+        return self.values[self.offsets[key]: self.offsets[key + 1]]
+
+    def __eq__(self, other):
+        if not isinstance(other, SvRaggedArray):
+            return NotImplemented
+        return np.array_equal(self.offsets, other.offsets) and \
+            (self.values == other.values if isinstance(self.values, SvRaggedArray)
+             else np.array_equal(self.values, other.values))
+
+    def __repr__(self):
+        return f"<SvRaggedArray: {len(self)} rows, values: {self.values!r}>"
@@ -16,6 +16,7 @@ from mathutils.bvhtree import BVHTree
 from sverchok.data_structure import repeat_last_for_length
 from sverchok.utils.sv_mesh_utils import polygons_to_edges
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
+from sverchok.utils.bvh_tree import bvh_find_nearest
 from sverchok.utils.geom import center, linear_approximation
 
 NONE = 'NONE'
@@ -63,6 +64,8 @@ def lloyd_relax(vertices, faces, iterations, mask=None, method=NORMAL, skip_boun
             face_centers_by_vert[bm_vert.index, :n] = face_centers[face_idxs]
         face_center_sums = face_centers_by_vert.sum(axis=1)
         face_center_means = face_center_sums / n_link_faces
+        if method == BVH:
+            projections = bvh_find_nearest(bvh, face_center_means)[0]
         for bm_vert in bm.verts:
             co = bm_vert.co
             if (skip_boundary and bm_vert.is_boundary) or (mask is not None and not mask[bm_vert.index]):
@@ -83,8 +86,7 @@ def lloyd_relax(vertices, faces, iterations, mask=None, method=NORMAL, skip_boun
                     dist = plane.distance_to_point(bm_vert.co)
                     new_vert = median + plane.normal.normalized() * dist
                 elif method == BVH:
-                    median = mathutils.Vector(face_center_means[bm_vert.index])
-                    new_vert, _normal, idx, dist = bvh.find_nearest(median)
+                    new_vert = projections[bm_vert.index]
                 else:
                     raise Exception("Unsupported volume preservation method")
                 
@@ -183,10 +185,7 @@ def edges_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
                 new_vert = tuple(bm_vert.co + dv)
                 verts_out.append(new_vert)
         elif method == BVH:
-            verts_out = []
-            for vert in target_verts:
-                new_vert, normal, idx, dist = bvh.find_nearest(vert)
-                verts_out.append(tuple(new_vert))
+            verts_out = bvh_find_nearest(bvh, target_verts)[0].tolist()
         else:
             raise Exception("Unsupported shape preservation method")
         
@@ -262,10 +261,7 @@ def faces_relax(vertices, edges, faces, iterations, k, mask=None, method=NONE, t
                 verts_out.append(new_vert)
 
         elif method == BVH:
-            verts_out = []
-            for bm_vert in bm.verts:
-                new_vert, normal, idx, dist = bvh.find_nearest(bm_vert.co)
-                verts_out.append(tuple(new_vert))
+            verts_out = bvh_find_nearest(bvh, target_verts)[0].tolist()
 
         else:
             raise Exception("Unsupported shape preservation method")
@@ -373,6 +373,22 @@ class SvRevolutionSurface(SvSurface):
             result = result + self.point
         return result
 
+    def has_analytic_derivatives(self):
+        return True
+
+    def derivatives_data_array(self, us, vs):
+        points_on_curve = self.curve.evaluate_array(us)
+        tangents = self.curve.tangent_array(us)
+        rotated = rotate_vector_around_vector_np(points_on_curve - self.point, self.direction, vs)
+        du = rotate_vector_around_vector_np(tangents, self.direction, vs)
+        # derivative of rotation by angle v around unit vector k is k x (rotated vector)
+        direction = np.asarray(self.direction, dtype=np.float64)
+        direction = direction / np.linalg.norm(direction)
+        dv = np.cross(direction, rotated)
+        if not self.global_origin:
+            rotated = rotated + self.point
+        return SurfaceDerivativesData(rotated, du, dv)
+
     def get_u_min(self):
         return self.curve.get_u_bounds()[0]
 
@@ -409,6 +425,15 @@ class SvExtrudeCurveVectorSurface(SvSurface):
         points_on_curve = self.curve.evaluate_array(us)
         return points_on_curve + vs[np.newaxis].T * self.vector
 
+    def has_analytic_derivatives(self):
+        return True
+
+    def derivatives_data_array(self, us, vs):
+        points = self.evaluate_array(us, vs)
+        du = self.curve.tangent_array(us)
+        dv = np.zeros_like(du) + self.vector
+        return SurfaceDerivativesData(points, du, dv)
+
     def get_u_min(self):
         return self.curve.get_u_bounds()[0]
 
@@ -455,6 +480,17 @@ class SvExtrudeCurvePointSurface(SvSurface):
         vs = vs[np.newaxis].T
         return (1.0 - vs) * points_on_curve + vs * self.point
 
+    def has_analytic_derivatives(self):
+        return True
+
+    def derivatives_data_array(self, us, vs):
+        points_on_curve = self.curve.evaluate_array(us)
+        vs = vs[np.newaxis].T
+        points = (1.0 - vs) * points_on_curve + vs * self.point
+        du = (1.0 - vs) * self.curve.tangent_array(us)
+        dv = self.point - points_on_curve
+        return SurfaceDerivativesData(points, du, dv)
+
     def get_u_min(self):
         return self.curve.get_u_bounds()[0]
 
@@ -511,6 +547,15 @@ class SvExtrudeCurveCurveSurface(SvSurface):
             result = u_points + (v_points - v0)
         return result
 
+    def has_analytic_derivatives(self):
+        return True
+
+    def derivatives_data_array(self, us, vs):
+        points = self.evaluate_array(us, vs)
+        du = self.u_curve.tangent_array(us)
+        dv = self.v_curve.tangent_array(vs)
+        return SurfaceDerivativesData(points, du, dv)
+
     def get_u_min(self):
         return self.u_curve.get_u_bounds()[0]
 
@@ -899,6 +944,22 @@ class SvCurveLerpSurface(SvSurface):
         points = (1.0 - vs)*c1_points + vs*c2_points
         return points
 
+    def has_analytic_derivatives(self):
+        return True
+
+    def derivatives_data_array(self, us, vs):
+        us1 = (self.c1_max - self.c1_min) * us + self.c1_min
+        us2 = (self.c2_max - self.c2_min) * us + self.c2_min
+        c1_points = self.curve1.evaluate_array(us1)
+        c2_points = self.curve2.evaluate_array(us2)
+        c1_tangents = self.curve1.tangent_array(us1) * (self.c1_max - self.c1_min)
+        c2_tangents = self.curve2.tangent_array(us2) * (self.c2_max - self.c2_min)
+        vs = vs[np.newaxis].T
+        points = (1.0 - vs)*c1_points + vs*c2_points
+        du = (1.0 - vs)*c1_tangents + vs*c2_tangents
+        dv = c2_points - c1_points
+        return SurfaceDerivativesData(points, du, dv)
+
     def get_u_min(self):
         return self.u_bounds[0]
 
@@ -968,6 +1029,24 @@ class SvSurfaceLerpSurface(SvSurface):
         points = (1.0 - k) * s1_points + k * s2_points
         return points
 
+    def has_analytic_derivatives(self):
+        return self.surface1.has_analytic_derivatives() and self.surface2.has_analytic_derivatives()
+
+    def derivatives_data_array(self, us, vs):
+        if not self.has_analytic_derivatives():
+            return super().derivatives_data_array(us, vs)
+        us1 = (self.s1_u_max - self.s1_u_min) * us + self.s1_u_min
+        us2 = (self.s2_u_max - self.s2_u_min) * us + self.s2_u_min
+        vs1 = (self.s1_v_max - self.s1_v_min) * vs + self.s1_v_min
+        vs2 = (self.s2_v_max - self.s2_v_min) * vs + self.s2_v_min
+        data1 = self.surface1.derivatives_data_array(us1, vs1)
+        data2 = self.surface2.derivatives_data_array(us2, vs2)
+        k = self.coefficient
+        points = (1.0 - k) * data1.points + k * data2.points
+        du = (1.0 - k) * (self.s1_u_max - self.s1_u_min) * data1.du + k * (self.s2_u_max - self.s2_u_min) * data2.du
+        dv = (1.0 - k) * (self.s1_v_max - self.s1_v_min) * data1.dv + k * (self.s2_v_max - self.s2_v_min) * data2.dv
+        return SurfaceDerivativesData(points, du, dv)
+
 class SvTaperSweepSurface(SvSurface):
     __description__ = "Taper & Sweep"
 
@@ -1035,6 +1114,38 @@ class SvTaperSweepSurface(SvSurface):
         profile_points = self.profile.evaluate_array(us)
         return profile_points * scale + taper_projections
 
+    def has_analytic_derivatives(self):
+        return True
+
+    def derivatives_data_array(self, us, vs):
+        direction = np.asarray(self.direction, dtype=np.float64)
+        direction = direction / np.linalg.norm(direction)
+        taper_points = self.taper.evaluate_array(vs)
+        taper_tangents = self.taper.tangent_array(vs)
+        taper_projections = self.line.projection_of_points(taper_points)
+        # projection onto the line moves along the line direction only
+        projection_tangents = (taper_tangents @ direction)[np.newaxis].T * direction
+        radius = taper_points - taper_projections
+        radius_tangents = taper_tangents - projection_tangents
+        scale = np.linalg.norm(radius, axis=1, keepdims=True)
+        scale_tangents = (radius * radius_tangents).sum(axis=1, keepdims=True) / scale
+
+        if self.scale_base == SvTaperSweepSurface.TAPER:
+            scale0 = self._get_profile_scale()
+        elif self.scale_base == SvTaperSweepSurface.PROFILE:
+            taper_start = self.taper.evaluate(self.get_v_min())
+            scale0 = np.linalg.norm(taper_start - np.array(self.line.projection_of_point(taper_start)))
+        else:
+            scale0 = 1.0
+        scale = scale / scale0
+        scale_tangents = scale_tangents / scale0
+
+        profile_points = self.profile.evaluate_array(us)
+        points = profile_points * scale + taper_projections
+        du = self.profile.tangent_array(us) * scale
+        dv = profile_points * scale_tangents + projection_tangents
+        return SurfaceDerivativesData(points, du, dv)
+
 class SvBlendSurface(SvSurface):
     def __init__(self, surface1, surface2, curve1, curve2, bulge1, bulge2):
         self.surface1 = surface1
@@ -41,7 +41,32 @@ class SvSurface(object):
         normal, *_ = self.normal_vertices_array(us, vs)
         return normal
 
+    def has_analytic_derivatives(self):
+        """
+        Should return True if derivatives_data_array method of the surface
+        calculates derivatives analytically (not by finite differences).
+        In this case normals and curvatures are calculated from these
+        derivatives instead of additional evaluations of the surface.
+        """
+        return False
+
+    def _delta_params(self, us, vs):
+        """Parameters shifted by normal_delta, shifted back near the upper bounds."""
+        if hasattr(self, 'normal_delta'):
+            h = self.normal_delta
+        else:
+            h = 0.0001
+        u_bounds = self.get_u_bounds()
+        v_bounds = self.get_v_bounds()
+        us_h = np.where(us + h < u_bounds[1], h, -h)
+        vs_h = np.where(vs + h < v_bounds[1], h, -h)
+        return us_h, vs_h
+
     def normal_vertices_array(self, us, vs):
+        if self.has_analytic_derivatives():
+            data = self.derivatives_data_array(us, vs)
+            return data.unit_normals(), data.points
+
         if hasattr(self, 'normal_delta'):
             h = self.normal_delta
         else:
@@ -79,6 +104,9 @@ class SvSurface(object):
         return SurfaceDerivativesData(surf_vertices, du, dv)
 
     def curvature_calculator(self, us, vs, order=True):
+        if self.has_analytic_derivatives():
+            return self._curvature_calculator_by_derivatives(us, vs, order)
+
         if hasattr(self, 'normal_delta'):
             h = self.normal_delta
         else:
@@ -115,6 +143,33 @@ class SvSurface(object):
         calc.set(surf_vertices, normal, fu, fv, duu, dvv, duv, nuu, nvv, nuv)
         return calc
 
+    def _curvature_calculator_by_derivatives(self, us, vs, order=True):
+        # second derivatives are finite differences of analytic first derivatives
+        data = self.derivatives_data_array(us, vs)
+        us_h, vs_h = self._delta_params(us, vs)
+        data_u = self.derivatives_data_array(us + us_h, vs)
+        data_v = self.derivatives_data_array(us, vs + vs_h)
+        us_h = us_h[np.newaxis].T
+        vs_h = vs_h[np.newaxis].T
+
+        fu, fv = data.du, data.dv
+        normal = data.unit_normals()
+        fuu = (data_u.du - fu) / us_h
+        fvv = (data_v.dv - fv) / vs_h
+        fuv = (data_v.du - fu) / vs_h
+
+        nuu = (fuu * normal).sum(axis=1)
+        nvv = (fvv * normal).sum(axis=1)
+        nuv = (fuv * normal).sum(axis=1)
+
+        duu = np.linalg.norm(fu, axis=1) **2
+        dvv = np.linalg.norm(fv, axis=1) **2
+        duv = (fu * fv).sum(axis=1)
+
+        calc = SurfaceCurvatureCalculator(us, vs, order=order)
+        calc.set(data.points, normal, fu, fv, duu, dvv, duv, nuu, nvv, nuv)
+        return calc
+
     def gauss_curvature_array(self, us, vs):
         calc = self.curvature_calculator(us, vs)
         return calc.gauss()
@@ -198,6 +253,12 @@ class SvSurfaceSubdomain(SvSurface):
     def normal_array(self, us, vs):
         return self.surface.normal_array(us, vs)
 
+    def has_analytic_derivatives(self):
+        return self.surface.has_analytic_derivatives()
+
+    def derivatives_data_array(self, us, vs):
+        return self.surface.derivatives_data_array(us, vs)
+
     def get_u_min(self):
         return self.u_bounds[0]
 
@@ -259,6 +320,16 @@ class SvFlipSurface(SvSurface):
         us, vs = self.flip(us, vs)
         return self.surface.normal_array(us, vs)
 
+    def has_analytic_derivatives(self):
+        return self.surface.has_analytic_derivatives()
+
+    def derivatives_data_array(self, us, vs):
+        us, vs = self.flip(us, vs)
+        data = self.surface.derivatives_data_array(us, vs)
+        du = -data.du if self.flip_u else data.du
+        dv = -data.dv if self.flip_v else data.dv
+        return SurfaceDerivativesData(data.points, du, dv)
+
 class SvSwapSurface(SvSurface):
     def __init__(self, surface):
         self.surface = surface
@@ -298,6 +369,13 @@ class SvSwapSurface(SvSurface):
     def normal_array(self, us, vs):
         return self.surface.normal_array(vs, us)
 
+    def has_analytic_derivatives(self):
+        return self.surface.has_analytic_derivatives()
+
+    def derivatives_data_array(self, us, vs):
+        data = self.surface.derivatives_data_array(vs, us)
+        return SurfaceDerivativesData(data.points, data.dv, data.du)
+
 class SvReparametrizedSurface(SvSurface):
     def __init__(self, surface, new_u_min, new_u_max, new_v_min, new_v_max):
         self.surface = surface
@@ -367,6 +445,9 @@ class SvReparametrizedSurface(SvSurface):
         us, vs = self.map_uv(us, vs)
         return self.surface.normal_array(us, vs)
 
+    def has_analytic_derivatives(self):
+        return self.surface.has_analytic_derivatives()
+
     def derivatives_data_array(self, us, vs):
         us, vs = self.map_uv(us, vs)
         data = self.surface.derivatives_data_array(us, vs)
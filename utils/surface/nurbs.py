@@ -770,6 +770,9 @@ class SvGeomdlSurface(SvNurbsSurface):
         calc.set(surf_vertices, normal, fu, fv, duu, dvv, duv, nuu, nvv, nuv)
         return calc
 
+    def has_analytic_derivatives(self):
+        return True
+
     def derivatives_data_array(self, us, vs):
         surf_vertices = self.evaluate_array(us, vs)
         derivatives = self.derivatives_list(us, vs)
@@ -1018,18 +1021,17 @@ class SvNativeNurbsSurface(SvNurbsSurface):
     def fraction(self, deriv_order_u, deriv_order_v, us, vs):
         pu = self.degree_u
         pv = self.degree_v
-        ku, kv, _ = self.control_points.shape
-        nsu = np.array([self.basis_u.derivative(i, pu, deriv_order_u)(us) for i in range(ku)]) # (ku, n)
-        nsv = np.array([self.basis_v.derivative(i, pv, deriv_order_v)(vs) for i in range(kv)]) # (kv, n)
-        nsu = np.transpose(nsu[np.newaxis], axes=(1,0,2)) # (ku, 1, n)
-        nsv = nsv[np.newaxis] # (1, kv, n)
-        ns = nsu * nsv # (ku, kv, n)
-        weights = np.transpose(self.weights[np.newaxis], axes=(1,2,0)) # (ku, kv, 1)
-        coeffs = ns * weights # (ku, kv, n)
-        coeffs = np.transpose(coeffs[np.newaxis], axes=(3,1,2,0)) # (n,ku,kv,1)
-        controls = self.control_points # (ku,kv,3)
-
-        numerator = coeffs * controls # (n,ku,kv,3)
+        # only (pu+1) x (pv+1) control points affect each point of the surface
+        idx_u, nsu = self.basis_u.span_basis(pu, us, deriv_order_u) # (n, pu+1)
+        idx_v, nsv = self.basis_v.span_basis(pv, vs, deriv_order_v) # (n, pv+1)
+        idx_u = idx_u[:,:,np.newaxis] # (n, pu+1, 1)
+        idx_v = idx_v[:,np.newaxis,:] # (n, 1, pv+1)
+        ns = nsu[deriv_order_u][:,:,np.newaxis] * nsv[deriv_order_v][:,np.newaxis,:] # (n, pu+1, pv+1)
+        coeffs = ns * self.weights[idx_u, idx_v] # (n, pu+1, pv+1)
+        coeffs = coeffs[:,:,:,np.newaxis] # (n, pu+1, pv+1, 1)
+        controls = self.control_points[idx_u, idx_v] # (n, pu+1, pv+1, 3)
+
+        numerator = coeffs * controls # (n, pu+1, pv+1, 3)
         numerator = numerator.sum(axis=1).sum(axis=1) # (n,3)
         denominator = coeffs.sum(axis=1).sum(axis=1)
 
@@ -1089,6 +1091,9 @@ class SvNativeNurbsSurface(SvNurbsSurface):
             else:
                 return curve
 
+    def has_analytic_derivatives(self):
+        return True
+
     def derivatives_data_array(self, us, vs):
         numerator, denominator = self.fraction(0, 0, us, vs)
         surface = nurbs_divide(numerator, denominator)
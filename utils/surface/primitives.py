@@ -7,6 +7,7 @@
 
 import numpy as np
 from sverchok.utils.surface.core import SvSurface
+from sverchok.utils.surface.data import SurfaceDerivativesData
 from sverchok.utils.nurbs_common import SvNurbsMaths
 from sverchok.utils.curve import knotvector as sv_knotvector
 
@@ -55,6 +56,15 @@ class SvPlane(SvSurface):
     def gauss_curvature_array(self, us, vs):
         return np.zeros_like(us, dtype=np.float64)
 
+    def has_analytic_derivatives(self):
+        return True
+
+    def derivatives_data_array(self, us, vs):
+        points = self.evaluate_array(us, vs)
+        du = np.zeros_like(points) + self.vector1
+        dv = np.zeros_like(points) + self.vector2
+        return SurfaceDerivativesData(points, du, dv)
+
     def normal(self, u, v):
         return self._normal
 
@@ -5,22 +5,15 @@
 # SPDX-License-Identifier: GPL3
 # License-Filename: LICENSE
 
-from mathutils import kdtree
 import numpy as np
-from sverchok.dependencies import scipy
 
 from sverchok.data_structure import match_long_repeat as mlr
+from sverchok.utils.kdtree import SvKdTree, SCIPY_ALL_THREADS
 
 # documentation/blender_python_api_2_70_release/mathutils.kdtree.html
 def create_kdt(verts):
-    '''Basic kdt setup'''
-    size = len(verts)
-    kd = kdtree.KDTree(size)
-    for i, xyz in enumerate(verts):
-        kd.insert(xyz, i)
-    kd.balance()
-
-    return kd
+    '''Basic kdt setup, the tree is reused while the same verts are passed'''
+    return SvKdTree.cached(SvKdTree.BLENDER, verts).kdtree
 
 
 def kdt_closest_verts_range(verts, v_find, dists, out):
@@ -109,17 +102,15 @@ def kdt_closest_edges(verts, socket_inputs):
 
 
 def scipy_kdt_closest_edges_fast(vs, min_dist, max_dist):
-    new_tree = scipy.spatial.cKDTree
-    kd_tree = new_tree(np.array(vs))
+    kd_tree = SvKdTree.cached(SvKdTree.SCIPY, vs).kdtree
     indexes_max = kd_tree.query_pairs(r=max_dist)
     indexes_min = kd_tree.query_pairs(r=min_dist)
     return list(indexes_max ^ indexes_min)
 
 def scipy_kdt_closest_max_queried(vs, min_dist, max_dist, maxNum, skip):
-    new_tree = scipy.spatial.cKDTree
-    kd_tree = new_tree(np.array(vs))
+    tree = SvKdTree.cached(SvKdTree.SCIPY, vs)
     skip_f = max(skip-1,0)
-    dist, idx = kd_tree.query(np.array(vs), distance_upper_bound=max_dist, k=maxNum+1+skip_f )
+    dist, idx = tree.kdtree.query(tree.points, distance_upper_bound=max_dist, k=maxNum+1+skip_f, **SCIPY_ALL_THREADS)
     all_edges = np.zeros([maxNum * len(vs), 2], dtype=np.int32)
     start = 0
     for i in range(1+skip_f, maxNum+1+skip_f):
@@ -135,9 +126,8 @@ def scipy_kdt_closest_max_queried(vs, min_dist, max_dist, maxNum, skip):
     return []
 
 def scipy_kdt_closest_edges_no_skip(vs, min_dist, max_dist, maxNum, skip):
-    new_tree = scipy.spatial.cKDTree
-    np_vs = np.array(vs)
-    kd_tree = new_tree(np_vs)
+    tree = SvKdTree.cached(SvKdTree.SCIPY, vs)
+    kd_tree, np_vs = tree.kdtree, tree.points
     # set minimum values
     maxNum = max(maxNum, 1)
     skip = max(skip, 0)
@@ -18,12 +18,14 @@
 
 from contextlib import contextmanager
 import math
+import threading
 from operator import setitem, getitem
-from itertools import count
+from itertools import count, chain
 from typing import ContextManager
 
 import numpy as np
 
+import bpy
 import bmesh
 from bmesh.types import BMVert, BMEdge, BMFace
 import mathutils
@@ -81,6 +83,10 @@ def bmesh_from_edit_mesh(mesh) -> ContextManager[bmesh.types.BMesh]:
     finally:
         bmesh.update_edit_mesh(mesh)
 
+# meshes with more vertices and faces are converted via temporary Blender mesh
+BULK_MESH_SIZE = 1000
+
+
 def bmesh_from_pydata(
         verts=None, edges=[], faces=[],
         markup_face_data=False, markup_edge_data=False, markup_vert_data=False,
@@ -92,10 +98,22 @@ def bmesh_from_pydata(
     normal_update      : optional - will update verts/edges/faces normals at the end
     index_edges (bool) : optional - will make it possible for users of the bmesh to manually 
                          iterate over any edges or do index lookups
+
+    Big meshes are created from temporary Blender mesh filled with foreach_set,
+    the result is the same as if elements are added one by one
     """
 
     bm = bmesh.new()
     bm_verts = bm.verts
+
+    if not markup_edge_data and len(verts) + len(faces) >= BULK_MESH_SIZE \
+            and _bmesh_from_pydata_bulk(bm, verts, edges, faces):
+        bm_verts.index_update()
+        bm_verts.ensure_lookup_table()
+        bm.faces.index_update()
+        bm.edges.index_update()
+        return _markup_bmesh(bm, markup_face_data, markup_vert_data, normal_update)
+
     add_vert = bm_verts.new
 
     py_verts = verts.tolist() if type(verts) == np.ndarray else verts
@@ -132,10 +150,14 @@ def bmesh_from_pydata(
     if has_element(edges) or index_edges:
         bm.edges.index_update()
 
+    return _markup_bmesh(bm, markup_face_data, markup_vert_data, normal_update)
+
+
+def _markup_bmesh(bm, markup_face_data, markup_vert_data, normal_update):
     if markup_vert_data:
-        bm_verts.ensure_lookup_table()
-        layer = bm_verts.layers.int.new("initial_index")
-        for idx, vert in enumerate(bm_verts):
+        bm.verts.ensure_lookup_table()
+        layer = bm.verts.layers.int.new("initial_index")
+        for idx, vert in enumerate(bm.verts):
             vert[layer] = idx
 
     if markup_face_data:
@@ -149,6 +171,108 @@ def bmesh_from_pydata(
     return bm
 
 
+def _flat_faces(faces):
+    """Returns vertex indices of all faces in one array and sizes of the faces"""
+    if not has_element(faces):
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    if isinstance(faces, np.ndarray) and faces.ndim == 2:
+        return faces.ravel().astype(np.int64), np.full(len(faces), faces.shape[1], dtype=np.int64)
+    sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    indices = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=sizes.sum())
+    return indices, sizes
+
+
+def _has_duplicate_faces(face_indices, face_sizes, face_starts) -> bool:
+    """Checks whether there are faces with the same vertices in the same
+    cyclic order in either direction, bm.faces.new does not allow them"""
+    for size in np.unique(face_sizes):
+        starts = face_starts[face_sizes == size]
+        if len(starts) < 2:
+            continue
+        cycles = face_indices[starts[:, np.newaxis] + np.arange(size)]
+        # rotate faces to start from their smallest vertex, then choose direction
+        shift = np.argmin(cycles, axis=1)
+        cycles = cycles[np.arange(len(cycles))[:, np.newaxis], (shift[:, np.newaxis] + np.arange(size)) % size]
+        reverse = cycles[:, 1] > cycles[:, -1]
+        cycles[reverse, 1:] = cycles[reverse, :0:-1]
+        if len(np.unique(cycles, axis=0)) != len(cycles):
+            return True
+    return False
+
+
+def _bmesh_from_pydata_bulk(bm, verts, edges, faces) -> bool:
+    """
+    Fills empty bmesh from temporary Blender mesh. Edges are ordered as
+    bm.faces.new and bm.edges.new would create them. Returns False if it's
+    impossible: in not main thread or in restricted context (data blocks
+    can't be created there) or if given data is invalid (wrong indices,
+    repeated vertices, duplicated faces), then elements should be added one
+    by one which raises proper errors.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return False
+    np_verts = np.asarray(verts, dtype=np.float32)
+    if np_verts.ndim != 2 or np_verts.shape[1] != 3:
+        return False
+    n_verts = len(np_verts)
+    face_indices, face_sizes = _flat_faces(faces)
+    np_edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2) if has_element(edges) \
+        else np.zeros((0, 2), dtype=np.int64)
+
+    if (face_sizes < 3).any() or (np_edges[:, 0] == np_edges[:, 1]).any():
+        return False
+    indices = np.concatenate([face_indices, np_edges.ravel()])
+    if len(indices) and (indices.min() < 0 or indices.max() >= n_verts):
+        return False
+    face_ends = np.cumsum(face_sizes)
+    face_starts = face_ends - face_sizes
+    item_faces = np.repeat(np.arange(len(face_sizes)), face_sizes)
+    if len(np.unique(item_faces * n_verts + face_indices)) != len(face_indices):
+        return False  # a face has repeated vertices
+    if _has_duplicate_faces(face_indices, face_sizes, face_starts):
+        return False
+
+    # edges of faces in order of appearance in the faces, then other given edges;
+    # bm.faces.new creates edges from the previous vertex of each loop, so
+    # the closing edge of a face comes first
+    next_items = np.arange(1, len(face_indices) + 1)
+    next_items[face_ends - 1] = face_starts
+    previous_items = np.arange(-1, len(face_indices) - 1)
+    previous_items[face_starts] = face_ends - 1
+    all_edges = np.concatenate([np.stack((face_indices[previous_items], face_indices), axis=1), np_edges])
+    sorted_edges = np.sort(all_edges, axis=1)
+    _, first, inverse = np.unique(sorted_edges[:, 0] * n_verts + sorted_edges[:, 1],
+                                  return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    edge_index = np.empty(len(order), dtype=np.int32)
+    edge_index[order] = np.arange(len(order))
+    mesh_edges = all_edges[first[order]]
+    # edge of a loop goes from its vertex to the next one
+    loop_edges = edge_index[inverse.ravel()[:len(face_indices)]][next_items]
+
+    try:
+        me = bpy.data.meshes.new('sv_bmesh_from_pydata')
+    except (AttributeError, RuntimeError):  # bpy.data is restricted in some contexts
+        return False
+    try:
+        me.vertices.add(n_verts)
+        me.vertices.foreach_set('co', np_verts.ravel())
+        me.edges.add(len(mesh_edges))
+        me.edges.foreach_set('vertices', mesh_edges.astype(np.int32).ravel())
+        me.loops.add(len(face_indices))
+        me.loops.foreach_set('vertex_index', face_indices.astype(np.int32))
+        me.loops.foreach_set('edge_index', loop_edges)
+        me.polygons.add(len(face_sizes))
+        me.polygons.foreach_set('loop_start', face_starts.astype(np.int32))
+        if bpy.app.version < (4, 0, 0):  # it's read only since 4.0
+            me.polygons.foreach_set('loop_total', face_sizes.astype(np.int32))
+        me.update()
+        bm.from_mesh(me)
+    finally:
+        bpy.data.meshes.remove(me)
+    return True
+
+
 def add_mesh_to_bmesh(bm, verts, edges=None, faces=None, sv_index_name=None, update_indexes=True, update_normals=True):
     new_vert = bm.verts.new
     new_edge = bm.edges.new
@@ -195,28 +319,73 @@ def add_mesh_to_bmesh(bm, verts, edges=None, faces=None, sv_index_name=None, upd
 
 
 def numpy_data_from_bmesh(bm, out_np, face_data=None):
-    if out_np[0]:
-        verts = np.array([v.co for v in bm.verts])
-    else:
-        verts = [v.co[:] for v in bm.verts]
-    if out_np[1]:
-        edges = np.array([[e.verts[0].index, e.verts[1].index] for e in bm.edges])
-    else:
-        edges = [[e.verts[0].index, e.verts[1].index] for e in bm.edges]
-    if out_np[2]:
-        faces = np.array([[i.index for i in p.verts] for p in bm.faces])
+    """
+    Returns vertices, edges, faces and face data of bmesh, out_np flags
+    define which of them should be NumPy arrays. Faces of different sizes are
+    returned as list of arrays. Data of big meshes is read with foreach_get
+    from temporary Blender mesh.
+    """
+    if len(bm.verts) + len(bm.faces) >= BULK_MESH_SIZE \
+            and threading.current_thread() is threading.main_thread():
+        verts, edges, face_indices, face_starts = _numpy_data_from_bmesh_bulk(bm)
+        if not out_np[0]:
+            verts = verts.tolist()
+        if not out_np[1]:
+            edges = edges.tolist()
+        face_sizes = np.diff(np.append(face_starts, len(face_indices)))
+        if out_np[2] and len(face_sizes) == 0:
+            faces = np.array([], dtype=np.int32)
+        elif out_np[2] and (face_sizes == face_sizes[0]).all():
+            faces = face_indices.reshape(len(face_sizes), -1)
+        elif out_np[2]:
+            faces = np.split(face_indices, face_starts[1:])
+        else:
+            face_indices = face_indices.tolist()
+            face_starts = face_starts.tolist() + [len(face_indices)]
+            faces = [face_indices[s:e] for s, e in zip(face_starts[:-1], face_starts[1:])]
     else:
-        faces = [[i.index for i in p.verts] for p in bm.faces]
+        if out_np[0]:
+            verts = np.array([v.co for v in bm.verts])
+        else:
+            verts = [v.co[:] for v in bm.verts]
+        if out_np[1]:
+            edges = np.array([[e.verts[0].index, e.verts[1].index] for e in bm.edges])
+        else:
+            edges = [[e.verts[0].index, e.verts[1].index] for e in bm.edges]
+        if out_np[2]:
+            faces = np.array([[i.index for i in p.verts] for p in bm.faces])
+        else:
+            faces = [[i.index for i in p.verts] for p in bm.faces]
 
     if face_data:
         if out_np[3]:
             face_data_out = np.array(face_data_from_bmesh_faces(bm, face_data))
         else:
             face_data_out = face_data_from_bmesh_faces(bm, face_data)
-            return verts, edges, faces, face_data_out
+        return verts, edges, faces, face_data_out
     else:
         return verts, edges, faces, []
 
+
+def _numpy_data_from_bmesh_bulk(bm):
+    """Returns vertices, edges, vertex indices of all faces and starts of the
+    faces in the indices"""
+    me = bpy.data.meshes.new('sv_numpy_data_from_bmesh')
+    try:
+        bm.to_mesh(me)
+        verts = np.empty(len(me.vertices) * 3, dtype=np.float64)
+        me.vertices.foreach_get('co', verts)
+        edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+        me.edges.foreach_get('vertices', edges)
+        face_indices = np.empty(len(me.loops), dtype=np.int32)
+        me.loops.foreach_get('vertex_index', face_indices)
+        face_starts = np.empty(len(me.polygons), dtype=np.int32)
+        me.polygons.foreach_get('loop_start', face_starts)
+    finally:
+        bpy.data.meshes.remove(me)
+    return verts.reshape(-1, 3), edges.reshape(-1, 2), face_indices, face_starts
+
+
 def pydata_from_bmesh(bm, face_data=None, ret_verts=True, ret_edges=True, ret_faces=True):
 
     verts = [v.co[:] for v in bm.verts] if ret_verts==True and face_data is None else None
@@ -0,0 +1,180 @@
+# This file is part of project Sverchok. It's copyrighted by the contributors
+# recorded in the version control history of the file, available from
+# its original location https://github.com/nortikin/sverchok/commit/master
+#
+# SPDX-License-Identifier: GPL3
+# License-Filename: LICENSE
+
+"""
+Tracing of node tree updates. Unlike the profile module which collects
+statistics of Python functions it records spans of time of the update system:
+execution of nodes, preparation of their input data, implicit conversions of
+socket data and copying of socket data. Spans are grouped by update runs and
+last runs are kept in a ring buffer. They can be saved in Chrome trace format
+(can be opened by chrome://tracing or https://ui.perfetto.dev) or in speedscope
+format (https://www.speedscope.app).
+
+Recording is done only when the tracer is enabled, code which records spans
+should check the `tracer.enabled` attribute first to avoid any overhead:
+
+    if tracer.enabled:
+        start = perf_counter()
+        ...
+        tracer.add('my span', 'category', start, my_arg=1)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import deque
+from time import perf_counter
+from typing import NamedTuple, Optional, Literal
+
+
+class Span(NamedTuple):
+    name: str
+    category: str  # node, process, prepare, conversion, copy
+    start: float  # seconds
+    end: float
+    thread: int
+    args: dict
+
+
+class UpdateTrace:
+    """Spans recorded during one update of a tree"""
+    def __init__(self, tree_name: str):
+        self.tree_name = tree_name
+        self.start = perf_counter()
+        self.end: Optional[float] = None
+        self.spans: list[Span] = []
+
+    @property
+    def name(self):
+        return f'{self.tree_name} update ({(self.end or self.start) - self.start:.3f}s)'
+
+
+class Tracer:
+    """Keeps spans of last updates. Spans can be added from any thread"""
+    def __init__(self, size: int = 10):
+        """:enabled: spans are recorded only when it's True
+        :traces: ring buffer of last updates"""
+        self.enabled = False
+        self.traces: deque[UpdateTrace] = deque(maxlen=size)
+        self._current: Optional[UpdateTrace] = None
+        self._depth = 0
+
+    def set_size(self, size: int):
+        """Sets number of updates to keep"""
+        self.traces = deque(self.traces, maxlen=max(1, size))
+
+    def begin(self, tree_name: str):
+        """Should be called before an update. Nested calls are considered as
+        part of the outer update"""
+        self._depth += 1
+        if self._depth == 1:
+            self._current = UpdateTrace(tree_name)
+            self.traces.append(self._current)
+
+    def finish(self):
+        """Should be called after the update even if it was canceled"""
+        self._depth = max(0, self._depth - 1)
+        if self._depth == 0 and self._current is not None:
+            self._current.end = perf_counter()
+            self._current = None
+
+    def add(self, name: str, category: str, start: float, end: float = None,
+            thread: int = None, **args):
+        """Adds a span to the current update, if there is no current update
+        the span is ignored"""
+        if (trace := self._current) is None:
+            return
+        trace.spans.append(Span(
+            name,
+            category,
+            start,
+            perf_counter() if end is None else end,
+            threading.get_ident() if thread is None else thread,
+            args))
+
+    def clear(self):
+        self.traces.clear()
+
+    def has_traces(self) -> bool:
+        return bool(self.traces)
+
+    def to_chrome_trace(self) -> dict:
+        """Returns data in Chrome trace event format. Each update is shown as
+        separate process"""
+        origin = self.traces[0].start if self.traces else 0
+        events = []
+        for pid, trace in enumerate(self.traces):
+            events.append({"name": "process_name", "ph": "M", "pid": pid,
+                           "args": {"name": trace.name}})
+            threads = {}
+            for span in trace.spans:
+                tid = threads.setdefault(span.thread, len(threads))
+                events.append({
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start - origin) * 1e6,
+                    "dur": (span.end - span.start) * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": span.args,
+                })
+            for thread, tid in threads.items():
+                name = "Main" if thread == threading.main_thread().ident else f"Worker {tid}"
+                events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                               "args": {"name": name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self) -> dict:
+        """Returns data in speedscope file format. Each thread of each update
+        is shown as separate evented profile"""
+        frames: dict[tuple[str, str], int] = {}
+        profiles = []
+        for trace in self.traces:
+            by_thread: dict[int, list[Span]] = {}
+            for span in trace.spans:
+                by_thread.setdefault(span.thread, []).append(span)
+            for thread, spans in by_thread.items():
+                events = []
+                stack: list[tuple[int, float]] = []  # frame index, end
+                for span in sorted(spans, key=lambda s: (s.start, -s.end)):
+                    while stack and stack[-1][1] <= span.start:
+                        frame, end = stack.pop()
+                        events.append({"type": "C", "frame": frame, "at": end * 1e3})
+                    # spans should be nested, measuring errors are fixed here
+                    end = min(span.end, stack[-1][1]) if stack else span.end
+                    frame = frames.setdefault((span.name, span.category), len(frames))
+                    events.append({"type": "O", "frame": frame, "at": span.start * 1e3})
+                    stack.append((frame, end))
+                while stack:
+                    frame, end = stack.pop()
+                    events.append({"type": "C", "frame": frame, "at": end * 1e3})
+                thread_name = "Main" if thread == threading.main_thread().ident else f"Thread {thread}"
+                profiles.append({
+                    "type": "evented",
+                    "name": f'{trace.name} - {thread_name}',
+                    "unit": "milliseconds",
+                    "startValue": trace.start * 1e3,
+                    "endValue": (trace.end or trace.start) * 1e3,
+                    "events": events,
+                })
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": name, "file": category} for name, category in frames]},
+            "profiles": profiles,
+            "name": "Sverchok updates",
+            "exporter": "sverchok",
+        }
+
+    def save(self, path: str, file_format: Literal['CHROME', 'SPEEDSCOPE'] = 'CHROME'):
+        data = self.to_chrome_trace() if file_format == 'CHROME' else self.to_speedscope()
+        with open(path, 'w') as file:
+            json.dump(data, file, default=repr)
+
+
+tracer = Tracer()
@@ -117,10 +117,22 @@ from sverchok.utils.sv_logging import sv_logger
 from sverchok.utils.geom import center, LineEquation2D, CircleEquation2D
 from sverchok.utils.math import weighted_center
 from sverchok.utils.sv_bmesh_utils import pydata_from_bmesh, bmesh_from_pydata
+from sverchok.dependencies import scipy
+
+if scipy is not None:
+    from scipy.spatial import Voronoi
+    try:
+        from scipy.spatial import QhullError
+    except ImportError:
+        from scipy.spatial.qhull import QhullError
 
 TOLERANCE = 1e-9
 BIG_FLOAT = 1e38
 
+# implementations of voronoi_bounded and lloyd2d
+FORTUNE = 'FORTUNE'
+SCIPY = 'SCIPY'
+
 
 def cmp(x,y):
     return x.__cmp__(y)
@@ -886,6 +898,13 @@ class Bounds(object):
     def restrict(self, point):
         raise Exception("not implemented")
 
+    def clip_rays(self, origins, directions, t_max):
+        """
+        Clip segments origins + t*directions, 0 <= t <= t_max, by the bounds.
+        Returns arrays of t of clipped ends and mask of segments that cross the bounds.
+        """
+        raise Exception("not implemented")
+
     def init_from_sites(self, sites):
         self.x_max = -BIG_FLOAT
         self.x_min = BIG_FLOAT
@@ -1031,6 +1050,20 @@ class BoxBounds(Bounds):
                     result.append(intersection)
         return result
 
+    def clip_rays(self, origins, directions, t_max):
+        t_min = np.zeros(len(origins))
+        t_max = np.array(t_max, dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for axis, low, high in [(0, self.x_min, self.x_max), (1, self.y_min, self.y_max)]:
+                o, d = origins[:, axis], directions[:, axis]
+                t_low = (low - o) / d
+                t_high = (high - o) / d
+                t_enter = np.where(d != 0, np.minimum(t_low, t_high), np.where(o >= low, -np.inf, np.inf))
+                t_exit = np.where(d != 0, np.maximum(t_low, t_high), np.where(o <= high, np.inf, -np.inf))
+                t_min = np.maximum(t_min, t_enter)
+                t_max = np.minimum(t_max, t_exit)
+        return t_min, t_max, t_min < t_max
+
     def restrict(self, point):
         def chop(t, m, M):
             return min(max(t, m), M)
@@ -1094,6 +1127,20 @@ class CircleBounds(Bounds):
         intersection = self.circle.intersect_with_line(line)
         return intersection
 
+    def clip_rays(self, origins, directions, t_max):
+        # |o + t*d - c|^2 = r^2
+        oc = origins - np.array(self.center)
+        a = np.einsum('ij,ij->i', directions, directions)
+        b = np.einsum('ij,ij->i', oc, directions)
+        c = np.einsum('ij,ij->i', oc, oc) - self.r_max ** 2
+        discriminant = b * b - a * c
+        crossing = (discriminant > 0) & (a > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            root = np.sqrt(np.where(crossing, discriminant, 0))
+            t_min = np.maximum(0, (-b - root) / a)
+            t_max = np.minimum(t_max, (-b + root) / a)
+        return t_min, t_max, crossing & (t_min < t_max)
+
     def restrict(self, point):
         pt2d = (point[0], point[1])
         if self.contains(pt2d):
@@ -1109,13 +1156,10 @@ class CircleBounds(Bounds):
         x,y = tuple(v)
         return x,y,0
 
-def voronoi_bounded(sites, bound_mode='BOX', clip=True, draw_bounds=True, draw_hangs=False, make_faces=False, ordered_faces=False, max_sides=10):
+def voronoi_bounded(sites, bound_mode='BOX', clip=True, draw_bounds=True, draw_hangs=False, make_faces=False, ordered_faces=False, max_sides=10, implementation=FORTUNE):
 
     bounds = Bounds.new(bound_mode)
     bounds.init_from_sites(sites)
-    source_sites = []
-    for x, y, z in sites:
-        source_sites.append(Site(x, y))
 
     delta = clip
     bounds.x_max = bounds.x_max + delta
@@ -1126,6 +1170,49 @@ def voronoi_bounded(sites, bound_mode='BOX', clip=True, draw_bounds=True, draw_h
 
     bounds.r_max = bounds.r_max + delta
 
+    new_vertices = None
+    if implementation == SCIPY:
+        new_vertices, edges = _voronoi_edges_scipy(sites, bounds, draw_bounds, draw_hangs)
+    if new_vertices is None:
+        new_vertices, edges = _voronoi_edges_fortune(sites, bounds, draw_bounds, draw_hangs)
+
+    if make_faces:
+        for i,j in edges:
+            if i==j:
+                print(i,j)
+        bm = bmesh_from_pydata(new_vertices, edges, [])
+        bmesh.ops.holes_fill(bm, edges=bm.edges[:], sides=max_sides)
+        new_vertices, edges, new_faces = pydata_from_bmesh(bm)
+        bm.free()
+        if ordered_faces:
+            bvh = BVHTree.FromPolygons(new_vertices, new_faces)
+            face_by_site = dict()
+            for site_idx, site in enumerate(sites):
+                loc, normal, index, distance = bvh.find_nearest(site)
+                if index is not None:
+                    face_by_site[site_idx] = index
+            r = []
+            for i in range(len(sites)):
+                if i not in face_by_site:
+                    raise Exception(f"Can't find a face for site #{i}")
+                face_idx = face_by_site[i]
+                face = new_faces[face_idx]
+                r.append(face)
+            new_faces = r
+    else:
+        new_faces = []
+
+    return new_vertices, edges, new_faces
+
+def _sort_bounding_verts(bounding_verts, verts, bounds):
+    x0, y0 = bounds.center
+    bounding_verts.sort(key = lambda idx: atan2(verts[idx][1] - y0, verts[idx][0] - x0))
+
+def _voronoi_edges_fortune(sites, bounds, draw_bounds, draw_hangs):
+    source_sites = []
+    for x, y, z in sites:
+        source_sites.append(Site(x, y))
+
     voronoi_data = computeVoronoiDiagram(source_sites, raise_exception=True)
     verts = voronoi_data.vertices
     lines = voronoi_data.lines
@@ -1236,7 +1323,7 @@ def voronoi_bounded(sites, bound_mode='BOX', clip=True, draw_bounds=True, draw_h
         # or "hanging edge"; so should we add a separate checkbox for such edges?...
 
     if draw_bounds and bounding_verts:
-        bounding_verts.sort(key = lambda idx: atan2(bm.verts[idx][1], bm.verts[idx][0]))
+        _sort_bounding_verts(bounding_verts, bm.verts, bounds)
         for i, j in zip(bounding_verts, bounding_verts[1:]):
             bm.new_edge(i, j)
         bm.new_edge(bounding_verts[-1], bounding_verts[0])
@@ -1249,34 +1336,72 @@ def voronoi_bounded(sites, bound_mode='BOX', clip=True, draw_bounds=True, draw_h
     verts, edges = bm.to_pydata()
 
     new_vertices = [(vert[0], vert[1], 0) for vert in verts]
+    return new_vertices, edges
 
-    if make_faces:
-        for i,j in edges:
-            if i==j:
-                print(i,j)
-        bm = bmesh_from_pydata(new_vertices, edges, [])
-        bmesh.ops.holes_fill(bm, edges=bm.edges[:], sides=max_sides)
-        new_vertices, edges, new_faces = pydata_from_bmesh(bm)
-        bm.free()
-        if ordered_faces:
-            bvh = BVHTree.FromPolygons(new_vertices, new_faces)
-            face_by_site = dict()
-            for site_idx, site in enumerate(sites):
-                loc, normal, index, distance = bvh.find_nearest(site)
-                if index is not None:
-                    face_by_site[site_idx] = index
-            r = []
-            for i in range(len(sites)):
-                if i not in face_by_site:
-                    raise Exception(f"Can't find a face for site #{i}")
-                face_idx = face_by_site[i]
-                face = new_faces[face_idx]
-                r.append(face)
-            new_faces = r
-    else:
-        new_faces = []
+def _voronoi_edges_scipy(sites, bounds, draw_bounds, draw_hangs):
+    """
+    The same edges as of _voronoi_edges_fortune, the diagram is calculated by SciPy
+    and clipped by the bounds at once for all the edges.
+    Returns None instead of vertices for the sites which SciPy can't handle.
+    """
+    points = np.asarray(sites, dtype=np.float64)[:, :2]
+    if len(points) < 3:
+        return None, None
+    try:
+        diagram = Voronoi(points)
+    except QhullError:
+        return None, None
+    vertices = diagram.vertices
+    ridge_points = diagram.ridge_points
+    ridge_vertices = np.array(diagram.ridge_vertices, dtype=np.int64).reshape(-1, 2)
+
+    # finite edges go from one vertex to another, rays go from their vertex
+    # perpendicular to the convex hull edge between their sites
+    finite = (ridge_vertices >= 0).all(axis=1)
+    starts = np.where(finite, ridge_vertices[:, 0], ridge_vertices.max(axis=1))
+    directions = vertices[ridge_vertices[:, 1]] - vertices[starts]
+    hull_sites = points[ridge_points[~finite]]
+    tangents = hull_sites[:, 1] - hull_sites[:, 0]
+    normals = np.stack((-tangents[:, 1], tangents[:, 0]), axis=1)
+    outside = hull_sites.mean(axis=1) - points.mean(axis=0)
+    normals[np.einsum('ij,ij->i', normals, outside) < 0] *= -1
+    directions[~finite] = normals
+    origins = vertices[starts]
+
+    t_min, t_max, crossing = bounds.clip_rays(origins, directions, np.where(finite, 1.0, np.inf))
+    start_inside = crossing & (t_min == 0)
+    end_inside = crossing & finite & (t_max == 1)
+    if not (draw_hangs or draw_bounds):
+        crossing &= start_inside & end_inside
+
+    # vertices of the diagram inside the bounds, then points on the bounds
+    inside = np.zeros(len(vertices), dtype=bool)
+    inside[starts[start_inside]] = True
+    inside[ridge_vertices[end_inside, 1]] = True
+    vert_index = np.cumsum(inside) - 1
+    new_verts = [vertices[inside]]
+    n_verts = np.count_nonzero(inside)
+    edge_ends = []
+    bounding_verts = []
+    for t, vertex_inside, ridge_vertex in [(t_min, start_inside, starts), (t_max, end_inside, ridge_vertices[:, 1])]:
+        clipped = crossing & ~vertex_inside
+        ends = np.empty(len(origins), dtype=np.int64)
+        ends[vertex_inside] = vert_index[ridge_vertex[vertex_inside]]
+        ends[clipped] = np.arange(n_verts, n_verts + np.count_nonzero(clipped))
+        new_verts.append(origins[clipped] + t[clipped, np.newaxis] * directions[clipped])
+        bounding_verts.extend(ends[clipped].tolist())
+        n_verts += np.count_nonzero(clipped)
+        edge_ends.append(ends[crossing])
+
+    verts = np.concatenate(new_verts)
+    edges = np.stack(edge_ends, axis=1).tolist()
+    if draw_bounds and bounding_verts:
+        _sort_bounding_verts(bounding_verts, verts, bounds)
+        edges.extend(zip(bounding_verts, bounding_verts[1:] + bounding_verts[:1]))
 
-    return new_vertices, edges, new_faces
+    new_vertices = np.zeros((len(verts), 3))
+    new_vertices[:, :2] = verts
+    return new_vertices.tolist(), edges
 
 def unique_points(points, eps=1e-4):
     kdt = KDTree(len(points))
@@ -1298,7 +1423,7 @@ def unique_points(points, eps=1e-4):
                 repeating.append(p)
     return mask, unique, repeating
 
-def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None):
+def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None, implementation=FORTUNE):
     bounds = Bounds.new(bound_mode)
     bounds.init_from_sites(verts)
 
@@ -1327,7 +1452,8 @@ def lloyd2d(bound_mode, verts, n_iterations, clip=0.0, weight_field=None):
                     draw_hangs = True,
                     make_faces = True,
                     ordered_faces = True,
-                    max_sides = 20)
+                    max_sides = 20,
+                    implementation = implementation)
         centers = []
         for face in voronoi_faces[:n]:
             face_verts = np.array([voronoi_verts[i] for i in face])
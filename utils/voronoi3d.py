@@ -19,7 +19,11 @@
 import numpy as np
 from collections import defaultdict
 import itertools
+import math
+import multiprocessing
+import sys
 import datetime
+from typing import NamedTuple
 
 import bpy
 import bmesh
@@ -28,7 +32,8 @@ from mathutils import Vector
 from mathutils.bvhtree import BVHTree
 
 from sverchok.data_structure import repeat_last_for_length
-from sverchok.utils.sv_mesh_utils import mask_vertices, polygons_to_edges, point_inside_mesh
+from sverchok.utils.sv_mesh_utils import mask_vertices, polygons_to_edges
+from sverchok.utils.bvh_tree import bvh_find_nearest, bvh_points_inside
 from sverchok.utils.sv_bmesh_utils import bmesh_from_pydata, pydata_from_bmesh, bmesh_clip
 from sverchok.utils.geom import calc_bounds, bounding_sphere, PlaneEquation, bounding_box_aligned
 from sverchok.utils.math import project_to_sphere, weighted_center
@@ -41,78 +46,295 @@ if FreeCAD is not None:
     from FreeCAD import Base
     import Part
 
-def voronoi3d_regions(sites, closed_only=True, recalc_normals=True, do_clip=False, clipping=1.0):
+class VoronoiRegions(NamedTuple):
+    """
+    Regions of 3D Voronoi diagram packed into one mesh. Regions do not share
+    vertices. Vertices, edges and faces of each region are stored contiguously,
+    offsets arrays have one more item than there are regions. All indices are
+    indices of the packed mesh.
+    """
+    sites: np.ndarray  # index of site of each region
+    verts: np.ndarray  # (n, 3)
+    edges: np.ndarray  # (n, 2)
+    face_indices: np.ndarray  # vertex indices of all faces, one after another
+    face_offsets: np.ndarray  # start of each face in face_indices, (n faces + 1)
+    vert_offsets: np.ndarray
+    edge_offsets: np.ndarray
+    region_face_offsets: np.ndarray  # start of faces of each region
+
+    def faces(self):
+        """Faces of the packed mesh as lists"""
+        indices = self.face_indices.tolist()
+        return [indices[s:e] for s, e in zip(self.face_offsets[:-1].tolist(), self.face_offsets[1:].tolist())]
+
+    def split(self):
+        """Returns vertices, edges and faces of each region as separate mesh"""
+        vert_offsets = self.vert_offsets.tolist()
+        edge_offsets = self.edge_offsets.tolist()
+        region_face_offsets = self.region_face_offsets.tolist()
+        n_regions = len(self.sites)
+
+        edges = self.edges - np.repeat(self.vert_offsets[:-1], np.diff(self.edge_offsets))[:, np.newaxis]
+        face_items_regions = np.repeat(np.arange(n_regions),
+                                       np.diff(self.face_offsets[self.region_face_offsets]))
+        face_indices = self.face_indices - self.vert_offsets[face_items_regions]
+        face_indices = face_indices.tolist()
+        faces = [face_indices[s:e] for s, e in zip(self.face_offsets[:-1].tolist(), self.face_offsets[1:].tolist())]
+
+        verts = self.verts.tolist()
+        edges = edges.tolist()
+        return ([verts[s:e] for s, e in zip(vert_offsets[:-1], vert_offsets[1:])],
+                [edges[s:e] for s, e in zip(edge_offsets[:-1], edge_offsets[1:])],
+                [faces[s:e] for s, e in zip(region_face_offsets[:-1], region_face_offsets[1:])])
+
+
+def _offsets(sizes):
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    return offsets
+
+def _next_in_face(face_offsets):
+    """Index of next item of the same face for each item of flat faces array"""
+    next_idx = np.arange(1, face_offsets[-1] + 1)
+    next_idx[face_offsets[1:] - 1] = face_offsets[:-1]
+    return next_idx
+
+def _gather_faces(face_indices, face_offsets, selection):
+    """Flat array and offsets of given faces"""
+    starts = face_offsets[selection]
+    sizes = face_offsets[selection + 1] - starts
+    new_offsets = _offsets(sizes)
+    items = np.arange(new_offsets[-1]) + np.repeat(starts - new_offsets[:-1], sizes)
+    return face_indices[items], new_offsets
+
+def _unique_rows(rows, return_index=False, return_inverse=False, return_counts=False):
+    """
+    The same as np.unique(rows, axis=0, ...) for rows of non-negative integers.
+    Rows are packed into single integers when possible, that's much faster.
+    """
+    ranges = rows.max(axis=0, initial=0) + 1
+    if np.prod(ranges, dtype=np.float64) >= 2**62:
+        result = np.unique(rows, axis=0, return_index=return_index,
+                           return_inverse=return_inverse, return_counts=return_counts)
+    else:
+        keys = np.zeros(len(rows), dtype=np.int64)
+        for column, size in zip(rows.T, ranges):
+            keys = keys * size + column
+        _, index, *rest = np.unique(keys, return_index=True,
+                                    return_inverse=return_inverse, return_counts=return_counts)
+        result = (rows[index],) + ((index,) if return_index else ()) + tuple(rest)
+    if not isinstance(result, tuple):
+        return result
+    if return_inverse:
+        # shape of the inverse array differs between numpy versions
+        inverse_idx = 2 if return_index else 1
+        result = result[:inverse_idx] + (result[inverse_idx].ravel(),) + result[inverse_idx+1:]
+    return result if len(result) > 1 else result[0]
+
+def _clip_regions(verts, face_indices, face_offsets, face_cells, axis, sign, bound):
+    """
+    Clips convex regions by plane axis = bound, keeping the half space where
+    sign * (coordinate - bound) <= 0. Cut holes are closed with new faces.
+    """
+    dist = (verts[:, axis] - bound) * sign
+    outside_items = dist[face_indices] > 0
+    if not outside_items.any():
+        return verts, face_indices, face_offsets, face_cells
+
+    # only regions crossing the plane are processed
+    item_cells = np.repeat(face_cells, np.diff(face_offsets))
+    affected = np.isin(face_cells, np.unique(item_cells[outside_items]))
+    not_affected = np.flatnonzero(~affected)
+    same_indices, same_offsets = _gather_faces(face_indices, face_offsets, not_affected)
+    same_cells = face_cells[not_affected]
+    affected = np.flatnonzero(affected)
+    face_indices, face_offsets = _gather_faces(face_indices, face_offsets, affected)
+    face_cells = face_cells[affected]
+
+    inside = dist <= 0
+    n_faces = len(face_offsets) - 1
+    next_idx = _next_in_face(face_offsets)
+    a, b = face_indices, face_indices[next_idx]
+    crossing = inside[a] != inside[b]
+
+    # intersection points are shared by faces with the same edge, if the inner
+    # end of an edge lies on the plane it is used instead of new point
+    edge_ends, inverse = _unique_rows(
+        np.sort(np.stack((a[crossing], b[crossing]), axis=1), axis=1), return_inverse=True)
+    d1, d2 = dist[edge_ends[:, 0]], dist[edge_ends[:, 1]]
+    cut_points = edge_ends[:, 0].copy()
+    cut_points[d2 == 0] = edge_ends[d2 == 0, 1]
+    is_new = (d1 != 0) & (d2 != 0)
+    p1, p2 = verts[edge_ends[is_new, 0]], verts[edge_ends[is_new, 1]]
+    t = d1[is_new] / (d1[is_new] - d2[is_new])
+    new_verts = p1 + (p2 - p1) * t[:, np.newaxis]
+    new_verts[:, axis] = bound
+    cut_points[is_new] = len(verts) + np.arange(len(new_verts))
+    verts = np.concatenate((verts, new_verts))
+    dist = np.concatenate((dist, np.zeros(len(new_verts))))
+
+    # Sutherland-Hodgman for all faces at once: each item emits itself if it is
+    # inside and the intersection point if the edge to next item is crossing
+    cuts = np.full(len(a), -1)
+    cuts[crossing] = cut_points[inverse]
+    emitted = np.stack((np.where(inside[a], a, -1), cuts), axis=1).ravel()
+    emitted_faces = np.repeat(np.repeat(np.arange(n_faces), np.diff(face_offsets)), 2)
+    good = emitted >= 0
+    emitted, emitted_faces = emitted[good], emitted_faces[good]
+    repeated = np.zeros(len(emitted), dtype=bool)
+    repeated[1:] = (emitted[1:] == emitted[:-1]) & (emitted_faces[1:] == emitted_faces[:-1])
+    emitted, emitted_faces = emitted[~repeated], emitted_faces[~repeated]
+    sizes = np.bincount(emitted_faces, minlength=n_faces)
+    ends = np.cumsum(sizes) - 1
+    starts = ends - sizes + 1
+    closing = (sizes > 1) & (emitted[np.maximum(ends, 0)] == emitted[np.minimum(starts, len(emitted) - 1)])
+    last_repeated = np.zeros(len(emitted), dtype=bool)
+    last_repeated[ends[closing]] = True
+    emitted, emitted_faces = emitted[~last_repeated], emitted_faces[~last_repeated]
+    sizes[closing] -= 1
+
+    kept = sizes >= 3
+    on_plane_items = dist[emitted] == 0
+    on_plane = np.bincount(emitted_faces, weights=on_plane_items, minlength=n_faces) == sizes
+    emitted_cells = face_cells[emitted_faces]
+
+    item_kept = kept[emitted_faces]
+    face_indices = emitted[item_kept]
+    face_offsets = _offsets(sizes[kept])
+    face_cells_clipped = face_cells[kept]
+
+    # new faces, points of a cut are sorted by angle around their center
+    cap_points = _unique_rows(np.stack((emitted_cells[on_plane_items], emitted[on_plane_items]), axis=1))
+    already_capped = np.unique(face_cells[kept & on_plane])
+    cap_points = cap_points[~np.isin(cap_points[:, 0], already_capped)]
+    if len(cap_points):
+        cap_cells, cap_inverse, cap_sizes = np.unique(cap_points[:, 0], return_inverse=True, return_counts=True)
+        cap_inverse = cap_inverse.ravel()
+        u_axis, v_axis = (axis + 1) % 3, (axis + 2) % 3
+        u = verts[cap_points[:, 1], u_axis]
+        v = verts[cap_points[:, 1], v_axis]
+        u_center = np.bincount(cap_inverse, weights=u) / cap_sizes
+        v_center = np.bincount(cap_inverse, weights=v) / cap_sizes
+        angle = np.arctan2(v - v_center[cap_inverse], u - u_center[cap_inverse]) * sign
+        order = np.lexsort((angle, cap_inverse))
+        valid = cap_sizes >= 3
+        order = order[valid[cap_inverse[order]]]
+        face_indices = np.concatenate((face_indices, cap_points[order, 1]))
+        face_offsets = np.concatenate((face_offsets, face_offsets[-1] + np.cumsum(cap_sizes[valid])))
+        face_cells_clipped = np.concatenate((face_cells_clipped, cap_cells[valid]))
+
+    return (verts,
+            np.concatenate((same_indices, face_indices)),
+            np.concatenate((same_offsets, same_offsets[-1] + face_offsets[1:])),
+            np.concatenate((same_cells, face_cells_clipped)))
+
+def _orient_faces(verts, face_indices, face_offsets, face_cells):
+    """Makes normals of faces of convex regions to point outside"""
+    sizes = np.diff(face_offsets)
+    points = verts[face_indices]
+    next_points = points[_next_in_face(face_offsets)]
+    normals = np.add.reduceat(np.cross(points, next_points), face_offsets[:-1])
+    centers = np.add.reduceat(points, face_offsets[:-1]) / sizes[:, np.newaxis]
+    cells, inverse, counts = np.unique(face_cells, return_inverse=True, return_counts=True)
+    inverse = inverse.ravel()
+    cell_centers = np.stack([np.bincount(inverse, weights=centers[:, i]) for i in range(3)], axis=1)
+    cell_centers /= counts[:, np.newaxis]
+    flip = np.einsum('ij,ij->i', normals, centers - cell_centers[inverse]) < 0
+    items_flip = np.repeat(flip, sizes)
+    starts = np.repeat(face_offsets[:-1], sizes)
+    ends = np.repeat(face_offsets[1:], sizes)
+    permutation = np.arange(len(face_indices))
+    permutation[items_flip] = (starts + ends - 1 - permutation)[items_flip]
+    return face_indices[permutation]
+
+def voronoi3d_regions(sites, closed_only=True, recalc_normals=True, do_clip=False, clipping=1.0, packed=False):
+    """
+    Regions of 3D Voronoi diagram as separate meshes.
+    All regions are processed at once with NumPy arrays: ridges of the diagram
+    are considered as faces of regions, regions which have edges used not
+    exactly by two faces or infinite ridges are open.
+
+    :param sites: points of the diagram
+    :param closed_only: skip open regions
+    :param recalc_normals: make normals of faces to point outside
+    :param do_clip: clip regions by bounding box of sites
+    :param clipping: distance from bounding box of sites to clipping planes
+    :param packed: return VoronoiRegions instead of lists of meshes
+    :return: vertices, edges and faces of regions or VoronoiRegions
+    """
+    sites = np.asarray(sites, dtype=np.float64)
     diagram = Voronoi(sites)
-    faces_per_site = defaultdict(list)
-    nsites = len(diagram.point_region)
-    nridges = len(diagram.ridge_points)
-    open_sites = set()
-    for ridge_idx in range(nridges):
-        site_idx_1, site_idx_2 = diagram.ridge_points[ridge_idx]
-        face = diagram.ridge_vertices[ridge_idx]
-        if -1 in face:
-            open_sites.add(site_idx_1)
-            open_sites.add(site_idx_2)
-            continue
-        faces_per_site[site_idx_1].append(face)
-        faces_per_site[site_idx_2].append(face)
-
-    new_verts = []
-    new_edges = []
-    new_faces = []
-
-    for site_idx in sorted(faces_per_site.keys()):
-        if closed_only and site_idx in open_sites:
-            continue
-        done_verts = dict()
-        bm = bmesh.new()
-        add_vert = bm.verts.new
-        add_face = bm.faces.new
-        for face in faces_per_site[site_idx]:
-            face_bm_verts = []
-            for vertex_idx in face:
-                if vertex_idx not in done_verts:
-                    bm_vert = add_vert(diagram.vertices[vertex_idx])
-                    done_verts[vertex_idx] = bm_vert
-                else:
-                    bm_vert = done_verts[vertex_idx]
-                face_bm_verts.append(bm_vert)
-            add_face(face_bm_verts)
-        bm.verts.index_update()
-        bm.verts.ensure_lookup_table()
-        bm.faces.index_update()
-        bm.edges.index_update()
-
-        if closed_only and any (v.is_boundary for v in bm.verts):
-            bm.free()
-            continue
-
-        if recalc_normals:
-            bm.normal_update()
-            bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
-
-        region_verts, region_edges, region_faces = pydata_from_bmesh(bm)
-        bm.free()
-        new_verts.append(region_verts)
-        new_edges.append(region_edges)
-        new_faces.append(region_faces)
-
-    if do_clip:
-        verts_n, edges_n, faces_n = [], [], []
-        bounds = calc_bounds(sites, clipping)
-        for verts_i, edges_i, faces_i in zip(new_verts, new_edges, new_faces):
-            bm = bmesh_from_pydata(verts_i, edges_i, faces_i)
-            bmesh_clip(bm, bounds, fill=True)
-            bm.normal_update()
-            bmesh.ops.recalc_face_normals(bm, faces=bm.faces[:])
-            verts_i, edges_i, faces_i = pydata_from_bmesh(bm)
-            bm.free()
-            verts_n.append(verts_i)
-            edges_n.append(edges_i)
-            faces_n.append(faces_i)
-        new_verts, new_edges, new_faces = verts_n, edges_n, faces_n
-
-    return new_verts, new_edges, new_faces
+    verts = diagram.vertices
+    ridge_sizes = np.array([len(ridge) for ridge in diagram.ridge_vertices], dtype=np.int64)
+    ridge_offsets = _offsets(ridge_sizes)
+    ridge_indices = np.fromiter(itertools.chain.from_iterable(diagram.ridge_vertices),
+                                dtype=np.int64, count=ridge_offsets[-1])
+
+    open_ridges = np.logical_or.reduceat(ridge_indices < 0, ridge_offsets[:-1])
+    open_sites = np.zeros(len(sites), dtype=bool)
+    open_sites[diagram.ridge_points[open_ridges].ravel()] = True
+
+    # each finite ridge is a face of two regions
+    ridges = np.flatnonzero(~open_ridges)
+    face_ridges = np.concatenate((ridges, ridges))
+    face_cells = np.concatenate((diagram.ridge_points[ridges, 0], diagram.ridge_points[ridges, 1]))
+    if closed_only:
+        not_open = ~open_sites[face_cells]
+        face_ridges, face_cells = face_ridges[not_open], face_cells[not_open]
+    order = np.lexsort((face_ridges, face_cells))
+    face_ridges, face_cells = face_ridges[order], face_cells[order]
+    face_indices, face_offsets = _gather_faces(ridge_indices, ridge_offsets, face_ridges)
+
+    if closed_only and len(face_cells):
+        item_cells = np.repeat(face_cells, np.diff(face_offsets))
+        edges = np.sort(np.stack((face_indices, face_indices[_next_in_face(face_offsets)]), axis=1), axis=1)
+        cell_edges, counts = _unique_rows(np.column_stack((item_cells, edges)), return_counts=True)
+        not_closed = np.unique(cell_edges[counts != 2, 0])
+        closed_faces = np.flatnonzero(~np.isin(face_cells, not_closed))
+        face_indices, face_offsets = _gather_faces(face_indices, face_offsets, closed_faces)
+        face_cells = face_cells[closed_faces]
+
+    if do_clip and len(face_cells):
+        x_min, x_max, y_min, y_max, z_min, z_max = calc_bounds(sites, clipping)
+        for axis, sign, bound in [(0, -1, x_min), (0, 1, x_max), (1, -1, y_min),
+                                  (1, 1, y_max), (2, -1, z_min), (2, 1, z_max)]:
+            verts, face_indices, face_offsets, face_cells = _clip_regions(
+                verts, face_indices, face_offsets, face_cells, axis, sign, bound)
+        order = np.argsort(face_cells, kind='stable')
+        face_indices, face_offsets = _gather_faces(face_indices, face_offsets, order)
+        face_cells = face_cells[order]
+
+    if recalc_normals and len(face_cells):
+        face_indices = _orient_faces(verts, face_indices, face_offsets, face_cells)
+
+    # vertices of each region are numbered in order of their appearance in faces
+    item_cells = np.repeat(face_cells, np.diff(face_offsets))
+    cell_verts, first, inverse = _unique_rows(
+        np.stack((item_cells, face_indices), axis=1).reshape(-1, 2), return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    new_index = np.empty(len(order), dtype=np.int64)
+    new_index[order] = np.arange(len(order))
+    cell_verts = cell_verts[order]
+    face_indices = new_index[inverse]
+
+    regions, region_faces = np.unique(face_cells, return_counts=True)
+    vert_offsets = np.searchsorted(cell_verts[:, 0], np.append(regions, len(sites)))
+    vert_offsets[-1] = len(cell_verts)
+    edges = _unique_rows(np.sort(np.stack(
+        (face_indices, face_indices[_next_in_face(face_offsets)]), axis=1), axis=1).reshape(-1, 2))
+    result = VoronoiRegions(
+        sites = regions,
+        verts = verts[cell_verts[:, 1]].reshape(-1, 3),
+        edges = edges,
+        face_indices = face_indices,
+        face_offsets = face_offsets,
+        vert_offsets = vert_offsets,
+        edge_offsets = np.searchsorted(edges[:, 0], vert_offsets),
+        region_face_offsets = _offsets(region_faces))
+
+    if packed:
+        return result
+    return result.split()
 
 def voronoi3d_layer(n_src_sites, all_sites, make_regions, do_clip, clipping, skip_added=True):
     diagram = Voronoi(all_sites)
@@ -221,63 +443,84 @@ def voronoi_on_surface(surface, uvpoints, thickness, do_clip, clipping, make_reg
             clipping = clipping)
 
 def calc_bvh_normals(bvh, sites):
-    normals = []
-    for site in sites:
-        loc, normal, index, distance = bvh.find_nearest(site)
-        if loc is not None:
-            normals.append(normal.normalized())
-    return np.array(normals)
+    locations, normals, indices, distances = bvh_find_nearest(bvh, sites)
+    normals = normals[indices >= 0]
+    return normals / np.linalg.norm(normals, axis=1, keepdims=True)
 
 def calc_bvh_projections(bvh, sites):
-    projections = []
-    for site in sites:
-        loc, normal, index, distance = bvh.find_nearest(site)
-        if loc is not None:
-            projections.append(loc)
-    return np.array(projections)
+    locations, normals, indices, distances = bvh_find_nearest(bvh, sites)
+    return locations[indices >= 0]
 
 # see additional info https://github.com/nortikin/sverchok/pull/4948
-def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='VOLUME', normal_update = False, precision=1e-8, mask=[]):
-
-    def get_sites_delaunay_params(delaunay, n_orig_sites):
-        result = defaultdict(list)
-        ridges = []
-        sites_pair = dict()
-        for simplex in delaunay.simplices:
-            ridges += itertools.combinations(tuple( sorted( simplex ) ), 2)
-
-        ridges = list(set( ridges )) # remove duplicates of ridges
-        ridges.sort() # for nice view in debugger
-
-        for ridge_idx in range(len(ridges)):
-            site1_idx, site2_idx = tuple(ridges[ridge_idx])
-            # Remove 4D simplex ridges:
-            if n_orig_sites<=site1_idx or n_orig_sites<=site2_idx:
-                continue
-            # Convert source sites to the 3D
-            site1 = delaunay.points[site1_idx]
-            site1 = Vector([site1[0], site1[1], site1[2], ])
-            site2 = delaunay.points[site2_idx]
-            site2 = Vector([site2[0], site2[1], site2[2], ])
-            middle = (site1 + site2) * 0.5
-            normal =  Vector(site1 - site2).normalized() # normal to site1
-            plane1 = PlaneEquation.from_normal_and_point( normal, middle)
-            plane2 = PlaneEquation.from_normal_and_point(-normal, middle)
-            result[site1_idx].append( (site2_idx, site1, site2, middle,  normal, plane1) )
-            result[site2_idx].append( (site1_idx, site2, site1, middle, -normal, plane2) )
-
-        return result
+def _get_sites_delaunay_params(delaunay, n_orig_sites):
+    result = defaultdict(list)
+    ridges = []
+    sites_pair = dict()
+    for simplex in delaunay.simplices:
+        ridges += itertools.combinations(tuple( sorted( simplex ) ), 2)
+
+    ridges = list(set( ridges )) # remove duplicates of ridges
+    ridges.sort() # for nice view in debugger
+
+    for ridge_idx in range(len(ridges)):
+        site1_idx, site2_idx = tuple(ridges[ridge_idx])
+        # Remove 4D simplex ridges:
+        if n_orig_sites<=site1_idx or n_orig_sites<=site2_idx:
+            continue
+        # Convert source sites to the 3D
+        site1 = delaunay.points[site1_idx]
+        site1 = Vector([site1[0], site1[1], site1[2], ])
+        site2 = delaunay.points[site2_idx]
+        site2 = Vector([site2[0], site2[1], site2[2], ])
+        middle = (site1 + site2) * 0.5
+        normal =  Vector(site1 - site2).normalized() # normal to site1
+        plane1 = PlaneEquation.from_normal_and_point( normal, middle)
+        plane2 = PlaneEquation.from_normal_and_point(-normal, middle)
+        result[site1_idx].append( (site2_idx, site1, site2, middle,  normal, plane1) )
+        result[site2_idx].append( (site1_idx, site2, site1, middle, -normal, plane2) )
 
-    # some statistics:
-    num_bisect = 0 # general count of bisect for full cutting process
-    num_unpredicted_erased = 0 # if optimisation can not find a skip bisect case (with using bounding box) then counter incremented
+    return result
 
-    def cut_cell(start_mesh, sites_delaunay_params, site_idx, spacing, center_of_mass, bbox_aligned):
-        nonlocal num_bisect, num_unpredicted_erased
+class _CellCutter:
+    """
+    Cuts Voronoi cells out of a mesh by bisections. The cells are independent
+    from each other so they can be cut in different processes.
+    """
+    def __init__(self, verts, faces, sites_delaunay_params, spacing, center_of_mass, bbox_aligned,
+                 mode='VOLUME', normal_update=False, precision=1e-8):
+        self.start_mesh = bmesh_from_pydata(verts, [], faces, normal_update=False)
+        self.sites_delaunay_params = sites_delaunay_params
+        self.spacing = spacing
+        self.center_of_mass = center_of_mass
+        self.bbox_aligned = bbox_aligned
+        self.mode = mode
+        self.normal_update = normal_update
+        self.precision = precision
+
+        # some statistics:
+        self.num_bisect = 0 # general count of bisect for full cutting process
+        self.num_unpredicted_erased = 0 # if optimisation can not find a skip bisect case (with using bounding box) then counter incremented
+
+    def free(self):
+        self.start_mesh.clear() # remember to clear empty geometry
+        self.start_mesh.free()
+
+    def cut_cells(self, sites_idx):
+        """Returns (site index, pydata) pairs for cells which are not empty"""
+        cells = []
+        for site_idx in sites_idx:
+            cell = self.cut_cell(site_idx)
+            if cell is not None and cell[0]:
+                cells.append((site_idx, cell))
+        return cells
+
+    def cut_cell(self, site_idx):
+        start_mesh, spacing = self.start_mesh, self.spacing[site_idx]
+        mode, precision = self.mode, self.precision
         src_mesh = None
         # Check ridges for sites before bisect. If no ridges then no bisect and no mesh in result
-        if site_idx in sites_delaunay_params:
-            site_params = sites_delaunay_params[site_idx]
+        if site_idx in self.sites_delaunay_params:
+            site_params = self.sites_delaunay_params[site_idx]
 
             if len(start_mesh.verts) > 0:
                 lst_ridges_to_bisect = []
@@ -290,7 +533,7 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
                     # Move bisect plane on size of half of spacing (normal point to the site_idx from site_pair_idx)
                     plane_co = middle + 0.5 * spacing * plane_no
                     # [1]. Test if bbox_aligned outside a site_pair plane?
-                    signs_verts_bbox_aligned = PlaneEquation.from_normal_and_point( plane_no, plane_co ).side_of_points(bbox_aligned)
+                    signs_verts_bbox_aligned = PlaneEquation.from_normal_and_point( plane_no, plane_co ).side_of_points(self.bbox_aligned)
                     # if all vertexes of bbox_aligned out of plane with negation normal then object will be erased anyway.
                     # So one can skeep bisect operation
                     if (signs_verts_bbox_aligned <= 0).all():
@@ -303,8 +546,8 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
                     else:
                         # [2]. calc middle planes for optimal bisects sequence (sort later)
                         plane_spacing = PlaneEquation.from_normal_and_point(plane_no, plane_co)
-                        sign = plane_spacing.side_of_points(center_of_mass)
-                        dist = plane_spacing.distance_to_point(center_of_mass)
+                        sign = plane_spacing.side_of_points(self.center_of_mass)
+                        dist = plane_spacing.distance_to_point(self.center_of_mass)
                 
                         lst_ridges_to_bisect.append( [dist*sign, site_pair_idx, site_vert, site_pair_vert, middle, plane_co, plane_no, plane, ] )
                     
@@ -340,7 +583,7 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
                                 clear_outer = False,
                                 clear_inner = True
                             )
-                        num_bisect+=1 # for statistics
+                        self.num_bisect+=1 # for statistics
 
                         if len(res_bisect['geom_cut'])>0:
                             if mode=='VOLUME': # fill faces after bisect
@@ -360,7 +603,7 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
                             # 1. Optimisation fail and not realized that this process has no result
                             # 2. Big spacing eat geometry inside mesh
                             if len( res_bisect['geom'] )==0:
-                                num_unpredicted_erased+=1 # for statistics
+                                self.num_unpredicted_erased+=1 # for statistics
                                 break
                             pass
                 else:
@@ -381,13 +624,58 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
             return None
 
         # if src_mesh has vertices then return mesh data
-        if mode=='VOLUME' and normal_update==True:
+        if mode=='VOLUME' and self.normal_update==True:
             src_mesh.normal_update()
         pydata = pydata_from_bmesh(src_mesh)
         src_mesh.clear() #remember to clear geometry before return
         src_mesh.free()
         return pydata
 
+# Worker processes are forked from Blender, they can't be spawned because
+# bmesh can't be imported outside of Blender. Python documents forking as
+# unsafe on macOS and there is no fork on Windows, so parallel cutting is
+# used only on Linux. Workers only use bmesh and never touch bpy data.
+CAN_CUT_CELLS_IN_PROCESSES = sys.platform.startswith('linux')
+
+# cell cutter of a worker process
+_worker_cell_cutter = None
+
+def _init_cell_cutter_worker(*args):
+    global _worker_cell_cutter
+    _worker_cell_cutter = _CellCutter(*args)
+
+def _cut_cells_in_worker(sites_idx):
+    cutter = _worker_cell_cutter
+    num_bisect, num_unpredicted_erased = cutter.num_bisect, cutter.num_unpredicted_erased
+    cells = cutter.cut_cells(sites_idx)
+    return cells, cutter.num_bisect - num_bisect, cutter.num_unpredicted_erased - num_unpredicted_erased
+
+def _cut_cells_parallel(processes, sites_idx, *cutter_args):
+    """
+    Cuts cells in worker processes. The processes are forked so the source mesh
+    and parameters of sites are shared with them without serialization, each
+    worker creates its start bmesh once. Only indices of sites and pydata of
+    cells are sent between the processes.
+    Returns (site index, pydata) pairs and statistics of bisections.
+    """
+    chunk_size = max(1, math.ceil(len(sites_idx) / (processes * 8)))
+    chunks = [sites_idx[i:i+chunk_size] for i in range(0, len(sites_idx), chunk_size)]
+    cells, num_bisect, num_unpredicted_erased = [], 0, 0
+    context = multiprocessing.get_context('fork')
+    with context.Pool(processes, initializer=_init_cell_cutter_worker, initargs=cutter_args) as pool:
+        for chunk_cells, chunk_bisect, chunk_erased in pool.imap(_cut_cells_in_worker, chunks):
+            cells.extend(chunk_cells)
+            num_bisect += chunk_bisect
+            num_unpredicted_erased += chunk_erased
+    return cells, num_bisect, num_unpredicted_erased
+
+def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='VOLUME', normal_update = False, precision=1e-8, mask=[], processes=1):
+    """
+    :param processes: number of processes to cut cells with. Worker processes
+        are forked, on platforms other than Linux the cells are cut in the
+        current process, see CAN_CUT_CELLS_IN_PROCESSES.
+    """
+
     verts_out = []
     edges_out = []
     faces_out = []
@@ -428,7 +716,7 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
         np_sites = np.array([(s[0], s[1], s[2]) for s in sites], dtype=np.float32)
 
     delaunay = Delaunay(np.array(np_sites, dtype=np.float32))
-    sites_delaunay_params = get_sites_delaunay_params(delaunay, n_orig_sites)
+    sites_delaunay_params = _get_sites_delaunay_params(delaunay, n_orig_sites)
 
     if isinstance(spacing, list):
         spacing = repeat_last_for_length(spacing, len(sites))
@@ -448,23 +736,26 @@ def voronoi_on_mesh_bmesh(verts, faces, n_orig_sites, sites, spacing=0.0, mode='
         # else extend mask by false and do not use sites that are not in the mask
         mask = mask[:]+[False]*(len(sites)-len(mask) if len(mask)<=len(sites) else 0)
 
-    start_mesh = bmesh_from_pydata(verts, [], faces, normal_update=False)
+    sites_idx = [site_idx for site_idx in range(len(sites)) if mask[site_idx]]
+    cutter_args = (verts, faces, sites_delaunay_params, spacing, center_of_mass, bbox_aligned,
+                   mode, normal_update, precision)
+    if processes > 1 and len(sites_idx) > 1 and CAN_CUT_CELLS_IN_PROCESSES:
+        cells, num_bisect, num_unpredicted_erased = _cut_cells_parallel(
+            min(processes, len(sites_idx)), sites_idx, *cutter_args)
+    else:
+        cutter = _CellCutter(*cutter_args)
+        cells = cutter.cut_cells(sites_idx)
+        num_bisect, num_unpredicted_erased = cutter.num_bisect, cutter.num_unpredicted_erased
+        cutter.free()
+
     used_sites_idx = []
     used_sites_verts = []
-    for site_idx in range(len(sites)):
-        if(mask[site_idx]):
-            cell = cut_cell(start_mesh, sites_delaunay_params, site_idx, spacing[site_idx], center_of_mass, bbox_aligned)
-            if cell is not None:
-                new_verts, new_edges, new_faces = cell
-                if new_verts:
-                    verts_out.append(new_verts)
-                    edges_out.append(new_edges)
-                    faces_out.append(new_faces)
-                    used_sites_idx.append( site_idx )
-                    used_sites_verts.append( sites[site_idx] )
-    start_mesh.clear() # remember to clear empty geometry
-    start_mesh.free()
-    
+    for site_idx, (new_verts, new_edges, new_faces) in cells:
+        verts_out.append(new_verts)
+        edges_out.append(new_edges)
+        faces_out.append(new_faces)
+        used_sites_idx.append( site_idx )
+        used_sites_verts.append( sites[site_idx] )
 
     # show statistics:
     # bisects - count of bisects in cut_cell
@@ -479,7 +770,8 @@ def voronoi_on_mesh(verts, faces, sites, thickness,
     clip_inner=True, clip_outer=True, do_clip=True,
     clipping=1.0, mode = 'REGIONS', normal_update=False,
     precision = 1e-8,
-    mask = []
+    mask = [],
+    processes = 1
     ):
 
     bvh = BVHTree.FromPolygons(verts, faces)
@@ -511,7 +803,7 @@ def voronoi_on_mesh(verts, faces, sites, thickness,
         all_points = sites[:]
         verts, edges, faces, used_sites_idx, used_sites_verts = voronoi_on_mesh_bmesh(verts, faces, len(sites), all_points,
                 spacing = spacing, mode = mode, normal_update = normal_update,
-                precision = precision, mask=mask)
+                precision = precision, mask=mask, processes=processes)
         return verts, edges, faces, used_sites_idx, used_sites_verts
 
 def project_solid_normals(shell, pts, thickness, add_plus=True, add_minus=True, predicate_plus=None, predicate_minus=None):
@@ -550,28 +842,22 @@ def voronoi_on_solid(solid, sites,
         all_points.extend(bounds)
     return voronoi3d_regions(all_points, closed_only=True, do_clip=do_clip, clipping=clipping)
 
+def _lloyd_centers(all_points, n, weight_field):
+    diagram = Voronoi(all_points)
+    centers = np.empty((n, 3))
+    for site_idx in range(n):
+        region = diagram.regions[diagram.point_region[site_idx]]
+        centers[site_idx] = weighted_center(diagram.vertices[region], weight_field)
+    return centers
+
 def lloyd_on_mesh(verts, faces, sites, thickness, n_iterations, weight_field=None):
     bvh = BVHTree.FromPolygons(verts, faces)
+    k = 0.5*thickness
 
     def iteration(points):
-        n = len(points)
-
         normals = calc_bvh_normals(bvh, points)
-        k = 0.5*thickness
-        points = np.array(points)
-        plus_points = points + k*normals
-        minus_points = points - k*normals
-        all_points = points.tolist() + plus_points.tolist() + minus_points.tolist()
-
-        diagram = Voronoi(all_points)
-        centers = []
-        for site_idx in range(n):
-            region_idx = diagram.point_region[site_idx]
-            region = diagram.regions[region_idx]
-            region_verts = np.array([diagram.vertices[i] for i in region])
-            center = weighted_center(region_verts, weight_field)
-            centers.append(tuple(center))
-        return centers
+        all_points = np.concatenate((points, points + k*normals, points - k*normals))
+        return _lloyd_centers(all_points, len(points), weight_field)
 
     points = calc_bvh_projections(bvh, sites)
     for i in range(n_iterations):
@@ -588,46 +874,29 @@ def lloyd_in_mesh(verts, faces, sites, n_iterations, thickness=None, weight_fiel
         thickness = max(x_max - x_min, y_max - y_min, z_max - z_min) / 4.0
 
     epsilon = 1e-8
+    k = 0.5*thickness
 
     def iteration(points):
-        n = len(points)
-
-        all_points = points[:]
-        k = 0.5*thickness
-        for p in points:
-            p = Vector(p)
-            loc, normal, index, distance = bvh.find_nearest(p)
-            if distance <= epsilon:
-                p1 = p + k * normal
-                all_points.append(tuple(p1))
-
-        diagram = Voronoi(all_points)
-        centers = []
-        for site_idx in range(n):
-            region_idx = diagram.point_region[site_idx]
-            region = diagram.regions[region_idx]
-            region_verts = np.array([diagram.vertices[i] for i in region])
-            center = weighted_center(region_verts, weight_field)
-            centers.append(tuple(center))
-        return centers
+        locations, normals, indices, distances = bvh_find_nearest(bvh, points)
+        on_surface = distances <= epsilon
+        all_points = np.concatenate((points, points[on_surface] + k * normals[on_surface]))
+        return _lloyd_centers(all_points, len(points), weight_field)
 
     def restrict(points):
-        result = []
-        for p in points:
-            if point_inside_mesh(bvh, p):
-                result.append(p)
-            else:
-                loc, normal, index, distance = bvh.find_nearest(p)
-                if loc is not None:
-                    result.append(tuple(loc))
-        return result
-
-    points = restrict(sites)
+        inside = bvh_points_inside(bvh, points)
+        locations, normals, indices, distances = bvh_find_nearest(bvh, points[~inside])
+        points = points.copy()
+        points[~inside] = locations
+        keep = np.ones(len(points), dtype=bool)
+        keep[~inside] = indices >= 0
+        return points[keep]
+
+    points = restrict(np.asarray(sites, dtype=np.float64))
     for i in range(n_iterations):
         points = iteration(points)
         points = restrict(points)
 
-    return points
+    return [tuple(p) for p in points.tolist()]
 
 def lloyd_in_solid(solid, sites, n_iterations, tolerance=1e-4, weight_field=None):
     shell = solid.Shells[0]